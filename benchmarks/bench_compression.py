@@ -0,0 +1,63 @@
+"""
+Benchmark compressed epJSON read and write per codec.
+
+Run from the repository root:
+
+    python benchmarks/bench_compression.py
+"""
+
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from bench_json_backends import DATA_DIR, cfs_heavy_model
+
+from epmodel.epjson import dump_epjson, load_epjson
+
+SUFFIXES = {"none": "", "gzip": ".gz", "bz2": ".bz2", "lzma": ".xz"}
+
+
+def timed(func):
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def main():
+    cases = {path.stem: load_epjson(path) for path in sorted(DATA_DIR.glob("*.epJSON"))}
+    cases["cfs_heavy"] = cfs_heavy_model(next(iter(DATA_DIR.glob("*.epJSON"))))
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, model in cases.items():
+            print(name)
+            plain = Path(tmp) / f"{name}.epJSON"
+            dump_epjson(model, plain)
+            raw_size = plain.stat().st_size
+            for codec, suffix in SUFFIXES.items():
+                path = Path(tmp) / f"{name}.epJSON{suffix}"
+                write = timed(lambda: dump_epjson(model, path))
+                read = timed(lambda: load_epjson(path))
+                read_peak = peak(lambda: load_epjson(path))
+                size = path.stat().st_size
+                print(
+                    f"  {codec:<6}{size / 2**20:>8.2f} MiB"
+                    f"{raw_size / size:>7.1f}x"
+                    f"{raw_size / 2**20 / write:>9.1f} MiB/s write"
+                    f"{raw_size / 2**20 / read:>9.1f} MiB/s read"
+                    f"{read_peak / 2**20:>8.1f} MiB peak read"
+                )
+
+
+if __name__ == "__main__":
+    main()
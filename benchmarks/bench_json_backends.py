@@ -0,0 +1,57 @@
+"""
+Benchmark the JSON backends of epmodel.epjson.
+
+Run from the repository root:
+
+    python benchmarks/bench_json_backends.py
+"""
+
+import tempfile
+import timeit
+from pathlib import Path
+
+from epmodel.builder import build_matrix_two_dimension
+from epmodel.epjson import BACKENDS, dump_epjson, load_epjson, orjson
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def cfs_heavy_model(path: Path):
+    """Reference building with four full Klems BSDF matrices added."""
+    model = load_epjson(path)
+    for idx in range(4):
+        model.add(
+            "matrix_two_dimension",
+            f"bsdf_{idx}",
+            build_matrix_two_dimension(
+                [[0.01 * col for col in range(145)] for _ in range(145)]
+            ),
+        )
+    return model
+
+
+def bench(label, func, number=5):
+    best = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"{label:<40}{best * 1000:>10.2f} ms")
+
+
+def main():
+    backends = [b for b in BACKENDS if b != "auto" and (b != "orjson" or orjson)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = {
+            path.stem: load_epjson(path) for path in sorted(DATA_DIR.glob("*.epJSON"))
+        }
+        cases["cfs_heavy"] = cfs_heavy_model(next(iter(DATA_DIR.glob("*.epJSON"))))
+        for name, model in cases.items():
+            print(name)
+            path = Path(tmp) / f"{name}.epJSON"
+            dump_epjson(model, path)
+            for backend in backends:
+                bench(f"  load {backend}", lambda: load_epjson(path, backend))
+            for backend in backends:
+                out = Path(tmp) / f"{name}_{backend}.epJSON"
+                bench(f"  dump {backend}", lambda: dump_epjson(model, out, backend))
+
+
+if __name__ == "__main__":
+    main()
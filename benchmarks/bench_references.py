@@ -0,0 +1,45 @@
+"""
+Benchmark the dangling reference check against building the reference
+graph.
+
+Run from the repository root:
+
+    python benchmarks/bench_references.py
+"""
+
+import json
+
+from bench_json_backends import DATA_DIR, bench
+
+from epmodel import EnergyPlusModel
+from epmodel.loader import validate_lazy
+from epmodel.references import build_reference_graph, find_dangling
+
+
+def many_surfaces(path, count=50000):
+    """Reference building with its surfaces copied count times over."""
+    with open(path, "r") as f:
+        data = json.load(f)
+    surfaces = list(data["BuildingSurface:Detailed"].values())
+    data["BuildingSurface:Detailed"] = {
+        f"Surface {idx}": dict(surfaces[idx % len(surfaces)]) for idx in range(count)
+    }
+    return data
+
+
+def main():
+    cases = {}
+    for path in sorted(DATA_DIR.glob("*.epJSON")):
+        with open(path, "r") as f:
+            cases[path.stem] = json.load(f)
+    cases["many_surfaces"] = many_surfaces(next(iter(DATA_DIR.glob("*.epJSON"))))
+    for name, data in cases.items():
+        print(name)
+        model = EnergyPlusModel.model_validate(data)
+        bench("  find_dangling", lambda: find_dangling(model))
+        bench("  build_reference_graph", lambda: build_reference_graph(model))
+        bench("  find_dangling, lazy", lambda: find_dangling(validate_lazy(data)))
+
+
+if __name__ == "__main__":
+    main()
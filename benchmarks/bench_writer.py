@@ -0,0 +1,79 @@
+"""
+Benchmark write_epjson and write_idf against dumping the whole model at once.
+
+Run from the repository root:
+
+    python benchmarks/bench_writer.py
+"""
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from bench_json_backends import DATA_DIR, cfs_heavy_model
+
+from epmodel.epjson import dumps, load_epjson, write_epjson
+from epmodel.idf import write_idf
+
+
+def naive(model, path):
+    with open(path, "w") as f:
+        data = model.model_dump(mode="json", by_alias=True, exclude_none=True)
+        json.dump(data, f, indent=4)
+
+
+def whole(model, path):
+    Path(path).write_bytes(dumps(model))
+
+
+def stream(model, path):
+    with open(path, "w") as f:
+        write_epjson(model, f)
+
+
+def stream_elide(model, path):
+    with open(path, "w") as f:
+        write_epjson(model, f, exclude_defaults=True)
+
+
+def stream_idf(model, path):
+    with open(path, "w") as f:
+        write_idf(model, f)
+
+
+def bench(label, func, model, path):
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func(model, path)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func(model, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    size = os.path.getsize(path)
+    print(
+        f"  {label:<28}{min(times) * 1000:>10.2f} ms"
+        f"{peak / 2**20:>10.1f} MiB peak{size / 2**20:>10.1f} MiB file"
+    )
+
+
+def main():
+    cases = {path.stem: load_epjson(path) for path in sorted(DATA_DIR.glob("*.epJSON"))}
+    cases["cfs_heavy"] = cfs_heavy_model(next(iter(DATA_DIR.glob("*.epJSON"))))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.epJSON"
+        for name, model in cases.items():
+            print(name)
+            bench("model_dump + json.dump", naive, model, path)
+            bench("model_dump_json", whole, model, path)
+            bench("write_epjson", stream, model, path)
+            bench("write_epjson elide defaults", stream_elide, model, path)
+            bench("write_idf", stream_idf, model, path)
+
+
+if __name__ == "__main__":
+    main()
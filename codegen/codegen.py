@@ -94,4 +94,6 @@ generate(
     set_default_enum_member=True,
     target_python_version=PythonVersion.PY_39,
     class_name="EnergyPlusModel",
+    # Reports field assignments, see src/epmodel/base.py
+    base_class="epmodel.base.TrackedModel",
 )
@@ -0,0 +1,158 @@
+"""
+Generate the IDD metadata of the EnergyPlus model objects, used to read
+and write IDF. The schema is trimmed to only include the keys in keys.txt,
+like codegen.py.
+
+For each object type it records whether objects have a name, the order of
+the fields, the extensible group, which fields accept numbers and the
+choices of fields that are enumerations, as well as the object lists its
+name is a reference in and the object lists the fields referencing other
+objects by name take their values from, used to resolve references. A
+reference field paired with an object type field, e.g. Branch
+component_name with component_object_type, resolves to that type only.
+
+It also records every object type of the schema, so that sections of the
+object types outside keys.txt are told apart from typos. The field order,
+numeric fields and choices of those object types go to unknown_idd.py,
+imported by the IDF reader and writer only, so that their objects are
+read from and written to IDF as raw epJSON data.
+"""
+
+import json
+from pathlib import Path
+
+import black
+
+
+def field_kind(schema):
+    """Whether a field accepts numbers, and its choices if an enumeration."""
+    members = schema.get("anyOf", [schema])
+    numeric = any(member.get("type") in ("number", "integer") for member in members)
+    choices = [
+        choice
+        for member in members
+        for choice in member.get("enum", [])
+        if choice != ""
+    ]
+    return numeric, choices
+
+
+def type_field(field, group):
+    """Field of the same group naming the object type of a reference
+    field, e.g. component_object_type for component_name."""
+    for suffix in ("_object_name", "_name"):
+        if field.endswith(suffix):
+            candidate = field[: -len(suffix)] + "_object_type"
+            return candidate if candidate in group else None
+    return None
+
+
+def object_info(schema, lists=None):
+    """IDD metadata of an object type, without its references if lists is
+    None."""
+    legacy = schema["legacy_idd"]
+    properties = next(iter(schema["patternProperties"].values()))["properties"]
+    fields = [field for field in legacy["fields"] if field != "name"]
+    extension = legacy.get("extension")
+    extensibles = legacy.get("extensibles", [])
+    field_schemas = {field: properties.get(field, {}) for field in fields}
+    if extension:
+        items = properties[extension]["items"]["properties"]
+        field_schemas.update({field: items.get(field, {}) for field in extensibles})
+    info = {"name": "name" in schema, "fields": fields}
+    if extension:
+        info["extension"] = extension
+        info["extensibles"] = extensibles
+    numeric = []
+    choices = {}
+    object_lists = {}
+    object_types = {}
+    for field, field_schema in field_schemas.items():
+        is_numeric, field_choices = field_kind(field_schema)
+        if is_numeric:
+            numeric.append(field)
+        if field_choices:
+            choices[field] = field_choices
+        # Lists no kept object is in, e.g. of object types, cannot resolve
+        field_lists = [
+            name
+            for name in field_schema.get("object_list", [])
+            if lists is not None and name in lists
+        ]
+        if field_lists:
+            object_lists[field] = field_lists
+            group = extensibles if field in extensibles else fields
+            paired = type_field(field, group)
+            if paired:
+                object_types[field] = paired
+    if numeric:
+        info["numeric"] = numeric
+    if choices:
+        info["choices"] = choices
+    if lists is None:
+        return info
+    references = schema.get("name", {}).get("reference", [])
+    if references:
+        info["references"] = references
+    if object_lists:
+        info["object_lists"] = object_lists
+    if object_types:
+        info["object_types"] = object_types
+    return info
+
+
+# Load in the keys to keep from schema
+keys = Path("keys.txt").read_text().splitlines()
+
+# load schema
+with open("Energy+.schema.epJSON") as f:
+    schema = json.load(f)
+
+# Object lists the kept objects are in
+lists = {
+    name
+    for key, value in schema["properties"].items()
+    if key in keys
+    for name in value.get("name", {}).get("reference", [])
+}
+
+idd = {
+    key: object_info(value, lists)
+    for key, value in sorted(schema["properties"].items())
+    if key in keys
+}
+
+unknown_idd = {
+    key: object_info(value)
+    for key, value in sorted(schema["properties"].items())
+    if key not in keys
+}
+
+source = f'''"""
+IDD metadata of the EnergyPlus model objects.
+
+Generated by codegen/genidd.py from Energy+.schema.epJSON, do not edit.
+"""
+
+from typing import Any, Dict, FrozenSet
+
+IDD: Dict[str, Dict[str, Any]] = {idd!r}
+
+# Every epJSON object type of the schema, including those outside keys.txt
+SCHEMA_OBJECT_TYPES: FrozenSet[str] = frozenset({sorted(schema["properties"])!r})
+'''
+Path("idd.py").write_text(black.format_str(source, mode=black.Mode()))
+
+source = f'''"""
+IDD metadata of the epJSON object types outside keys.txt: field order,
+numeric fields and choices only, to read and write their objects as raw
+epJSON data. Kept apart from epmodel.idd, as only IDF needs it.
+
+Generated by codegen/genidd.py from Energy+.schema.epJSON, do not edit.
+"""
+
+from typing import Any, Dict
+
+UNKNOWN_IDD: Dict[str, Dict[str, Any]] = {unknown_idd!r}
+'''
+Path("unknown_idd.py").write_text(black.format_str(source, mode=black.Mode()))
@@ -0,0 +1,85 @@
+"""
+Base class of the generated EnergyPlus models.
+
+codegen.py generates every model of epmodel.epmodel from TrackedModel,
+which reports assignments to its fields to an owner, if it has one. An
+EnergyPlusModel that tracks changes owns its objects and everything
+nested in them, see EnergyPlusModel.checkpoint.
+
+The owner is kept in a slot rather than a private attribute, so it is not
+compared, dumped, copied or pickled along with the model.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional, Protocol, Tuple, get_args
+
+from pydantic import BaseModel
+
+
+class Owner(Protocol):
+    def field_set(self, obj: "TrackedModel", name: str, old: Any, new: Any) -> None:
+        """Called after a field of an owned model is assigned to."""
+
+
+class TrackedModel(BaseModel):
+    """BaseModel that reports field assignments to its owner."""
+
+    __slots__ = ("__epmodel_owner__",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        owner = get_owner(self)
+        if owner is None:
+            super().__setattr__(name, value)
+            return
+        old = self.__dict__.get(name)
+        super().__setattr__(name, value)
+        set_owner(old, None)
+        set_owner(value, owner)
+        owner.field_set(self, name, old, value)
+
+
+_OWNER = TrackedModel.__dict__["__epmodel_owner__"]
+
+
+def get_owner(obj: TrackedModel) -> Optional[Owner]:
+    """Get the owner of a model, None if it has none."""
+    try:
+        return _OWNER.__get__(obj)
+    except AttributeError:
+        return None
+
+
+def _mentions_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_mentions_model(arg) for arg in get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(cls: type) -> Tuple[str, ...]:
+    """Fields of a model class that can hold models."""
+    return tuple(
+        name
+        for name, field in cls.model_fields.items()
+        if _mentions_model(field.annotation)
+    )
+
+
+def set_owner(value: Any, owner: Optional[Owner]) -> None:
+    """Set the owner of a model and of the models nested in it.
+
+    Args:
+        value: model, or list or dictionary of models. Anything else is
+            ignored.
+        owner: the new owner, None to remove it
+    """
+    if isinstance(value, TrackedModel):
+        _OWNER.__set__(value, owner)
+        for name in _nested_fields(type(value)):
+            set_owner(value.__dict__.get(name), owner)
+    elif isinstance(value, list):
+        for item in value:
+            set_owner(item, owner)
+    elif isinstance(value, dict):
+        for item in value.values():
+            set_owner(item, owner)
@@ -3,12 +3,37 @@ Functions: helper function usually to create base level components
 Classes: Factory class to create systems
 """
 
+import json
+import warnings
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError
 
 from epmodel import epmodel as epm
+from epmodel.base import set_owner
+from epmodel.hashing import combine_hashes, hash_data, hash_object
+from epmodel.journal import Journal, ObjectOwner
+from epmodel.names import NameIndex
+from epmodel.references import (
+    ROOT_TYPES,
+    ReferenceGraph,
+    build_reference_graph,
+    find_unreachable,
+    set_reference,
+    unknown_referrers,
+)
+from epmodel.sections import (
+    ERROR_TITLE,
+    SECTIONS,
+    get_section,
+    observing,
+    raise_errors,
+    revalidate_object,
+    unknown_sections,
+    validate_section,
+    validate_sections,
+)
 
 
 class Spectrum(Enum):
@@ -112,8 +137,535 @@ def build_matrix_two_dimension(matrix: List[List[float]]) -> epm.MatrixTwoDimens
     )
 
 
+class _Document(epm.EnergyPlusModel):
+    """epJSON document, with the sections outside EnergyPlusModel as extra
+    fields, so that they are read in the same pass as JSON."""
+
+    model_config = ConfigDict(extra="allow", title=ERROR_TITLE)
+
+
 class EnergyPlusModel(epm.EnergyPlusModel):
-    """EnergyPlusModel with builder methods to add systems."""
+    """EnergyPlusModel with builder methods to add systems.
+
+    Sections can be held as raw data and validated on first access,
+    see epmodel.loader.validate_lazy.
+
+    Objects added with add and sections assigned to are tracked, so that
+    revalidate only checks what changed since the last validation.
+
+    Sections of object types outside keys.txt are kept as raw JSON data
+    by model_validate, model_validate_json and the loaders, never parsed
+    into models, and written back as is by epmodel.epjson. Other unknown
+    keys are ignored, and unknown attributes cannot be set.
+
+    Content hashes of objects and sections are cached, and dropped along
+    with the tracking above, see content_hash.
+
+    Once the model tracks its objects, assignments to the fields of
+    objects and of the models nested in them mark the objects dirty, see
+    track_objects. After checkpoint, every change is also journaled, so
+    it can be undone and redone, see changes_since and undo.
+
+    Objects can be found by name in constant time, see find, and renamed
+    along with the references to them, see rename.
+    """
+
+    _pending_sections: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    # field name -> names of touched objects, None if the whole section
+    _dirty: Dict[str, Optional[Set[str]]] = PrivateAttr(default_factory=dict)
+    # field name -> object name -> object hash
+    _object_hashes: Dict[str, Dict[str, str]] = PrivateAttr(default_factory=dict)
+    # field name -> section hash
+    _section_hashes: Dict[str, str] = PrivateAttr(default_factory=dict)
+    # Whether the model owns its objects, see track_objects
+    _owned: bool = PrivateAttr(default=False)
+    # Changes since the first checkpoint, None if not tracking
+    _journal: Optional[Journal] = PrivateAttr(default=None)
+    # Built on first use, see find
+    _name_index: Optional[NameIndex] = PrivateAttr(default=None)
+    # Built on first use and dropped on changes, see reference_graph
+    _reference_graph: Optional[ReferenceGraph] = PrivateAttr(default=None)
+    # epJSON object type -> raw data, for object types outside keys.txt
+    _unknown_sections: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> "EnergyPlusModel":
+        """Validate epJSON data, keeping the sections of object types
+        outside EnergyPlusModel, see epmodel.sections.unknown_sections.
+
+        While a validation observer is registered, e.g. a
+        ValidationProfiler, sections are validated one at a time so that
+        each of them is seen, with the same result and errors.
+        """
+        if isinstance(obj, dict) and not kwargs and observing():
+            return cls._validate_observed(obj)
+        model = super().model_validate(obj, **kwargs)
+        if isinstance(obj, dict):
+            model._unknown_sections = unknown_sections(obj)
+        return model
+
+    @classmethod
+    def model_validate_json(
+        cls, json_data: Union[str, bytes, bytearray], **kwargs: Any
+    ) -> "EnergyPlusModel":
+        """Validate epJSON text in a single pass, keeping the sections of
+        object types outside EnergyPlusModel.
+
+        While a validation observer is registered, the text is parsed
+        first and validated as by model_validate.
+        """
+        if not kwargs and observing():
+            return cls._validate_observed(json.loads(json_data))
+        document = _Document.model_validate_json(json_data, **kwargs)
+        model = cls.model_construct(document.model_fields_set, **document.__dict__)
+        model._unknown_sections = unknown_sections(document.__pydantic_extra__)
+        return model
+
+    @classmethod
+    def _validate_observed(cls, data: Dict[str, Any]) -> "EnergyPlusModel":
+        """Validate epJSON data section by section, in field order."""
+        validated = {}
+        line_errors: List[Dict[str, Any]] = []
+        for field_name, section in SECTIONS.items():
+            if section.object_type in data:
+                try:
+                    validated[section.object_type] = validate_section(
+                        field_name, data[section.object_type]
+                    )
+                except ValidationError as exc:
+                    line_errors.extend(exc.errors(include_url=False))
+            elif section.required:
+                line_errors.append(
+                    {"type": "missing", "loc": (section.object_type,), "input": data}
+                )
+        raise_errors(line_errors)
+        model = cls.model_construct(**validated)
+        model._unknown_sections = unknown_sections(data)
+        return model
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            pending = private["_pending_sections"]
+        except (AttributeError, KeyError, TypeError):
+            pending = None
+        if pending and name in pending:
+            value = validate_section(name, pending[name])
+            del pending[name]
+            self.__dict__[name] = value
+            self._own(name, value)
+            return value
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__pydantic_private__ and name in SECTIONS:
+            journal = self._journal
+            if journal is not None:
+                old = getattr(self, name)
+            else:
+                old = self.__dict__.get(name)
+            self._pending_sections.pop(name, None)
+            self._dirty[name] = None
+            self._object_hashes.pop(name, None)
+            self._section_hashes.pop(name, None)
+            super().__setattr__(name, value)
+            self._reference_graph = None
+            if self._name_index is not None:
+                self._name_index.set_section(name, self.__dict__[name] or {})
+            if self._owned:
+                set_owner(old, None)
+                self._own(name, self.__dict__[name])
+            if journal is not None:
+                journal.section_replaced(name, old, self.__dict__[name])
+            return
+        super().__setattr__(name, value)
+
+    def mark_dirty(self, objkey: str, objname: Optional[str] = None) -> None:
+        """Mark an object, or a whole section, to be checked by revalidate.
+
+        Assignments to the fields of objects are marked automatically once
+        the model tracks its objects, see track_objects. Other changes made
+        in place, to the section dictionaries or to lists, should be marked.
+        Marking also drops the cached content hashes of the objects, and
+        updates the name index for objects added to or deleted from the
+        section dictionary directly.
+
+        Args:
+            objkey: key of object in EnergyPlusModel
+            objname: name of the object, the whole section if None
+        """
+        field_name = get_section(objkey).field_name
+        # Called for every tracked change, so private attributes are read
+        # from their dictionary rather than through __getattr__
+        private = self.__pydantic_private__
+        private["_section_hashes"].pop(field_name, None)
+        private["_reference_graph"] = None
+        index = private["_name_index"]
+        if objname is None:
+            private["_dirty"][field_name] = None
+            private["_object_hashes"].pop(field_name, None)
+            if index is not None:
+                index.set_section(field_name, self._section_names(field_name))
+        else:
+            names = private["_dirty"].setdefault(field_name, set())
+            if names is not None:
+                names.add(objname)
+            private["_object_hashes"].get(field_name, {}).pop(objname, None)
+            if index is not None:
+                if objname in self._section_names(field_name):
+                    index.add(field_name, objname)
+                else:
+                    index.discard(field_name, objname)
+
+    def _section_names(self, field_name: str) -> Dict[str, Any]:
+        """Objects of a section by name, as models or raw data."""
+        pending = self.__pydantic_private__["_pending_sections"]
+        if field_name in pending:
+            return pending[field_name] or {}
+        return self.__dict__.get(field_name) or {}
+
+    def _names(self) -> NameIndex:
+        index = self._name_index
+        if index is None:
+            index = NameIndex()
+            for field_name in SECTIONS:
+                index.set_section(field_name, self._section_names(field_name))
+            self._name_index = index
+        return index
+
+    def find(self, objname: str) -> Dict[str, Any]:
+        """Find the objects of a name, compared case-insensitively.
+
+        The first lookup indexes the names of the model, in time
+        proportional to its size. The index is then kept up to date by
+        add, remove, section assignment and mark_dirty, so lookups take
+        constant time.
+
+        Args:
+            objname: name of the objects
+
+        Returns:
+            epJSON object type -> object, for every section with an object
+            of the name
+        """
+        index = self._names()
+        objects = {}
+        for field_name in index.fields(objname):
+            section = getattr(self, field_name)
+            objects[SECTIONS[field_name].object_type] = section[
+                index.get(field_name, objname)
+            ]
+        return objects
+
+    def canonical_name(self, objkey: str, objname: str) -> Optional[str]:
+        """Spelling in the model of an object name, compared
+        case-insensitively, e.g. to check a new name for collisions.
+
+        Args:
+            objkey: key of object in EnergyPlusModel
+            objname: name of the object
+
+        Returns:
+            Name of the object in the section, None if there is none
+        """
+        return self._names().get(get_section(objkey).field_name, objname)
+
+    def get_object(self, objkey: str, objname: str) -> Any:
+        """Get an object by name, compared case-insensitively.
+
+        Args:
+            objkey: key of object in EnergyPlusModel
+            objname: name of the object
+
+        Returns:
+            The object
+
+        Raises:
+            KeyError: If there is no such object.
+        """
+        field_name = get_section(objkey).field_name
+        name = self._names().get(field_name, objname)
+        if name is None:
+            raise KeyError(objname)
+        return getattr(self, field_name)[name]
+
+    def object_hash(self, objkey: str, objname: str) -> str:
+        """Canonical content hash of an object, see epmodel.hashing.
+
+        Args:
+            objkey: key of object in EnergyPlusModel
+            objname: name of the object
+
+        Returns:
+            Hex digest
+
+        Raises:
+            KeyError: If there is no such object.
+        """
+        field_name = get_section(objkey).field_name
+        self.track_objects()
+        hashes = self._object_hashes.setdefault(field_name, {})
+        digest = hashes.get(objname)
+        if digest is None:
+            section = getattr(self, field_name) or {}
+            digest = hash_object(field_name, objname, section[objname])
+            hashes[objname] = digest
+        return digest
+
+    def section_hash(self, objkey: str) -> str:
+        """Canonical content hash of a section, independent of object order.
+
+        An empty section hashes the same as a missing one.
+
+        Args:
+            objkey: key of object in EnergyPlusModel
+
+        Returns:
+            Hex digest
+        """
+        field_name = get_section(objkey).field_name
+        self.track_objects()
+        digest = self._section_hashes.get(field_name)
+        if digest is None:
+            section = getattr(self, field_name) or {}
+            hashes = self._object_hashes.setdefault(field_name, {})
+            for name, obj in section.items():
+                if name not in hashes:
+                    hashes[name] = hash_object(field_name, name, obj)
+            digest = combine_hashes({name: hashes[name] for name in section})
+            self._section_hashes[field_name] = digest
+        return digest
+
+    def content_hash(self) -> str:
+        """Canonical content hash of the model, e.g. to deduplicate runs.
+
+        Equal for models with the same objects, whatever the order of
+        objects and sections or how they were loaded. Object and section
+        hashes are cached, so after an edit only the touched objects are
+        hashed again. Hashing tracks the objects of the model, see
+        track_objects, so assigning to their fields drops their hashes.
+        Changes made in place to section dictionaries or lists must be
+        marked with mark_dirty.
+
+        Returns:
+            Hex digest
+        """
+        hashes = {}
+        for field_name, section in SECTIONS.items():
+            if self._pending_sections.get(field_name) or self.__dict__.get(field_name):
+                hashes[section.object_type] = self.section_hash(field_name)
+        for object_type, objects in self._unknown_sections.items():
+            hashes[object_type] = hash_data(objects)
+        return combine_hashes(hashes)
+
+    def reference_graph(self) -> ReferenceGraph:
+        """References between the objects of the model, see
+        epmodel.references.
+
+        The graph is cached until the model changes, objects changed in
+        place being marked with mark_dirty.
+
+        Returns:
+            ReferenceGraph of the model
+        """
+        graph = self._reference_graph
+        if graph is None:
+            graph = self._reference_graph = build_reference_graph(self)
+        return graph
+
+    def rename(self, objkey: str, old: str, new: str) -> int:
+        """Rename an object and every reference to it.
+
+        Only the fields referencing the object are updated, found through
+        the reverse edges of the reference graph, which rename keeps up to
+        date, so a series of renames takes time proportional to the
+        references renamed once the graph is built. The object is moved to
+        its new name in the same section dictionary, at its end. Each
+        change is tracked like any other, see checkpoint.
+
+        The sections of object types outside EnergyPlusModel are kept as
+        raw data and their fields are not known, so they are not updated.
+        A warning lists those holding the old name, which may reference
+        the object, see epmodel.references.unknown_referrers.
+
+        Args:
+            objkey: key of object in EnergyPlusModel
+            old: name of the object, compared case-insensitively
+            new: new name of the object
+
+        Returns:
+            Number of references updated
+
+        Raises:
+            KeyError: If there is no such object.
+            ValueError: If another object of the section has the new name.
+        """
+        section = get_section(objkey)
+        field_name = section.field_name
+        name = self.canonical_name(field_name, old)
+        if name is None:
+            raise KeyError(old)
+        existing = self.canonical_name(field_name, new)
+        if existing is not None and existing != name:
+            raise ValueError(f"{section.object_type} {existing!r} already exists")
+        unknown = unknown_referrers(self, name)
+        if unknown:
+            warnings.warn(
+                f"{name!r} is not renamed in the sections of unknown object "
+                f"types {', '.join(unknown)}, which may reference it"
+            )
+        graph = self.reference_graph()
+        referrers = graph.referrers(section.object_type, name)
+        for reference in referrers:
+            set_reference(self, reference, new)
+        if new != name:
+            self.add(field_name, new, self.remove(field_name, name))
+        graph.rename(section.object_type, name, new)
+        self._reference_graph = graph
+        return len(referrers)
+
+    def prune(
+        self, roots: Optional[Iterable[str]] = None, dry_run: bool = False
+    ) -> Dict[str, List[str]]:
+        """Remove the objects not reachable from the roots of the model.
+
+        Mark and sweep over the reference graph, see
+        epmodel.references.find_unreachable: unused schedules, materials,
+        curves, matrices and the like are removed, while zones, surfaces,
+        loops, outputs and the objects no field can reference are kept,
+        along with everything they reference. Each removal is tracked like
+        any other, see checkpoint.
+
+        Args:
+            roots: epJSON object types to start from, ROOT_TYPES if None
+            dry_run: only report the objects that would be removed
+
+        Returns:
+            epJSON object type -> names of the objects removed
+        """
+        unreachable = find_unreachable(self, ROOT_TYPES if roots is None else roots)
+        if not dry_run:
+            for object_type, names in unreachable.items():
+                field_name = get_section(object_type).field_name
+                for name in names:
+                    self.remove(field_name, name)
+        return unreachable
+
+    def revalidate(self) -> None:
+        """Validate what changed since the last validation.
+
+        Only the objects and sections marked dirty, and sections still
+        held as raw data, are checked, so the cost is proportional to the
+        edits rather than the size of the model. Objects added as raw
+        data are replaced by their validated models.
+
+        Raises:
+            ValidationError: If any touched object is invalid. Errors are
+                reported together, and the invalid objects stay dirty.
+        """
+        self.validate_pending()
+        dirty = self._dirty
+        line_errors = []
+        for field_name in sorted(dirty, key=lambda name: SECTIONS[name].index):
+            section = self.__dict__[field_name]
+            if not isinstance(section, dict):
+                try:
+                    validate_section(field_name, section)
+                    del dirty[field_name]
+                except ValidationError as exc:
+                    line_errors.extend(exc.errors(include_url=False))
+                continue
+            names = dirty[field_name]
+            failed = set()
+            for name in section if names is None else sorted(names):
+                if name not in section:
+                    continue
+                try:
+                    obj = revalidate_object(field_name, name, section[name])
+                    if obj is not section[name]:
+                        section[name] = obj
+                        self._own(field_name, {name: obj})
+                except ValidationError as exc:
+                    line_errors.extend(exc.errors(include_url=False))
+                    failed.add(name)
+            if failed:
+                dirty[field_name] = failed
+            else:
+                del dirty[field_name]
+        raise_errors(line_errors)
+
+    def validate_pending(self) -> None:
+        """Validate all sections that are still held as raw data.
+
+        Raises:
+            ValidationError: If any pending section is invalid. Errors of
+                all pending sections are reported together.
+        """
+        pending = self._pending_sections
+        if pending:
+            sections = validate_sections(pending)
+            self.__dict__.update(sections)
+            pending.clear()
+            for field_name, section in sections.items():
+                self._own(field_name, section)
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        self.validate_pending()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        self.validate_pending()
+        return super().model_dump_json(**kwargs)
+
+    def __iter__(self):
+        self.validate_pending()
+        return super().__iter__()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, EnergyPlusModel):
+            return super().__eq__(other)
+        self.validate_pending()
+        other.validate_pending()
+        # Compared by content, the other private attributes are caches
+        # and tracking state
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self._unknown_sections == other._unknown_sections
+        )
+
+    def __copy__(self):
+        self.validate_pending()
+        copied = super().__copy__()
+        copied._journal = None
+        copied._name_index = None
+        copied._reference_graph = None
+        copied._unknown_sections = dict(self._unknown_sections)
+        return copied
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        state = super().__getstate__()
+        # Owners are not pickled, so neither is the journal relying on them
+        state["__pydantic_private__"] = {
+            **state["__pydantic_private__"],
+            "_journal": None,
+        }
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        if self._owned:
+            self._owned = False
+            self.track_objects()
+
+    def __deepcopy__(self, memo=None):
+        self.validate_pending()
+        copied = super().__deepcopy__(memo)
+        # Owners are not copied, the copy owns its own objects
+        if copied._owned:
+            copied._owned = False
+            copied.track_objects()
+        return copied
 
     def add(self, objkey, objname, obj):
         """Add object to EnergyPlusModel.
@@ -125,10 +677,162 @@ class EnergyPlusModel(epm.EnergyPlusModel):
             objname: name of the object
             obj: object to add
         """
-        if getattr(self, objkey) is None:
+        section = getattr(self, objkey)
+        if section is None:
             setattr(self, objkey, {objname: obj})
         else:
-            getattr(self, objkey)[objname] = obj
+            old = section.get(objname)
+            section[objname] = obj
+            self.mark_dirty(objkey, objname)
+            field_name = get_section(objkey).field_name
+            self._replace_owner(field_name, objname, old, obj)
+            if self._journal is not None:
+                self._journal.object_replaced(field_name, objname, old, obj)
+
+    def remove(self, objkey: str, objname: str) -> Any:
+        """Remove an object from EnergyPlusModel.
+
+        Args:
+            objkey: key of object in EnergyPlusModel
+            objname: name of the object
+
+        Returns:
+            The object removed
+
+        Raises:
+            KeyError: If there is no such object.
+        """
+        section = getattr(self, objkey)
+        if not section or objname not in section:
+            raise KeyError(objname)
+        obj = section.pop(objname)
+        self.mark_dirty(objkey, objname)
+        field_name = get_section(objkey).field_name
+        self._replace_owner(field_name, objname, obj, None)
+        if self._journal is not None:
+            self._journal.object_replaced(field_name, objname, obj, None)
+        return obj
+
+    def track_objects(self) -> None:
+        """Own every object of the model, so that changes to them are seen.
+
+        From then on, assignments to the fields of objects, or of the
+        models nested in them, mark the objects dirty, see mark_dirty, so
+        revalidate, the content hashes and save_sharded see them without
+        being told. Objects added, sections assigned to and sections still
+        held as raw data are owned as they enter the model. Owning every
+        object takes time proportional to the size of the model, once.
+        """
+        if not self._owned:
+            self._owned = True
+            for field_name in SECTIONS:
+                self._own(field_name, self.__dict__.get(field_name))
+
+    def _own(self, field_name: str, section: Optional[Dict[str, Any]]) -> None:
+        """Own the objects of a section, if the model tracks its objects."""
+        if self.__pydantic_private__["_owned"]:
+            for name, obj in (section or {}).items():
+                set_owner(obj, ObjectOwner(self, field_name, name))
+
+    def _replace_owner(self, field_name: str, objname: str, old: Any, new: Any) -> None:
+        """Disown an object replaced or removed, and own the new one."""
+        if self.__pydantic_private__["_owned"]:
+            set_owner(old, None)
+            if new is not None:
+                self._own(field_name, {objname: new})
+
+    def checkpoint(self) -> int:
+        """Start tracking changes, or mark the current point if tracking.
+
+        The first checkpoint tracks the objects of the model, see
+        track_objects. From then on, objects added or removed with add and
+        remove, sections assigned to, and fields assigned on objects or on
+        the models nested in them are journaled and marked dirty, so
+        revalidate, the content hashes and save_sharded only redo the work
+        for what changed.
+
+        Changes made to the section dictionaries directly, or to lists in
+        place, are not seen and should be marked with mark_dirty.
+
+        Returns:
+            Checkpoint, for changes_since and rollback
+        """
+        self.track_objects()
+        journal = self._journal
+        if journal is None:
+            journal = self._journal = Journal(self)
+        return journal.sequence
+
+    def changes_since(self, checkpoint: int) -> Dict[str, Optional[Set[str]]]:
+        """Objects added, removed or changed since a checkpoint, including
+        by undo and redo.
+
+        Args:
+            checkpoint: as returned by checkpoint
+
+        Returns:
+            Field name -> names of the objects touched, None if the whole
+            section was assigned to
+
+        Raises:
+            RuntimeError: If changes are not tracked.
+        """
+        return self._tracking().changes_since(checkpoint)
+
+    def undo(self, steps: int = 1) -> int:
+        """Undo the last changes tracked, one change per step.
+
+        Args:
+            steps: number of changes to undo
+
+        Returns:
+            Number of changes undone, fewer than steps if there are no more
+
+        Raises:
+            RuntimeError: If changes are not tracked.
+        """
+        return self._tracking().undo(steps)
+
+    def redo(self, steps: int = 1) -> int:
+        """Redo the last changes undone. Any new change drops them.
+
+        Args:
+            steps: number of changes to redo
+
+        Returns:
+            Number of changes redone, fewer than steps if there are no more
+
+        Raises:
+            RuntimeError: If changes are not tracked.
+        """
+        return self._tracking().redo(steps)
+
+    def rollback(self, checkpoint: int) -> int:
+        """Undo every change made or redone since a checkpoint.
+
+        Args:
+            checkpoint: as returned by checkpoint
+
+        Returns:
+            Number of changes undone
+
+        Raises:
+            RuntimeError: If changes are not tracked.
+        """
+        return self._tracking().rollback(checkpoint)
+
+    def stop_tracking(self) -> None:
+        """Stop journaling changes and drop the journal.
+
+        Objects stay tracked, see track_objects, so their changes are
+        still marked dirty.
+        """
+        self._journal = None
+
+    def _tracking(self) -> Journal:
+        if self._journal is None:
+            raise RuntimeError("Changes are not tracked, call checkpoint first")
+        return self._journal
 
     def add_construction_complex_fenestration_state(
         self,
@@ -154,9 +858,10 @@ class EnergyPlusModel(epm.EnergyPlusModel):
 
         # Set the all fenestration surface constructions to the 1st cfs
         first_cfs = next(iter(self.construction_complex_fenestration_state.keys()))
-        for window in self.fenestration_surface_detailed.values():
+        for window_name, window in self.fenestration_surface_detailed.items():
             if window.surface_type.value == "Window":
                 window.construction_name = first_cfs
+                self.mark_dirty("fenestration_surface_detailed", window_name)
 
 
 class ConstructionComplexFenestrationStateBuilder:
@@ -0,0 +1,75 @@
+"""
+Transparent compression of model files with the stdlib codecs.
+
+The codec is inferred from the file suffix: .gz (gzip), .bz2 (bz2), and
+.xz or .lzma (lzma). Compressed files are opened as text streams, so they
+are decompressed, or compressed, as they are read or written.
+"""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Optional, Tuple, Union
+
+COMPRESSIONS = ("gzip", "bz2", "lzma")
+
+_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"}
+_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "lzma": lzma.open}
+
+
+def resolve_compression(
+    path: Union[str, Path], compression: Optional[str] = "infer"
+) -> Optional[str]:
+    """Get the codec of a file.
+
+    Args:
+        path: path to the file
+        compression: one of COMPRESSIONS, None for none, or infer to use
+            the file suffix
+
+    Returns:
+        One of COMPRESSIONS, or None if the file is not compressed
+    """
+    if compression == "infer":
+        return _SUFFIXES.get(Path(path).suffix.lower())
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression}, expected one of {COMPRESSIONS}"
+        )
+    return compression
+
+
+def open_text(
+    path: Union[str, Path], mode: str = "r", compression: Optional[str] = "infer"
+) -> IO[str]:
+    """Open a file as text, compressed or not.
+
+    Args:
+        path: path to the file
+        mode: r to read or w to write
+        compression: one of COMPRESSIONS, None for none, or infer to use
+            the file suffix
+
+    Returns:
+        Text file object
+    """
+    codec = resolve_compression(path, compression)
+    if codec is None:
+        return open(path, mode)
+    return _OPENERS[codec](path, mode + "t")
+
+
+def open_source(source: Union[str, Path, IO[str]]) -> Tuple[IO[str], bool]:
+    """Open a path or pass through a text file object to read from.
+
+    Args:
+        source: path to a file, compressed or not, or a text file object
+
+    Returns:
+        Tuple of the text file object and whether the caller opened it, and
+        so must close it once read
+    """
+    if isinstance(source, (str, Path)):
+        return open_text(source, "r"), True
+    return source, False
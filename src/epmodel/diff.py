@@ -0,0 +1,154 @@
+"""
+Object-level structural diff between two EnergyPlusModel objects.
+
+Sections, then objects, are compared by their cached content hashes (see
+EnergyPlusModel.content_hash) where available, so unchanged sections are
+skipped without looking at their objects, and only the objects that
+differ are dumped to find the changed fields.
+"""
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from epmodel.builder import EnergyPlusModel
+from epmodel.sections import SECTIONS
+
+
+class FieldChange(BaseModel):
+    """A changed field of an epJSON object, in epJSON form."""
+
+    # epJSON field name, e.g. vertices for the whole extensible list
+    field: str
+    # None if the field was not set
+    old: Any = None
+    new: Any = None
+
+
+class ModelDiff(BaseModel):
+    """Differences between two EnergyPlusModel objects."""
+
+    # epJSON object type -> names of the objects only in the new model
+    added: Dict[str, List[str]] = {}
+    # epJSON object type -> names of the objects only in the old model
+    removed: Dict[str, List[str]] = {}
+    # epJSON object type -> object name -> changed fields
+    modified: Dict[str, Dict[str, List[FieldChange]]] = {}
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.modified)
+
+    @property
+    def object_types(self) -> List[str]:
+        """epJSON object types with any difference."""
+        return sorted({*self.added, *self.removed, *self.modified})
+
+
+def _dump(obj: Any) -> Dict[str, Any]:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(
+            mode="json", by_alias=True, exclude_none=True, warnings=False
+        )
+    return obj
+
+
+def diff_objects(old: Any, new: Any) -> List[FieldChange]:
+    """Compare two epJSON objects field by field.
+
+    Args:
+        old: object model or epJSON data
+        new: object model or epJSON data
+
+    Returns:
+        Changed fields, in the field order of old then new
+    """
+    old_data = _dump(old)
+    new_data = _dump(new)
+    changes = []
+    for field in {**old_data, **new_data}:
+        old_value = old_data.get(field)
+        new_value = new_data.get(field)
+        if old_value != new_value:
+            changes.append(FieldChange(field=field, old=old_value, new=new_value))
+    return changes
+
+
+def _diff_section(
+    diff: ModelDiff,
+    object_type: str,
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    old_hashes: Dict[str, str],
+    new_hashes: Dict[str, str],
+) -> None:
+    added = [name for name in new if name not in old]
+    removed = [name for name in old if name not in new]
+    modified = {}
+    for name, old_obj in old.items():
+        new_obj = new.get(name)
+        if new_obj is None or new_obj is old_obj:
+            continue
+        old_hash = old_hashes.get(name)
+        new_hash = new_hashes.get(name)
+        if old_hash is not None and new_hash is not None:
+            if old_hash == new_hash:
+                continue
+        elif old_obj == new_obj:
+            continue
+        changes = diff_objects(old_obj, new_obj)
+        if changes:
+            modified[name] = changes
+    if added:
+        diff.added[object_type] = added
+    if removed:
+        diff.removed[object_type] = removed
+    if modified:
+        diff.modified[object_type] = modified
+
+
+def diff_models(old: EnergyPlusModel, new: EnergyPlusModel) -> ModelDiff:
+    """Compare two models object by object.
+
+    Sections and objects are skipped when their content hashes are
+    cached on both models and equal, and compared with == otherwise, so
+    nothing is hashed that was not hashed already. Hash the baseline once
+    with content_hash to compare many variants of it cheaply.
+
+    Args:
+        old: baseline model
+        new: changed model
+
+    Returns:
+        ModelDiff with added, removed and modified objects per epJSON
+        object type
+    """
+    diff = ModelDiff()
+    for field_name, section in SECTIONS.items():
+        old_section = getattr(old, field_name) or {}
+        new_section = getattr(new, field_name) or {}
+        if old_section is new_section:
+            continue
+        old_hash = old._section_hashes.get(field_name)
+        new_hash = new._section_hashes.get(field_name)
+        if old_hash is not None and new_hash is not None:
+            if old_hash == new_hash:
+                continue
+        elif old_section == new_section:
+            continue
+        _diff_section(
+            diff,
+            section.object_type,
+            old_section,
+            new_section,
+            old._object_hashes.get(field_name, {}),
+            new._object_hashes.get(field_name, {}),
+        )
+    old_extra = old._unknown_sections
+    new_extra = new._unknown_sections
+    for object_type in {**old_extra, **new_extra}:
+        old_section = old_extra.get(object_type) or {}
+        new_section = new_extra.get(object_type) or {}
+        if old_section != new_section:
+            _diff_section(diff, object_type, old_section, new_section, {}, {})
+    return diff
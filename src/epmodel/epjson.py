@@ -0,0 +1,248 @@
+"""
+Reading and writing epJSON files.
+
+The JSON backend is pluggable:
+
+* pydantic: parse and validate in a single pass with pydantic-core
+  (model_validate_json / model_dump_json)
+* orjson: parse with orjson, if installed
+* json: parse with the standard library
+
+The default, auto, picks the fastest backend available for the call.
+
+write_epjson streams a model to a file handle one object at a time.
+
+Files ending in .gz, .bz2, .xz or .lzma are compressed with the matching
+stdlib codec, see epmodel.compression. They are parsed incrementally as
+they are decompressed, and written with write_epjson as they are
+compressed, so neither the whole text nor the whole compressed content is
+ever held in memory.
+"""
+
+import io
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Optional, Union
+
+from epmodel.builder import EnergyPlusModel
+from epmodel.compression import open_text, resolve_compression
+from epmodel.loader import select_sections, validate_lazy
+from epmodel.sections import SECTIONS
+from epmodel.stream import read_epjson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+BACKENDS = ("auto", "pydantic", "orjson", "json")
+
+
+def _check_backend(backend: str) -> None:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend}, expected one of {BACKENDS}")
+    if backend == "orjson" and orjson is None:
+        raise ImportError("orjson backend requires the orjson package")
+
+
+def loads(content: Union[str, bytes], backend: str = "auto") -> Dict[str, Any]:
+    """Parse epJSON text into a dictionary.
+
+    Args:
+        content: epJSON text
+        backend: orjson, json or auto
+
+    Returns:
+        epJSON data
+    """
+    _check_backend(backend)
+    if backend == "pydantic":
+        raise ValueError("pydantic backend does not parse into a dictionary")
+    if backend == "orjson" or (backend == "auto" and orjson is not None):
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def load_epjson(
+    path: Union[str, Path],
+    backend: str = "auto",
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    lazy: bool = False,
+    compression: Optional[str] = "infer",
+) -> EnergyPlusModel:
+    """Load and validate an epJSON file.
+
+    Args:
+        path: path to the epJSON file
+        backend: JSON backend, one of auto, pydantic, orjson or json.
+            Compressed files are always parsed incrementally with json.
+        include: epJSON object types to validate, see
+            epmodel.loader.select_sections
+        exclude: epJSON object types to skip
+        lazy: validate sections on first access, see
+            epmodel.loader.validate_lazy
+        compression: gzip, bz2, lzma, None for none, or infer from the
+            file suffix
+
+    Returns:
+        EnergyPlusModel object
+
+    Raises:
+        ValidationError: If the model is invalid.
+    """
+    _check_backend(backend)
+    selective = include is not None or exclude is not None
+    codec = resolve_compression(path, compression)
+    if codec is not None:
+        with open_text(path, "r", codec) as f:
+            data = read_epjson(f)
+    else:
+        content = Path(path).read_bytes()
+        if backend in ("auto", "pydantic") and not (selective or lazy):
+            return EnergyPlusModel.model_validate_json(content)
+        if backend == "pydantic":
+            raise ValueError(
+                "pydantic backend does not support include, exclude or lazy"
+            )
+        data = loads(content, backend)
+    if selective:
+        data = select_sections(data, include, exclude)
+    if lazy:
+        return validate_lazy(data)
+    return EnergyPlusModel.model_validate(data)
+
+
+def dumps(
+    model: EnergyPlusModel, backend: str = "auto", indent: Optional[int] = 4
+) -> bytes:
+    """Dump an EnergyPlusModel to epJSON text.
+
+    Fields left as None are omitted. Sections of object types outside
+    EnergyPlusModel are written after the others.
+
+    Args:
+        model: EnergyPlusModel object
+        backend: JSON backend, one of auto, pydantic, orjson or json
+        indent: indentation, None for compact output. orjson only
+            supports an indentation of 2.
+
+    Returns:
+        epJSON text
+    """
+    _check_backend(backend)
+    if backend in ("auto", "pydantic"):
+        if model._unknown_sections:
+            # Not fields of the model, so not dumped by pydantic-core
+            f = io.StringIO()
+            write_epjson(model, f, indent)
+            return f.getvalue().encode()
+        return model.model_dump_json(
+            by_alias=True, exclude_none=True, indent=indent
+        ).encode()
+    data = model.model_dump(mode="json", by_alias=True, exclude_none=True)
+    data.update(model._unknown_sections)
+    if backend == "orjson":
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=indent).encode()
+
+
+def dump_epjson(
+    model: EnergyPlusModel,
+    path: Union[str, Path],
+    backend: str = "auto",
+    indent: Optional[int] = 4,
+    compression: Optional[str] = "infer",
+) -> None:
+    """Write an EnergyPlusModel to an epJSON file.
+
+    Args:
+        model: EnergyPlusModel object
+        path: path to the epJSON file
+        backend: JSON backend, one of auto, pydantic, orjson or json.
+            Compressed files are always streamed with write_epjson.
+        indent: indentation, None for compact output
+        compression: gzip, bz2, lzma, None for none, or infer from the
+            file suffix
+    """
+    _check_backend(backend)
+    codec = resolve_compression(path, compression)
+    if codec is not None:
+        with open_text(path, "w", codec) as f:
+            write_epjson(model, f, indent)
+        return
+    Path(path).write_bytes(dumps(model, backend, indent))
+
+
+def write_epjson(
+    model: EnergyPlusModel,
+    f: IO[str],
+    indent: Optional[int] = 4,
+    exclude_defaults: bool = False,
+    exclude_unset: bool = False,
+) -> None:
+    """Stream an EnergyPlusModel to a text file handle as epJSON.
+
+    Objects are serialized one at a time with pydantic-core using epJSON
+    aliases, so no intermediate dictionary or string of the whole model
+    is built. Fields left as None are omitted. Sections still pending from
+    lazy loading are written as loaded, without being validated, and so
+    are sections of object types outside EnergyPlusModel.
+
+    Args:
+        model: EnergyPlusModel object
+        f: text file handle to write to
+        indent: indentation, None for compact output
+        exclude_defaults: omit fields equal to their default, which
+            EnergyPlus fills in the same way
+        exclude_unset: omit fields that were not set explicitly
+    """
+    newline = "" if indent is None else "\n"
+    colon = ":" if indent is None else ": "
+    pad1 = "" if indent is None else " " * indent
+    pad2 = pad1 * 2
+    section_sep = "," + newline + pad1
+    object_sep = "," + newline + pad2
+    pending = model._pending_sections
+    f.write("{")
+    first_section = True
+    for field_name, section in SECTIONS.items():
+        if field_name in pending:
+            objects = pending[field_name]
+            raw = True
+        else:
+            objects = model.__dict__.get(field_name)
+            raw = False
+        if objects is None:
+            continue
+        f.write((newline + pad1) if first_section else section_sep)
+        first_section = False
+        f.write(json.dumps(section.object_type) + colon + "{")
+        first_object = True
+        for name, obj in objects.items():
+            f.write((newline + pad2) if first_object else object_sep)
+            first_object = False
+            if raw:
+                text = json.dumps(obj, indent=indent)
+            else:
+                text = obj.model_dump_json(
+                    by_alias=True,
+                    exclude_none=True,
+                    exclude_defaults=exclude_defaults,
+                    exclude_unset=exclude_unset,
+                    indent=indent,
+                )
+            if indent is not None:
+                text = text.replace("\n", "\n" + pad2)
+            f.write(json.dumps(name) + colon + text)
+        if not first_object:
+            f.write(newline + pad1)
+        f.write("}")
+    for object_type, objects in model._unknown_sections.items():
+        f.write((newline + pad1) if first_section else section_sep)
+        first_section = False
+        text = json.dumps(objects, indent=indent)
+        if indent is not None:
+            text = text.replace("\n", "\n" + pad1)
+        f.write(json.dumps(object_type) + colon + text)
+    f.write(newline + "}" + newline)
@@ -7,10 +7,12 @@ from __future__ import annotations
 from enum import Enum
 from typing import Annotated, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import Field, RootModel
 
+from epmodel.base import TrackedModel
 
-class Version(BaseModel):
+
+class Version(TrackedModel):
     version_identifier: Optional[str] = 25.1
 
 
@@ -32,7 +34,7 @@ class SolarDistribution(Enum):
     minimal_shadowing = "MinimalShadowing"
 
 
-class Building(BaseModel):
+class Building(TrackedModel):
     north_axis: Optional[float] = 0.0
     terrain: Optional[Terrain] = Terrain.suburbs
     loads_convergence_tolerance_value: Annotated[
@@ -69,7 +71,7 @@ class SkyDiffuseModelingAlgorithm(Enum):
     simple_sky_diffuse_modeling = "SimpleSkyDiffuseModeling"
 
 
-class ShadingZoneGroup(BaseModel):
+class ShadingZoneGroup(TrackedModel):
     shading_zone_group_zonelist_name: Optional[str] = None
 
 
@@ -81,7 +83,7 @@ class Algorithm(Enum):
     tarp = "TARP"
 
 
-class SurfaceConvectionAlgorithmInside(BaseModel):
+class SurfaceConvectionAlgorithmInside(TrackedModel):
     algorithm: Optional[Algorithm] = Algorithm.tarp
 
 
@@ -93,7 +95,7 @@ class Algorithm1(Enum):
     tarp = "TARP"
 
 
-class SurfaceConvectionAlgorithmOutside(BaseModel):
+class SurfaceConvectionAlgorithmOutside(TrackedModel):
     algorithm: Optional[Algorithm1] = Algorithm1.doe_2
 
 
@@ -106,7 +108,7 @@ class Algorithm2(Enum):
     )
 
 
-class HeatBalanceAlgorithm(BaseModel):
+class HeatBalanceAlgorithm(TrackedModel):
     algorithm: Optional[Algorithm2] = Algorithm2.conduction_transfer_function
     surface_temperature_upper_limit: Annotated[Optional[float], Field(ge=200.0)] = 200.0
     minimum_surface_convection_heat_transfer_coefficient_value: Annotated[
@@ -123,7 +125,7 @@ class Algorithm3(Enum):
     third_order_backward_difference = "ThirdOrderBackwardDifference"
 
 
-class ZoneCapacitanceMultiplierResearchSpecial(BaseModel):
+class ZoneCapacitanceMultiplierResearchSpecial(TrackedModel):
     zone_or_zonelist_name: Optional[str] = None
     temperature_capacity_multiplier: Annotated[Optional[float], Field(gt=0.0)] = 1.0
     humidity_capacity_multiplier: Annotated[Optional[float], Field(gt=0.0)] = 1.0
@@ -133,11 +135,11 @@ class ZoneCapacitanceMultiplierResearchSpecial(BaseModel):
     ] = 1.0
 
 
-class Timestep(BaseModel):
+class Timestep(TrackedModel):
     number_of_timesteps_per_hour: Annotated[Optional[int], Field(ge=1, le=60)] = 6
 
 
-class ConvergenceLimits(BaseModel):
+class ConvergenceLimits(TrackedModel):
     minimum_system_timestep: Annotated[Optional[int], Field(ge=0, le=60)] = None
     maximum_hvac_iterations: Annotated[Optional[int], Field(ge=1)] = 20
     minimum_plant_iterations: Annotated[Optional[int], Field(ge=1)] = 2
@@ -213,18 +215,18 @@ class SpecialDayType(Enum):
     winter_design_day = "WinterDesignDay"
 
 
-class RunPeriodControlSpecialDays(BaseModel):
+class RunPeriodControlSpecialDays(TrackedModel):
     start_date: str
     duration: Annotated[Optional[float], Field(ge=1.0, le=366.0)] = 1.0
     special_day_type: Optional[SpecialDayType] = SpecialDayType.holiday
 
 
-class RunPeriodControlDaylightSavingTime(BaseModel):
+class RunPeriodControlDaylightSavingTime(TrackedModel):
     start_date: str
     end_date: str
 
 
-class SiteGroundTemperatureBuildingSurface(BaseModel):
+class SiteGroundTemperatureBuildingSurface(TrackedModel):
     january_ground_temperature: Optional[float] = 18.0
     february_ground_temperature: Optional[float] = 18.0
     march_ground_temperature: Optional[float] = 18.0
@@ -239,7 +241,7 @@ class SiteGroundTemperatureBuildingSurface(BaseModel):
     december_ground_temperature: Optional[float] = 18.0
 
 
-class SiteGroundTemperatureFCfactorMethod(BaseModel):
+class SiteGroundTemperatureFCfactorMethod(TrackedModel):
     january_ground_temperature: Optional[float] = 13.0
     february_ground_temperature: Optional[float] = 13.0
     march_ground_temperature: Optional[float] = 13.0
@@ -260,7 +262,7 @@ class CalculationMethod(Enum):
     schedule = "Schedule"
 
 
-class SiteWaterMainsTemperature(BaseModel):
+class SiteWaterMainsTemperature(TrackedModel):
     calculation_method: Optional[CalculationMethod] = (
         CalculationMethod.correlation_from_weather_file
     )
@@ -293,14 +295,14 @@ class UnitType(Enum):
     velocity = "Velocity"
 
 
-class ScheduleTypeLimits(BaseModel):
+class ScheduleTypeLimits(TrackedModel):
     lower_limit_value: Optional[float] = None
     upper_limit_value: Optional[float] = None
     numeric_type: Optional[NumericType] = None
     unit_type: Optional[UnitType] = UnitType.dimensionless
 
 
-class ScheduleDayHourly(BaseModel):
+class ScheduleDayHourly(TrackedModel):
     schedule_type_limits_name: Optional[str] = None
     hour_1: Optional[float] = 0.0
     hour_2: Optional[float] = 0.0
@@ -334,18 +336,18 @@ class InterpolateToTimestep(Enum):
     no = "No"
 
 
-class Datum(BaseModel):
+class Datum(TrackedModel):
     time: Optional[str] = None
     value_until_time: Optional[float] = None
 
 
-class ScheduleDayInterval(BaseModel):
+class ScheduleDayInterval(TrackedModel):
     schedule_type_limits_name: Optional[str] = None
     interpolate_to_timestep: Optional[InterpolateToTimestep] = InterpolateToTimestep.no
     data: Optional[List[Datum]] = None
 
 
-class ScheduleWeekDaily(BaseModel):
+class ScheduleWeekDaily(TrackedModel):
     sunday_schedule_day_name: str
     monday_schedule_day_name: str
     tuesday_schedule_day_name: str
@@ -360,7 +362,7 @@ class ScheduleWeekDaily(BaseModel):
     customday2_schedule_day_name: str
 
 
-class ScheduleWeek(BaseModel):
+class ScheduleWeek(TrackedModel):
     schedule_week_name: str
     start_month: Annotated[int, Field(ge=1, le=12)]
     start_day: Annotated[int, Field(ge=1, le=31)]
@@ -368,23 +370,23 @@ class ScheduleWeek(BaseModel):
     end_day: Annotated[int, Field(ge=1, le=31)]
 
 
-class ScheduleYear(BaseModel):
+class ScheduleYear(TrackedModel):
     schedule_type_limits_name: Optional[str] = None
     schedule_weeks: Annotated[
         Optional[List[ScheduleWeek]], Field(max_length=53, min_length=1)
     ] = None
 
 
-class Datum1(BaseModel):
+class Datum1(TrackedModel):
     field: Optional[Union[float, str]] = None
 
 
-class ScheduleCompact(BaseModel):
+class ScheduleCompact(TrackedModel):
     schedule_type_limits_name: Optional[str] = None
     data: Optional[List[Datum1]] = None
 
 
-class ScheduleConstant(BaseModel):
+class ScheduleConstant(TrackedModel):
     schedule_type_limits_name: Optional[str] = None
     hourly_value: Optional[float] = 0.0
 
@@ -398,7 +400,7 @@ class Roughness(Enum):
     very_smooth = "VerySmooth"
 
 
-class Material(BaseModel):
+class Material(TrackedModel):
     roughness: Roughness
     thickness: Annotated[float, Field(gt=0.0)]
     conductivity: Annotated[float, Field(gt=0.0)]
@@ -409,7 +411,7 @@ class Material(BaseModel):
     visible_absorptance: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = 0.7
 
 
-class MaterialNoMass(BaseModel):
+class MaterialNoMass(TrackedModel):
     roughness: Roughness
     thermal_resistance: Annotated[float, Field(ge=0.001)]
     thermal_absorptance: Annotated[Optional[float], Field(gt=0.0, le=0.99999)] = 0.9
@@ -417,11 +419,11 @@ class MaterialNoMass(BaseModel):
     visible_absorptance: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = 0.7
 
 
-class MaterialAirGap(BaseModel):
+class MaterialAirGap(TrackedModel):
     thermal_resistance: Annotated[float, Field(gt=0.0)]
 
 
-class WindowMaterialSimpleGlazingSystem(BaseModel):
+class WindowMaterialSimpleGlazingSystem(TrackedModel):
     u_factor: Annotated[float, Field(gt=0.0)]
     solar_heat_gain_coefficient: Annotated[float, Field(gt=0.0, lt=1.0)]
     visible_transmittance: Annotated[Optional[float], Field(gt=0.0, lt=1.0)] = None
@@ -442,7 +444,7 @@ class GasType(Enum):
     xenon = "Xenon"
 
 
-class WindowMaterialGas(BaseModel):
+class WindowMaterialGas(TrackedModel):
     gas_type: GasType
     thickness: Annotated[float, Field(gt=0.0)]
     conductivity_coefficient_a: Optional[float] = None
@@ -458,12 +460,12 @@ class WindowMaterialGas(BaseModel):
     specific_heat_ratio: Annotated[Optional[float], Field(gt=1.0)] = None
 
 
-class WindowGapSupportPillar(BaseModel):
+class WindowGapSupportPillar(TrackedModel):
     spacing: Annotated[Optional[float], Field(gt=0.0)] = 0.04
     radius: Annotated[Optional[float], Field(gt=0.0)] = 0.0004
 
 
-class WindowGapDeflectionState(BaseModel):
+class WindowGapDeflectionState(TrackedModel):
     deflected_thickness: Annotated[Optional[float], Field(ge=0.0)] = 0.0
     initial_temperature: Annotated[Optional[float], Field(ge=0.0)] = 25.0
     initial_pressure: Annotated[Optional[float], Field(ge=0.0)] = 101325.0
@@ -476,7 +478,7 @@ class Gas1Type(Enum):
     xenon = "Xenon"
 
 
-class WindowMaterialGasMixture(BaseModel):
+class WindowMaterialGasMixture(TrackedModel):
     thickness: Annotated[float, Field(gt=0.0)]
     number_of_gases_in_mixture: Annotated[int, Field(ge=1, le=4)]
     gas_1_type: Gas1Type
@@ -489,7 +491,7 @@ class WindowMaterialGasMixture(BaseModel):
     gas_4_fraction: Annotated[Optional[float], Field(gt=0.0, le=1.0)] = None
 
 
-class WindowMaterialGap(BaseModel):
+class WindowMaterialGap(TrackedModel):
     thickness: Annotated[float, Field(gt=0.0)]
     gas_or_gas_mixture_: str
     pressure: Optional[float] = 101325.0
@@ -506,7 +508,7 @@ class LayerType(Enum):
     woven = "Woven"
 
 
-class WindowMaterialComplexShade(BaseModel):
+class WindowMaterialComplexShade(TrackedModel):
     layer_type: Optional[LayerType] = LayerType.other_shading_type
     thickness: Annotated[Optional[float], Field(gt=0.0)] = 0.002
     conductivity: Annotated[Optional[float], Field(gt=0.0)] = 1.0
@@ -535,7 +537,7 @@ class SlatOrientation(Enum):
     vertical = "Vertical"
 
 
-class WindowMaterialBlind(BaseModel):
+class WindowMaterialBlind(TrackedModel):
     slat_orientation: Optional[SlatOrientation] = SlatOrientation.horizontal
     slat_width: Annotated[float, Field(gt=0.0, le=1.0)]
     slat_separation: Annotated[float, Field(gt=0.0, le=1.0)]
@@ -594,7 +596,7 @@ class WindowMaterialBlind(BaseModel):
     maximum_slat_angle: Annotated[Optional[float], Field(ge=0.0, le=180.0)] = 180.0
 
 
-class Construction(BaseModel):
+class Construction(TrackedModel):
     outside_layer: str
     layer_2: Optional[str] = None
     layer_3: Optional[str] = None
@@ -607,12 +609,12 @@ class Construction(BaseModel):
     layer_10: Optional[str] = None
 
 
-class ConstructionCfactorUndergroundWall(BaseModel):
+class ConstructionCfactorUndergroundWall(TrackedModel):
     c_factor: Annotated[float, Field(gt=0.0)]
     height: Annotated[float, Field(gt=0.0)]
 
 
-class ConstructionFfactorGroundFloor(BaseModel):
+class ConstructionFfactorGroundFloor(TrackedModel):
     f_factor: Annotated[float, Field(gt=0.0)]
     area: Annotated[float, Field(gt=0.0)]
     perimeterexposed: Annotated[float, Field(ge=0.0)]
@@ -637,7 +639,7 @@ class DeflectionModel(Enum):
     temperature_and_pressure_input = "TemperatureAndPressureInput"
 
 
-class WindowThermalModelParams(BaseModel):
+class WindowThermalModelParams(TrackedModel):
     standard: Optional[Standard] = Standard.iso15099
     thermal_model: Optional[ThermalModel] = ThermalModel.iso15099
     sdscalar: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = 1.0
@@ -657,7 +659,7 @@ class BasisSymmetryType(Enum):
     none = "None"
 
 
-class ConstructionComplexFenestrationState(BaseModel):
+class ConstructionComplexFenestrationState(TrackedModel):
     basis_type: Optional[BasisType] = BasisType.lbnlwindow
     basis_symmetry_type: Optional[BasisSymmetryType] = BasisSymmetryType.none
     window_thermal_model: str
@@ -712,7 +714,7 @@ class CoordinateSystem(Enum):
     world = "World"
 
 
-class GlobalGeometryRules(BaseModel):
+class GlobalGeometryRules(TrackedModel):
     starting_vertex_position: StartingVertexPosition
     vertex_entry_direction: VertexEntryDirection
     coordinate_system: CoordinateSystem
@@ -733,15 +735,15 @@ class ZoneInsideConvectionAlgorithm(Enum):
     trombe_wall = "TrombeWall"
 
 
-class Zone1(BaseModel):
+class Zone1(TrackedModel):
     zone_name: str
 
 
-class ZoneList(BaseModel):
+class ZoneList(TrackedModel):
     zones: Optional[List[Zone1]] = None
 
 
-class ZoneGroup(BaseModel):
+class ZoneGroup(TrackedModel):
     zone_list_name: str
     zone_list_multiplier: Annotated[Optional[int], Field(ge=1)] = 1
 
@@ -793,13 +795,13 @@ class NumberOfVertices(RootModel[float]):
     root: Annotated[float, Field(ge=3.0)]
 
 
-class Vertice(BaseModel):
+class Vertice(TrackedModel):
     vertex_x_coordinate: float
     vertex_y_coordinate: float
     vertex_z_coordinate: float
 
 
-class BuildingSurfaceDetailed(BaseModel):
+class BuildingSurfaceDetailed(TrackedModel):
     surface_type: SurfaceType
     construction_name: str
     zone_name: str
@@ -829,7 +831,7 @@ class NumberOfVertices1(RootModel[float]):
     root: Annotated[float, Field(ge=3.0, le=4.0)]
 
 
-class FenestrationSurfaceDetailed(BaseModel):
+class FenestrationSurfaceDetailed(TrackedModel):
     surface_type: SurfaceType1
     construction_name: str
     building_surface_name: str
@@ -925,7 +927,7 @@ class MultipleSurfaceControlType(Enum):
     sequential = "Sequential"
 
 
-class FenestrationSurface(BaseModel):
+class FenestrationSurface(TrackedModel):
     fenestration_surface_name: str
 
 
@@ -959,7 +961,7 @@ class NfrcProductTypeForAssemblyCalculations(Enum):
     vertical_slider = "VerticalSlider"
 
 
-class WindowPropertyFrameAndDivider(BaseModel):
+class WindowPropertyFrameAndDivider(TrackedModel):
     frame_width: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = 0.0
     frame_outside_projection: Annotated[Optional[float], Field(ge=0.0, le=0.5)] = 0.0
     frame_inside_projection: Annotated[Optional[float], Field(ge=0.0, le=0.5)] = 0.0
@@ -1003,7 +1005,7 @@ class WindowPropertyFrameAndDivider(BaseModel):
     ] = NfrcProductTypeForAssemblyCalculations.curtain_wall
 
 
-class InternalMass(BaseModel):
+class InternalMass(TrackedModel):
     construction_name: str
     zone_or_zonelist_name: Optional[str] = None
     space_or_spacelist_name: Optional[str] = None
@@ -1014,7 +1016,7 @@ class NumberOfVertices2(NumberOfVertices):
     pass
 
 
-class ShadingSiteDetailed(BaseModel):
+class ShadingSiteDetailed(TrackedModel):
     transmittance_schedule_name: Optional[str] = None
     number_of_vertices: Optional[Union[NumberOfVertices2, Literal["Autocalculate"]]] = (
         "Autocalculate"
@@ -1025,7 +1027,7 @@ class ShadingSiteDetailed(BaseModel):
 ShadingBuildingDetailed = ShadingSiteDetailed
 
 
-class ShadingZoneDetailed(BaseModel):
+class ShadingZoneDetailed(TrackedModel):
     base_surface_name: str
     transmittance_schedule_name: Optional[str] = None
     number_of_vertices: Optional[Union[NumberOfVertices2, Literal["Autocalculate"]]] = (
@@ -1034,7 +1036,7 @@ class ShadingZoneDetailed(BaseModel):
     vertices: Optional[List[Vertice]] = None
 
 
-class ShadingPropertyReflectance(BaseModel):
+class ShadingPropertyReflectance(TrackedModel):
     shading_surface_name: str
     diffuse_solar_reflectance_of_unglazed_part_of_shading_surface: Annotated[
         Optional[float], Field(ge=0.0, le=1.0)
@@ -1048,13 +1050,13 @@ class ShadingPropertyReflectance(BaseModel):
     glazing_construction_name: Optional[str] = None
 
 
-class SurfacePropertySolarIncidentInside(BaseModel):
+class SurfacePropertySolarIncidentInside(TrackedModel):
     surface_name: str
     construction_name: str
     inside_surface_incident_sun_solar_radiation_schedule_name: str
 
 
-class ComplexFenestrationPropertySolarAbsorbedLayers(BaseModel):
+class ComplexFenestrationPropertySolarAbsorbedLayers(TrackedModel):
     fenestration_surface: str
     construction_name: str
     layer_1_solar_radiation_absorbed_schedule_name: str
@@ -1108,7 +1110,7 @@ class DesignLevelCalculationMethod1(Enum):
     watts_person = "Watts/Person"
 
 
-class ElectricEquipment(BaseModel):
+class ElectricEquipment(TrackedModel):
     zone_or_zonelist_or_space_or_spacelist_name: str
     schedule_name: str
     design_level_calculation_method: Optional[DesignLevelCalculationMethod1] = (
@@ -1131,7 +1133,7 @@ class DesignLevelCalculationMethod2(Enum):
     watts_person = "Watts/Person"
 
 
-class GasEquipment(BaseModel):
+class GasEquipment(TrackedModel):
     zone_or_zonelist_or_space_or_spacelist_name: str
     schedule_name: str
     design_level_calculation_method: Optional[DesignLevelCalculationMethod2] = (
@@ -1166,7 +1168,7 @@ class FuelType(Enum):
     propane = "Propane"
 
 
-class OtherEquipment(BaseModel):
+class OtherEquipment(TrackedModel):
     fuel_type: Optional[FuelType] = FuelType.none
     zone_or_zonelist_or_space_or_spacelist_name: str
     schedule_name: str
@@ -1196,7 +1198,7 @@ class LightingControlType(Enum):
     stepped = "Stepped"
 
 
-class ControlDatum(BaseModel):
+class ControlDatum(TrackedModel):
     daylighting_reference_point_name: str
     fraction_of_lights_controlled_by_reference_point: Annotated[
         Optional[float], Field(ge=0.0, le=1.0)
@@ -1206,7 +1208,7 @@ class ControlDatum(BaseModel):
     ] = 500.0
 
 
-class DaylightingControls(BaseModel):
+class DaylightingControls(TrackedModel):
     zone_or_space_name: str
     daylighting_method: Optional[DaylightingMethod] = DaylightingMethod.split_flux
     availability_schedule_name: Optional[str] = None
@@ -1234,7 +1236,7 @@ class DaylightingControls(BaseModel):
     control_data: Optional[List[ControlDatum]] = None
 
 
-class DaylightingReferencePoint(BaseModel):
+class DaylightingReferencePoint(TrackedModel):
     zone_or_space_name: str
     x_coordinate_of_reference_point: float
     y_coordinate_of_reference_point: float
@@ -1255,7 +1257,7 @@ class DensityBasis(Enum):
     standard = "Standard"
 
 
-class ZoneInfiltrationDesignFlowRate(BaseModel):
+class ZoneInfiltrationDesignFlowRate(TrackedModel):
     zone_or_zonelist_or_space_or_spacelist_name: str
     schedule_name: Optional[str] = None
     design_flow_rate_calculation_method: Optional[DesignFlowRateCalculationMethod] = (
@@ -1288,7 +1290,7 @@ class VentilationType(Enum):
     natural = "Natural"
 
 
-class ZoneVentilationDesignFlowRate(BaseModel):
+class ZoneVentilationDesignFlowRate(TrackedModel):
     zone_or_zonelist_or_space_or_spacelist_name: str
     schedule_name: Optional[str] = None
     design_flow_rate_calculation_method: Optional[DesignFlowRateCalculationMethod1] = (
@@ -1335,7 +1337,7 @@ class DischargeCoefficientForOpening(ViewFactorToGround):
     pass
 
 
-class ZoneVentilationWindandStackOpenArea(BaseModel):
+class ZoneVentilationWindandStackOpenArea(TrackedModel):
     zone_or_space_name: str
     opening_area: Annotated[Optional[float], Field(ge=0.0)] = 0.0
     opening_area_fraction_schedule_name: Optional[str] = None
@@ -1368,7 +1370,7 @@ class ZoneVentilationWindandStackOpenArea(BaseModel):
     maximum_wind_speed: Annotated[Optional[float], Field(ge=0.0, le=40.0)] = 40.0
 
 
-class ZoneMixing(BaseModel):
+class ZoneMixing(TrackedModel):
     zone_or_space_name: str
     schedule_name: Optional[str] = None
     design_flow_rate_calculation_method: Optional[DesignFlowRateCalculationMethod1] = (
@@ -1395,7 +1397,7 @@ class DoorProtectionType(Enum):
     strip_curtain = "StripCurtain"
 
 
-class ZoneRefrigerationDoorMixing(BaseModel):
+class ZoneRefrigerationDoorMixing(TrackedModel):
     zone_or_space_name_1: str
     zone_or_space_name_2: str
     schedule_name: str
@@ -1404,7 +1406,7 @@ class ZoneRefrigerationDoorMixing(BaseModel):
     door_protection_type: Optional[DoorProtectionType] = DoorProtectionType.none
 
 
-class AirflowNetworkMultiZoneSurfaceEffectiveLeakageArea(BaseModel):
+class AirflowNetworkMultiZoneSurfaceEffectiveLeakageArea(TrackedModel):
     effective_leakage_area: Annotated[float, Field(gt=0.0)]
     discharge_coefficient: Annotated[Optional[float], Field(gt=0.0)] = 1.0
     reference_pressure_difference: Annotated[Optional[float], Field(gt=0.0)] = 4.0
@@ -1416,7 +1418,7 @@ class ControlOption(Enum):
     schedule_name_only = "ScheduleNameOnly"
 
 
-class ExteriorLights(BaseModel):
+class ExteriorLights(TrackedModel):
     schedule_name: str
     design_level: Annotated[float, Field(ge=0.0)]
     control_option: Optional[ControlOption] = None
@@ -1440,7 +1442,7 @@ class FuelUseType(Enum):
     water = "Water"
 
 
-class ExteriorFuelEquipment(BaseModel):
+class ExteriorFuelEquipment(TrackedModel):
     fuel_use_type: FuelUseType
     schedule_name: str
     design_level: Annotated[float, Field(ge=0.0)]
@@ -1463,7 +1465,7 @@ class OutdoorAirMethod(Enum):
     sum = "Sum"
 
 
-class DesignSpecificationOutdoorAir(BaseModel):
+class DesignSpecificationOutdoorAir(TrackedModel):
     outdoor_air_method: Optional[OutdoorAirMethod] = OutdoorAirMethod.flow_person
     outdoor_air_flow_per_person: Annotated[Optional[float], Field(ge=0.0)] = 0.00944
     outdoor_air_flow_per_zone_floor_area: Annotated[Optional[float], Field(ge=0.0)] = (
@@ -1479,7 +1481,7 @@ class DesignSpecificationOutdoorAir(BaseModel):
     )
 
 
-class DesignSpecificationZoneAirDistribution(BaseModel):
+class DesignSpecificationZoneAirDistribution(TrackedModel):
     zone_air_distribution_effectiveness_in_cooling_mode: Annotated[
         Optional[float], Field(gt=0.0)
     ] = 1.0
@@ -1495,7 +1497,7 @@ class DesignSpecificationZoneAirDistribution(BaseModel):
     ] = 0.0
 
 
-class SizingParameters(BaseModel):
+class SizingParameters(TrackedModel):
     heating_sizing_factor: Annotated[Optional[float], Field(gt=0.0)] = 1.0
     cooling_sizing_factor: Annotated[Optional[float], Field(gt=0.0)] = 1.0
     timesteps_in_averaging_window: Annotated[Optional[int], Field(ge=1)] = None
@@ -1620,7 +1622,7 @@ class CoincidentSizingFactorMode(Enum):
     none = "None"
 
 
-class SizingPlant(BaseModel):
+class SizingPlant(TrackedModel):
     plant_or_condenser_loop_name: str
     loop_type: LoopType
     design_loop_exit_temperature: float
@@ -1630,7 +1632,7 @@ class SizingPlant(BaseModel):
     coincident_sizing_factor_mode: Optional[CoincidentSizingFactorMode] = None
 
 
-class ZoneControlHumidistat(BaseModel):
+class ZoneControlHumidistat(TrackedModel):
     zone_name: str
     humidifying_relative_humidity_setpoint_schedule_name: str
     dehumidifying_relative_humidity_setpoint_schedule_name: Optional[str] = None
@@ -1645,7 +1647,7 @@ class Control1ObjectType(Enum):
     )
 
 
-class ZoneControlThermostat(BaseModel):
+class ZoneControlThermostat(TrackedModel):
     zone_or_zonelist_name: str
     control_type_schedule_name: str
     control_1_object_type: Control1ObjectType
@@ -1661,14 +1663,14 @@ class ZoneControlThermostat(BaseModel):
     ] = 0.0
 
 
-class ThermostatSetpointSingleHeating(BaseModel):
+class ThermostatSetpointSingleHeating(TrackedModel):
     setpoint_temperature_schedule_name: Optional[str] = None
 
 
 ThermostatSetpointSingleCooling = ThermostatSetpointSingleHeating
 
 
-class ThermostatSetpointDualSetpoint(BaseModel):
+class ThermostatSetpointDualSetpoint(TrackedModel):
     heating_setpoint_temperature_schedule_name: Optional[str] = None
     cooling_setpoint_temperature_schedule_name: Optional[str] = None
 
@@ -1727,7 +1729,7 @@ class HeatRecoveryType(Enum):
     sensible = "Sensible"
 
 
-class ZoneHvacIdealLoadsAirSystem(BaseModel):
+class ZoneHvacIdealLoadsAirSystem(TrackedModel):
     availability_schedule_name: Optional[str] = None
     zone_supply_air_node_name: str
     zone_exhaust_air_node_name: Optional[str] = None
@@ -1822,7 +1824,7 @@ class MaximumSupplyAirTemperatureInHeatingMode(DesignOutdoorAirFlowRate):
     pass
 
 
-class ZoneHvacFourPipeFanCoil(BaseModel):
+class ZoneHvacFourPipeFanCoil(TrackedModel):
     availability_schedule_name: Optional[str] = None
     capacity_control_method: CapacityControlMethod
     maximum_supply_air_flow_rate: Union[float, Literal["Autosize"]]
@@ -1921,7 +1923,7 @@ class ExhaustAirFlowRate(CoolingSupplyAirFlowRate):
     pass
 
 
-class ZoneHvacEnergyRecoveryVentilator(BaseModel):
+class ZoneHvacEnergyRecoveryVentilator(TrackedModel):
     availability_schedule_name: Optional[str] = None
     heat_exchanger_name: str
     supply_air_flow_rate: Union[SupplyAirFlowRate, Literal["Autosize"]]
@@ -1974,14 +1976,14 @@ class TemperatureControlType(Enum):
     operative_temperature_setpoint = "OperativeTemperatureSetpoint"
 
 
-class SurfaceFraction(BaseModel):
+class SurfaceFraction(TrackedModel):
     surface_name: Optional[str] = None
     fraction_of_radiant_energy_to_surface: Annotated[
         Optional[float], Field(ge=0.0, le=1.0)
     ] = None
 
 
-class ZoneHvacHighTemperatureRadiant(BaseModel):
+class ZoneHvacHighTemperatureRadiant(TrackedModel):
     availability_schedule_name: Optional[str] = None
     zone_name: str
     heating_design_capacity_method: Optional[HeatingDesignCapacityMethod1] = (
@@ -2027,7 +2029,7 @@ class PerPersonVentilationRateMode(Enum):
     design_occupancy = "DesignOccupancy"
 
 
-class AirTerminalSingleDuctConstantVolumeNoReheat(BaseModel):
+class AirTerminalSingleDuctConstantVolumeNoReheat(TrackedModel):
     availability_schedule_name: Optional[str] = None
     air_inlet_node_name: str
     air_outlet_node_name: str
@@ -2054,7 +2056,7 @@ class DamperHeatingAction(Enum):
     reverse_with_limits = "ReverseWithLimits"
 
 
-class AirTerminalSingleDuctVavReheat(BaseModel):
+class AirTerminalSingleDuctVavReheat(TrackedModel):
     availability_schedule_name: Optional[str] = None
     damper_air_outlet_node_name: str
     air_inlet_node_name: str
@@ -2133,7 +2135,7 @@ class AirTerminalObjectType(Enum):
     )
 
 
-class ZoneHvacAirDistributionUnit(BaseModel):
+class ZoneHvacAirDistributionUnit(TrackedModel):
     air_distribution_unit_outlet_node_name: str
     air_terminal_object_type: AirTerminalObjectType
     air_terminal_name: str
@@ -2207,7 +2209,7 @@ class ZoneEquipmentObjectType(Enum):
     zone_hvac_window_air_conditioner = "ZoneHVAC:WindowAirConditioner"
 
 
-class EquipmentItem(BaseModel):
+class EquipmentItem(TrackedModel):
     zone_equipment_object_type: ZoneEquipmentObjectType
     zone_equipment_name: str
     zone_equipment_cooling_sequence: Annotated[int, Field(ge=0)]
@@ -2216,14 +2218,14 @@ class EquipmentItem(BaseModel):
     zone_equipment_sequential_heating_fraction_schedule_name: Optional[str] = None
 
 
-class ZoneHvacEquipmentList(BaseModel):
+class ZoneHvacEquipmentList(TrackedModel):
     load_distribution_scheme: Optional[LoadDistributionScheme] = (
         LoadDistributionScheme.sequential_load
     )
     equipment: Optional[List[EquipmentItem]] = None
 
 
-class ZoneHvacEquipmentConnections(BaseModel):
+class ZoneHvacEquipmentConnections(TrackedModel):
     zone_name: str
     zone_conditioning_equipment_list_name: str
     zone_air_inlet_node_or_nodelist_name: Optional[str] = None
@@ -2244,14 +2246,14 @@ class DesignPowerSizingMethod(Enum):
     total_efficiency_and_pressure = "TotalEfficiencyAndPressure"
 
 
-class SpeedFraction(BaseModel):
+class SpeedFraction(TrackedModel):
     speed_flow_fraction: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = None
     speed_electric_power_fraction: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = (
         None
     )
 
 
-class FanSystemModel(BaseModel):
+class FanSystemModel(TrackedModel):
     availability_schedule_name: Optional[str] = None
     air_inlet_node_name: str
     air_outlet_node_name: str
@@ -2292,7 +2294,7 @@ class MaximumFlowRate(DesignOutdoorAirFlowRate):
     pass
 
 
-class FanConstantVolume(BaseModel):
+class FanConstantVolume(TrackedModel):
     availability_schedule_name: Optional[str] = None
     fan_total_efficiency: Annotated[Optional[float], Field(gt=0.0, le=1.0)] = 0.7
     pressure_rise: float
@@ -2309,7 +2311,7 @@ class FanPowerMinimumFlowRateInputMethod(Enum):
     fraction = "Fraction"
 
 
-class FanVariableVolume(BaseModel):
+class FanVariableVolume(TrackedModel):
     availability_schedule_name: Optional[str] = None
     fan_total_efficiency: Annotated[Optional[float], Field(gt=0.0, le=1.0)] = 0.7
     pressure_rise: float
@@ -2333,7 +2335,7 @@ class FanVariableVolume(BaseModel):
     end_use_subcategory: Optional[str] = "General"
 
 
-class FanOnOff(BaseModel):
+class FanOnOff(TrackedModel):
     availability_schedule_name: Optional[str] = None
     fan_total_efficiency: Annotated[Optional[float], Field(gt=0.0, le=1.0)] = 0.6
     pressure_rise: float
@@ -2352,7 +2354,7 @@ class SystemAvailabilityManagerCouplingMode(Enum):
     decoupled = "Decoupled"
 
 
-class FanZoneExhaust(BaseModel):
+class FanZoneExhaust(TrackedModel):
     availability_schedule_name: Optional[str] = None
     fan_total_efficiency: Annotated[Optional[float], Field(gt=0.0, le=1.0)] = 0.6
     pressure_rise: float
@@ -2406,7 +2408,7 @@ class HeatExchangerConfiguration(Enum):
     cross_flow = "CrossFlow"
 
 
-class CoilCoolingWater(BaseModel):
+class CoilCoolingWater(TrackedModel):
     availability_schedule_name: Optional[str] = None
     design_water_flow_rate: Optional[
         Union[DesignWaterFlowRate, Literal["Autosize"]]
@@ -2463,7 +2465,7 @@ class NumberOfTubesPerRow(CoolingSupplyAirFlowRate):
     pass
 
 
-class CoilCoolingWaterDetailedGeometry(BaseModel):
+class CoilCoolingWaterDetailedGeometry(TrackedModel):
     availability_schedule_name: Optional[str] = None
     maximum_water_flow_rate: Optional[Union[float, Literal["Autosize"]]] = "Autosize"
     tube_outside_surface_area: Optional[Union[float, Literal["Autosize"]]] = "Autosize"
@@ -2565,7 +2567,7 @@ class LowSpeedEvaporativeCondenserPumpRatedPowerConsumption(DesignOutdoorAirFlow
     pass
 
 
-class CoilCoolingDxTwoSpeed(BaseModel):
+class CoilCoolingDxTwoSpeed(TrackedModel):
     availability_schedule_name: Optional[str] = None
     high_speed_gross_rated_total_cooling_capacity: Union[
         HighSpeedGrossRatedTotalCoolingCapacity, Literal["Autosize"]
@@ -2753,7 +2755,7 @@ class RatedCapacity(DesignOutdoorAirFlowRate):
     pass
 
 
-class CoilHeatingWater(BaseModel):
+class CoilHeatingWater(TrackedModel):
     availability_schedule_name: Optional[str] = None
     u_factor_times_area_value: Optional[Union[float, Literal["Autosize"]]] = "Autosize"
     maximum_water_flow_rate: Optional[Union[float, Literal["Autosize"]]] = "Autosize"
@@ -2777,7 +2779,7 @@ class CoilHeatingWater(BaseModel):
     )
 
 
-class CoilHeatingElectric(BaseModel):
+class CoilHeatingElectric(TrackedModel):
     availability_schedule_name: Optional[str] = None
     efficiency: Annotated[Optional[float], Field(gt=0.0, le=1.0)] = 1.0
     nominal_capacity: Optional[Union[float, Literal["Autosize"]]] = None
@@ -2798,7 +2800,7 @@ class FuelType3(Enum):
     propane = "Propane"
 
 
-class CoilHeatingFuel(BaseModel):
+class CoilHeatingFuel(TrackedModel):
     availability_schedule_name: Optional[str] = None
     fuel_type: Optional[FuelType3] = FuelType3.natural_gas
     burner_efficiency: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = 0.8
@@ -2833,7 +2835,7 @@ class SecondaryCoilAirFlowRate(CoolingSupplyAirFlowRate):
     pass
 
 
-class CoilHeatingDxSingleSpeed(BaseModel):
+class CoilHeatingDxSingleSpeed(TrackedModel):
     availability_schedule_name: Optional[str] = None
     gross_rated_heating_capacity: Union[GrossRatedHeatingCapacity, Literal["Autosize"]]
     gross_rated_heating_cop: Annotated[float, Field(gt=0.0)]
@@ -2904,7 +2906,7 @@ class GrossRatedSensibleCoolingCapacity(CoolingSupplyAirFlowRate):
     pass
 
 
-class CoilCoolingWaterToAirHeatPumpEquationFit(BaseModel):
+class CoilCoolingWaterToAirHeatPumpEquationFit(TrackedModel):
     water_inlet_node_name: str
     water_outlet_node_name: str
     air_inlet_node_name: str
@@ -2942,7 +2944,7 @@ class CoilCoolingWaterToAirHeatPumpEquationFit(BaseModel):
     fan_delay_time: Annotated[Optional[float], Field(ge=0.0)] = 60.0
 
 
-class CoilHeatingWaterToAirHeatPumpEquationFit(BaseModel):
+class CoilHeatingWaterToAirHeatPumpEquationFit(TrackedModel):
     water_inlet_node_name: str
     water_outlet_node_name: str
     air_inlet_node_name: str
@@ -2989,7 +2991,7 @@ class RatedPower(DesignOutdoorAirFlowRate):
     pass
 
 
-class HumidifierSteamElectric(BaseModel):
+class HumidifierSteamElectric(TrackedModel):
     availability_schedule_name: Optional[str] = None
     rated_capacity: Optional[Union[RatedCapacity, Literal["Autosize"]]] = None
     rated_power: Optional[Union[RatedPower, Literal["Autosize"]]] = None
@@ -3148,7 +3150,7 @@ class CoolingSpeedSupplyAirFlowRatio(CoolingSupplyAirFlowRate):
     pass
 
 
-class FlowRatio(BaseModel):
+class FlowRatio(TrackedModel):
     heating_speed_supply_air_flow_ratio: Union[
         HeatingSpeedSupplyAirFlowRatio, Literal["Autosize"]
     ]
@@ -3186,7 +3188,7 @@ class ReheatCoilObjectType1(Enum):
     coil_heating_water = "Coil:Heating:Water"
 
 
-class AirLoopHvacUnitaryFurnaceHeatCool(BaseModel):
+class AirLoopHvacUnitaryFurnaceHeatCool(TrackedModel):
     availability_schedule_name: Optional[str] = None
     furnace_air_inlet_node_name: str
     furnace_air_outlet_node_name: str
@@ -3212,7 +3214,7 @@ class AirLoopHvacUnitaryFurnaceHeatCool(BaseModel):
     reheat_coil_name: Optional[str] = None
 
 
-class AirLoopHvacUnitaryHeatCool(BaseModel):
+class AirLoopHvacUnitaryHeatCool(TrackedModel):
     availability_schedule_name: Optional[str] = None
     unitary_system_air_inlet_node_name: str
     unitary_system_air_outlet_node_name: str
@@ -3257,7 +3259,7 @@ class CoolingCoilObjectType6(Enum):
     )
 
 
-class AirLoopHvacUnitaryHeatPumpAirToAir(BaseModel):
+class AirLoopHvacUnitaryHeatPumpAirToAir(TrackedModel):
     availability_schedule_name: Optional[str] = None
     air_inlet_node_name: str
     air_outlet_node_name: str
@@ -3323,7 +3325,7 @@ class HeatPumpCoilWaterFlowMode(Enum):
     cycling = "Cycling"
 
 
-class AirLoopHvacUnitaryHeatPumpWaterToAir(BaseModel):
+class AirLoopHvacUnitaryHeatPumpWaterToAir(TrackedModel):
     availability_schedule_name: Optional[str] = None
     air_inlet_node_name: str
     air_outlet_node_name: str
@@ -3371,7 +3373,7 @@ class MaximumActuatedFlow(DesignOutdoorAirFlowRate):
     pass
 
 
-class ControllerWaterCoil(BaseModel):
+class ControllerWaterCoil(TrackedModel):
     control_variable: ControlVariable
     action: Optional[Action] = None
     actuator_variable: Literal["Flow"]
@@ -3445,7 +3447,7 @@ class SystemOutdoorAirMethod1(Enum):
     zone_sum = "ZoneSum"
 
 
-class ZoneSpecification(BaseModel):
+class ZoneSpecification(TrackedModel):
     zone_or_zonelist_name: str
     design_specification_outdoor_air_object_name: Optional[str] = None
     design_specification_zone_air_distribution_object_name: Optional[str] = None
@@ -3456,7 +3458,7 @@ class Controller1ObjectType(Enum):
     controller_water_coil = "Controller:WaterCoil"
 
 
-class AirLoopHvacControllerList(BaseModel):
+class AirLoopHvacControllerList(TrackedModel):
     controller_1_object_type: Controller1ObjectType
     controller_1_name: str
     controller_2_object_type: Optional[Controller1ObjectType] = None
@@ -3475,7 +3477,7 @@ class AirLoopHvacControllerList(BaseModel):
     controller_8_name: Optional[str] = None
 
 
-class AirLoopHvac(BaseModel):
+class AirLoopHvac(TrackedModel):
     controller_list_name: Optional[str] = None
     availability_manager_list_name: Optional[str] = None
     design_supply_air_flow_rate: Optional[Union[float, Literal["Autosize"]]] = 0.0
@@ -3490,7 +3492,7 @@ class AirLoopHvac(BaseModel):
     ] = 1.0
 
 
-class AirLoopHvacOutdoorAirSystemEquipmentList(BaseModel):
+class AirLoopHvacOutdoorAirSystemEquipmentList(TrackedModel):
     component_1_object_type: str
     component_1_name: str
     component_2_object_type: Optional[str] = None
@@ -3511,23 +3513,23 @@ class AirLoopHvacOutdoorAirSystemEquipmentList(BaseModel):
     component_9_name: Optional[str] = None
 
 
-class AirLoopHvacOutdoorAirSystem(BaseModel):
+class AirLoopHvacOutdoorAirSystem(TrackedModel):
     controller_list_name: Optional[str] = None
     outdoor_air_equipment_list_name: str
 
 
-class OutdoorAirMixer(BaseModel):
+class OutdoorAirMixer(TrackedModel):
     mixed_air_node_name: str
     outdoor_air_stream_node_name: str
     relief_air_stream_node_name: str
     return_air_stream_node_name: str
 
 
-class Node(BaseModel):
+class Node(TrackedModel):
     outlet_node_name: str
 
 
-class AirLoopHvacZoneSplitter(BaseModel):
+class AirLoopHvacZoneSplitter(TrackedModel):
     inlet_node_name: str
     nodes: Optional[List[Node]] = None
 
@@ -3537,26 +3539,26 @@ class ComponentObjectType(Enum):
     air_loop_hvac_zone_splitter = "AirLoopHVAC:ZoneSplitter"
 
 
-class Component(BaseModel):
+class Component(TrackedModel):
     component_object_type: ComponentObjectType
     component_name: str
 
 
-class AirLoopHvacSupplyPath(BaseModel):
+class AirLoopHvacSupplyPath(TrackedModel):
     supply_air_path_inlet_node_name: str
     components: Optional[List[Component]] = None
 
 
-class Node1(BaseModel):
+class Node1(TrackedModel):
     inlet_node_name: str
 
 
-class AirLoopHvacZoneMixer(BaseModel):
+class AirLoopHvacZoneMixer(TrackedModel):
     outlet_node_name: str
     nodes: Optional[List[Node1]] = None
 
 
-class AirLoopHvacReturnPlenum(BaseModel):
+class AirLoopHvacReturnPlenum(TrackedModel):
     zone_name: str
     zone_node_name: str
     outlet_node_name: str
@@ -3569,50 +3571,50 @@ class ComponentObjectType1(Enum):
     air_loop_hvac_zone_mixer = "AirLoopHVAC:ZoneMixer"
 
 
-class Component1(BaseModel):
+class Component1(TrackedModel):
     component_object_type: ComponentObjectType1
     component_name: str
 
 
-class AirLoopHvacReturnPath(BaseModel):
+class AirLoopHvacReturnPath(TrackedModel):
     return_air_path_outlet_node_name: str
     components: Optional[List[Component1]] = None
 
 
-class Component2(BaseModel):
+class Component2(TrackedModel):
     component_object_type: str
     component_name: str
     component_inlet_node_name: str
     component_outlet_node_name: str
 
 
-class Branch(BaseModel):
+class Branch(TrackedModel):
     pressure_drop_curve_name: Optional[str] = None
     components: Optional[List[Component2]] = None
 
 
-class Branch1(BaseModel):
+class Branch1(TrackedModel):
     branch_name: str
 
 
-class BranchList(BaseModel):
+class BranchList(TrackedModel):
     branches: Optional[List[Branch1]] = None
 
 
-class Branch2(BaseModel):
+class Branch2(TrackedModel):
     outlet_branch_name: str
 
 
-class ConnectorSplitter(BaseModel):
+class ConnectorSplitter(TrackedModel):
     inlet_branch_name: str
     branches: Optional[List[Branch2]] = None
 
 
-class Branch3(BaseModel):
+class Branch3(TrackedModel):
     inlet_branch_name: str
 
 
-class ConnectorMixer(BaseModel):
+class ConnectorMixer(TrackedModel):
     outlet_branch_name: str
     branches: Optional[List[Branch3]] = None
 
@@ -3622,18 +3624,18 @@ class Connector1ObjectType(Enum):
     connector_splitter = "Connector:Splitter"
 
 
-class ConnectorList(BaseModel):
+class ConnectorList(TrackedModel):
     connector_1_object_type: Connector1ObjectType
     connector_1_name: str
     connector_2_object_type: Optional[Connector1ObjectType] = None
     connector_2_name: Optional[str] = None
 
 
-class Node3(BaseModel):
+class Node3(TrackedModel):
     node_name: str
 
 
-class NodeList(BaseModel):
+class NodeList(TrackedModel):
     nodes: Optional[List[Node3]] = None
 
 
@@ -3642,15 +3644,15 @@ class WindAngleType(Enum):
     relative = "Relative"
 
 
-class Node4(BaseModel):
+class Node4(TrackedModel):
     node_or_nodelist_name: str
 
 
-class OutdoorAirNodeList(BaseModel):
+class OutdoorAirNodeList(TrackedModel):
     nodes: Optional[List[Node4]] = None
 
 
-class PipeAdiabatic(BaseModel):
+class PipeAdiabatic(TrackedModel):
     inlet_node_name: str
     outlet_node_name: str
 
@@ -3674,7 +3676,7 @@ class DesignPowerSizingMethod1(Enum):
     power_per_flow_per_pressure = "PowerPerFlowPerPressure"
 
 
-class PumpVariableSpeed(BaseModel):
+class PumpVariableSpeed(TrackedModel):
     inlet_node_name: str
     outlet_node_name: str
     design_maximum_flow_rate: Optional[
@@ -3724,7 +3726,7 @@ class DesignFlowRate(CoolingSupplyAirFlowRate):
     pass
 
 
-class PumpConstantSpeed(BaseModel):
+class PumpConstantSpeed(TrackedModel):
     inlet_node_name: str
     outlet_node_name: str
     design_flow_rate: Optional[Union[DesignFlowRate, Literal["Autosize"]]] = None
@@ -3759,7 +3761,7 @@ class TotalDesignFlowRate(CoolingSupplyAirFlowRate):
     pass
 
 
-class HeaderedPumpsVariableSpeed(BaseModel):
+class HeaderedPumpsVariableSpeed(TrackedModel):
     inlet_node_name: str
     outlet_node_name: str
     total_design_flow_rate: Optional[
@@ -3824,7 +3826,7 @@ class BoilerFlowMode(Enum):
     not_modulated = "NotModulated"
 
 
-class BoilerHotWater(BaseModel):
+class BoilerHotWater(TrackedModel):
     fuel_type: FuelType4
     nominal_capacity: Optional[Union[NominalCapacity, Literal["Autosize"]]] = None
     nominal_thermal_efficiency: Annotated[float, Field(gt=0.0)]
@@ -3871,7 +3873,7 @@ class CondenserMaximumRequestedFlowRate(CoolingSupplyAirFlowRate):
     pass
 
 
-class ChillerElectricAshrae205(BaseModel):
+class ChillerElectricAshrae205(TrackedModel):
     representation_file_name: str
     performance_interpolation_method: Optional[PerformanceInterpolationMethod] = (
         PerformanceInterpolationMethod.linear
@@ -3933,7 +3935,7 @@ class CondenserFlowControl(Enum):
     modulated_loop_plr = "ModulatedLoopPLR"
 
 
-class ChillerElectricEir(BaseModel):
+class ChillerElectricEir(TrackedModel):
     reference_capacity: Union[ReferenceCapacity, Literal["Autosize"]]
     reference_cop: Annotated[float, Field(gt=0.0)]
     reference_leaving_chilled_water_temperature: Optional[float] = 6.67
@@ -4002,7 +4004,7 @@ class ElectricInputToCoolingOutputRatioFunctionOfPartLoadRatioCurveType(Enum):
     lift = "Lift"
 
 
-class ChillerElectricReformulatedEir(BaseModel):
+class ChillerElectricReformulatedEir(TrackedModel):
     reference_capacity: Union[ReferenceCapacity, Literal["Autosize"]]
     reference_cop: Annotated[float, Field(gt=0.0)]
     reference_leaving_chilled_water_temperature: Optional[float] = 6.67
@@ -4118,7 +4120,7 @@ class CellControl(Enum):
     minimal_cell = "MinimalCell"
 
 
-class CoolingTowerSingleSpeed(BaseModel):
+class CoolingTowerSingleSpeed(TrackedModel):
     water_inlet_node_name: str
     water_outlet_node_name: str
     design_water_flow_rate: Optional[
@@ -4199,7 +4201,7 @@ class ModelType(Enum):
     york_calc_user_defined = "YorkCalcUserDefined"
 
 
-class CoolingTowerVariableSpeed(BaseModel):
+class CoolingTowerVariableSpeed(TrackedModel):
     water_inlet_node_name: str
     water_outlet_node_name: str
     model_type: Optional[ModelType] = ModelType.york_calc
@@ -4284,7 +4286,7 @@ class LowSpeedUserSpecifiedDesignCapacity(CoolingSupplyAirFlowRate):
     pass
 
 
-class EvaporativeFluidCoolerTwoSpeed(BaseModel):
+class EvaporativeFluidCoolerTwoSpeed(TrackedModel):
     water_inlet_node_name: str
     water_outlet_node_name: str
     high_fan_speed_air_flow_rate: Union[HighFanSpeedAirFlowRate, Literal["Autosize"]]
@@ -4344,7 +4346,7 @@ class LowSpeedNominalCapacity(CoolingSupplyAirFlowRate):
     pass
 
 
-class FluidCoolerTwoSpeed(BaseModel):
+class FluidCoolerTwoSpeed(TrackedModel):
     water_inlet_node_name: str
     water_outlet_node_name: str
     performance_input_method: Optional[PerformanceInputMethod] = (
@@ -4428,7 +4430,7 @@ class ComponentOverrideCoolingControlTemperatureMode(Enum):
     wet_bulb_temperature = "WetBulbTemperature"
 
 
-class HeatExchangerFluidToFluid(BaseModel):
+class HeatExchangerFluidToFluid(TrackedModel):
     availability_schedule_name: Optional[str] = None
     loop_demand_side_inlet_node_name: str
     loop_demand_side_outlet_node_name: str
@@ -4506,7 +4508,7 @@ class SourceSideFlowControlMode(Enum):
     storage_tank = "StorageTank"
 
 
-class WaterHeaterMixed(BaseModel):
+class WaterHeaterMixed(TrackedModel):
     tank_volume: Optional[Union[TankVolume, Literal["Autosize"]]] = 0.0
     setpoint_temperature_schedule_name: str
     deadband_temperature_difference: Annotated[Optional[float], Field(ge=0.0)] = 0.0
@@ -4615,7 +4617,7 @@ class PressureSimulationType(Enum):
     pump_power_correction = "PumpPowerCorrection"
 
 
-class PlantLoop(BaseModel):
+class PlantLoop(TrackedModel):
     fluid_type: Optional[FluidType] = FluidType.water
     user_defined_fluid_type: Optional[str] = None
     plant_equipment_operation_scheme_name: str
@@ -4662,7 +4664,7 @@ class CondenserLoopVolume(DesignOutdoorAirFlowRate):
     pass
 
 
-class CondenserLoop(BaseModel):
+class CondenserLoop(TrackedModel):
     fluid_type: Optional[FluidType1] = FluidType1.water
     user_defined_fluid_type: Optional[str] = None
     condenser_equipment_operation_scheme_name: str
@@ -4691,19 +4693,19 @@ class CondenserLoop(BaseModel):
     loop_circulation_time: Annotated[Optional[float], Field(ge=0.0)] = 2.0
 
 
-class EquipmentItem1(BaseModel):
+class EquipmentItem1(TrackedModel):
     equipment_object_type: Optional[str] = None
     equipment_name: Optional[str] = None
 
 
-class PlantEquipmentList(BaseModel):
+class PlantEquipmentList(TrackedModel):
     equipment: Optional[List[EquipmentItem1]] = None
 
 
 CondenserEquipmentList = PlantEquipmentList
 
 
-class PlantEquipmentOperationCoolingLoad(BaseModel):
+class PlantEquipmentOperationCoolingLoad(TrackedModel):
     load_range_1_lower_limit: Annotated[float, Field(ge=0.0)]
     load_range_1_upper_limit: Annotated[float, Field(ge=0.0)]
     range_1_equipment_list_name: Optional[str] = None
@@ -4736,7 +4738,7 @@ class PlantEquipmentOperationCoolingLoad(BaseModel):
     range_10_equipment_list_name: Optional[str] = None
 
 
-class PlantEquipmentOperationHeatingLoad(BaseModel):
+class PlantEquipmentOperationHeatingLoad(TrackedModel):
     load_range_1_lower_limit: Annotated[float, Field(ge=0.0)]
     load_range_1_upper_limit: Annotated[float, Field(ge=0.0)]
     range_1_equipment_list_name: str
@@ -4775,7 +4777,7 @@ class Operation1Type(Enum):
     heating = "Heating"
 
 
-class PlantEquipmentOperationComponentSetpoint(BaseModel):
+class PlantEquipmentOperationComponentSetpoint(TrackedModel):
     equipment_1_object_type: str
     equipment_1_name: str
     demand_calculation_1_node_name: str
@@ -4875,7 +4877,7 @@ class ControlScheme1ObjectType(Enum):
     plant_equipment_operation_user_defined = "PlantEquipmentOperation:UserDefined"
 
 
-class PlantEquipmentOperationSchemes(BaseModel):
+class PlantEquipmentOperationSchemes(TrackedModel):
     control_scheme_1_object_type: ControlScheme1ObjectType
     control_scheme_1_name: str
     control_scheme_1_schedule_name: str
@@ -4930,7 +4932,7 @@ class ControlScheme1ObjectType1(Enum):
     plant_equipment_operation_user_defined = "PlantEquipmentOperation:UserDefined"
 
 
-class CondenserEquipmentOperationSchemes(BaseModel):
+class CondenserEquipmentOperationSchemes(TrackedModel):
     control_scheme_1_object_type: ControlScheme1ObjectType1
     control_scheme_1_name: str
     control_scheme_1_schedule_name: str
@@ -4957,12 +4959,12 @@ class CondenserEquipmentOperationSchemes(BaseModel):
     control_scheme_8_schedule_name: Optional[str] = None
 
 
-class EnergyManagementSystemSensor(BaseModel):
+class EnergyManagementSystemSensor(TrackedModel):
     output_variable_or_output_meter_index_key_name: Optional[str] = None
     output_variable_or_output_meter_name: str
 
 
-class EnergyManagementSystemActuator(BaseModel):
+class EnergyManagementSystemActuator(TrackedModel):
     actuated_component_unique_name: str
     actuated_component_type: str
     actuated_component_control_type: str
@@ -4999,28 +5001,28 @@ class EnergyplusModelCallingPoint(Enum):
     user_defined_component_model = "UserDefinedComponentModel"
 
 
-class Program(BaseModel):
+class Program(TrackedModel):
     program_name: str
 
 
-class EnergyManagementSystemProgramCallingManager(BaseModel):
+class EnergyManagementSystemProgramCallingManager(TrackedModel):
     energyplus_model_calling_point: Optional[EnergyplusModelCallingPoint] = None
     programs: Optional[List[Program]] = None
 
 
-class Line(BaseModel):
+class Line(TrackedModel):
     program_line: Optional[str] = None
 
 
-class EnergyManagementSystemProgram(BaseModel):
+class EnergyManagementSystemProgram(TrackedModel):
     lines: Annotated[List[Line], Field(min_length=1)]
 
 
-class Variable(BaseModel):
+class Variable(TrackedModel):
     erl_variable_name: str
 
 
-class EnergyManagementSystemGlobalVariable(BaseModel):
+class EnergyManagementSystemGlobalVariable(TrackedModel):
     variables: Optional[List[Variable]] = None
 
 
@@ -5034,7 +5036,7 @@ class UpdateFrequency(Enum):
     zone_timestep = "ZoneTimestep"
 
 
-class EnergyManagementSystemOutputVariable(BaseModel):
+class EnergyManagementSystemOutputVariable(TrackedModel):
     ems_variable_name: str
     type_of_data_in_variable: TypeOfDataInVariable
     update_frequency: UpdateFrequency
@@ -5042,12 +5044,12 @@ class EnergyManagementSystemOutputVariable(BaseModel):
     units: Optional[str] = None
 
 
-class EnergyManagementSystemInternalVariable(BaseModel):
+class EnergyManagementSystemInternalVariable(TrackedModel):
     internal_data_index_key_name: Optional[str] = None
     internal_data_type: str
 
 
-class AvailabilityManagerScheduled(BaseModel):
+class AvailabilityManagerScheduled(TrackedModel):
     schedule_name: str
 
 
@@ -5068,7 +5070,7 @@ class CyclingRunTimeControlType(Enum):
     thermostat_with_minimum_run_time = "ThermostatWithMinimumRunTime"
 
 
-class AvailabilityManagerNightCycle(BaseModel):
+class AvailabilityManagerNightCycle(TrackedModel):
     applicability_schedule_name: str
     fan_schedule_name: str
     control_type: Optional[ControlType2] = ControlType2.stay_off
@@ -5107,12 +5109,12 @@ class AvailabilityManagerObjectType(Enum):
     availability_manager_scheduled_on = "AvailabilityManager:ScheduledOn"
 
 
-class Manager(BaseModel):
+class Manager(TrackedModel):
     availability_manager_object_type: AvailabilityManagerObjectType
     availability_manager_name: str
 
 
-class AvailabilityManagerAssignmentList(BaseModel):
+class AvailabilityManagerAssignmentList(TrackedModel):
     managers: Optional[List[Manager]] = None
 
 
@@ -5128,13 +5130,13 @@ class ControlVariable1(Enum):
     temperature = "Temperature"
 
 
-class SetpointManagerScheduled(BaseModel):
+class SetpointManagerScheduled(TrackedModel):
     control_variable: ControlVariable1
     schedule_name: str
     setpoint_node_or_nodelist_name: str
 
 
-class SetpointManagerScheduledDualSetpoint(BaseModel):
+class SetpointManagerScheduledDualSetpoint(TrackedModel):
     control_variable: Optional[Literal["Temperature"]] = "Temperature"
     high_setpoint_schedule_name: str
     low_setpoint_schedule_name: str
@@ -5147,7 +5149,7 @@ class ControlVariable2(Enum):
     temperature = "Temperature"
 
 
-class SetpointManagerOutdoorAirReset(BaseModel):
+class SetpointManagerOutdoorAirReset(TrackedModel):
     control_variable: Optional[ControlVariable2] = ControlVariable2.temperature
     setpoint_at_outdoor_low_temperature: float
     outdoor_low_temperature: float
@@ -5161,7 +5163,7 @@ class SetpointManagerOutdoorAirReset(BaseModel):
     outdoor_high_temperature_2: Optional[float] = None
 
 
-class SetpointManagerSingleZoneReheat(BaseModel):
+class SetpointManagerSingleZoneReheat(TrackedModel):
     control_variable: Optional[Literal["Temperature"]] = "Temperature"
     minimum_supply_air_temperature: Optional[float] = -99.0
     maximum_supply_air_temperature: Optional[float] = 99.0
@@ -5177,7 +5179,7 @@ SetpointManagerSingleZoneHeating = SetpointManagerSingleZoneReheat
 SetpointManagerSingleZoneCooling = SetpointManagerSingleZoneReheat
 
 
-class SetpointManagerSingleZoneHumidityMinimum(BaseModel):
+class SetpointManagerSingleZoneHumidityMinimum(TrackedModel):
     setpoint_node_or_nodelist_name: str
     control_zone_air_node_name: str
 
@@ -5185,7 +5187,7 @@ class SetpointManagerSingleZoneHumidityMinimum(BaseModel):
 SetpointManagerSingleZoneHumidityMaximum = SetpointManagerSingleZoneHumidityMinimum
 
 
-class SetpointManagerMixedAir(BaseModel):
+class SetpointManagerMixedAir(TrackedModel):
     control_variable: Optional[Literal["Temperature"]] = "Temperature"
     reference_setpoint_node_name: str
     fan_inlet_node_name: str
@@ -5205,7 +5207,7 @@ class ControlVariable3(Enum):
     temperature = "Temperature"
 
 
-class SetpointManagerOutdoorAirPretreat(BaseModel):
+class SetpointManagerOutdoorAirPretreat(TrackedModel):
     control_variable: Optional[ControlVariable3] = None
     minimum_setpoint_temperature: Optional[float] = -99.0
     maximum_setpoint_temperature: Optional[float] = 99.0
@@ -5218,14 +5220,14 @@ class SetpointManagerOutdoorAirPretreat(BaseModel):
     setpoint_node_or_nodelist_name: str
 
 
-class SetpointManagerMultiZoneHumidityMinimum(BaseModel):
+class SetpointManagerMultiZoneHumidityMinimum(TrackedModel):
     hvac_air_loop_name: str
     minimum_setpoint_humidity_ratio: Annotated[Optional[float], Field(gt=0.0)] = 0.005
     maximum_setpoint_humidity_ratio: Annotated[Optional[float], Field(gt=0.0)] = 0.012
     setpoint_node_or_nodelist_name: str
 
 
-class SetpointManagerMultiZoneHumidityMaximum(BaseModel):
+class SetpointManagerMultiZoneHumidityMaximum(TrackedModel):
     hvac_air_loop_name: str
     minimum_setpoint_humidity_ratio: Annotated[Optional[float], Field(gt=0.0)] = 0.008
     maximum_setpoint_humidity_ratio: Annotated[Optional[float], Field(gt=0.0)] = 0.015
@@ -5237,7 +5239,7 @@ class ReferenceTemperatureType(Enum):
     outdoor_air_wet_bulb = "OutdoorAirWetBulb"
 
 
-class SetpointManagerFollowOutdoorAirTemperature(BaseModel):
+class SetpointManagerFollowOutdoorAirTemperature(TrackedModel):
     control_variable: Optional[ControlVariable2] = ControlVariable2.temperature
     reference_temperature_type: Optional[ReferenceTemperatureType] = (
         ReferenceTemperatureType.outdoor_air_wet_bulb
@@ -5254,7 +5256,7 @@ class ReturnTemperatureSetpointInputType(Enum):
     scheduled = "Scheduled"
 
 
-class SetpointManagerReturnTemperatureChilledWater(BaseModel):
+class SetpointManagerReturnTemperatureChilledWater(TrackedModel):
     plant_loop_supply_outlet_node: str
     plant_loop_supply_inlet_node: str
     minimum_supply_temperature_setpoint: Optional[float] = 5.0
@@ -5264,7 +5266,7 @@ class SetpointManagerReturnTemperatureChilledWater(BaseModel):
     return_temperature_setpoint_schedule_name: Optional[str] = None
 
 
-class SetpointManagerReturnTemperatureHotWater(BaseModel):
+class SetpointManagerReturnTemperatureHotWater(TrackedModel):
     plant_loop_supply_outlet_node: str
     plant_loop_supply_inlet_node: str
     minimum_supply_temperature_setpoint: Optional[float] = 77.0
@@ -5306,7 +5308,7 @@ class DefrostEnergyCorrectionCurveType(Enum):
     relative_humidity_method = "RelativeHumidityMethod"
 
 
-class RefrigerationCase(BaseModel):
+class RefrigerationCase(TrackedModel):
     availability_schedule_name: Optional[str] = None
     zone_name: str
     rated_ambient_temperature: Annotated[Optional[float], Field(gt=0.0)] = 23.9
@@ -5384,7 +5386,7 @@ class DesignEvaporativeCondenserWaterPumpPower(DesignOutdoorAirFlowRate):
     pass
 
 
-class RefrigerationCompressorRack(BaseModel):
+class RefrigerationCompressorRack(TrackedModel):
     heat_rejection_location: Optional[HeatRejectionLocation] = (
         HeatRejectionLocation.outdoors
     )
@@ -5432,11 +5434,11 @@ class RefrigerationCompressorRack(BaseModel):
     heat_rejection_zone_name: Optional[str] = None
 
 
-class CasesAndWalkin(BaseModel):
+class CasesAndWalkin(TrackedModel):
     case_or_walkin_name: Optional[str] = None
 
 
-class RefrigerationCaseAndWalkInList(BaseModel):
+class RefrigerationCaseAndWalkInList(TrackedModel):
     cases_and_walkins: Optional[List[CasesAndWalkin]] = None
 
 
@@ -5447,7 +5449,7 @@ class CondenserFanSpeedControlType(Enum):
     variable_speed = "VariableSpeed"
 
 
-class RefrigerationCondenserAirCooled(BaseModel):
+class RefrigerationCondenserAirCooled(TrackedModel):
     rated_effective_total_heat_rejection_rate_curve_name: Optional[str] = None
     rated_subcooling_temperature_difference: Annotated[
         Optional[float], Field(ge=0.0)
@@ -5469,7 +5471,7 @@ class ModeOfOperation(Enum):
     transcritical = "Transcritical"
 
 
-class RefrigerationCompressor(BaseModel):
+class RefrigerationCompressor(TrackedModel):
     refrigeration_compressor_power_curve_name: str
     refrigeration_compressor_capacity_curve_name: str
     rated_superheat: Optional[float] = None
@@ -5482,11 +5484,11 @@ class RefrigerationCompressor(BaseModel):
     transcritical_compressor_capacity_curve_name: Optional[str] = None
 
 
-class Compressor(BaseModel):
+class Compressor(TrackedModel):
     refrigeration_compressor_name: str
 
 
-class RefrigerationCompressorList(BaseModel):
+class RefrigerationCompressorList(TrackedModel):
     compressors: Optional[List[Compressor]] = None
 
 
@@ -5506,7 +5508,7 @@ class IntercoolerType(Enum):
     shell_and_coil_intercooler = "Shell-and-Coil Intercooler"
 
 
-class RefrigerationSystem(BaseModel):
+class RefrigerationSystem(TrackedModel):
     refrigerated_case_or_walkin_or_caseandwalkinlist_name: Optional[str] = None
     refrigeration_transfer_load_or_transferload_list_name: Optional[str] = None
     refrigeration_condenser_name: str
@@ -5568,7 +5570,7 @@ class VerticalLocation(Enum):
     middle = "Middle"
 
 
-class RefrigerationAirChiller(BaseModel):
+class RefrigerationAirChiller(TrackedModel):
     availability_schedule_name: Optional[str] = None
     capacity_rating_type: CapacityRatingType
     rated_unit_load_factor: Optional[float] = None
@@ -5606,11 +5608,11 @@ class RefrigerationAirChiller(BaseModel):
     average_refrigerant_charge_inventory: Optional[float] = 0.0
 
 
-class Chiller(BaseModel):
+class Chiller(TrackedModel):
     air_chiller_name: Optional[str] = None
 
 
-class ZoneHvacRefrigerationChillerSet(BaseModel):
+class ZoneHvacRefrigerationChillerSet(TrackedModel):
     availability_schedule_name: Optional[str] = None
     zone_name: Optional[str] = None
     air_inlet_node_name: Optional[str] = None
@@ -5637,7 +5639,7 @@ class ArrayGeometryType(Enum):
     tilt_azimuth = "TiltAzimuth"
 
 
-class GeneratorPvWatts(BaseModel):
+class GeneratorPvWatts(TrackedModel):
     pvwatts_version: Optional[Literal["5"]] = None
     dc_system_capacity: Annotated[float, Field(gt=0.0)]
     module_type: ModuleType
@@ -5650,7 +5652,7 @@ class GeneratorPvWatts(BaseModel):
     ground_coverage_ratio: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = 0.4
 
 
-class ElectricLoadCenterInverterPvWatts(BaseModel):
+class ElectricLoadCenterInverterPvWatts(TrackedModel):
     dc_to_ac_size_ratio: Annotated[Optional[float], Field(gt=0.0)] = 1.1
     inverter_efficiency: Annotated[Optional[float], Field(gt=0.0, le=1.0)] = 0.96
 
@@ -5666,7 +5668,7 @@ class GeneratorObjectType(Enum):
     generator_wind_turbine = "Generator:WindTurbine"
 
 
-class GeneratorOutput(BaseModel):
+class GeneratorOutput(TrackedModel):
     generator_name: str
     generator_object_type: GeneratorObjectType
     generator_rated_electric_power_output: Optional[float] = None
@@ -5674,18 +5676,18 @@ class GeneratorOutput(BaseModel):
     generator_rated_thermal_to_electrical_power_ratio: Optional[float] = None
 
 
-class ElectricLoadCenterGenerators(BaseModel):
+class ElectricLoadCenterGenerators(TrackedModel):
     generator_outputs: Optional[List[GeneratorOutput]] = None
 
 
-class ElectricLoadCenterInverterSimple(BaseModel):
+class ElectricLoadCenterInverterSimple(TrackedModel):
     availability_schedule_name: Optional[str] = None
     zone_name: Optional[str] = None
     radiative_fraction: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = None
     inverter_efficiency: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = None
 
 
-class ElectricLoadCenterStorageSimple(BaseModel):
+class ElectricLoadCenterStorageSimple(TrackedModel):
     availability_schedule_name: Optional[str] = None
     zone_name: Optional[str] = None
     radiative_fraction_for_zone_heat_gains: Annotated[
@@ -5724,7 +5726,7 @@ class PerformanceInputMethod4(Enum):
     rated_losses = "RatedLosses"
 
 
-class Meter(BaseModel):
+class Meter(TrackedModel):
     meter_name: Optional[str] = None
 
 
@@ -5755,7 +5757,7 @@ class StorageOperationScheme(Enum):
     track_meter_demand_store_excess_on_site = "TrackMeterDemandStoreExcessOnSite"
 
 
-class ElectricLoadCenterDistribution(BaseModel):
+class ElectricLoadCenterDistribution(TrackedModel):
     generator_list_name: Optional[str] = None
     generator_operation_scheme_type: Optional[GeneratorOperationSchemeType] = None
     generator_demand_limit_scheme_purchased_electric_demand_limit: Optional[float] = (
@@ -5789,7 +5791,7 @@ class PowerConversionEfficiencyMethod(Enum):
     simple_fixed = "SimpleFixed"
 
 
-class ElectricLoadCenterStorageConverter(BaseModel):
+class ElectricLoadCenterStorageConverter(TrackedModel):
     availability_schedule_name: Optional[str] = None
     power_conversion_efficiency_method: Optional[PowerConversionEfficiencyMethod] = (
         PowerConversionEfficiencyMethod.simple_fixed
@@ -5802,7 +5804,7 @@ class ElectricLoadCenterStorageConverter(BaseModel):
     radiative_fraction: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = None
 
 
-class WaterUseEquipment(BaseModel):
+class WaterUseEquipment(TrackedModel):
     end_use_subcategory: Optional[str] = "General"
     peak_flow_rate: Annotated[float, Field(ge=0.0)]
     flow_rate_fraction_schedule_name: Optional[str] = None
@@ -5827,11 +5829,11 @@ class DrainWaterHeatExchangerDestination(Enum):
     plant_and_equipment = "PlantAndEquipment"
 
 
-class Connection(BaseModel):
+class Connection(TrackedModel):
     water_use_equipment_name: str
 
 
-class WaterUseConnections(BaseModel):
+class WaterUseConnections(TrackedModel):
     inlet_node_name: Optional[str] = None
     outlet_node_name: Optional[str] = None
     supply_water_storage_tank_name: Optional[str] = None
@@ -5850,11 +5852,11 @@ class WaterUseConnections(BaseModel):
     connections: Optional[List[Connection]] = None
 
 
-class Value(BaseModel):
+class Value(TrackedModel):
     value: Optional[float] = None
 
 
-class MatrixTwoDimension(BaseModel):
+class MatrixTwoDimension(TrackedModel):
     number_of_rows: int
     number_of_columns: int
     values: Optional[List[Value]] = None
@@ -5878,7 +5880,7 @@ class OutputUnitType(Enum):
     temperature = "Temperature"
 
 
-class CurveLinear(BaseModel):
+class CurveLinear(TrackedModel):
     coefficient1_constant: float
     coefficient2_x: float
     minimum_value_of_x: float
@@ -5899,7 +5901,7 @@ class InputUnitTypeForW(Enum):
     volumetric_flow_per_power = "VolumetricFlowPerPower"
 
 
-class CurveQuadLinear(BaseModel):
+class CurveQuadLinear(TrackedModel):
     coefficient1_constant: float
     coefficient2_w: float
     coefficient3_x: float
@@ -5921,7 +5923,7 @@ class CurveQuadLinear(BaseModel):
     input_unit_type_for_z: Optional[InputUnitTypeForW] = InputUnitTypeForW.dimensionless
 
 
-class CurveQuintLinear(BaseModel):
+class CurveQuintLinear(TrackedModel):
     coefficient1_constant: float
     coefficient2_v: float
     coefficient3_w: float
@@ -5956,7 +5958,7 @@ class InputUnitTypeForX3(Enum):
     volumetric_flow = "VolumetricFlow"
 
 
-class CurveQuadratic(BaseModel):
+class CurveQuadratic(TrackedModel):
     coefficient1_constant: float
     coefficient2_x: float
     coefficient3_x_2: float
@@ -5970,7 +5972,7 @@ class CurveQuadratic(BaseModel):
     output_unit_type: Optional[OutputUnitType] = OutputUnitType.dimensionless
 
 
-class CurveCubic(BaseModel):
+class CurveCubic(TrackedModel):
     coefficient1_constant: float
     coefficient2_x: float
     coefficient3_x_2: float
@@ -5985,7 +5987,7 @@ class CurveCubic(BaseModel):
     output_unit_type: Optional[OutputUnitType] = OutputUnitType.dimensionless
 
 
-class CurveQuartic(BaseModel):
+class CurveQuartic(TrackedModel):
     coefficient1_constant: float
     coefficient2_x: float
     coefficient3_x_2: float
@@ -6001,7 +6003,7 @@ class CurveQuartic(BaseModel):
     output_unit_type: Optional[OutputUnitType] = OutputUnitType.dimensionless
 
 
-class CurveExponent(BaseModel):
+class CurveExponent(TrackedModel):
     coefficient1_constant: float
     coefficient2_constant: float
     coefficient3_constant: float
@@ -6015,7 +6017,7 @@ class CurveExponent(BaseModel):
     output_unit_type: Optional[OutputUnitType] = OutputUnitType.dimensionless
 
 
-class CurveBicubic(BaseModel):
+class CurveBicubic(TrackedModel):
     coefficient1_constant: float
     coefficient2_x: float
     coefficient3_x_2: float
@@ -6041,7 +6043,7 @@ class CurveBicubic(BaseModel):
     output_unit_type: Optional[OutputUnitType] = OutputUnitType.dimensionless
 
 
-class CurveBiquadratic(BaseModel):
+class CurveBiquadratic(TrackedModel):
     coefficient1_constant: float
     coefficient2_x: float
     coefficient3_x_2: float
@@ -6078,7 +6080,7 @@ class UnitType1(Enum):
     volumetric_flow = "VolumetricFlow"
 
 
-class TableIndependentVariable(BaseModel):
+class TableIndependentVariable(TrackedModel):
     interpolation_method: Optional[PerformanceInterpolationMethod] = (
         PerformanceInterpolationMethod.linear
     )
@@ -6093,11 +6095,11 @@ class TableIndependentVariable(BaseModel):
     values: Optional[List[Value]] = None
 
 
-class IndependentVariable(BaseModel):
+class IndependentVariable(TrackedModel):
     independent_variable_name: str
 
 
-class TableIndependentVariableList(BaseModel):
+class TableIndependentVariableList(TrackedModel):
     independent_variables: Optional[List[IndependentVariable]] = None
 
 
@@ -6107,11 +6109,11 @@ class NormalizationMethod(Enum):
     none = "None"
 
 
-class Value2(BaseModel):
+class Value2(TrackedModel):
     output_value: Optional[float] = None
 
 
-class TableLookup(BaseModel):
+class TableLookup(TrackedModel):
     independent_variable_list_name: str
     normalization_method: Optional[NormalizationMethod] = NormalizationMethod.none
     normalization_divisor: Optional[float] = 1.0
@@ -6129,7 +6131,7 @@ class FluidType2(Enum):
     refrigerant = "Refrigerant"
 
 
-class FluidPropertiesName(BaseModel):
+class FluidPropertiesName(TrackedModel):
     fluid_name: str
     fluid_type: FluidType2
 
@@ -6140,13 +6142,13 @@ class GlycolType(Enum):
     user_defined_glycol_type = "UserDefinedGlycolType"
 
 
-class FluidPropertiesGlycolConcentration(BaseModel):
+class FluidPropertiesGlycolConcentration(TrackedModel):
     glycol_type: GlycolType
     user_defined_glycol_name: Optional[str] = None
     glycol_concentration: Annotated[Optional[float], Field(ge=0.0, le=1.0)] = None
 
 
-class FluidPropertiesTemperatures(BaseModel):
+class FluidPropertiesTemperatures(TrackedModel):
     temperature_1: Optional[float] = None
     temperature_2: Optional[float] = None
     temperature_3: Optional[float] = None
@@ -6411,7 +6413,7 @@ class FluidPhase(Enum):
     fluid_gas = "FluidGas"
 
 
-class FluidPropertiesSaturated(BaseModel):
+class FluidPropertiesSaturated(TrackedModel):
     fluid_name: Optional[str] = None
     fluid_property_type: Optional[FluidPropertyType] = None
     fluid_phase: Optional[FluidPhase] = None
@@ -6673,7 +6675,7 @@ class FluidPropertyType1(Enum):
     enthalpy = "Enthalpy"
 
 
-class FluidPropertiesSuperheated(BaseModel):
+class FluidPropertiesSuperheated(TrackedModel):
     fluid_name: Optional[str] = None
     fluid_property_type: Optional[FluidPropertyType1] = None
     temperature_values_name: Optional[str] = None
@@ -6958,7 +6960,7 @@ class BuyOrSell(Enum):
     sell_to_utility = "SellToUtility"
 
 
-class UtilityCostTariff(BaseModel):
+class UtilityCostTariff(TrackedModel):
     output_meter_name: str
     conversion_factor_choice: Optional[ConversionFactorChoice] = None
     energy_conversion_factor: Optional[float] = None
@@ -6993,7 +6995,7 @@ class ThresholdTest(Enum):
     count = "Count"
 
 
-class UtilityCostQualify(BaseModel):
+class UtilityCostQualify(TrackedModel):
     utility_cost_qualify_name: str
     tariff_name: str
     variable_name: str
@@ -7017,7 +7019,7 @@ class CategoryVariableName(Enum):
     total = "Total"
 
 
-class UtilityCostChargeSimple(BaseModel):
+class UtilityCostChargeSimple(TrackedModel):
     utility_cost_charge_simple_name: str
     tariff_name: str
     source_variable: str
@@ -7026,7 +7028,7 @@ class UtilityCostChargeSimple(BaseModel):
     cost_per_unit_value_or_variable_name: Union[float, str]
 
 
-class UtilityCostChargeBlock(BaseModel):
+class UtilityCostChargeBlock(TrackedModel):
     utility_cost_charge_block_name: str
     tariff_name: str
     source_variable: str
@@ -7073,7 +7075,7 @@ class VariableType(Enum):
     energy = "Energy"
 
 
-class UtilityCostVariable(BaseModel):
+class UtilityCostVariable(TrackedModel):
     tariff_name: str
     variable_type: Optional[VariableType] = VariableType.dimensionless
     january_value: Optional[float] = None
@@ -7100,7 +7102,7 @@ class SortOption(Enum):
     unsorted = "Unsorted"
 
 
-class OutputVariableDictionary(BaseModel):
+class OutputVariableDictionary(TrackedModel):
     key_field: Optional[KeyField] = KeyField.regular
     sort_option: Optional[SortOption] = None
 
@@ -7115,7 +7117,7 @@ class ReportType(Enum):
     view_factor_info = "ViewFactorInfo"
 
 
-class OutputSurfacesList(BaseModel):
+class OutputSurfacesList(TrackedModel):
     report_type: ReportType
     report_specifications: Optional[Literal["IDF"]] = None
 
@@ -7132,7 +7134,7 @@ class ReportSpecifications1(Enum):
     triangulate3_d_face = "Triangulate3DFace"
 
 
-class OutputSurfacesDrawing(BaseModel):
+class OutputSurfacesDrawing(TrackedModel):
     report_type: ReportType1
     report_specifications_1: Optional[ReportSpecifications1] = (
         ReportSpecifications1.triangulate3_d_face
@@ -7145,7 +7147,7 @@ class DetailsType1(Enum):
     materials = "Materials"
 
 
-class OutputConstructions(BaseModel):
+class OutputConstructions(TrackedModel):
     details_type_1: Optional[DetailsType1] = None
     details_type_2: Optional[DetailsType1] = None
 
@@ -7162,7 +7164,7 @@ class EmsRuntimeLanguageDebugOutputLevel(Enum):
     verbose = "Verbose"
 
 
-class OutputEnergyManagementSystem(BaseModel):
+class OutputEnergyManagementSystem(TrackedModel):
     actuator_availability_dictionary_reporting: Optional[
         ActuatorAvailabilityDictionaryReporting
     ] = ActuatorAvailabilityDictionaryReporting.none
@@ -7321,11 +7323,11 @@ class ReportName(Enum):
     )
 
 
-class Report(BaseModel):
+class Report(TrackedModel):
     report_name: Optional[ReportName] = None
 
 
-class OutputTableSummaryReports(BaseModel):
+class OutputTableSummaryReports(TrackedModel):
     reports: Optional[List[Report]] = None
 
 
@@ -7336,7 +7338,7 @@ class VariableType1(Enum):
     volumetric_flow = "VolumetricFlow"
 
 
-class OutputTableTimeBins(BaseModel):
+class OutputTableTimeBins(TrackedModel):
     key_value: Optional[str] = "*"
     variable_name: str
     interval_start: Optional[float] = None
@@ -7362,14 +7364,14 @@ class AggregationTypeForVariableOrMeter(Enum):
     value_when_maximum_or_minimum = "ValueWhenMaximumOrMinimum"
 
 
-class VariableDetail(BaseModel):
+class VariableDetail(TrackedModel):
     variable_or_meter_name: Optional[str] = None
     aggregation_type_for_variable_or_meter: Optional[
         AggregationTypeForVariableOrMeter
     ] = None
 
 
-class OutputTableMonthly(BaseModel):
+class OutputTableMonthly(TrackedModel):
     digits_after_decimal: Annotated[Optional[int], Field(ge=0, le=10)] = 2
     variable_details: Optional[List[VariableDetail]] = None
 
@@ -7396,12 +7398,12 @@ class UnitConversion(Enum):
     none = "None"
 
 
-class OutputControlTableStyle(BaseModel):
+class OutputControlTableStyle(TrackedModel):
     column_separator: Optional[ColumnSeparator] = ColumnSeparator.comma
     unit_conversion: Optional[UnitConversion] = UnitConversion.none
 
 
-class OutputControlReportingTolerances(BaseModel):
+class OutputControlReportingTolerances(TrackedModel):
     tolerance_for_time_heating_setpoint_not_met: Annotated[
         Optional[float], Field(ge=0.0, le=10.0)
     ] = 0.2
@@ -7421,14 +7423,14 @@ class ReportingFrequency(Enum):
     timestep = "Timestep"
 
 
-class OutputVariable(BaseModel):
+class OutputVariable(TrackedModel):
     key_value: Optional[str] = "*"
     variable_name: str
     reporting_frequency: Optional[ReportingFrequency] = ReportingFrequency.hourly
     schedule_name: Optional[str] = None
 
 
-class OutputMeter(BaseModel):
+class OutputMeter(TrackedModel):
     key_name: str
     reporting_frequency: Optional[ReportingFrequency] = ReportingFrequency.hourly
 
@@ -7454,17 +7456,17 @@ class ResourceType(Enum):
     water = "Water"
 
 
-class VariableDetail1(BaseModel):
+class VariableDetail1(TrackedModel):
     key_name: Optional[str] = None
     output_variable_or_meter_name: Optional[str] = None
 
 
-class MeterCustom(BaseModel):
+class MeterCustom(TrackedModel):
     resource_type: Optional[ResourceType] = None
     variable_details: Optional[List[VariableDetail1]] = None
 
 
-class MeterCustomDecrement(BaseModel):
+class MeterCustomDecrement(TrackedModel):
     resource_type: Optional[ResourceType] = None
     source_meter_name: str
     variable_details: Optional[List[VariableDetail1]] = None
@@ -7490,7 +7492,7 @@ class UnitConversionForTabularData(Enum):
     use_output_control_table_style = "UseOutputControlTableStyle"
 
 
-class OutputSqLite(BaseModel):
+class OutputSqLite(TrackedModel):
     option_type: Optional[OptionType1] = None
     unit_conversion_for_tabular_data: Optional[UnitConversionForTabularData] = (
         UnitConversionForTabularData.use_output_control_table_style
@@ -7507,11 +7509,11 @@ class ReportingFrequency3(Enum):
     timestep = "Timestep"
 
 
-class OutputEnvironmentalImpactFactors(BaseModel):
+class OutputEnvironmentalImpactFactors(TrackedModel):
     reporting_frequency: Optional[ReportingFrequency3] = None
 
 
-class EnvironmentalImpactFactors(BaseModel):
+class EnvironmentalImpactFactors(TrackedModel):
     district_heating_water_efficiency: Annotated[Optional[float], Field(gt=0.0)] = 0.3
     district_cooling_cop: Annotated[Optional[float], Field(gt=0.0)] = 3.0
     district_heating_steam_conversion_efficiency: Annotated[
@@ -7522,7 +7524,7 @@ class EnvironmentalImpactFactors(BaseModel):
     total_carbon_equivalent_emission_factor_from_co2: Optional[float] = 0.2727
 
 
-class FuelFactors(BaseModel):
+class FuelFactors(TrackedModel):
     existing_fuel_resource_name: Optional[FuelType4] = None
     source_energy_factor: Optional[float] = None
     source_energy_schedule_name: Optional[str] = None
@@ -7575,11 +7577,11 @@ class Key(Enum):
     report_during_warmup = "ReportDuringWarmup"
 
 
-class Diagnostic(BaseModel):
+class Diagnostic(TrackedModel):
     key: Optional[Key] = None
 
 
-class OutputDiagnostics(BaseModel):
+class OutputDiagnostics(TrackedModel):
     diagnostics: Optional[List[Diagnostic]] = None
 
 
@@ -7588,7 +7590,7 @@ class EPBoolean(Enum):
     yes = "Yes"
 
 
-class SimulationControl(BaseModel):
+class SimulationControl(TrackedModel):
     do_zone_sizing_calculation: Optional[EPBoolean] = EPBoolean.no
     do_system_sizing_calculation: Optional[EPBoolean] = EPBoolean.no
     do_plant_sizing_calculation: Optional[EPBoolean] = EPBoolean.no
@@ -7600,7 +7602,7 @@ class SimulationControl(BaseModel):
     ] = 1
 
 
-class ShadowCalculation(BaseModel):
+class ShadowCalculation(TrackedModel):
     shading_calculation_method: Optional[ShadingCalculationMethod] = (
         ShadingCalculationMethod.polygon_clipping
     )
@@ -7626,20 +7628,20 @@ class ShadowCalculation(BaseModel):
     shading_zone_groups: Optional[List[ShadingZoneGroup]] = None
 
 
-class ZoneAirHeatBalanceAlgorithm(BaseModel):
+class ZoneAirHeatBalanceAlgorithm(TrackedModel):
     algorithm: Optional[Algorithm3] = Algorithm3.third_order_backward_difference
     do_space_heat_balance_for_sizing: Optional[EPBoolean] = EPBoolean.no
     do_space_heat_balance_for_simulation: Optional[EPBoolean] = EPBoolean.no
 
 
-class ZoneAirContaminantBalance(BaseModel):
+class ZoneAirContaminantBalance(TrackedModel):
     carbon_dioxide_concentration: Optional[EPBoolean] = EPBoolean.no
     outdoor_carbon_dioxide_schedule_name: Optional[str] = None
     generic_contaminant_concentration: Optional[EPBoolean] = EPBoolean.no
     outdoor_generic_contaminant_schedule_name: Optional[str] = None
 
 
-class SiteLocation(BaseModel):
+class SiteLocation(TrackedModel):
     latitude: Annotated[Optional[float], Field(ge=-90.0, le=90.0)] = 0.0
     longitude: Annotated[Optional[float], Field(ge=-180.0, le=180.0)] = 0.0
     time_zone: Annotated[Optional[float], Field(ge=-12.0, le=14.0)] = 0.0
@@ -7647,7 +7649,7 @@ class SiteLocation(BaseModel):
     keep_site_location_information: Optional[EPBoolean] = EPBoolean.no
 
 
-class SizingPeriodDesignDay(BaseModel):
+class SizingPeriodDesignDay(TrackedModel):
     month: Annotated[int, Field(ge=1, le=12)]
     day_of_month: Annotated[int, Field(ge=1, le=31)]
     day_type: DayType
@@ -7693,7 +7695,7 @@ class SizingPeriodDesignDay(BaseModel):
     )
 
 
-class RunPeriod(BaseModel):
+class RunPeriod(TrackedModel):
     begin_month: Annotated[int, Field(ge=1, le=12)]
     begin_day_of_month: Annotated[int, Field(ge=1, le=31)]
     begin_year: Optional[float] = None
@@ -7712,7 +7714,7 @@ class RunPeriod(BaseModel):
     ] = FirstHourInterpolationStartingValues.hour24
 
 
-class WindowMaterialGlazing(BaseModel):
+class WindowMaterialGlazing(TrackedModel):
     optical_data_type: OpticalDataType
     window_glass_spectral_data_set_name: Optional[str] = None
     thickness: Annotated[float, Field(gt=0.0)]
@@ -7761,7 +7763,7 @@ class WindowMaterialGlazing(BaseModel):
     ) = (None)
 
 
-class Zone(BaseModel):
+class Zone(TrackedModel):
     direction_of_relative_north: Optional[float] = 0.0
     x_origin: Optional[float] = 0.0
     y_origin: Optional[float] = 0.0
@@ -7776,7 +7778,7 @@ class Zone(BaseModel):
     part_of_total_floor_area: Optional[EPBoolean] = EPBoolean.no
 
 
-class WindowShadingControl(BaseModel):
+class WindowShadingControl(TrackedModel):
     zone_name: str
     shading_control_sequence_number: Annotated[Optional[int], Field(ge=1)] = 1
     shading_type: ShadingType
@@ -7799,7 +7801,7 @@ class WindowShadingControl(BaseModel):
     fenestration_surfaces: Optional[List[FenestrationSurface]] = None
 
 
-class People(BaseModel):
+class People(TrackedModel):
     zone_or_zonelist_or_space_or_spacelist_name: str
     number_of_people_schedule_name: str
     number_of_people_calculation_method: Optional[NumberOfPeopleCalculationMethod] = (
@@ -7840,7 +7842,7 @@ class People(BaseModel):
     heat_stress_temperature_threshold: Optional[float] = 30.0
 
 
-class Lights(BaseModel):
+class Lights(TrackedModel):
     zone_or_zonelist_or_space_or_spacelist_name: str
     schedule_name: str
     design_level_calculation_method: Optional[DesignLevelCalculationMethod] = (
@@ -7867,7 +7869,7 @@ class Lights(BaseModel):
     exhaust_air_heat_gain_node_name: Optional[str] = None
 
 
-class SizingZone(BaseModel):
+class SizingZone(TrackedModel):
     zone_or_zonelist_name: str
     zone_cooling_design_supply_air_temperature_input_method: Optional[
         ZoneCoolingDesignSupplyAirTemperatureInputMethod
@@ -7945,7 +7947,7 @@ class SizingZone(BaseModel):
     )
 
 
-class SizingSystem(BaseModel):
+class SizingSystem(TrackedModel):
     airloop_name: str
     type_of_load_to_size_on: Optional[TypeOfLoadToSizeOn] = TypeOfLoadToSizeOn.sensible
     design_outdoor_air_flow_rate: Optional[
@@ -8036,7 +8038,7 @@ class SizingSystem(BaseModel):
     )
 
 
-class ZoneHvacPackagedTerminalAirConditioner(BaseModel):
+class ZoneHvacPackagedTerminalAirConditioner(TrackedModel):
     availability_schedule_name: Optional[str] = None
     air_inlet_node_name: str
     air_outlet_node_name: str
@@ -8076,7 +8078,7 @@ class ZoneHvacPackagedTerminalAirConditioner(BaseModel):
     ] = "Autosize"
 
 
-class ZoneHvacEnergyRecoveryVentilatorController(BaseModel):
+class ZoneHvacEnergyRecoveryVentilatorController(TrackedModel):
     temperature_high_limit: Optional[float] = None
     temperature_low_limit: Optional[float] = None
     enthalpy_high_limit: Optional[float] = None
@@ -8099,7 +8101,7 @@ class ZoneHvacEnergyRecoveryVentilatorController(BaseModel):
     ] = EPBoolean.no
 
 
-class ZoneHvacUnitHeater(BaseModel):
+class ZoneHvacUnitHeater(TrackedModel):
     availability_schedule_name: Optional[str] = None
     air_inlet_node_name: Optional[str] = None
     air_outlet_node_name: Optional[str] = None
@@ -8121,7 +8123,7 @@ class ZoneHvacUnitHeater(BaseModel):
     design_specification_zonehvac_sizing_object_name: Optional[str] = None
 
 
-class CoilCoolingDxSingleSpeed(BaseModel):
+class CoilCoolingDxSingleSpeed(TrackedModel):
     availability_schedule_name: Optional[str] = None
     gross_rated_total_cooling_capacity: Union[
         GrossRatedTotalCoolingCapacity, Literal["Autosize"]
@@ -8194,7 +8196,7 @@ class CoilCoolingDxSingleSpeed(BaseModel):
     zone_name_for_condenser_placement: Optional[str] = None
 
 
-class CoilCoolingDxMultiSpeed(BaseModel):
+class CoilCoolingDxMultiSpeed(TrackedModel):
     availability_schedule_name: Optional[str] = None
     air_inlet_node_name: str
     air_outlet_node_name: str
@@ -8456,7 +8458,7 @@ class CoilCoolingDxMultiSpeed(BaseModel):
     zone_name_for_condenser_placement: Optional[str] = None
 
 
-class CoilSystemCoolingDx(BaseModel):
+class CoilSystemCoolingDx(TrackedModel):
     availability_schedule_name: Optional[str] = None
     dx_cooling_coil_system_inlet_node_name: str
     dx_cooling_coil_system_outlet_node_name: str
@@ -8474,7 +8476,7 @@ class CoilSystemCoolingDx(BaseModel):
     ] = 2.0
 
 
-class HeatExchangerAirToAirSensibleAndLatent(BaseModel):
+class HeatExchangerAirToAirSensibleAndLatent(TrackedModel):
     availability_schedule_name: Optional[str] = None
     nominal_supply_air_flow_rate: Union[NominalSupplyAirFlowRate, Literal["Autosize"]]
     sensible_effectiveness_at_100_heating_air_flow: Annotated[
@@ -8511,7 +8513,7 @@ class HeatExchangerAirToAirSensibleAndLatent(BaseModel):
     latent_effectiveness_of_cooling_air_flow_curve_name: Optional[str] = None
 
 
-class AirLoopHvacUnitarySystem(BaseModel):
+class AirLoopHvacUnitarySystem(TrackedModel):
     control_type: Optional[ControlType] = ControlType.load
     controlling_zone_or_thermostat_location: Optional[str] = None
     dehumidification_control_type: Optional[DehumidificationControlType1] = (
@@ -8613,7 +8615,7 @@ class AirLoopHvacUnitarySystem(BaseModel):
     design_specification_multispeed_object_name: Optional[str] = None
 
 
-class UnitarySystemPerformanceMultispeed(BaseModel):
+class UnitarySystemPerformanceMultispeed(TrackedModel):
     number_of_speeds_for_heating: Annotated[int, Field(ge=0, le=10)]
     number_of_speeds_for_cooling: Annotated[int, Field(ge=0, le=10)]
     single_mode_operation: Optional[EPBoolean] = EPBoolean.no
@@ -8623,7 +8625,7 @@ class UnitarySystemPerformanceMultispeed(BaseModel):
     flow_ratios: Optional[List[FlowRatio]] = None
 
 
-class ControllerOutdoorAir(BaseModel):
+class ControllerOutdoorAir(TrackedModel):
     relief_air_outlet_node_name: str
     return_air_node_name: str
     mixed_air_node_name: str
@@ -8666,7 +8668,7 @@ class ControllerOutdoorAir(BaseModel):
     )
 
 
-class ControllerMechanicalVentilation(BaseModel):
+class ControllerMechanicalVentilation(TrackedModel):
     availability_schedule_name: Optional[str] = None
     demand_controlled_ventilation: Optional[EPBoolean] = EPBoolean.no
     system_outdoor_air_method: Optional[SystemOutdoorAirMethod1] = (
@@ -8676,7 +8678,7 @@ class ControllerMechanicalVentilation(BaseModel):
     zone_specifications: Optional[List[ZoneSpecification]] = None
 
 
-class OutdoorAirNode(BaseModel):
+class OutdoorAirNode(TrackedModel):
     height_above_ground: Optional[float] = -1.0
     drybulb_temperature_schedule_name: Optional[str] = None
     wetbulb_temperature_schedule_name: Optional[str] = None
@@ -8687,7 +8689,7 @@ class OutdoorAirNode(BaseModel):
     wind_angle_type: Optional[WindAngleType] = WindAngleType.absolute
 
 
-class ElectricLoadCenterTransformer(BaseModel):
+class ElectricLoadCenterTransformer(TrackedModel):
     availability_schedule_name: Optional[str] = None
     transformer_usage: Optional[TransformerUsage] = TransformerUsage.power_in_from_grid
     zone_name: Optional[str] = None
@@ -8720,7 +8722,7 @@ class ElectricLoadCenterTransformer(BaseModel):
     meters: Optional[List[Meter]] = None
 
 
-class OutputControlFiles(BaseModel):
+class OutputControlFiles(TrackedModel):
     output_csv: Optional[EPBoolean] = EPBoolean.no
     output_mtr: Optional[EPBoolean] = EPBoolean.no
     output_eso: Optional[EPBoolean] = EPBoolean.no
@@ -8755,19 +8757,19 @@ class OutputControlFiles(BaseModel):
     output_tarcog: Optional[EPBoolean] = EPBoolean.no
 
 
-class OutputControlTimestamp(BaseModel):
+class OutputControlTimestamp(TrackedModel):
     iso_8601_format: Optional[EPBoolean] = EPBoolean.no
     timestamp_at_beginning_of_interval: Optional[EPBoolean] = EPBoolean.no
 
 
-class OutputJson(BaseModel):
+class OutputJson(TrackedModel):
     option_type: OptionType
     output_json: Optional[EPBoolean] = EPBoolean.no
     output_cbor: Optional[EPBoolean] = EPBoolean.no
     output_messagepack: Optional[EPBoolean] = EPBoolean.no
 
 
-class EnergyPlusModel(BaseModel):
+class EnergyPlusModel(TrackedModel):
     version: Annotated[Optional[Dict[str, Version]], Field(alias="Version")] = None
     simulation_control: Annotated[
         Optional[Dict[str, SimulationControl]], Field(alias="SimulationControl")
@@ -0,0 +1,60 @@
+"""
+Canonical content hashes of epJSON objects, sections and models.
+
+An object is hashed from its validated form, serialized by pydantic-core
+with epJSON aliases and without the fields left as None, so the same
+content hashes the same however it was loaded or built. A section is
+hashed from the names and hashes of its objects, and a model from the
+hashes of its sections, both sorted, so neither depends on the order of
+objects or sections.
+
+EnergyPlusModel caches these hashes, see EnergyPlusModel.content_hash.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+from epmodel.sections import validate_object
+
+
+def hash_object(key: str, name: str, obj: Any) -> str:
+    """Canonical hash of an epJSON object.
+
+    Args:
+        key: field name or epJSON object type of the section
+        name: name of the object
+        obj: object model, or raw epJSON data which is validated first
+
+    Returns:
+        Hex digest
+
+    Raises:
+        ValidationError: If obj is raw data and invalid.
+    """
+    if not isinstance(obj, BaseModel):
+        obj = validate_object(key, name, obj)
+    content = obj.model_dump_json(by_alias=True, exclude_none=True, warnings=False)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def hash_data(data: Any) -> str:
+    """Canonical hash of raw JSON data, e.g. of an unknown object type."""
+    content = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def combine_hashes(hashes: Dict[str, str]) -> str:
+    """Order independent hash of named hashes.
+
+    Args:
+        hashes: name -> hex digest, e.g. object name -> object hash
+
+    Returns:
+        Hex digest
+    """
+    # Length prefixed, so that no name can run into its hash
+    content = "".join(f"{len(name)}:{name}{hashes[name]}" for name in sorted(hashes))
+    return hashlib.sha256(content.encode()).hexdigest()
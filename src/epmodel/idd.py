@@ -0,0 +1,12644 @@
+"""
+IDD metadata of the EnergyPlus model objects.
+
+Generated by codegen/genidd.py from Energy+.schema.epJSON, do not edit.
+"""
+
+from typing import Any, Dict, FrozenSet
+
+IDD: Dict[str, Dict[str, Any]] = {
+    "AirLoopHVAC": {
+        "name": True,
+        "fields": [
+            "controller_list_name",
+            "availability_manager_list_name",
+            "design_supply_air_flow_rate",
+            "branch_list_name",
+            "connector_list_name",
+            "supply_side_inlet_node_name",
+            "demand_side_outlet_node_name",
+            "demand_side_inlet_node_names",
+            "supply_side_outlet_node_names",
+            "design_return_air_flow_fraction_of_supply_air_flow",
+        ],
+        "numeric": [
+            "design_supply_air_flow_rate",
+            "design_return_air_flow_fraction_of_supply_air_flow",
+        ],
+        "choices": {"design_supply_air_flow_rate": ["Autosize"]},
+        "references": ["AirPrimaryLoops"],
+        "object_lists": {
+            "controller_list_name": ["ControllerLists"],
+            "availability_manager_list_name": ["SystemAvailabilityManagerLists"],
+            "branch_list_name": ["BranchLists"],
+            "connector_list_name": ["ConnectorLists"],
+        },
+    },
+    "AirLoopHVAC:ControllerList": {
+        "name": True,
+        "fields": [
+            "controller_1_object_type",
+            "controller_1_name",
+            "controller_2_object_type",
+            "controller_2_name",
+            "controller_3_object_type",
+            "controller_3_name",
+            "controller_4_object_type",
+            "controller_4_name",
+            "controller_5_object_type",
+            "controller_5_name",
+            "controller_6_object_type",
+            "controller_6_name",
+            "controller_7_object_type",
+            "controller_7_name",
+            "controller_8_object_type",
+            "controller_8_name",
+        ],
+        "choices": {
+            "controller_1_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+            "controller_2_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+            "controller_3_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+            "controller_4_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+            "controller_5_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+            "controller_6_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+            "controller_7_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+            "controller_8_object_type": [
+                "Controller:OutdoorAir",
+                "Controller:WaterCoil",
+            ],
+        },
+        "references": ["ControllerLists"],
+        "object_lists": {
+            "controller_1_name": ["AirLoopControllers"],
+            "controller_2_name": ["AirLoopControllers"],
+            "controller_3_name": ["AirLoopControllers"],
+            "controller_4_name": ["AirLoopControllers"],
+            "controller_5_name": ["AirLoopControllers"],
+            "controller_6_name": ["AirLoopControllers"],
+            "controller_7_name": ["AirLoopControllers"],
+            "controller_8_name": ["AirLoopControllers"],
+        },
+        "object_types": {
+            "controller_1_name": "controller_1_object_type",
+            "controller_2_name": "controller_2_object_type",
+            "controller_3_name": "controller_3_object_type",
+            "controller_4_name": "controller_4_object_type",
+            "controller_5_name": "controller_5_object_type",
+            "controller_6_name": "controller_6_object_type",
+            "controller_7_name": "controller_7_object_type",
+            "controller_8_name": "controller_8_object_type",
+        },
+    },
+    "AirLoopHVAC:OutdoorAirSystem": {
+        "name": True,
+        "fields": ["controller_list_name", "outdoor_air_equipment_list_name"],
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "controller_list_name": ["ControllerLists"],
+            "outdoor_air_equipment_list_name": ["AirLoopOAEquipmentLists"],
+        },
+    },
+    "AirLoopHVAC:OutdoorAirSystem:EquipmentList": {
+        "name": True,
+        "fields": [
+            "component_1_object_type",
+            "component_1_name",
+            "component_2_object_type",
+            "component_2_name",
+            "component_3_object_type",
+            "component_3_name",
+            "component_4_object_type",
+            "component_4_name",
+            "component_5_object_type",
+            "component_5_name",
+            "component_6_object_type",
+            "component_6_name",
+            "component_7_object_type",
+            "component_7_name",
+            "component_8_object_type",
+            "component_8_name",
+            "component_9_object_type",
+            "component_9_name",
+        ],
+        "references": ["AirLoopOAEquipmentLists"],
+        "object_lists": {
+            "component_1_name": ["validOASysEquipmentNames"],
+            "component_2_name": ["validOASysEquipmentNames"],
+            "component_3_name": ["validOASysEquipmentNames"],
+            "component_4_name": ["validOASysEquipmentNames"],
+            "component_5_name": ["validOASysEquipmentNames"],
+            "component_6_name": ["validOASysEquipmentNames"],
+            "component_7_name": ["validOASysEquipmentNames"],
+            "component_8_name": ["validOASysEquipmentNames"],
+            "component_9_name": ["validOASysEquipmentNames"],
+        },
+        "object_types": {
+            "component_1_name": "component_1_object_type",
+            "component_2_name": "component_2_object_type",
+            "component_3_name": "component_3_object_type",
+            "component_4_name": "component_4_object_type",
+            "component_5_name": "component_5_object_type",
+            "component_6_name": "component_6_object_type",
+            "component_7_name": "component_7_object_type",
+            "component_8_name": "component_8_object_type",
+            "component_9_name": "component_9_object_type",
+        },
+    },
+    "AirLoopHVAC:ReturnPath": {
+        "name": True,
+        "fields": ["return_air_path_outlet_node_name"],
+        "extension": "components",
+        "extensibles": ["component_object_type", "component_name"],
+        "choices": {
+            "component_object_type": [
+                "AirLoopHVAC:ReturnPlenum",
+                "AirLoopHVAC:ZoneMixer",
+            ]
+        },
+        "object_lists": {"component_name": ["ReturnPathComponentNames"]},
+        "object_types": {"component_name": "component_object_type"},
+    },
+    "AirLoopHVAC:ReturnPlenum": {
+        "name": True,
+        "fields": [
+            "zone_name",
+            "zone_node_name",
+            "outlet_node_name",
+            "induced_air_outlet_node_or_nodelist_name",
+        ],
+        "extension": "nodes",
+        "extensibles": ["inlet_node_name"],
+        "references": ["ReturnPathComponentNames"],
+        "object_lists": {"zone_name": ["ZoneNames"]},
+    },
+    "AirLoopHVAC:SupplyPath": {
+        "name": True,
+        "fields": ["supply_air_path_inlet_node_name"],
+        "extension": "components",
+        "extensibles": ["component_object_type", "component_name"],
+        "choices": {
+            "component_object_type": [
+                "AirLoopHVAC:SupplyPlenum",
+                "AirLoopHVAC:ZoneSplitter",
+            ]
+        },
+        "object_lists": {"component_name": ["SupplyPathComponentNames"]},
+        "object_types": {"component_name": "component_object_type"},
+    },
+    "AirLoopHVAC:Unitary:Furnace:HeatCool": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "furnace_air_inlet_node_name",
+            "furnace_air_outlet_node_name",
+            "supply_air_fan_operating_mode_schedule_name",
+            "maximum_supply_air_temperature",
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+            "controlling_zone_or_thermostat_location",
+            "supply_fan_object_type",
+            "supply_fan_name",
+            "fan_placement",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "dehumidification_control_type",
+            "reheat_coil_object_type",
+            "reheat_coil_name",
+        ],
+        "numeric": [
+            "maximum_supply_air_temperature",
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+        ],
+        "choices": {
+            "maximum_supply_air_temperature": ["Autosize"],
+            "cooling_supply_air_flow_rate": ["Autosize"],
+            "heating_supply_air_flow_rate": ["Autosize"],
+            "no_load_supply_air_flow_rate": ["Autosize"],
+            "supply_fan_object_type": ["Fan:ConstantVolume", "Fan:OnOff"],
+            "fan_placement": ["BlowThrough", "DrawThrough"],
+            "heating_coil_object_type": [
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+            "cooling_coil_object_type": [
+                "Coil:Cooling:DX:SingleSpeed",
+                "Coil:Cooling:DX:VariableSpeed",
+                "CoilSystem:Cooling:DX:HeatExchangerAssisted",
+            ],
+            "dehumidification_control_type": ["CoolReheat", "Multimode", "None"],
+            "reheat_coil_object_type": [
+                "Coil:Heating:Desuperheater",
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+            "controlling_zone_or_thermostat_location": ["ZoneNames"],
+            "supply_fan_name": ["FansCVandOnOff"],
+            "heating_coil_name": ["HeatingCoilName"],
+            "cooling_coil_name": ["CoolingCoilsDXSingleSpeed"],
+            "reheat_coil_name": ["HeatingCoilName"],
+        },
+        "object_types": {
+            "supply_fan_name": "supply_fan_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+            "cooling_coil_name": "cooling_coil_object_type",
+            "reheat_coil_name": "reheat_coil_object_type",
+        },
+    },
+    "AirLoopHVAC:UnitaryHeatCool": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "unitary_system_air_inlet_node_name",
+            "unitary_system_air_outlet_node_name",
+            "supply_air_fan_operating_mode_schedule_name",
+            "maximum_supply_air_temperature",
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+            "controlling_zone_or_thermostat_location",
+            "supply_fan_object_type",
+            "supply_fan_name",
+            "fan_placement",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "dehumidification_control_type",
+            "reheat_coil_object_type",
+            "reheat_coil_name",
+        ],
+        "numeric": [
+            "maximum_supply_air_temperature",
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+        ],
+        "choices": {
+            "maximum_supply_air_temperature": ["Autosize"],
+            "cooling_supply_air_flow_rate": ["Autosize"],
+            "heating_supply_air_flow_rate": ["Autosize"],
+            "no_load_supply_air_flow_rate": ["Autosize"],
+            "supply_fan_object_type": ["Fan:ConstantVolume", "Fan:OnOff"],
+            "fan_placement": ["BlowThrough", "DrawThrough"],
+            "heating_coil_object_type": [
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+            "cooling_coil_object_type": [
+                "Coil:Cooling:DX:SingleSpeed",
+                "Coil:Cooling:DX:VariableSpeed",
+                "CoilSystem:Cooling:DX:HeatExchangerAssisted",
+            ],
+            "dehumidification_control_type": ["CoolReheat", "Multimode", "None"],
+            "reheat_coil_object_type": [
+                "Coil:Heating:Desuperheater",
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+            "controlling_zone_or_thermostat_location": ["ZoneNames"],
+            "supply_fan_name": ["FansCVandOnOff"],
+            "heating_coil_name": ["HeatingCoilName"],
+            "cooling_coil_name": ["CoolingCoilsDXSingleSpeed"],
+            "reheat_coil_name": ["HeatingCoilName"],
+        },
+        "object_types": {
+            "supply_fan_name": "supply_fan_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+            "cooling_coil_name": "cooling_coil_object_type",
+            "reheat_coil_name": "reheat_coil_object_type",
+        },
+    },
+    "AirLoopHVAC:UnitaryHeatPump:AirToAir": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+            "controlling_zone_or_thermostat_location",
+            "supply_air_fan_object_type",
+            "supply_air_fan_name",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "supplemental_heating_coil_object_type",
+            "supplemental_heating_coil_name",
+            "maximum_supply_air_temperature_from_supplemental_heater",
+            "maximum_outdoor_dry_bulb_temperature_for_supplemental_heater_operation",
+            "fan_placement",
+            "supply_air_fan_operating_mode_schedule_name",
+            "dehumidification_control_type",
+        ],
+        "numeric": [
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+            "maximum_supply_air_temperature_from_supplemental_heater",
+            "maximum_outdoor_dry_bulb_temperature_for_supplemental_heater_operation",
+        ],
+        "choices": {
+            "cooling_supply_air_flow_rate": ["Autosize"],
+            "heating_supply_air_flow_rate": ["Autosize"],
+            "no_load_supply_air_flow_rate": ["Autosize"],
+            "supply_air_fan_object_type": ["Fan:ConstantVolume", "Fan:OnOff"],
+            "heating_coil_object_type": [
+                "Coil:Heating:DX:SingleSpeed",
+                "Coil:Heating:DX:VariableSpeed",
+                "CoilSystem:IntegratedHeatPump:AirSource",
+            ],
+            "cooling_coil_object_type": [
+                "Coil:Cooling:DX:SingleSpeed",
+                "Coil:Cooling:DX:VariableSpeed",
+                "CoilSystem:Cooling:DX:HeatExchangerAssisted",
+                "CoilSystem:IntegratedHeatPump:AirSource",
+            ],
+            "supplemental_heating_coil_object_type": [
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+            "maximum_supply_air_temperature_from_supplemental_heater": ["Autosize"],
+            "fan_placement": ["BlowThrough", "DrawThrough"],
+            "dehumidification_control_type": ["CoolReheat", "Multimode", "None"],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "controlling_zone_or_thermostat_location": ["ZoneNames"],
+            "supply_air_fan_name": ["FansCVandOnOff"],
+            "heating_coil_name": ["HeatingCoilsDXSingleSpeed"],
+            "cooling_coil_name": ["CoolingCoilsDXSingleSpeed"],
+            "supplemental_heating_coil_name": ["HeatingCoilName"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+        },
+        "object_types": {
+            "supply_air_fan_name": "supply_air_fan_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+            "cooling_coil_name": "cooling_coil_object_type",
+            "supplemental_heating_coil_name": "supplemental_heating_coil_object_type",
+        },
+    },
+    "AirLoopHVAC:UnitaryHeatPump:WaterToAir": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "supply_air_flow_rate",
+            "controlling_zone_or_thermostat_location",
+            "supply_air_fan_object_type",
+            "supply_air_fan_name",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "heating_convergence",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "cooling_convergence",
+            "supplemental_heating_coil_object_type",
+            "supplemental_heating_coil_name",
+            "maximum_supply_air_temperature_from_supplemental_heater",
+            "maximum_outdoor_dry_bulb_temperature_for_supplemental_heater_operation",
+            "outdoor_dry_bulb_temperature_sensor_node_name",
+            "fan_placement",
+            "supply_air_fan_operating_mode_schedule_name",
+            "dehumidification_control_type",
+            "heat_pump_coil_water_flow_mode",
+        ],
+        "numeric": [
+            "supply_air_flow_rate",
+            "heating_convergence",
+            "cooling_convergence",
+            "maximum_supply_air_temperature_from_supplemental_heater",
+            "maximum_outdoor_dry_bulb_temperature_for_supplemental_heater_operation",
+        ],
+        "choices": {
+            "supply_air_flow_rate": ["Autosize"],
+            "supply_air_fan_object_type": ["Fan:OnOff"],
+            "heating_coil_object_type": [
+                "Coil:Heating:WaterToAirHeatPump:EquationFit",
+                "Coil:Heating:WaterToAirHeatPump:ParameterEstimation",
+                "Coil:Heating:WaterToAirHeatPump:VariableSpeedEquationFit",
+            ],
+            "cooling_coil_object_type": [
+                "Coil:Cooling:WaterToAirHeatPump:EquationFit",
+                "Coil:Cooling:WaterToAirHeatPump:ParameterEstimation",
+                "Coil:Cooling:WaterToAirHeatPump:VariableSpeedEquationFit",
+            ],
+            "supplemental_heating_coil_object_type": [
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+            "maximum_supply_air_temperature_from_supplemental_heater": ["Autosize"],
+            "fan_placement": ["BlowThrough", "DrawThrough"],
+            "dehumidification_control_type": ["CoolReheat", "None"],
+            "heat_pump_coil_water_flow_mode": [
+                "Constant",
+                "ConstantOnDemand",
+                "Cycling",
+            ],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "controlling_zone_or_thermostat_location": ["ZoneNames"],
+            "supply_air_fan_name": ["FansOnOff"],
+            "heating_coil_name": ["HeatingCoilsWaterToAirHP"],
+            "cooling_coil_name": ["CoolingCoilsWaterToAirHP"],
+            "supplemental_heating_coil_name": ["HeatingCoilName"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+        },
+        "object_types": {
+            "supply_air_fan_name": "supply_air_fan_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+            "cooling_coil_name": "cooling_coil_object_type",
+            "supplemental_heating_coil_name": "supplemental_heating_coil_object_type",
+        },
+    },
+    "AirLoopHVAC:UnitarySystem": {
+        "name": True,
+        "fields": [
+            "control_type",
+            "controlling_zone_or_thermostat_location",
+            "dehumidification_control_type",
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "supply_fan_object_type",
+            "supply_fan_name",
+            "fan_placement",
+            "supply_air_fan_operating_mode_schedule_name",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "dx_heating_coil_sizing_ratio",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "use_doas_dx_cooling_coil",
+            "minimum_supply_air_temperature",
+            "latent_load_control",
+            "supplemental_heating_coil_object_type",
+            "supplemental_heating_coil_name",
+            "cooling_supply_air_flow_rate_method",
+            "cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_floor_area",
+            "cooling_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_unit_of_capacity",
+            "heating_supply_air_flow_rate_method",
+            "heating_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_floor_area",
+            "heating_fraction_of_autosized_heating_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_unit_of_capacity",
+            "no_load_supply_air_flow_rate_method",
+            "no_load_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate_per_floor_area",
+            "no_load_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "no_load_fraction_of_autosized_heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate_per_unit_of_capacity_during_cooling_operation",
+            "no_load_supply_air_flow_rate_per_unit_of_capacity_during_heating_operation",
+            "no_load_supply_air_flow_rate_control_set_to_low_speed",
+            "maximum_supply_air_temperature",
+            "maximum_outdoor_dry_bulb_temperature_for_supplemental_heater_operation",
+            "outdoor_dry_bulb_temperature_sensor_node_name",
+            "ancillary_on_cycle_electric_power",
+            "ancillary_off_cycle_electric_power",
+            "design_heat_recovery_water_flow_rate",
+            "maximum_temperature_for_heat_recovery",
+            "heat_recovery_water_inlet_node_name",
+            "heat_recovery_water_outlet_node_name",
+            "design_specification_multispeed_object_type",
+            "design_specification_multispeed_object_name",
+        ],
+        "numeric": [
+            "dx_heating_coil_sizing_ratio",
+            "minimum_supply_air_temperature",
+            "cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_floor_area",
+            "cooling_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_unit_of_capacity",
+            "heating_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_floor_area",
+            "heating_fraction_of_autosized_heating_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_unit_of_capacity",
+            "no_load_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate_per_floor_area",
+            "no_load_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "no_load_fraction_of_autosized_heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate_per_unit_of_capacity_during_cooling_operation",
+            "no_load_supply_air_flow_rate_per_unit_of_capacity_during_heating_operation",
+            "maximum_supply_air_temperature",
+            "maximum_outdoor_dry_bulb_temperature_for_supplemental_heater_operation",
+            "ancillary_on_cycle_electric_power",
+            "ancillary_off_cycle_electric_power",
+            "design_heat_recovery_water_flow_rate",
+            "maximum_temperature_for_heat_recovery",
+        ],
+        "choices": {
+            "control_type": ["Load", "SetPoint", "SingleZoneVAV"],
+            "dehumidification_control_type": ["CoolReheat", "Multimode", "None"],
+            "supply_fan_object_type": [
+                "Fan:ComponentModel",
+                "Fan:ConstantVolume",
+                "Fan:OnOff",
+                "Fan:SystemModel",
+                "Fan:VariableVolume",
+            ],
+            "fan_placement": ["BlowThrough", "DrawThrough"],
+            "heating_coil_object_type": [
+                "Coil:Heating:DX:MultiSpeed",
+                "Coil:Heating:DX:SingleSpeed",
+                "Coil:Heating:DX:VariableSpeed",
+                "Coil:Heating:Desuperheater",
+                "Coil:Heating:Electric",
+                "Coil:Heating:Electric:MultiStage",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Gas:MultiStage",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+                "Coil:Heating:WaterToAirHeatPump:EquationFit",
+                "Coil:Heating:WaterToAirHeatPump:ParameterEstimation",
+                "Coil:Heating:WaterToAirHeatPump:VariableSpeedEquationFit",
+                "Coil:UserDefined",
+            ],
+            "cooling_coil_object_type": [
+                "Coil:Cooling:DX",
+                "Coil:Cooling:DX:MultiSpeed",
+                "Coil:Cooling:DX:SingleSpeed",
+                "Coil:Cooling:DX:SingleSpeed:ThermalStorage",
+                "Coil:Cooling:DX:TwoSpeed",
+                "Coil:Cooling:DX:TwoStageWithHumidityControlMode",
+                "Coil:Cooling:DX:VariableSpeed",
+                "Coil:Cooling:Water",
+                "Coil:Cooling:Water:DetailedGeometry",
+                "Coil:Cooling:WaterToAirHeatPump:EquationFit",
+                "Coil:Cooling:WaterToAirHeatPump:ParameterEstimation",
+                "Coil:Cooling:WaterToAirHeatPump:VariableSpeedEquationFit",
+                "Coil:UserDefined",
+                "CoilSystem:Cooling:DX:HeatExchangerAssisted",
+                "CoilSystem:Cooling:Water:HeatExchangerAssisted",
+            ],
+            "use_doas_dx_cooling_coil": ["No", "Yes"],
+            "minimum_supply_air_temperature": ["Autosize"],
+            "latent_load_control": [
+                "LatentOnlyLoadControl",
+                "LatentOrSensibleLoadControl",
+                "LatentWithSensibleLoadControl",
+                "SensibleOnlyLoadControl",
+            ],
+            "supplemental_heating_coil_object_type": [
+                "Coil:Heating:Desuperheater",
+                "Coil:Heating:Electric",
+                "Coil:Heating:Electric:Multistage",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+                "Coil:UserDefined",
+            ],
+            "cooling_supply_air_flow_rate_method": [
+                "FlowPerCoolingCapacity",
+                "FlowPerFloorArea",
+                "FractionOfAutosizedCoolingValue",
+                "None",
+                "SupplyAirFlowRate",
+            ],
+            "cooling_supply_air_flow_rate": ["Autosize"],
+            "heating_supply_air_flow_rate_method": [
+                "FlowPerFloorArea",
+                "FlowPerHeatingCapacity",
+                "FractionOfAutosizedHeatingValue",
+                "None",
+                "SupplyAirFlowRate",
+            ],
+            "heating_supply_air_flow_rate": ["Autosize"],
+            "no_load_supply_air_flow_rate_method": [
+                "FlowPerCoolingCapacity",
+                "FlowPerFloorArea",
+                "FlowPerHeatingCapacity",
+                "FractionOfAutosizedCoolingValue",
+                "FractionOfAutosizedHeatingValue",
+                "None",
+                "SupplyAirFlowRate",
+            ],
+            "no_load_supply_air_flow_rate": ["Autosize"],
+            "no_load_supply_air_flow_rate_control_set_to_low_speed": ["No", "Yes"],
+            "maximum_supply_air_temperature": ["Autosize"],
+            "design_specification_multispeed_object_type": [
+                "UnitarySystemPerformance:Multispeed"
+            ],
+        },
+        "references": [
+            "DOAToZonalUnit",
+            "ZoneEquipmentNames",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {
+            "controlling_zone_or_thermostat_location": ["ZoneNames"],
+            "availability_schedule_name": ["ScheduleNames"],
+            "supply_fan_name": ["Fans"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+            "heating_coil_name": [
+                "HeatingCoilName",
+                "HeatingCoilsDX",
+                "HeatingCoilsWaterToAirHP",
+            ],
+            "cooling_coil_name": [
+                "CoolingCoilsDX",
+                "CoolingCoilsDXMultiSpeed",
+                "CoolingCoilsWater",
+                "CoolingCoilsWaterToAirHP",
+            ],
+            "supplemental_heating_coil_name": ["HeatingCoilName"],
+            "design_specification_multispeed_object_name": [
+                "UnitarySystemPerformanceNames"
+            ],
+        },
+        "object_types": {
+            "supply_fan_name": "supply_fan_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+            "cooling_coil_name": "cooling_coil_object_type",
+            "supplemental_heating_coil_name": "supplemental_heating_coil_object_type",
+            "design_specification_multispeed_object_name": "design_specification_multispeed_object_type",
+        },
+    },
+    "AirLoopHVAC:ZoneMixer": {
+        "name": True,
+        "fields": ["outlet_node_name"],
+        "extension": "nodes",
+        "extensibles": ["inlet_node_name"],
+        "references": ["ReturnPathComponentNames", "ZoneMixers"],
+    },
+    "AirLoopHVAC:ZoneSplitter": {
+        "name": True,
+        "fields": ["inlet_node_name"],
+        "extension": "nodes",
+        "extensibles": ["outlet_node_name"],
+        "references": ["SupplyPathComponentNames"],
+    },
+    "AirTerminal:SingleDuct:ConstantVolume:NoReheat": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "maximum_air_flow_rate",
+            "design_specification_outdoor_air_object_name",
+            "per_person_ventilation_rate_mode",
+        ],
+        "numeric": ["maximum_air_flow_rate"],
+        "choices": {
+            "maximum_air_flow_rate": ["Autosize"],
+            "per_person_ventilation_rate_mode": ["CurrentOccupancy", "DesignOccupancy"],
+        },
+        "references": ["AFNTerminalUnitNames", "AirTerminalUnitNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "design_specification_outdoor_air_object_name": [
+                "DesignSpecificationOutdoorAirNames"
+            ],
+        },
+    },
+    "AirTerminal:SingleDuct:VAV:Reheat": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "damper_air_outlet_node_name",
+            "air_inlet_node_name",
+            "maximum_air_flow_rate",
+            "zone_minimum_air_flow_input_method",
+            "constant_minimum_air_flow_fraction",
+            "fixed_minimum_air_flow_rate",
+            "minimum_air_flow_fraction_schedule_name",
+            "reheat_coil_object_type",
+            "reheat_coil_name",
+            "maximum_hot_water_or_steam_flow_rate",
+            "minimum_hot_water_or_steam_flow_rate",
+            "air_outlet_node_name",
+            "convergence_tolerance",
+            "damper_heating_action",
+            "maximum_flow_per_zone_floor_area_during_reheat",
+            "maximum_flow_fraction_during_reheat",
+            "maximum_reheat_air_temperature",
+            "design_specification_outdoor_air_object_name",
+            "minimum_air_flow_turndown_schedule_name",
+        ],
+        "numeric": [
+            "maximum_air_flow_rate",
+            "constant_minimum_air_flow_fraction",
+            "fixed_minimum_air_flow_rate",
+            "maximum_hot_water_or_steam_flow_rate",
+            "minimum_hot_water_or_steam_flow_rate",
+            "convergence_tolerance",
+            "maximum_flow_per_zone_floor_area_during_reheat",
+            "maximum_flow_fraction_during_reheat",
+            "maximum_reheat_air_temperature",
+        ],
+        "choices": {
+            "maximum_air_flow_rate": ["Autosize"],
+            "zone_minimum_air_flow_input_method": [
+                "Constant",
+                "FixedFlowRate",
+                "Scheduled",
+            ],
+            "constant_minimum_air_flow_fraction": ["Autosize"],
+            "fixed_minimum_air_flow_rate": ["Autosize"],
+            "reheat_coil_object_type": [
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+            "maximum_hot_water_or_steam_flow_rate": ["Autosize"],
+            "damper_heating_action": ["Normal", "Reverse", "ReverseWithLimits"],
+            "maximum_flow_per_zone_floor_area_during_reheat": ["Autosize"],
+            "maximum_flow_fraction_during_reheat": ["Autosize"],
+        },
+        "references": ["AFNTerminalUnitNames", "AirTerminalUnitNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "minimum_air_flow_fraction_schedule_name": ["ScheduleNames"],
+            "reheat_coil_name": ["HeatingCoilName"],
+            "design_specification_outdoor_air_object_name": [
+                "DesignSpecificationOutdoorAirNames"
+            ],
+            "minimum_air_flow_turndown_schedule_name": ["ScheduleNames"],
+        },
+        "object_types": {"reheat_coil_name": "reheat_coil_object_type"},
+    },
+    "AirflowNetwork:MultiZone:Surface:EffectiveLeakageArea": {
+        "name": True,
+        "fields": [
+            "effective_leakage_area",
+            "discharge_coefficient",
+            "reference_pressure_difference",
+            "air_mass_flow_exponent",
+        ],
+        "numeric": [
+            "effective_leakage_area",
+            "discharge_coefficient",
+            "reference_pressure_difference",
+            "air_mass_flow_exponent",
+        ],
+        "references": ["SurfaceAirflowLeakageNames"],
+    },
+    "AvailabilityManager:NightCycle": {
+        "name": True,
+        "fields": [
+            "applicability_schedule_name",
+            "fan_schedule_name",
+            "control_type",
+            "thermostat_tolerance",
+            "cycling_run_time_control_type",
+            "cycling_run_time",
+            "control_zone_or_zone_list_name",
+            "cooling_control_zone_or_zone_list_name",
+            "heating_control_zone_or_zone_list_name",
+            "heating_zone_fans_only_zone_or_zone_list_name",
+        ],
+        "numeric": ["thermostat_tolerance", "cycling_run_time"],
+        "choices": {
+            "control_type": [
+                "CycleOnAny",
+                "CycleOnAnyCoolingOrHeatingZone",
+                "CycleOnAnyCoolingZone",
+                "CycleOnAnyHeatingZone",
+                "CycleOnAnyHeatingZoneFansOnly",
+                "CycleOnAnyZoneFansOnly",
+                "CycleOnControlZone",
+                "StayOff",
+            ],
+            "cycling_run_time_control_type": [
+                "FixedRunTime",
+                "Thermostat",
+                "ThermostatWithMinimumRunTime",
+            ],
+        },
+        "references": ["SystemAvailabilityManagers"],
+        "object_lists": {
+            "applicability_schedule_name": ["ScheduleNames"],
+            "fan_schedule_name": ["ScheduleNames"],
+            "control_zone_or_zone_list_name": ["ZoneAndZoneListNames"],
+            "cooling_control_zone_or_zone_list_name": ["ZoneAndZoneListNames"],
+            "heating_control_zone_or_zone_list_name": ["ZoneAndZoneListNames"],
+            "heating_zone_fans_only_zone_or_zone_list_name": ["ZoneAndZoneListNames"],
+        },
+    },
+    "AvailabilityManager:Scheduled": {
+        "name": True,
+        "fields": ["schedule_name"],
+        "references": ["SystemAvailabilityManagers"],
+        "object_lists": {"schedule_name": ["ScheduleNames"]},
+    },
+    "AvailabilityManagerAssignmentList": {
+        "name": True,
+        "fields": [],
+        "extension": "managers",
+        "extensibles": [
+            "availability_manager_object_type",
+            "availability_manager_name",
+        ],
+        "choices": {
+            "availability_manager_object_type": [
+                "AvailabilityManager:DifferentialThermostat",
+                "AvailabilityManager:HighTemperatureTurnOff",
+                "AvailabilityManager:HighTemperatureTurnOn",
+                "AvailabilityManager:LowTemperatureTurnOff",
+                "AvailabilityManager:LowTemperatureTurnOn",
+                "AvailabilityManager:NightCycle",
+                "AvailabilityManager:NightVentilation",
+                "AvailabilityManager:OptimumStart",
+                "AvailabilityManager:Scheduled",
+                "AvailabilityManager:ScheduledOff",
+                "AvailabilityManager:ScheduledOn",
+            ]
+        },
+        "references": ["SystemAvailabilityManagerLists"],
+        "object_lists": {"availability_manager_name": ["SystemAvailabilityManagers"]},
+        "object_types": {
+            "availability_manager_name": "availability_manager_object_type"
+        },
+    },
+    "Boiler:HotWater": {
+        "name": True,
+        "fields": [
+            "fuel_type",
+            "nominal_capacity",
+            "nominal_thermal_efficiency",
+            "efficiency_curve_temperature_evaluation_variable",
+            "normalized_boiler_efficiency_curve_name",
+            "design_water_flow_rate",
+            "minimum_part_load_ratio",
+            "maximum_part_load_ratio",
+            "optimum_part_load_ratio",
+            "boiler_water_inlet_node_name",
+            "boiler_water_outlet_node_name",
+            "water_outlet_upper_temperature_limit",
+            "boiler_flow_mode",
+            "on_cycle_parasitic_electric_load",
+            "sizing_factor",
+            "end_use_subcategory",
+            "off_cycle_parasitic_fuel_load",
+        ],
+        "numeric": [
+            "nominal_capacity",
+            "nominal_thermal_efficiency",
+            "design_water_flow_rate",
+            "minimum_part_load_ratio",
+            "maximum_part_load_ratio",
+            "optimum_part_load_ratio",
+            "water_outlet_upper_temperature_limit",
+            "on_cycle_parasitic_electric_load",
+            "sizing_factor",
+            "off_cycle_parasitic_fuel_load",
+        ],
+        "choices": {
+            "fuel_type": [
+                "Coal",
+                "Diesel",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ],
+            "nominal_capacity": ["Autosize"],
+            "efficiency_curve_temperature_evaluation_variable": [
+                "EnteringBoiler",
+                "LeavingBoiler",
+            ],
+            "design_water_flow_rate": ["Autosize"],
+            "boiler_flow_mode": [
+                "ConstantFlow",
+                "LeavingSetpointModulated",
+                "NotModulated",
+            ],
+        },
+        "references": [
+            "Boilers",
+            "validBranchEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "normalized_boiler_efficiency_curve_name": [
+                "BivariateFunctions",
+                "UnivariateFunctions",
+            ]
+        },
+    },
+    "Branch": {
+        "name": True,
+        "fields": ["pressure_drop_curve_name"],
+        "extension": "components",
+        "extensibles": [
+            "component_object_type",
+            "component_name",
+            "component_inlet_node_name",
+            "component_outlet_node_name",
+        ],
+        "references": ["Branches"],
+        "object_lists": {
+            "pressure_drop_curve_name": ["UnivariateFunctions"],
+            "component_name": ["validBranchEquipmentNames"],
+        },
+        "object_types": {"component_name": "component_object_type"},
+    },
+    "BranchList": {
+        "name": True,
+        "fields": [],
+        "extension": "branches",
+        "extensibles": ["branch_name"],
+        "references": ["BranchLists"],
+        "object_lists": {"branch_name": ["Branches"]},
+    },
+    "Building": {
+        "name": True,
+        "fields": [
+            "north_axis",
+            "terrain",
+            "loads_convergence_tolerance_value",
+            "temperature_convergence_tolerance_value",
+            "solar_distribution",
+            "maximum_number_of_warmup_days",
+            "minimum_number_of_warmup_days",
+        ],
+        "numeric": [
+            "north_axis",
+            "loads_convergence_tolerance_value",
+            "temperature_convergence_tolerance_value",
+            "maximum_number_of_warmup_days",
+            "minimum_number_of_warmup_days",
+        ],
+        "choices": {
+            "terrain": ["City", "Country", "Ocean", "Suburbs", "Urban"],
+            "solar_distribution": [
+                "FullExterior",
+                "FullExteriorWithReflections",
+                "FullInteriorAndExterior",
+                "FullInteriorAndExteriorWithReflections",
+                "MinimalShadowing",
+            ],
+        },
+    },
+    "BuildingSurface:Detailed": {
+        "name": True,
+        "fields": [
+            "surface_type",
+            "construction_name",
+            "zone_name",
+            "space_name",
+            "outside_boundary_condition",
+            "outside_boundary_condition_object",
+            "sun_exposure",
+            "wind_exposure",
+            "view_factor_to_ground",
+            "number_of_vertices",
+        ],
+        "extension": "vertices",
+        "extensibles": [
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "numeric": [
+            "view_factor_to_ground",
+            "number_of_vertices",
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "choices": {
+            "surface_type": ["Ceiling", "Floor", "Roof", "Wall"],
+            "outside_boundary_condition": [
+                "Adiabatic",
+                "Foundation",
+                "Ground",
+                "GroundBasementPreprocessorAverageFloor",
+                "GroundBasementPreprocessorAverageWall",
+                "GroundBasementPreprocessorLowerWall",
+                "GroundBasementPreprocessorUpperWall",
+                "GroundFCfactorMethod",
+                "GroundSlabPreprocessorAverage",
+                "GroundSlabPreprocessorCore",
+                "GroundSlabPreprocessorPerimeter",
+                "OtherSideCoefficients",
+                "OtherSideConditionsModel",
+                "Outdoors",
+                "Space",
+                "Surface",
+                "Zone",
+            ],
+            "sun_exposure": ["NoSun", "SunExposed"],
+            "wind_exposure": ["NoWind", "WindExposed"],
+            "view_factor_to_ground": ["Autocalculate"],
+            "number_of_vertices": ["Autocalculate"],
+        },
+        "references": [
+            "AllHeatTranAngFacNames",
+            "AllHeatTranSurfNames",
+            "AllShadingAndHTSurfNames",
+            "FloorSurfaceNames",
+            "OutFaceEnvNames",
+            "RadiantSurfaceNames",
+            "SurfAndSubSurfNames",
+            "SurfaceNames",
+        ],
+        "object_lists": {
+            "construction_name": ["ConstructionNames"],
+            "zone_name": ["ZoneNames"],
+            "outside_boundary_condition_object": ["OutFaceEnvNames"],
+        },
+    },
+    "Chiller:Electric:ASHRAE205": {
+        "name": True,
+        "fields": [
+            "representation_file_name",
+            "performance_interpolation_method",
+            "rated_capacity",
+            "sizing_factor",
+            "ambient_temperature_indicator",
+            "ambient_temperature_schedule_name",
+            "ambient_temperature_zone_name",
+            "ambient_temperature_outdoor_air_node_name",
+            "chilled_water_inlet_node_name",
+            "chilled_water_outlet_node_name",
+            "chilled_water_maximum_requested_flow_rate",
+            "condenser_inlet_node_name",
+            "condenser_outlet_node_name",
+            "condenser_maximum_requested_flow_rate",
+            "chiller_flow_mode",
+            "oil_cooler_inlet_node_name",
+            "oil_cooler_outlet_node_name",
+            "oil_cooler_design_flow_rate",
+            "auxiliary_inlet_node_name",
+            "auxiliary_outlet_node_name",
+            "auxiliary_cooling_design_flow_rate",
+            "heat_recovery_inlet_node_name",
+            "heat_recovery_outlet_node_name",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "rated_capacity",
+            "sizing_factor",
+            "chilled_water_maximum_requested_flow_rate",
+            "condenser_maximum_requested_flow_rate",
+            "oil_cooler_design_flow_rate",
+            "auxiliary_cooling_design_flow_rate",
+        ],
+        "choices": {
+            "performance_interpolation_method": ["Cubic", "Linear"],
+            "rated_capacity": ["Autosize"],
+            "ambient_temperature_indicator": ["Outdoors", "Schedule", "Zone"],
+            "chilled_water_maximum_requested_flow_rate": ["Autosize"],
+            "condenser_maximum_requested_flow_rate": ["Autosize"],
+            "chiller_flow_mode": [
+                "ConstantFlow",
+                "LeavingSetpointModulated",
+                "NotModulated",
+            ],
+        },
+        "references": [
+            "Chillers",
+            "validBranchEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "ambient_temperature_schedule_name": ["ScheduleNames"],
+            "ambient_temperature_zone_name": ["ZoneNames"],
+        },
+    },
+    "Chiller:Electric:EIR": {
+        "name": True,
+        "fields": [
+            "reference_capacity",
+            "reference_cop",
+            "reference_leaving_chilled_water_temperature",
+            "reference_entering_condenser_fluid_temperature",
+            "reference_chilled_water_flow_rate",
+            "reference_condenser_fluid_flow_rate",
+            "cooling_capacity_function_of_temperature_curve_name",
+            "electric_input_to_cooling_output_ratio_function_of_temperature_curve_name",
+            "electric_input_to_cooling_output_ratio_function_of_part_load_ratio_curve_name",
+            "minimum_part_load_ratio",
+            "maximum_part_load_ratio",
+            "optimum_part_load_ratio",
+            "minimum_unloading_ratio",
+            "chilled_water_inlet_node_name",
+            "chilled_water_outlet_node_name",
+            "condenser_inlet_node_name",
+            "condenser_outlet_node_name",
+            "condenser_type",
+            "condenser_fan_power_ratio",
+            "fraction_of_compressor_electric_consumption_rejected_by_condenser",
+            "leaving_chilled_water_lower_temperature_limit",
+            "chiller_flow_mode",
+            "design_heat_recovery_water_flow_rate",
+            "heat_recovery_inlet_node_name",
+            "heat_recovery_outlet_node_name",
+            "sizing_factor",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "basin_heater_operating_schedule_name",
+            "condenser_heat_recovery_relative_capacity_fraction",
+            "heat_recovery_inlet_high_temperature_limit_schedule_name",
+            "heat_recovery_leaving_temperature_setpoint_node_name",
+            "end_use_subcategory",
+            "condenser_flow_control",
+            "condenser_loop_flow_rate_fraction_function_of_loop_part_load_ratio_curve_name",
+            "temperature_difference_across_condenser_schedule_name",
+            "condenser_minimum_flow_fraction",
+            "thermosiphon_capacity_fraction_curve_name",
+            "thermosiphon_minimum_temperature_difference",
+        ],
+        "numeric": [
+            "reference_capacity",
+            "reference_cop",
+            "reference_leaving_chilled_water_temperature",
+            "reference_entering_condenser_fluid_temperature",
+            "reference_chilled_water_flow_rate",
+            "reference_condenser_fluid_flow_rate",
+            "minimum_part_load_ratio",
+            "maximum_part_load_ratio",
+            "optimum_part_load_ratio",
+            "minimum_unloading_ratio",
+            "condenser_fan_power_ratio",
+            "fraction_of_compressor_electric_consumption_rejected_by_condenser",
+            "leaving_chilled_water_lower_temperature_limit",
+            "design_heat_recovery_water_flow_rate",
+            "sizing_factor",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "condenser_heat_recovery_relative_capacity_fraction",
+            "condenser_minimum_flow_fraction",
+            "thermosiphon_minimum_temperature_difference",
+        ],
+        "choices": {
+            "reference_capacity": ["Autosize"],
+            "reference_chilled_water_flow_rate": ["Autosize"],
+            "reference_condenser_fluid_flow_rate": ["Autosize"],
+            "condenser_type": ["AirCooled", "EvaporativelyCooled", "WaterCooled"],
+            "chiller_flow_mode": [
+                "ConstantFlow",
+                "LeavingSetpointModulated",
+                "NotModulated",
+            ],
+            "design_heat_recovery_water_flow_rate": ["Autosize"],
+            "condenser_flow_control": [
+                "ConstantFlow",
+                "ModulatedChillerPLR",
+                "ModulatedDeltaTemperature",
+                "ModulatedLoopPLR",
+            ],
+        },
+        "references": [
+            "Chillers",
+            "validBranchEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "electric_input_to_cooling_output_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "electric_input_to_cooling_output_ratio_function_of_part_load_ratio_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "basin_heater_operating_schedule_name": ["ScheduleNames"],
+            "heat_recovery_inlet_high_temperature_limit_schedule_name": [
+                "ScheduleNames"
+            ],
+            "condenser_loop_flow_rate_fraction_function_of_loop_part_load_ratio_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "temperature_difference_across_condenser_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Chiller:Electric:ReformulatedEIR": {
+        "name": True,
+        "fields": [
+            "reference_capacity",
+            "reference_cop",
+            "reference_leaving_chilled_water_temperature",
+            "reference_leaving_condenser_water_temperature",
+            "reference_chilled_water_flow_rate",
+            "reference_condenser_water_flow_rate",
+            "cooling_capacity_function_of_temperature_curve_name",
+            "electric_input_to_cooling_output_ratio_function_of_temperature_curve_name",
+            "electric_input_to_cooling_output_ratio_function_of_part_load_ratio_curve_type",
+            "electric_input_to_cooling_output_ratio_function_of_part_load_ratio_curve_name",
+            "minimum_part_load_ratio",
+            "maximum_part_load_ratio",
+            "optimum_part_load_ratio",
+            "minimum_unloading_ratio",
+            "chilled_water_inlet_node_name",
+            "chilled_water_outlet_node_name",
+            "condenser_inlet_node_name",
+            "condenser_outlet_node_name",
+            "fraction_of_compressor_electric_consumption_rejected_by_condenser",
+            "leaving_chilled_water_lower_temperature_limit",
+            "chiller_flow_mode_type",
+            "design_heat_recovery_water_flow_rate",
+            "heat_recovery_inlet_node_name",
+            "heat_recovery_outlet_node_name",
+            "sizing_factor",
+            "condenser_heat_recovery_relative_capacity_fraction",
+            "heat_recovery_inlet_high_temperature_limit_schedule_name",
+            "heat_recovery_leaving_temperature_setpoint_node_name",
+            "end_use_subcategory",
+            "condenser_flow_control",
+            "condenser_loop_flow_rate_fraction_function_of_loop_part_load_ratio_curve_name",
+            "temperature_difference_across_condenser_schedule_name",
+            "condenser_minimum_flow_fraction",
+            "thermosiphon_capacity_fraction_curve_name",
+            "thermosiphon_minimum_temperature_difference",
+        ],
+        "numeric": [
+            "reference_capacity",
+            "reference_cop",
+            "reference_leaving_chilled_water_temperature",
+            "reference_leaving_condenser_water_temperature",
+            "reference_chilled_water_flow_rate",
+            "reference_condenser_water_flow_rate",
+            "minimum_part_load_ratio",
+            "maximum_part_load_ratio",
+            "optimum_part_load_ratio",
+            "minimum_unloading_ratio",
+            "fraction_of_compressor_electric_consumption_rejected_by_condenser",
+            "leaving_chilled_water_lower_temperature_limit",
+            "design_heat_recovery_water_flow_rate",
+            "sizing_factor",
+            "condenser_heat_recovery_relative_capacity_fraction",
+            "condenser_minimum_flow_fraction",
+            "thermosiphon_minimum_temperature_difference",
+        ],
+        "choices": {
+            "reference_capacity": ["Autosize"],
+            "reference_chilled_water_flow_rate": ["Autosize"],
+            "reference_condenser_water_flow_rate": ["Autosize"],
+            "electric_input_to_cooling_output_ratio_function_of_part_load_ratio_curve_type": [
+                "LeavingCondenserWaterTemperature",
+                "Lift",
+            ],
+            "chiller_flow_mode_type": [
+                "ConstantFlow",
+                "LeavingSetpointModulated",
+                "NotModulated",
+            ],
+            "design_heat_recovery_water_flow_rate": ["Autosize"],
+            "condenser_flow_control": [
+                "ConstantFlow",
+                "ModulatedChillerPLR",
+                "ModulatedDeltaTemperature",
+                "ModulatedLoopPLR",
+            ],
+        },
+        "references": [
+            "Chillers",
+            "validBranchEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "electric_input_to_cooling_output_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "electric_input_to_cooling_output_ratio_function_of_part_load_ratio_curve_name": [
+                "BivariateFunctions",
+                "TrivariateFunctions",
+            ],
+            "heat_recovery_inlet_high_temperature_limit_schedule_name": [
+                "ScheduleNames"
+            ],
+            "condenser_loop_flow_rate_fraction_function_of_loop_part_load_ratio_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "temperature_difference_across_condenser_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Coil:Cooling:DX:MultiSpeed": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "condenser_air_inlet_node_name",
+            "condenser_type",
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "supply_water_storage_tank_name",
+            "condensate_collection_water_storage_tank_name",
+            "apply_part_load_fraction_to_speeds_greater_than_1",
+            "apply_latent_degradation_to_speeds_greater_than_1",
+            "crankcase_heater_capacity",
+            "crankcase_heater_capacity_function_of_temperature_curve_name",
+            "maximum_outdoor_dry_bulb_temperature_for_crankcase_heater_operation",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "basin_heater_operating_schedule_name",
+            "fuel_type",
+            "number_of_speeds",
+            "speed_1_gross_rated_total_cooling_capacity",
+            "speed_1_gross_rated_sensible_heat_ratio",
+            "speed_1_gross_rated_cooling_cop",
+            "speed_1_rated_air_flow_rate",
+            "2017_speed_1_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_1_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_1_total_cooling_capacity_function_of_temperature_curve_name",
+            "speed_1_total_cooling_capacity_function_of_flow_fraction_curve_name",
+            "speed_1_energy_input_ratio_function_of_temperature_curve_name",
+            "speed_1_energy_input_ratio_function_of_flow_fraction_curve_name",
+            "speed_1_part_load_fraction_correlation_curve_name",
+            "speed_1_nominal_time_for_condensate_removal_to_begin",
+            "speed_1_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_1_maximum_cycling_rate",
+            "speed_1_latent_capacity_time_constant",
+            "speed_1_rated_waste_heat_fraction_of_power_input",
+            "speed_1_waste_heat_function_of_temperature_curve_name",
+            "speed_1_evaporative_condenser_effectiveness",
+            "speed_1_evaporative_condenser_air_flow_rate",
+            "speed_1_rated_evaporative_condenser_pump_power_consumption",
+            "speed_2_gross_rated_total_cooling_capacity",
+            "speed_2_gross_rated_sensible_heat_ratio",
+            "speed_2_gross_rated_cooling_cop",
+            "speed_2_rated_air_flow_rate",
+            "2017_speed_2_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_2_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_2_total_cooling_capacity_function_of_temperature_curve_name",
+            "speed_2_total_cooling_capacity_function_of_flow_fraction_curve_name",
+            "speed_2_energy_input_ratio_function_of_temperature_curve_name",
+            "speed_2_energy_input_ratio_function_of_flow_fraction_curve_name",
+            "speed_2_part_load_fraction_correlation_curve_name",
+            "speed_2_nominal_time_for_condensate_removal_to_begin",
+            "speed_2_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_2_maximum_cycling_rate",
+            "speed_2_latent_capacity_time_constant",
+            "speed_2_rated_waste_heat_fraction_of_power_input",
+            "speed_2_waste_heat_function_of_temperature_curve_name",
+            "speed_2_evaporative_condenser_effectiveness",
+            "speed_2_evaporative_condenser_air_flow_rate",
+            "speed_2_rated_evaporative_condenser_pump_power_consumption",
+            "speed_3_gross_rated_total_cooling_capacity",
+            "speed_3_gross_rated_sensible_heat_ratio",
+            "speed_3_gross_rated_cooling_cop",
+            "speed_3_rated_air_flow_rate",
+            "2017_speed_3_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_3_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_3_total_cooling_capacity_function_of_temperature_curve_name",
+            "speed_3_total_cooling_capacity_function_of_flow_fraction_curve_name",
+            "speed_3_energy_input_ratio_function_of_temperature_curve_name",
+            "speed_3_energy_input_ratio_function_of_flow_fraction_curve_name",
+            "speed_3_part_load_fraction_correlation_curve_name",
+            "speed_3_nominal_time_for_condensate_removal_to_begin",
+            "speed_3_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_3_maximum_cycling_rate",
+            "speed_3_latent_capacity_time_constant",
+            "speed_3_rated_waste_heat_fraction_of_power_input",
+            "speed_3_waste_heat_function_of_temperature_curve_name",
+            "speed_3_evaporative_condenser_effectiveness",
+            "speed_3_evaporative_condenser_air_flow_rate",
+            "speed_3_rated_evaporative_condenser_pump_power_consumption",
+            "speed_4_gross_rated_total_cooling_capacity",
+            "speed_4_gross_rated_sensible_heat_ratio",
+            "speed_4_gross_rated_cooling_cop",
+            "speed_4_rated_air_flow_rate",
+            "2017_speed_4_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_4_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_4_total_cooling_capacity_function_of_temperature_curve_name",
+            "speed_4_total_cooling_capacity_function_of_flow_fraction_curve_name",
+            "speed_4_energy_input_ratio_function_of_temperature_curve_name",
+            "speed_4_energy_input_ratio_function_of_flow_fraction_curve_name",
+            "speed_4_part_load_fraction_correlation_curve_name",
+            "speed_4_nominal_time_for_condensate_removal_to_begin",
+            "speed_4_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_4_maximum_cycling_rate",
+            "speed_4_latent_capacity_time_constant",
+            "speed_4_rated_waste_heat_fraction_of_power_input",
+            "speed_4_waste_heat_function_of_temperature_curve_name",
+            "speed_4_evaporative_condenser_effectiveness",
+            "speed_4_evaporative_condenser_air_flow_rate",
+            "speed_4_rated_evaporative_condenser_pump_power_consumption",
+            "zone_name_for_condenser_placement",
+        ],
+        "numeric": [
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "crankcase_heater_capacity",
+            "maximum_outdoor_dry_bulb_temperature_for_crankcase_heater_operation",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "number_of_speeds",
+            "speed_1_gross_rated_total_cooling_capacity",
+            "speed_1_gross_rated_sensible_heat_ratio",
+            "speed_1_gross_rated_cooling_cop",
+            "speed_1_rated_air_flow_rate",
+            "2017_speed_1_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_1_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_1_nominal_time_for_condensate_removal_to_begin",
+            "speed_1_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_1_maximum_cycling_rate",
+            "speed_1_latent_capacity_time_constant",
+            "speed_1_rated_waste_heat_fraction_of_power_input",
+            "speed_1_evaporative_condenser_effectiveness",
+            "speed_1_evaporative_condenser_air_flow_rate",
+            "speed_1_rated_evaporative_condenser_pump_power_consumption",
+            "speed_2_gross_rated_total_cooling_capacity",
+            "speed_2_gross_rated_sensible_heat_ratio",
+            "speed_2_gross_rated_cooling_cop",
+            "speed_2_rated_air_flow_rate",
+            "2017_speed_2_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_2_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_2_nominal_time_for_condensate_removal_to_begin",
+            "speed_2_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_2_maximum_cycling_rate",
+            "speed_2_latent_capacity_time_constant",
+            "speed_2_rated_waste_heat_fraction_of_power_input",
+            "speed_2_evaporative_condenser_effectiveness",
+            "speed_2_evaporative_condenser_air_flow_rate",
+            "speed_2_rated_evaporative_condenser_pump_power_consumption",
+            "speed_3_gross_rated_total_cooling_capacity",
+            "speed_3_gross_rated_sensible_heat_ratio",
+            "speed_3_gross_rated_cooling_cop",
+            "speed_3_rated_air_flow_rate",
+            "2017_speed_3_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_3_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_3_nominal_time_for_condensate_removal_to_begin",
+            "speed_3_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_3_maximum_cycling_rate",
+            "speed_3_latent_capacity_time_constant",
+            "speed_3_rated_waste_heat_fraction_of_power_input",
+            "speed_3_evaporative_condenser_effectiveness",
+            "speed_3_evaporative_condenser_air_flow_rate",
+            "speed_3_rated_evaporative_condenser_pump_power_consumption",
+            "speed_4_gross_rated_total_cooling_capacity",
+            "speed_4_gross_rated_sensible_heat_ratio",
+            "speed_4_gross_rated_cooling_cop",
+            "speed_4_rated_air_flow_rate",
+            "2017_speed_4_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_speed_4_rated_evaporator_fan_power_per_volume_flow_rate",
+            "speed_4_nominal_time_for_condensate_removal_to_begin",
+            "speed_4_ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "speed_4_maximum_cycling_rate",
+            "speed_4_latent_capacity_time_constant",
+            "speed_4_rated_waste_heat_fraction_of_power_input",
+            "speed_4_evaporative_condenser_effectiveness",
+            "speed_4_evaporative_condenser_air_flow_rate",
+            "speed_4_rated_evaporative_condenser_pump_power_consumption",
+        ],
+        "choices": {
+            "condenser_type": ["AirCooled", "EvaporativelyCooled"],
+            "apply_part_load_fraction_to_speeds_greater_than_1": ["No", "Yes"],
+            "apply_latent_degradation_to_speeds_greater_than_1": ["No", "Yes"],
+            "fuel_type": [
+                "Diesel",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ],
+            "speed_1_gross_rated_total_cooling_capacity": ["Autosize"],
+            "speed_1_gross_rated_sensible_heat_ratio": ["Autosize"],
+            "speed_1_rated_air_flow_rate": ["Autosize"],
+            "speed_1_evaporative_condenser_air_flow_rate": ["Autosize"],
+            "speed_1_rated_evaporative_condenser_pump_power_consumption": ["Autosize"],
+            "speed_2_gross_rated_total_cooling_capacity": ["Autosize"],
+            "speed_2_gross_rated_sensible_heat_ratio": ["Autosize"],
+            "speed_2_rated_air_flow_rate": ["Autosize"],
+            "speed_2_evaporative_condenser_air_flow_rate": ["Autosize"],
+            "speed_2_rated_evaporative_condenser_pump_power_consumption": ["Autosize"],
+            "speed_3_gross_rated_total_cooling_capacity": ["Autosize"],
+            "speed_3_gross_rated_sensible_heat_ratio": ["Autosize"],
+            "speed_3_rated_air_flow_rate": ["Autosize"],
+            "speed_3_evaporative_condenser_air_flow_rate": ["Autosize"],
+            "speed_3_rated_evaporative_condenser_pump_power_consumption": ["Autosize"],
+            "speed_4_gross_rated_total_cooling_capacity": ["Autosize"],
+            "speed_4_gross_rated_sensible_heat_ratio": ["Autosize"],
+            "speed_4_rated_air_flow_rate": ["Autosize"],
+            "speed_4_evaporative_condenser_air_flow_rate": ["Autosize"],
+            "speed_4_rated_evaporative_condenser_pump_power_consumption": ["Autosize"],
+        },
+        "references": [
+            "AFNCoilNames",
+            "CoolingCoilsDXMultiSpeed",
+            "DesuperHeatingWaterOnlySources",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "crankcase_heater_capacity_function_of_temperature_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "basin_heater_operating_schedule_name": ["ScheduleNames"],
+            "speed_1_total_cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_1_total_cooling_capacity_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_1_energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_1_energy_input_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_1_part_load_fraction_correlation_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_1_waste_heat_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_2_total_cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_2_total_cooling_capacity_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_2_energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_2_energy_input_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_2_part_load_fraction_correlation_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_2_waste_heat_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_3_total_cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_3_total_cooling_capacity_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_3_energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_3_energy_input_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_3_part_load_fraction_correlation_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_3_waste_heat_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_4_total_cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_4_total_cooling_capacity_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_4_energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "speed_4_energy_input_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_4_part_load_fraction_correlation_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "speed_4_waste_heat_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "zone_name_for_condenser_placement": ["ZoneNames"],
+        },
+    },
+    "Coil:Cooling:DX:SingleSpeed": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "gross_rated_total_cooling_capacity",
+            "gross_rated_sensible_heat_ratio",
+            "gross_rated_cooling_cop",
+            "rated_air_flow_rate",
+            "2017_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_rated_evaporator_fan_power_per_volume_flow_rate",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "total_cooling_capacity_function_of_temperature_curve_name",
+            "total_cooling_capacity_function_of_flow_fraction_curve_name",
+            "energy_input_ratio_function_of_temperature_curve_name",
+            "energy_input_ratio_function_of_flow_fraction_curve_name",
+            "part_load_fraction_correlation_curve_name",
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "nominal_time_for_condensate_removal_to_begin",
+            "ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "maximum_cycling_rate",
+            "latent_capacity_time_constant",
+            "condenser_air_inlet_node_name",
+            "condenser_type",
+            "evaporative_condenser_effectiveness",
+            "evaporative_condenser_air_flow_rate",
+            "evaporative_condenser_pump_rated_power_consumption",
+            "crankcase_heater_capacity",
+            "crankcase_heater_capacity_function_of_temperature_curve_name",
+            "maximum_outdoor_dry_bulb_temperature_for_crankcase_heater_operation",
+            "supply_water_storage_tank_name",
+            "condensate_collection_water_storage_tank_name",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "basin_heater_operating_schedule_name",
+            "sensible_heat_ratio_function_of_temperature_curve_name",
+            "sensible_heat_ratio_function_of_flow_fraction_curve_name",
+            "report_ashrae_standard_127_performance_ratings",
+            "zone_name_for_condenser_placement",
+        ],
+        "numeric": [
+            "gross_rated_total_cooling_capacity",
+            "gross_rated_sensible_heat_ratio",
+            "gross_rated_cooling_cop",
+            "rated_air_flow_rate",
+            "2017_rated_evaporator_fan_power_per_volume_flow_rate",
+            "2023_rated_evaporator_fan_power_per_volume_flow_rate",
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "nominal_time_for_condensate_removal_to_begin",
+            "ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "maximum_cycling_rate",
+            "latent_capacity_time_constant",
+            "evaporative_condenser_effectiveness",
+            "evaporative_condenser_air_flow_rate",
+            "evaporative_condenser_pump_rated_power_consumption",
+            "crankcase_heater_capacity",
+            "maximum_outdoor_dry_bulb_temperature_for_crankcase_heater_operation",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+        ],
+        "choices": {
+            "gross_rated_total_cooling_capacity": ["Autosize"],
+            "gross_rated_sensible_heat_ratio": ["Autosize"],
+            "rated_air_flow_rate": ["Autosize"],
+            "condenser_type": ["AirCooled", "EvaporativelyCooled"],
+            "evaporative_condenser_air_flow_rate": ["Autosize"],
+            "evaporative_condenser_pump_rated_power_consumption": ["Autosize"],
+            "report_ashrae_standard_127_performance_ratings": ["No", "Yes"],
+        },
+        "references": [
+            "AFNCoilNames",
+            "CoolingCoilsDX",
+            "CoolingCoilsDXMultiModeOrSingleSpeed",
+            "CoolingCoilsDXSingleSpeed",
+            "DesuperHeatingCoilSources",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "total_cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "total_cooling_capacity_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "energy_input_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "part_load_fraction_correlation_curve_name": ["UnivariateFunctions"],
+            "crankcase_heater_capacity_function_of_temperature_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "basin_heater_operating_schedule_name": ["ScheduleNames"],
+            "sensible_heat_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "sensible_heat_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "zone_name_for_condenser_placement": ["ZoneNames"],
+        },
+    },
+    "Coil:Cooling:DX:TwoSpeed": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "high_speed_gross_rated_total_cooling_capacity",
+            "high_speed_rated_sensible_heat_ratio",
+            "high_speed_gross_rated_cooling_cop",
+            "high_speed_rated_air_flow_rate",
+            "high_speed_2017_rated_evaporator_fan_power_per_volume_flow_rate",
+            "high_speed_2023_rated_evaporator_fan_power_per_volume_flow_rate",
+            "unit_internal_static_air_pressure",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "total_cooling_capacity_function_of_temperature_curve_name",
+            "total_cooling_capacity_function_of_flow_fraction_curve_name",
+            "energy_input_ratio_function_of_temperature_curve_name",
+            "energy_input_ratio_function_of_flow_fraction_curve_name",
+            "part_load_fraction_correlation_curve_name",
+            "low_speed_gross_rated_total_cooling_capacity",
+            "low_speed_gross_rated_sensible_heat_ratio",
+            "low_speed_gross_rated_cooling_cop",
+            "low_speed_rated_air_flow_rate",
+            "low_speed_2017_rated_evaporator_fan_power_per_volume_flow_rate",
+            "low_speed_2023_rated_evaporator_fan_power_per_volume_flow_rate",
+            "low_speed_total_cooling_capacity_function_of_temperature_curve_name",
+            "low_speed_energy_input_ratio_function_of_temperature_curve_name",
+            "condenser_air_inlet_node_name",
+            "condenser_type",
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "high_speed_evaporative_condenser_effectiveness",
+            "high_speed_evaporative_condenser_air_flow_rate",
+            "high_speed_evaporative_condenser_pump_rated_power_consumption",
+            "low_speed_evaporative_condenser_effectiveness",
+            "low_speed_evaporative_condenser_air_flow_rate",
+            "low_speed_evaporative_condenser_pump_rated_power_consumption",
+            "supply_water_storage_tank_name",
+            "condensate_collection_water_storage_tank_name",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "basin_heater_operating_schedule_name",
+            "sensible_heat_ratio_function_of_temperature_curve_name",
+            "sensible_heat_ratio_function_of_flow_fraction_curve_name",
+            "low_speed_sensible_heat_ratio_function_of_temperature_curve_name",
+            "low_speed_sensible_heat_ratio_function_of_flow_fraction_curve_name",
+            "zone_name_for_condenser_placement",
+        ],
+        "numeric": [
+            "high_speed_gross_rated_total_cooling_capacity",
+            "high_speed_rated_sensible_heat_ratio",
+            "high_speed_gross_rated_cooling_cop",
+            "high_speed_rated_air_flow_rate",
+            "high_speed_2017_rated_evaporator_fan_power_per_volume_flow_rate",
+            "high_speed_2023_rated_evaporator_fan_power_per_volume_flow_rate",
+            "unit_internal_static_air_pressure",
+            "low_speed_gross_rated_total_cooling_capacity",
+            "low_speed_gross_rated_sensible_heat_ratio",
+            "low_speed_gross_rated_cooling_cop",
+            "low_speed_rated_air_flow_rate",
+            "low_speed_2017_rated_evaporator_fan_power_per_volume_flow_rate",
+            "low_speed_2023_rated_evaporator_fan_power_per_volume_flow_rate",
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "high_speed_evaporative_condenser_effectiveness",
+            "high_speed_evaporative_condenser_air_flow_rate",
+            "high_speed_evaporative_condenser_pump_rated_power_consumption",
+            "low_speed_evaporative_condenser_effectiveness",
+            "low_speed_evaporative_condenser_air_flow_rate",
+            "low_speed_evaporative_condenser_pump_rated_power_consumption",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+        ],
+        "choices": {
+            "high_speed_gross_rated_total_cooling_capacity": ["Autosize"],
+            "high_speed_rated_sensible_heat_ratio": ["Autosize"],
+            "high_speed_rated_air_flow_rate": ["Autosize"],
+            "low_speed_gross_rated_total_cooling_capacity": ["Autosize"],
+            "low_speed_gross_rated_sensible_heat_ratio": ["Autosize"],
+            "low_speed_rated_air_flow_rate": ["Autosize"],
+            "condenser_type": ["AirCooled", "EvaporativelyCooled"],
+            "high_speed_evaporative_condenser_air_flow_rate": ["Autosize"],
+            "high_speed_evaporative_condenser_pump_rated_power_consumption": [
+                "Autosize"
+            ],
+            "low_speed_evaporative_condenser_air_flow_rate": ["Autosize"],
+            "low_speed_evaporative_condenser_pump_rated_power_consumption": [
+                "Autosize"
+            ],
+        },
+        "references": ["AFNCoilNames", "CoolingCoilsDX", "DesuperHeatingCoilSources"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "total_cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "total_cooling_capacity_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "energy_input_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "part_load_fraction_correlation_curve_name": ["UnivariateFunctions"],
+            "low_speed_total_cooling_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "low_speed_energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "basin_heater_operating_schedule_name": ["ScheduleNames"],
+            "sensible_heat_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "sensible_heat_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "low_speed_sensible_heat_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "low_speed_sensible_heat_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "zone_name_for_condenser_placement": ["ZoneNames"],
+        },
+    },
+    "Coil:Cooling:Water": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "design_water_flow_rate",
+            "design_air_flow_rate",
+            "design_inlet_water_temperature",
+            "design_inlet_air_temperature",
+            "design_outlet_air_temperature",
+            "design_inlet_air_humidity_ratio",
+            "design_outlet_air_humidity_ratio",
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "type_of_analysis",
+            "heat_exchanger_configuration",
+            "condensate_collection_water_storage_tank_name",
+            "design_water_temperature_difference",
+        ],
+        "numeric": [
+            "design_water_flow_rate",
+            "design_air_flow_rate",
+            "design_inlet_water_temperature",
+            "design_inlet_air_temperature",
+            "design_outlet_air_temperature",
+            "design_inlet_air_humidity_ratio",
+            "design_outlet_air_humidity_ratio",
+            "design_water_temperature_difference",
+        ],
+        "choices": {
+            "design_water_flow_rate": ["Autosize"],
+            "design_air_flow_rate": ["Autosize"],
+            "design_inlet_water_temperature": ["Autosize"],
+            "design_inlet_air_temperature": ["Autosize"],
+            "design_outlet_air_temperature": ["Autosize"],
+            "design_inlet_air_humidity_ratio": ["Autosize"],
+            "design_outlet_air_humidity_ratio": ["Autosize"],
+            "type_of_analysis": ["DetailedAnalysis", "SimpleAnalysis"],
+            "heat_exchanger_configuration": ["CounterFlow", "CrossFlow"],
+        },
+        "references": [
+            "AFNCoilNames",
+            "CoolingCoilName",
+            "CoolingCoilsWater",
+            "CoolingCoilsWaterNoHX",
+            "SimpleCoils",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "Coil:Cooling:Water:DetailedGeometry": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "maximum_water_flow_rate",
+            "tube_outside_surface_area",
+            "total_tube_inside_area",
+            "fin_surface_area",
+            "minimum_airflow_area",
+            "coil_depth",
+            "fin_diameter",
+            "fin_thickness",
+            "tube_inside_diameter",
+            "tube_outside_diameter",
+            "tube_thermal_conductivity",
+            "fin_thermal_conductivity",
+            "fin_spacing",
+            "tube_depth_spacing",
+            "number_of_tube_rows",
+            "number_of_tubes_per_row",
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "condensate_collection_water_storage_tank_name",
+            "design_water_temperature_difference",
+            "design_inlet_water_temperature",
+        ],
+        "numeric": [
+            "maximum_water_flow_rate",
+            "tube_outside_surface_area",
+            "total_tube_inside_area",
+            "fin_surface_area",
+            "minimum_airflow_area",
+            "coil_depth",
+            "fin_diameter",
+            "fin_thickness",
+            "tube_inside_diameter",
+            "tube_outside_diameter",
+            "tube_thermal_conductivity",
+            "fin_thermal_conductivity",
+            "fin_spacing",
+            "tube_depth_spacing",
+            "number_of_tube_rows",
+            "number_of_tubes_per_row",
+            "design_water_temperature_difference",
+            "design_inlet_water_temperature",
+        ],
+        "choices": {
+            "maximum_water_flow_rate": ["Autosize"],
+            "tube_outside_surface_area": ["Autosize"],
+            "total_tube_inside_area": ["Autosize"],
+            "fin_surface_area": ["Autosize"],
+            "minimum_airflow_area": ["Autosize"],
+            "coil_depth": ["Autosize"],
+            "fin_diameter": ["Autosize"],
+            "number_of_tubes_per_row": ["Autosize"],
+            "design_inlet_water_temperature": ["Autosize"],
+        },
+        "references": [
+            "AFNCoilNames",
+            "CoolingCoilName",
+            "CoolingCoilsWater",
+            "CoolingCoilsWaterNoHX",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "Coil:Cooling:WaterToAirHeatPump:EquationFit": {
+        "name": True,
+        "fields": [
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "rated_air_flow_rate",
+            "rated_water_flow_rate",
+            "gross_rated_total_cooling_capacity",
+            "gross_rated_sensible_cooling_capacity",
+            "gross_rated_cooling_cop",
+            "rated_entering_water_temperature",
+            "rated_entering_air_dry_bulb_temperature",
+            "rated_entering_air_wet_bulb_temperature",
+            "total_cooling_capacity_curve_name",
+            "sensible_cooling_capacity_curve_name",
+            "cooling_power_consumption_curve_name",
+            "part_load_fraction_correlation_curve_name",
+            "nominal_time_for_condensate_removal_to_begin",
+            "ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "maximum_cycling_rate",
+            "latent_capacity_time_constant",
+            "fan_delay_time",
+        ],
+        "numeric": [
+            "rated_air_flow_rate",
+            "rated_water_flow_rate",
+            "gross_rated_total_cooling_capacity",
+            "gross_rated_sensible_cooling_capacity",
+            "gross_rated_cooling_cop",
+            "rated_entering_water_temperature",
+            "rated_entering_air_dry_bulb_temperature",
+            "rated_entering_air_wet_bulb_temperature",
+            "nominal_time_for_condensate_removal_to_begin",
+            "ratio_of_initial_moisture_evaporation_rate_and_steady_state_latent_capacity",
+            "maximum_cycling_rate",
+            "latent_capacity_time_constant",
+            "fan_delay_time",
+        ],
+        "choices": {
+            "rated_air_flow_rate": ["Autosize"],
+            "rated_water_flow_rate": ["Autosize"],
+            "gross_rated_total_cooling_capacity": ["Autosize"],
+            "gross_rated_sensible_cooling_capacity": ["Autosize"],
+        },
+        "references": [
+            "CoolingCoilsWaterToAirHP",
+            "DesuperHeatingWaterOnlySources",
+            "validBranchEquipmentNames",
+        ],
+        "object_lists": {
+            "total_cooling_capacity_curve_name": ["QuadvariateFunctions"],
+            "sensible_cooling_capacity_curve_name": ["QuintvariateFunctions"],
+            "cooling_power_consumption_curve_name": ["QuadvariateFunctions"],
+            "part_load_fraction_correlation_curve_name": ["UnivariateFunctions"],
+        },
+    },
+    "Coil:Heating:DX:SingleSpeed": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "gross_rated_heating_capacity",
+            "gross_rated_heating_cop",
+            "rated_air_flow_rate",
+            "2017_rated_supply_fan_power_per_volume_flow_rate",
+            "2023_rated_supply_fan_power_per_volume_flow_rate",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "heating_capacity_function_of_temperature_curve_name",
+            "heating_capacity_function_of_flow_fraction_curve_name",
+            "energy_input_ratio_function_of_temperature_curve_name",
+            "energy_input_ratio_function_of_flow_fraction_curve_name",
+            "part_load_fraction_correlation_curve_name",
+            "defrost_energy_input_ratio_function_of_temperature_curve_name",
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "outdoor_dry_bulb_temperature_to_turn_on_compressor",
+            "maximum_outdoor_dry_bulb_temperature_for_defrost_operation",
+            "crankcase_heater_capacity",
+            "crankcase_heater_capacity_function_of_temperature_curve_name",
+            "maximum_outdoor_dry_bulb_temperature_for_crankcase_heater_operation",
+            "defrost_strategy",
+            "defrost_control",
+            "defrost_time_period_fraction",
+            "resistive_defrost_heater_capacity",
+            "region_number_for_calculating_hspf",
+            "evaporator_air_inlet_node_name",
+            "zone_name_for_evaporator_placement",
+            "secondary_coil_air_flow_rate",
+            "secondary_coil_fan_flow_scaling_factor",
+            "nominal_sensible_heat_ratio_of_secondary_coil",
+            "sensible_heat_ratio_modifier_function_of_temperature_curve_name",
+            "sensible_heat_ratio_modifier_function_of_flow_fraction_curve_name",
+        ],
+        "numeric": [
+            "gross_rated_heating_capacity",
+            "gross_rated_heating_cop",
+            "rated_air_flow_rate",
+            "2017_rated_supply_fan_power_per_volume_flow_rate",
+            "2023_rated_supply_fan_power_per_volume_flow_rate",
+            "minimum_outdoor_dry_bulb_temperature_for_compressor_operation",
+            "outdoor_dry_bulb_temperature_to_turn_on_compressor",
+            "maximum_outdoor_dry_bulb_temperature_for_defrost_operation",
+            "crankcase_heater_capacity",
+            "maximum_outdoor_dry_bulb_temperature_for_crankcase_heater_operation",
+            "defrost_time_period_fraction",
+            "resistive_defrost_heater_capacity",
+            "region_number_for_calculating_hspf",
+            "secondary_coil_air_flow_rate",
+            "secondary_coil_fan_flow_scaling_factor",
+            "nominal_sensible_heat_ratio_of_secondary_coil",
+        ],
+        "choices": {
+            "gross_rated_heating_capacity": ["Autosize"],
+            "rated_air_flow_rate": ["Autosize"],
+            "defrost_strategy": ["Resistive", "ReverseCycle"],
+            "defrost_control": ["OnDemand", "Timed"],
+            "resistive_defrost_heater_capacity": ["Autosize"],
+            "secondary_coil_air_flow_rate": ["Autosize"],
+        },
+        "references": ["AFNCoilNames", "HeatingCoilsDX", "HeatingCoilsDXSingleSpeed"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "heating_capacity_function_of_temperature_curve_name": [
+                "BivariateFunctions",
+                "UnivariateFunctions",
+            ],
+            "heating_capacity_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions",
+                "UnivariateFunctions",
+            ],
+            "energy_input_ratio_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "part_load_fraction_correlation_curve_name": ["UnivariateFunctions"],
+            "defrost_energy_input_ratio_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "crankcase_heater_capacity_function_of_temperature_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "sensible_heat_ratio_modifier_function_of_temperature_curve_name": [
+                "BivariateFunctions"
+            ],
+            "sensible_heat_ratio_modifier_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+        },
+    },
+    "Coil:Heating:Electric": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "efficiency",
+            "nominal_capacity",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "temperature_setpoint_node_name",
+        ],
+        "numeric": ["efficiency", "nominal_capacity"],
+        "choices": {"nominal_capacity": ["Autosize"]},
+        "references": [
+            "AFNCoilNames",
+            "HeatingCoilName",
+            "HeatingCoilsElectric",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "Coil:Heating:Fuel": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "fuel_type",
+            "burner_efficiency",
+            "nominal_capacity",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "temperature_setpoint_node_name",
+            "on_cycle_parasitic_electric_load",
+            "part_load_fraction_correlation_curve_name",
+            "off_cycle_parasitic_fuel_load",
+        ],
+        "numeric": [
+            "burner_efficiency",
+            "nominal_capacity",
+            "on_cycle_parasitic_electric_load",
+            "off_cycle_parasitic_fuel_load",
+        ],
+        "choices": {
+            "fuel_type": [
+                "Coal",
+                "Diesel",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ],
+            "nominal_capacity": ["Autosize"],
+        },
+        "references": [
+            "AFNCoilNames",
+            "HeatingCoilName",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "part_load_fraction_correlation_curve_name": ["UnivariateFunctions"],
+        },
+    },
+    "Coil:Heating:Water": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "u_factor_times_area_value",
+            "maximum_water_flow_rate",
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "performance_input_method",
+            "rated_capacity",
+            "rated_inlet_water_temperature",
+            "rated_inlet_air_temperature",
+            "rated_outlet_water_temperature",
+            "rated_outlet_air_temperature",
+            "rated_ratio_for_air_and_water_convection",
+            "design_water_temperature_difference",
+        ],
+        "numeric": [
+            "u_factor_times_area_value",
+            "maximum_water_flow_rate",
+            "rated_capacity",
+            "rated_inlet_water_temperature",
+            "rated_inlet_air_temperature",
+            "rated_outlet_water_temperature",
+            "rated_outlet_air_temperature",
+            "rated_ratio_for_air_and_water_convection",
+            "design_water_temperature_difference",
+        ],
+        "choices": {
+            "u_factor_times_area_value": ["Autosize"],
+            "maximum_water_flow_rate": ["Autosize"],
+            "performance_input_method": [
+                "NominalCapacity",
+                "UFactorTimesAreaAndDesignWaterFlowRate",
+            ],
+            "rated_capacity": ["Autosize"],
+        },
+        "references": [
+            "AFNCoilNames",
+            "HeatingCoilName",
+            "HeatingCoilsWater",
+            "SimpleCoils",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "Coil:Heating:WaterToAirHeatPump:EquationFit": {
+        "name": True,
+        "fields": [
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "rated_air_flow_rate",
+            "rated_water_flow_rate",
+            "gross_rated_heating_capacity",
+            "gross_rated_heating_cop",
+            "rated_entering_water_temperature",
+            "rated_entering_air_dry_bulb_temperature",
+            "ratio_of_rated_heating_capacity_to_rated_cooling_capacity",
+            "heating_capacity_curve_name",
+            "heating_power_consumption_curve_name",
+            "part_load_fraction_correlation_curve_name",
+        ],
+        "numeric": [
+            "rated_air_flow_rate",
+            "rated_water_flow_rate",
+            "gross_rated_heating_capacity",
+            "gross_rated_heating_cop",
+            "rated_entering_water_temperature",
+            "rated_entering_air_dry_bulb_temperature",
+            "ratio_of_rated_heating_capacity_to_rated_cooling_capacity",
+        ],
+        "choices": {
+            "rated_air_flow_rate": ["Autosize"],
+            "rated_water_flow_rate": ["Autosize"],
+            "gross_rated_heating_capacity": ["Autosize"],
+        },
+        "references": ["HeatingCoilsWaterToAirHP", "validBranchEquipmentNames"],
+        "object_lists": {
+            "heating_capacity_curve_name": ["QuadvariateFunctions"],
+            "heating_power_consumption_curve_name": ["QuadvariateFunctions"],
+            "part_load_fraction_correlation_curve_name": ["UnivariateFunctions"],
+        },
+    },
+    "CoilSystem:Cooling:DX": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "dx_cooling_coil_system_inlet_node_name",
+            "dx_cooling_coil_system_outlet_node_name",
+            "dx_cooling_coil_system_sensor_node_name",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "dehumidification_control_type",
+            "run_on_sensible_load",
+            "run_on_latent_load",
+            "use_outdoor_air_dx_cooling_coil",
+            "outdoor_air_dx_cooling_coil_leaving_minimum_air_temperature",
+        ],
+        "numeric": ["outdoor_air_dx_cooling_coil_leaving_minimum_air_temperature"],
+        "choices": {
+            "cooling_coil_object_type": [
+                "Coil:Cooling:DX",
+                "Coil:Cooling:DX:SingleSpeed",
+                "Coil:Cooling:DX:SingleSpeed:ThermalStorage",
+                "Coil:Cooling:DX:TwoSpeed",
+                "Coil:Cooling:DX:TwoStageWithHumidityControlMode",
+                "Coil:Cooling:DX:VariableSpeed",
+                "CoilSystem:Cooling:DX:HeatExchangerAssisted",
+            ],
+            "dehumidification_control_type": ["CoolReheat", "Multimode", "None"],
+            "run_on_sensible_load": ["No", "Yes"],
+            "run_on_latent_load": ["No", "Yes"],
+            "use_outdoor_air_dx_cooling_coil": ["No", "Yes"],
+        },
+        "references": [
+            "CoolingCoilSystemName",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "cooling_coil_name": ["CoolingCoilsDX"],
+        },
+        "object_types": {"cooling_coil_name": "cooling_coil_object_type"},
+    },
+    "ComplexFenestrationProperty:SolarAbsorbedLayers": {
+        "name": True,
+        "fields": [
+            "fenestration_surface",
+            "construction_name",
+            "layer_1_solar_radiation_absorbed_schedule_name",
+            "layer_2_solar_radiation_absorbed_schedule_name",
+            "layer_3_solar_radiation_absorbed_schedule_name",
+            "layer_4_solar_radiation_absorbed_schedule_name",
+            "layer_5_solar_radiation_absorbed_schedule_name",
+        ],
+        "object_lists": {
+            "fenestration_surface": ["SubSurfNames"],
+            "construction_name": ["ComplexFenestrationStates"],
+            "layer_1_solar_radiation_absorbed_schedule_name": ["ScheduleNames"],
+            "layer_2_solar_radiation_absorbed_schedule_name": ["ScheduleNames"],
+            "layer_3_solar_radiation_absorbed_schedule_name": ["ScheduleNames"],
+            "layer_4_solar_radiation_absorbed_schedule_name": ["ScheduleNames"],
+            "layer_5_solar_radiation_absorbed_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "CondenserEquipmentList": {
+        "name": True,
+        "fields": [],
+        "extension": "equipment",
+        "extensibles": ["equipment_object_type", "equipment_name"],
+        "references": ["CondenserEquipmentLists", "PlantAndCondenserEquipmentLists"],
+        "object_lists": {"equipment_name": ["validCondenserEquipmentNames"]},
+        "object_types": {"equipment_name": "equipment_object_type"},
+    },
+    "CondenserEquipmentOperationSchemes": {
+        "name": True,
+        "fields": [
+            "control_scheme_1_object_type",
+            "control_scheme_1_name",
+            "control_scheme_1_schedule_name",
+            "control_scheme_2_object_type",
+            "control_scheme_2_name",
+            "control_scheme_2_schedule_name",
+            "control_scheme_3_object_type",
+            "control_scheme_3_name",
+            "control_scheme_3_schedule_name",
+            "control_scheme_4_object_type",
+            "control_scheme_4_name",
+            "control_scheme_4_schedule_name",
+            "control_scheme_5_object_type",
+            "control_scheme_5_name",
+            "control_scheme_5_schedule_name",
+            "control_scheme_6_object_type",
+            "control_scheme_6_name",
+            "control_scheme_6_schedule_name",
+            "control_scheme_7_object_type",
+            "control_scheme_7_name",
+            "control_scheme_7_schedule_name",
+            "control_scheme_8_object_type",
+            "control_scheme_8_name",
+            "control_scheme_8_schedule_name",
+        ],
+        "choices": {
+            "control_scheme_1_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_2_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_3_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_4_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_5_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_6_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_7_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_8_object_type": [
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+        },
+        "references": ["CondenserOperationSchemes"],
+        "object_lists": {
+            "control_scheme_1_name": ["ControlSchemeList"],
+            "control_scheme_1_schedule_name": ["ScheduleNames"],
+            "control_scheme_2_name": ["ControlSchemeList"],
+            "control_scheme_2_schedule_name": ["ScheduleNames"],
+            "control_scheme_3_name": ["ControlSchemeList"],
+            "control_scheme_3_schedule_name": ["ScheduleNames"],
+            "control_scheme_4_name": ["ControlSchemeList"],
+            "control_scheme_4_schedule_name": ["ScheduleNames"],
+            "control_scheme_5_name": ["ControlSchemeList"],
+            "control_scheme_5_schedule_name": ["ScheduleNames"],
+            "control_scheme_6_name": ["ControlSchemeList"],
+            "control_scheme_6_schedule_name": ["ScheduleNames"],
+            "control_scheme_7_name": ["ControlSchemeList"],
+            "control_scheme_7_schedule_name": ["ScheduleNames"],
+            "control_scheme_8_name": ["ControlSchemeList"],
+            "control_scheme_8_schedule_name": ["ScheduleNames"],
+        },
+        "object_types": {
+            "control_scheme_1_name": "control_scheme_1_object_type",
+            "control_scheme_2_name": "control_scheme_2_object_type",
+            "control_scheme_3_name": "control_scheme_3_object_type",
+            "control_scheme_4_name": "control_scheme_4_object_type",
+            "control_scheme_5_name": "control_scheme_5_object_type",
+            "control_scheme_6_name": "control_scheme_6_object_type",
+            "control_scheme_7_name": "control_scheme_7_object_type",
+            "control_scheme_8_name": "control_scheme_8_object_type",
+        },
+    },
+    "CondenserLoop": {
+        "name": True,
+        "fields": [
+            "fluid_type",
+            "user_defined_fluid_type",
+            "condenser_equipment_operation_scheme_name",
+            "condenser_loop_temperature_setpoint_node_name",
+            "maximum_loop_temperature",
+            "minimum_loop_temperature",
+            "maximum_loop_flow_rate",
+            "minimum_loop_flow_rate",
+            "condenser_loop_volume",
+            "condenser_side_inlet_node_name",
+            "condenser_side_outlet_node_name",
+            "condenser_side_branch_list_name",
+            "condenser_side_connector_list_name",
+            "demand_side_inlet_node_name",
+            "demand_side_outlet_node_name",
+            "condenser_demand_side_branch_list_name",
+            "condenser_demand_side_connector_list_name",
+            "load_distribution_scheme",
+            "pressure_simulation_type",
+            "loop_circulation_time",
+        ],
+        "numeric": [
+            "maximum_loop_temperature",
+            "minimum_loop_temperature",
+            "maximum_loop_flow_rate",
+            "minimum_loop_flow_rate",
+            "condenser_loop_volume",
+            "loop_circulation_time",
+        ],
+        "choices": {
+            "fluid_type": ["UserDefinedFluidType", "Water"],
+            "maximum_loop_flow_rate": ["Autosize"],
+            "condenser_loop_volume": ["Autocalculate"],
+            "load_distribution_scheme": [
+                "Optimal",
+                "SequentialLoad",
+                "SequentialUniformPLR",
+                "UniformLoad",
+                "UniformPLR",
+            ],
+            "pressure_simulation_type": [
+                "LoopFlowCorrection",
+                "None",
+                "PumpPowerCorrection",
+            ],
+        },
+        "references": ["PlantLoops"],
+        "object_lists": {
+            "user_defined_fluid_type": ["FluidAndGlycolNames"],
+            "condenser_equipment_operation_scheme_name": ["CondenserOperationSchemes"],
+            "condenser_side_branch_list_name": ["BranchLists"],
+            "condenser_side_connector_list_name": ["ConnectorLists"],
+            "condenser_demand_side_branch_list_name": ["BranchLists"],
+            "condenser_demand_side_connector_list_name": ["ConnectorLists"],
+        },
+    },
+    "Connector:Mixer": {
+        "name": True,
+        "fields": ["outlet_branch_name"],
+        "extension": "branches",
+        "extensibles": ["inlet_branch_name"],
+        "references": ["PlantConnectors"],
+        "object_lists": {
+            "outlet_branch_name": ["Branches"],
+            "inlet_branch_name": ["Branches"],
+        },
+    },
+    "Connector:Splitter": {
+        "name": True,
+        "fields": ["inlet_branch_name"],
+        "extension": "branches",
+        "extensibles": ["outlet_branch_name"],
+        "references": ["PlantConnectors"],
+        "object_lists": {
+            "inlet_branch_name": ["Branches"],
+            "outlet_branch_name": ["Branches"],
+        },
+    },
+    "ConnectorList": {
+        "name": True,
+        "fields": [
+            "connector_1_object_type",
+            "connector_1_name",
+            "connector_2_object_type",
+            "connector_2_name",
+        ],
+        "choices": {
+            "connector_1_object_type": ["Connector:Mixer", "Connector:Splitter"],
+            "connector_2_object_type": ["Connector:Mixer", "Connector:Splitter"],
+        },
+        "references": ["ConnectorLists"],
+        "object_lists": {
+            "connector_1_name": ["PlantConnectors"],
+            "connector_2_name": ["PlantConnectors"],
+        },
+        "object_types": {
+            "connector_1_name": "connector_1_object_type",
+            "connector_2_name": "connector_2_object_type",
+        },
+    },
+    "Construction": {
+        "name": True,
+        "fields": [
+            "outside_layer",
+            "layer_2",
+            "layer_3",
+            "layer_4",
+            "layer_5",
+            "layer_6",
+            "layer_7",
+            "layer_8",
+            "layer_9",
+            "layer_10",
+        ],
+        "references": ["ConstructionNames"],
+        "object_lists": {
+            "outside_layer": ["MaterialName"],
+            "layer_2": ["MaterialName"],
+            "layer_3": ["MaterialName"],
+            "layer_4": ["MaterialName"],
+            "layer_5": ["MaterialName"],
+            "layer_6": ["MaterialName"],
+            "layer_7": ["MaterialName"],
+            "layer_8": ["MaterialName"],
+            "layer_9": ["MaterialName"],
+            "layer_10": ["MaterialName"],
+        },
+    },
+    "Construction:CfactorUndergroundWall": {
+        "name": True,
+        "fields": ["c_factor", "height"],
+        "numeric": ["c_factor", "height"],
+        "references": ["ConstructionNames"],
+    },
+    "Construction:ComplexFenestrationState": {
+        "name": True,
+        "fields": [
+            "basis_type",
+            "basis_symmetry_type",
+            "window_thermal_model",
+            "basis_matrix_name",
+            "solar_optical_complex_front_transmittance_matrix_name",
+            "solar_optical_complex_back_reflectance_matrix_name",
+            "visible_optical_complex_front_transmittance_matrix_name",
+            "visible_optical_complex_back_transmittance_matrix_name",
+            "outside_layer_name",
+            "outside_layer_directional_front_absorptance_matrix_name",
+            "outside_layer_directional_back_absorptance_matrix_name",
+            "gap_1_name",
+            "cfs_gap_1_directional_front_absorptance_matrix_name",
+            "cfs_gap_1_directional_back_absorptance_matrix_name",
+            "layer_2_name",
+            "layer_2_directional_front_absorptance_matrix_name",
+            "layer_2_directional_back_absorptance_matrix_name",
+            "gap_2_name",
+            "gap_2_directional_front_absorptance_matrix_name",
+            "gap_2_directional_back_absorptance_matrix_name",
+            "layer_3_name",
+            "layer_3_directional_front_absorptance_matrix_name",
+            "layer_3_directional_back_absorptance_matrix_name",
+            "gap_3_name",
+            "gap_3_directional_front_absorptance_matrix_name",
+            "gap_3_directional_back_absorptance_matrix_name",
+            "layer_4_name",
+            "layer_4_directional_front_absorptance_matrix_name",
+            "layer_4_directional_back_absorptance_matrix_name",
+            "gap_4_name",
+            "gap_4_directional_front_absorptance_matrix_name",
+            "gap_4_directional_back_absorptance_matrix_name",
+            "layer_5_name",
+            "layer_5_directional_front_absorptance_matrix_name",
+            "layer_5_directional_back_absorptance_matrix_name",
+        ],
+        "choices": {
+            "basis_type": ["LBNLWINDOW", "UserDefined"],
+            "basis_symmetry_type": ["Axisymmetric", "None"],
+        },
+        "references": ["ComplexFenestrationStates"],
+        "object_lists": {
+            "window_thermal_model": ["WindowThermalModelParameters"],
+            "basis_matrix_name": ["DataMatrices"],
+            "solar_optical_complex_front_transmittance_matrix_name": ["DataMatrices"],
+            "solar_optical_complex_back_reflectance_matrix_name": ["DataMatrices"],
+            "visible_optical_complex_front_transmittance_matrix_name": ["DataMatrices"],
+            "visible_optical_complex_back_transmittance_matrix_name": ["DataMatrices"],
+            "outside_layer_name": ["CFSGlazingName", "WindowComplexShades"],
+            "outside_layer_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "outside_layer_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "gap_1_name": ["CFSGap"],
+            "cfs_gap_1_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "cfs_gap_1_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "layer_2_name": ["CFSGlazingName", "WindowComplexShades"],
+            "layer_2_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "layer_2_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "gap_2_name": ["CFSGap"],
+            "gap_2_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "gap_2_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "layer_3_name": ["CFSGlazingName", "WindowComplexShades"],
+            "layer_3_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "layer_3_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "gap_3_name": ["CFSGap"],
+            "gap_3_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "gap_3_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "layer_4_name": ["CFSGlazingName", "WindowComplexShades"],
+            "layer_4_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "layer_4_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "gap_4_name": ["CFSGap"],
+            "gap_4_directional_front_absorptance_matrix_name": ["DataMatrices"],
+            "gap_4_directional_back_absorptance_matrix_name": ["DataMatrices"],
+            "layer_5_name": ["CFSGlazingName", "WindowComplexShades"],
+            "layer_5_directional_front_absorptance_matrix_name": ["DataMatrices"],
+        },
+    },
+    "Construction:FfactorGroundFloor": {
+        "name": True,
+        "fields": ["f_factor", "area", "perimeterexposed"],
+        "numeric": ["f_factor", "area", "perimeterexposed"],
+        "references": ["ConstructionNames"],
+    },
+    "Controller:MechanicalVentilation": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "demand_controlled_ventilation",
+            "system_outdoor_air_method",
+            "zone_maximum_outdoor_air_fraction",
+        ],
+        "extension": "zone_specifications",
+        "extensibles": [
+            "zone_or_zonelist_name",
+            "design_specification_outdoor_air_object_name",
+            "design_specification_zone_air_distribution_object_name",
+        ],
+        "numeric": ["zone_maximum_outdoor_air_fraction"],
+        "choices": {
+            "demand_controlled_ventilation": ["No", "Yes"],
+            "system_outdoor_air_method": [
+                "IndoorAirQualityProcedure",
+                "IndoorAirQualityProcedureCombined",
+                "IndoorAirQualityProcedureGenericContaminant",
+                "ProportionalControlBasedOnDesignOARate",
+                "ProportionalControlBasedOnDesignOccupancy",
+                "ProportionalControlBasedOnOccupancySchedule",
+                "Standard62.1VentilationRateProcedure",
+                "Standard62.1VentilationRateProcedureWithLimit",
+                "ZoneSum",
+            ],
+        },
+        "references": ["ControllerMechanicalVentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "zone_or_zonelist_name": ["ZoneAndZoneListNames"],
+            "design_specification_outdoor_air_object_name": [
+                "DesignSpecificationOutdoorAirNames"
+            ],
+            "design_specification_zone_air_distribution_object_name": [
+                "DesignSpecificationZoneAirDistributionNames"
+            ],
+        },
+    },
+    "Controller:OutdoorAir": {
+        "name": True,
+        "fields": [
+            "relief_air_outlet_node_name",
+            "return_air_node_name",
+            "mixed_air_node_name",
+            "actuator_node_name",
+            "minimum_outdoor_air_flow_rate",
+            "maximum_outdoor_air_flow_rate",
+            "economizer_control_type",
+            "economizer_control_action_type",
+            "economizer_maximum_limit_dry_bulb_temperature",
+            "economizer_maximum_limit_enthalpy",
+            "economizer_maximum_limit_dewpoint_temperature",
+            "electronic_enthalpy_limit_curve_name",
+            "economizer_minimum_limit_dry_bulb_temperature",
+            "lockout_type",
+            "minimum_limit_type",
+            "minimum_outdoor_air_schedule_name",
+            "minimum_fraction_of_outdoor_air_schedule_name",
+            "maximum_fraction_of_outdoor_air_schedule_name",
+            "mechanical_ventilation_controller_name",
+            "time_of_day_economizer_control_schedule_name",
+            "high_humidity_control",
+            "humidistat_control_zone_name",
+            "high_humidity_outdoor_air_flow_ratio",
+            "control_high_indoor_humidity_based_on_outdoor_humidity_ratio",
+            "heat_recovery_bypass_control_type",
+            "economizer_operation_staging",
+        ],
+        "numeric": [
+            "minimum_outdoor_air_flow_rate",
+            "maximum_outdoor_air_flow_rate",
+            "economizer_maximum_limit_dry_bulb_temperature",
+            "economizer_maximum_limit_enthalpy",
+            "economizer_maximum_limit_dewpoint_temperature",
+            "economizer_minimum_limit_dry_bulb_temperature",
+            "high_humidity_outdoor_air_flow_ratio",
+        ],
+        "choices": {
+            "minimum_outdoor_air_flow_rate": ["Autosize"],
+            "maximum_outdoor_air_flow_rate": ["Autosize"],
+            "economizer_control_type": [
+                "DifferentialDryBulb",
+                "DifferentialDryBulbAndEnthalpy",
+                "DifferentialEnthalpy",
+                "ElectronicEnthalpy",
+                "FixedDewPointAndDryBulb",
+                "FixedDryBulb",
+                "FixedEnthalpy",
+                "NoEconomizer",
+            ],
+            "economizer_control_action_type": ["MinimumFlowWithBypass", "ModulateFlow"],
+            "lockout_type": [
+                "LockoutWithCompressor",
+                "LockoutWithHeating",
+                "NoLockout",
+            ],
+            "minimum_limit_type": ["FixedMinimum", "ProportionalMinimum"],
+            "high_humidity_control": ["No", "Yes"],
+            "control_high_indoor_humidity_based_on_outdoor_humidity_ratio": [
+                "No",
+                "Yes",
+            ],
+            "heat_recovery_bypass_control_type": [
+                "BypassWhenOAFlowGreaterThanMinimum",
+                "BypassWhenWithinEconomizerLimits",
+            ],
+            "economizer_operation_staging": [
+                "EconomizerFirst",
+                "InterlockedWithMechanicalCooling",
+            ],
+        },
+        "references": ["AirLoopControllers", "OAControllerNames"],
+        "object_lists": {
+            "electronic_enthalpy_limit_curve_name": ["UnivariateFunctions"],
+            "minimum_outdoor_air_schedule_name": ["ScheduleNames"],
+            "minimum_fraction_of_outdoor_air_schedule_name": ["ScheduleNames"],
+            "maximum_fraction_of_outdoor_air_schedule_name": ["ScheduleNames"],
+            "mechanical_ventilation_controller_name": ["ControllerMechanicalVentNames"],
+            "time_of_day_economizer_control_schedule_name": ["ScheduleNames"],
+            "humidistat_control_zone_name": ["ZoneNames"],
+        },
+    },
+    "Controller:WaterCoil": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "action",
+            "actuator_variable",
+            "sensor_node_name",
+            "actuator_node_name",
+            "controller_convergence_tolerance",
+            "maximum_actuated_flow",
+            "minimum_actuated_flow",
+        ],
+        "numeric": [
+            "controller_convergence_tolerance",
+            "maximum_actuated_flow",
+            "minimum_actuated_flow",
+        ],
+        "choices": {
+            "control_variable": [
+                "HumidityRatio",
+                "Temperature",
+                "TemperatureAndHumidityRatio",
+            ],
+            "action": ["Normal", "Reverse"],
+            "actuator_variable": ["Flow"],
+            "controller_convergence_tolerance": ["Autosize"],
+            "maximum_actuated_flow": ["Autosize"],
+        },
+        "references": ["AirLoopControllers", "WaterCoilControllers"],
+    },
+    "ConvergenceLimits": {
+        "name": False,
+        "fields": [
+            "minimum_system_timestep",
+            "maximum_hvac_iterations",
+            "minimum_plant_iterations",
+            "maximum_plant_iterations",
+        ],
+        "numeric": [
+            "minimum_system_timestep",
+            "maximum_hvac_iterations",
+            "minimum_plant_iterations",
+            "maximum_plant_iterations",
+        ],
+    },
+    "CoolingTower:SingleSpeed": {
+        "name": True,
+        "fields": [
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "design_water_flow_rate",
+            "design_air_flow_rate",
+            "design_fan_power",
+            "design_u_factor_times_area_value",
+            "free_convection_regime_air_flow_rate",
+            "free_convection_regime_air_flow_rate_sizing_factor",
+            "free_convection_regime_u_factor_times_area_value",
+            "free_convection_u_factor_times_area_value_sizing_factor",
+            "performance_input_method",
+            "heat_rejection_capacity_and_nominal_capacity_sizing_ratio",
+            "nominal_capacity",
+            "free_convection_capacity",
+            "free_convection_nominal_capacity_sizing_factor",
+            "design_inlet_air_dry_bulb_temperature",
+            "design_inlet_air_wet_bulb_temperature",
+            "design_approach_temperature",
+            "design_range_temperature",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "basin_heater_operating_schedule_name",
+            "evaporation_loss_mode",
+            "evaporation_loss_factor",
+            "drift_loss_percent",
+            "blowdown_calculation_mode",
+            "blowdown_concentration_ratio",
+            "blowdown_makeup_water_usage_schedule_name",
+            "supply_water_storage_tank_name",
+            "outdoor_air_inlet_node_name",
+            "capacity_control",
+            "number_of_cells",
+            "cell_control",
+            "cell_minimum_water_flow_rate_fraction",
+            "cell_maximum_water_flow_rate_fraction",
+            "sizing_factor",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "design_water_flow_rate",
+            "design_air_flow_rate",
+            "design_fan_power",
+            "design_u_factor_times_area_value",
+            "free_convection_regime_air_flow_rate",
+            "free_convection_regime_air_flow_rate_sizing_factor",
+            "free_convection_regime_u_factor_times_area_value",
+            "free_convection_u_factor_times_area_value_sizing_factor",
+            "heat_rejection_capacity_and_nominal_capacity_sizing_ratio",
+            "nominal_capacity",
+            "free_convection_capacity",
+            "free_convection_nominal_capacity_sizing_factor",
+            "design_inlet_air_dry_bulb_temperature",
+            "design_inlet_air_wet_bulb_temperature",
+            "design_approach_temperature",
+            "design_range_temperature",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "evaporation_loss_factor",
+            "drift_loss_percent",
+            "blowdown_concentration_ratio",
+            "number_of_cells",
+            "cell_minimum_water_flow_rate_fraction",
+            "cell_maximum_water_flow_rate_fraction",
+            "sizing_factor",
+        ],
+        "choices": {
+            "design_water_flow_rate": ["Autosize"],
+            "design_air_flow_rate": ["Autosize"],
+            "design_fan_power": ["Autosize"],
+            "design_u_factor_times_area_value": ["Autosize"],
+            "free_convection_regime_air_flow_rate": ["Autocalculate"],
+            "free_convection_regime_u_factor_times_area_value": ["Autocalculate"],
+            "performance_input_method": [
+                "NominalCapacity",
+                "UFactorTimesAreaAndDesignWaterFlowRate",
+            ],
+            "free_convection_capacity": ["Autocalculate"],
+            "design_approach_temperature": ["Autosize"],
+            "design_range_temperature": ["Autosize"],
+            "evaporation_loss_mode": ["LossFactor", "SaturatedExit"],
+            "blowdown_calculation_mode": ["ConcentrationRatio", "ScheduledRate"],
+            "capacity_control": ["FanCycling", "FluidBypass"],
+            "cell_control": ["MaximalCell", "MinimalCell"],
+        },
+        "references": [
+            "CoolingTowers",
+            "CoolingTowersWithUA",
+            "validBranchEquipmentNames",
+            "validCondenserEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "basin_heater_operating_schedule_name": ["ScheduleNames"],
+            "blowdown_makeup_water_usage_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "CoolingTower:VariableSpeed": {
+        "name": True,
+        "fields": [
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "model_type",
+            "model_coefficient_name",
+            "design_inlet_air_wet_bulb_temperature",
+            "design_approach_temperature",
+            "design_range_temperature",
+            "design_water_flow_rate",
+            "design_air_flow_rate",
+            "design_fan_power",
+            "fan_power_ratio_function_of_air_flow_rate_ratio_curve_name",
+            "minimum_air_flow_rate_ratio",
+            "fraction_of_tower_capacity_in_free_convection_regime",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "basin_heater_operating_schedule_name",
+            "evaporation_loss_mode",
+            "evaporation_loss_factor",
+            "drift_loss_percent",
+            "blowdown_calculation_mode",
+            "blowdown_concentration_ratio",
+            "blowdown_makeup_water_usage_schedule_name",
+            "supply_water_storage_tank_name",
+            "outdoor_air_inlet_node_name",
+            "number_of_cells",
+            "cell_control",
+            "cell_minimum_water_flow_rate_fraction",
+            "cell_maximum_water_flow_rate_fraction",
+            "sizing_factor",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "design_inlet_air_wet_bulb_temperature",
+            "design_approach_temperature",
+            "design_range_temperature",
+            "design_water_flow_rate",
+            "design_air_flow_rate",
+            "design_fan_power",
+            "minimum_air_flow_rate_ratio",
+            "fraction_of_tower_capacity_in_free_convection_regime",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "evaporation_loss_factor",
+            "drift_loss_percent",
+            "blowdown_concentration_ratio",
+            "number_of_cells",
+            "cell_minimum_water_flow_rate_fraction",
+            "cell_maximum_water_flow_rate_fraction",
+            "sizing_factor",
+        ],
+        "choices": {
+            "model_type": [
+                "CoolToolsCrossFlow",
+                "CoolToolsUserDefined",
+                "YorkCalc",
+                "YorkCalcUserDefined",
+            ],
+            "design_water_flow_rate": ["Autosize"],
+            "design_air_flow_rate": ["Autosize"],
+            "design_fan_power": ["Autosize"],
+            "evaporation_loss_mode": ["LossFactor", "SaturatedExit"],
+            "blowdown_calculation_mode": ["ConcentrationRatio", "ScheduledRate"],
+            "cell_control": ["MaximalCell", "MinimalCell"],
+        },
+        "references": [
+            "CoolingTowers",
+            "validBranchEquipmentNames",
+            "validCondenserEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "fan_power_ratio_function_of_air_flow_rate_ratio_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "basin_heater_operating_schedule_name": ["ScheduleNames"],
+            "blowdown_makeup_water_usage_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Curve:Bicubic": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_y",
+            "coefficient5_y_2",
+            "coefficient6_x_y",
+            "coefficient7_x_3",
+            "coefficient8_y_3",
+            "coefficient9_x_2_y",
+            "coefficient10_x_y_2",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_x",
+            "input_unit_type_for_y",
+            "output_unit_type",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_y",
+            "coefficient5_y_2",
+            "coefficient6_x_y",
+            "coefficient7_x_3",
+            "coefficient8_y_3",
+            "coefficient9_x_2_y",
+            "coefficient10_x_y_2",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "input_unit_type_for_y": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": ["BivariateFunctions"],
+    },
+    "Curve:Biquadratic": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_y",
+            "coefficient5_y_2",
+            "coefficient6_x_y",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_x",
+            "input_unit_type_for_y",
+            "output_unit_type",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_y",
+            "coefficient5_y_2",
+            "coefficient6_x_y",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "input_unit_type_for_y": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": ["BivariateFunctions"],
+    },
+    "Curve:Cubic": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_x_3",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_x",
+            "output_unit_type",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_x_3",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": ["UnivariateFunctions"],
+    },
+    "Curve:Exponent": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_constant",
+            "coefficient3_constant",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_x",
+            "output_unit_type",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_constant",
+            "coefficient3_constant",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": ["UnivariateFunctions"],
+    },
+    "Curve:Linear": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_x",
+            "output_unit_type",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Pressure",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": ["UnivariateFunctions"],
+    },
+    "Curve:QuadLinear": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_w",
+            "coefficient3_x",
+            "coefficient4_y",
+            "coefficient5_z",
+            "minimum_value_of_w",
+            "maximum_value_of_w",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_value_of_z",
+            "maximum_value_of_z",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_w",
+            "input_unit_type_for_x",
+            "input_unit_type_for_y",
+            "input_unit_type_for_z",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_w",
+            "coefficient3_x",
+            "coefficient4_y",
+            "coefficient5_z",
+            "minimum_value_of_w",
+            "maximum_value_of_w",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_value_of_z",
+            "maximum_value_of_z",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_w": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+            "input_unit_type_for_y": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+            "input_unit_type_for_z": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+        },
+        "references": ["QuadvariateFunctions"],
+    },
+    "Curve:Quadratic": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_x",
+            "output_unit_type",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": ["UnivariateFunctions"],
+    },
+    "Curve:Quartic": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_x_3",
+            "coefficient5_x_4",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_x",
+            "output_unit_type",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_x",
+            "coefficient3_x_2",
+            "coefficient4_x_3",
+            "coefficient5_x_4",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": ["UnivariateFunctions"],
+    },
+    "Curve:QuintLinear": {
+        "name": True,
+        "fields": [
+            "coefficient1_constant",
+            "coefficient2_v",
+            "coefficient3_w",
+            "coefficient4_x",
+            "coefficient5_y",
+            "coefficient6_z",
+            "minimum_value_of_v",
+            "maximum_value_of_v",
+            "minimum_value_of_w",
+            "maximum_value_of_w",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_value_of_z",
+            "maximum_value_of_z",
+            "minimum_curve_output",
+            "maximum_curve_output",
+            "input_unit_type_for_v",
+            "input_unit_type_for_w",
+            "input_unit_type_for_x",
+            "input_unit_type_for_y",
+            "input_unit_type_for_z",
+        ],
+        "numeric": [
+            "coefficient1_constant",
+            "coefficient2_v",
+            "coefficient3_w",
+            "coefficient4_x",
+            "coefficient5_y",
+            "coefficient6_z",
+            "minimum_value_of_v",
+            "maximum_value_of_v",
+            "minimum_value_of_w",
+            "maximum_value_of_w",
+            "minimum_value_of_x",
+            "maximum_value_of_x",
+            "minimum_value_of_y",
+            "maximum_value_of_y",
+            "minimum_value_of_z",
+            "maximum_value_of_z",
+            "minimum_curve_output",
+            "maximum_curve_output",
+        ],
+        "choices": {
+            "input_unit_type_for_v": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+            "input_unit_type_for_w": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+            "input_unit_type_for_x": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+            "input_unit_type_for_y": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+            "input_unit_type_for_z": [
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+                "VolumetricFlowPerPower",
+            ],
+        },
+        "references": ["QuintvariateFunctions"],
+    },
+    "Daylighting:Controls": {
+        "name": True,
+        "fields": [
+            "zone_or_space_name",
+            "daylighting_method",
+            "availability_schedule_name",
+            "lighting_control_type",
+            "minimum_input_power_fraction_for_continuous_or_continuousoff_dimming_control",
+            "minimum_light_output_fraction_for_continuous_or_continuousoff_dimming_control",
+            "number_of_stepped_control_steps",
+            "probability_lighting_will_be_reset_when_needed_in_manual_stepped_control",
+            "glare_calculation_daylighting_reference_point_name",
+            "glare_calculation_azimuth_angle_of_view_direction_clockwise_from_zone_y_axis",
+            "maximum_allowable_discomfort_glare_index",
+            "delight_gridding_resolution",
+        ],
+        "extension": "control_data",
+        "extensibles": [
+            "daylighting_reference_point_name",
+            "fraction_of_lights_controlled_by_reference_point",
+            "illuminance_setpoint_at_reference_point",
+        ],
+        "numeric": [
+            "minimum_input_power_fraction_for_continuous_or_continuousoff_dimming_control",
+            "minimum_light_output_fraction_for_continuous_or_continuousoff_dimming_control",
+            "number_of_stepped_control_steps",
+            "probability_lighting_will_be_reset_when_needed_in_manual_stepped_control",
+            "glare_calculation_azimuth_angle_of_view_direction_clockwise_from_zone_y_axis",
+            "maximum_allowable_discomfort_glare_index",
+            "delight_gridding_resolution",
+            "fraction_of_lights_controlled_by_reference_point",
+            "illuminance_setpoint_at_reference_point",
+        ],
+        "choices": {
+            "daylighting_method": ["DElight", "SplitFlux"],
+            "lighting_control_type": ["Continuous", "ContinuousOff", "Stepped"],
+        },
+        "references": ["DaylightingControlNames"],
+        "object_lists": {
+            "zone_or_space_name": ["ZoneNames"],
+            "availability_schedule_name": ["ScheduleNames"],
+            "glare_calculation_daylighting_reference_point_name": [
+                "DaylightReferencePointNames"
+            ],
+            "daylighting_reference_point_name": ["DaylightReferencePointNames"],
+        },
+    },
+    "Daylighting:ReferencePoint": {
+        "name": True,
+        "fields": [
+            "zone_or_space_name",
+            "x_coordinate_of_reference_point",
+            "y_coordinate_of_reference_point",
+            "z_coordinate_of_reference_point",
+        ],
+        "numeric": [
+            "x_coordinate_of_reference_point",
+            "y_coordinate_of_reference_point",
+            "z_coordinate_of_reference_point",
+        ],
+        "references": ["DaylightReferencePointNames"],
+        "object_lists": {"zone_or_space_name": ["ZoneNames"]},
+    },
+    "DesignSpecification:OutdoorAir": {
+        "name": True,
+        "fields": [
+            "outdoor_air_method",
+            "outdoor_air_flow_per_person",
+            "outdoor_air_flow_per_zone_floor_area",
+            "outdoor_air_flow_per_zone",
+            "outdoor_air_flow_air_changes_per_hour",
+            "outdoor_air_schedule_name",
+            "proportional_control_minimum_outdoor_air_flow_rate_schedule_name",
+        ],
+        "numeric": [
+            "outdoor_air_flow_per_person",
+            "outdoor_air_flow_per_zone_floor_area",
+            "outdoor_air_flow_per_zone",
+            "outdoor_air_flow_air_changes_per_hour",
+        ],
+        "choices": {
+            "outdoor_air_method": [
+                "AirChanges/Hour",
+                "Flow/Area",
+                "Flow/Person",
+                "Flow/Zone",
+                "IndoorAirQualityProcedure",
+                "Maximum",
+                "ProportionalControlBasedOnDesignOccupancy",
+                "ProportionalControlBasedOnOccupancySchedule",
+                "Sum",
+            ]
+        },
+        "references": ["DesignSpecificationOutdoorAirNames"],
+        "object_lists": {
+            "outdoor_air_schedule_name": ["ScheduleNames"],
+            "proportional_control_minimum_outdoor_air_flow_rate_schedule_name": [
+                "ScheduleNames"
+            ],
+        },
+    },
+    "DesignSpecification:ZoneAirDistribution": {
+        "name": True,
+        "fields": [
+            "zone_air_distribution_effectiveness_in_cooling_mode",
+            "zone_air_distribution_effectiveness_in_heating_mode",
+            "zone_air_distribution_effectiveness_schedule_name",
+            "zone_secondary_recirculation_fraction",
+            "minimum_zone_ventilation_efficiency",
+        ],
+        "numeric": [
+            "zone_air_distribution_effectiveness_in_cooling_mode",
+            "zone_air_distribution_effectiveness_in_heating_mode",
+            "zone_secondary_recirculation_fraction",
+            "minimum_zone_ventilation_efficiency",
+        ],
+        "references": ["DesignSpecificationZoneAirDistributionNames"],
+        "object_lists": {
+            "zone_air_distribution_effectiveness_schedule_name": ["ScheduleNames"]
+        },
+    },
+    "ElectricEquipment": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_or_space_or_spacelist_name",
+            "schedule_name",
+            "design_level_calculation_method",
+            "design_level",
+            "watts_per_floor_area",
+            "watts_per_person",
+            "fraction_latent",
+            "fraction_radiant",
+            "fraction_lost",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "design_level",
+            "watts_per_floor_area",
+            "watts_per_person",
+            "fraction_latent",
+            "fraction_radiant",
+            "fraction_lost",
+        ],
+        "choices": {
+            "design_level_calculation_method": [
+                "EquipmentLevel",
+                "Watts/Area",
+                "Watts/Person",
+            ]
+        },
+        "references": ["ElectricEquipmentNames"],
+        "object_lists": {
+            "zone_or_zonelist_or_space_or_spacelist_name": ["ZoneAndZoneListNames"],
+            "schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ElectricLoadCenter:Distribution": {
+        "name": True,
+        "fields": [
+            "generator_list_name",
+            "generator_operation_scheme_type",
+            "generator_demand_limit_scheme_purchased_electric_demand_limit",
+            "generator_track_schedule_name_scheme_schedule_name",
+            "generator_track_meter_scheme_meter_name",
+            "electrical_buss_type",
+            "inverter_name",
+            "electrical_storage_object_name",
+            "transformer_object_name",
+            "storage_operation_scheme",
+            "storage_control_track_meter_name",
+            "storage_converter_object_name",
+            "maximum_storage_state_of_charge_fraction",
+            "minimum_storage_state_of_charge_fraction",
+            "design_storage_control_charge_power",
+            "storage_charge_power_fraction_schedule_name",
+            "design_storage_control_discharge_power",
+            "storage_discharge_power_fraction_schedule_name",
+            "storage_control_utility_demand_target",
+            "storage_control_utility_demand_target_fraction_schedule_name",
+        ],
+        "numeric": [
+            "generator_demand_limit_scheme_purchased_electric_demand_limit",
+            "maximum_storage_state_of_charge_fraction",
+            "minimum_storage_state_of_charge_fraction",
+            "design_storage_control_charge_power",
+            "design_storage_control_discharge_power",
+            "storage_control_utility_demand_target",
+        ],
+        "choices": {
+            "generator_operation_scheme_type": [
+                "Baseload",
+                "DemandLimit",
+                "FollowThermal",
+                "FollowThermalLimitElectrical",
+                "TrackElectrical",
+                "TrackMeter",
+                "TrackSchedule",
+            ],
+            "electrical_buss_type": [
+                "AlternatingCurrent",
+                "AlternatingCurrentWithStorage",
+                "DirectCurrentWithInverter",
+                "DirectCurrentWithInverterACStorage",
+                "DirectCurrentWithInverterDCStorage",
+            ],
+            "storage_operation_scheme": [
+                "FacilityDemandLeveling",
+                "TrackChargeDischargeSchedules",
+                "TrackFacilityElectricDemandStoreExcessOnSite",
+                "TrackMeterDemandStoreExcessOnSite",
+            ],
+        },
+        "object_lists": {
+            "generator_list_name": ["GeneratorLists"],
+            "generator_track_schedule_name_scheme_schedule_name": ["ScheduleNames"],
+            "inverter_name": ["InverterList"],
+            "electrical_storage_object_name": ["ElecStorageList"],
+            "transformer_object_name": ["TransformerNames"],
+            "storage_converter_object_name": ["ConverterList"],
+            "storage_charge_power_fraction_schedule_name": ["ScheduleNames"],
+            "storage_discharge_power_fraction_schedule_name": ["ScheduleNames"],
+            "storage_control_utility_demand_target_fraction_schedule_name": [
+                "ScheduleNames"
+            ],
+        },
+    },
+    "ElectricLoadCenter:Generators": {
+        "name": True,
+        "fields": [],
+        "extension": "generator_outputs",
+        "extensibles": [
+            "generator_name",
+            "generator_object_type",
+            "generator_rated_electric_power_output",
+            "generator_availability_schedule_name",
+            "generator_rated_thermal_to_electrical_power_ratio",
+        ],
+        "numeric": [
+            "generator_rated_electric_power_output",
+            "generator_rated_thermal_to_electrical_power_ratio",
+        ],
+        "choices": {
+            "generator_object_type": [
+                "Generator:CombustionTurbine",
+                "Generator:FuelCell",
+                "Generator:InternalCombustionEngine",
+                "Generator:MicroCHP",
+                "Generator:MicroTurbine",
+                "Generator:PVWatts",
+                "Generator:Photovoltaic",
+                "Generator:WindTurbine",
+            ]
+        },
+        "references": ["GeneratorLists"],
+        "object_lists": {
+            "generator_name": ["GeneratorNames"],
+            "generator_availability_schedule_name": ["ScheduleNames"],
+        },
+        "object_types": {"generator_name": "generator_object_type"},
+    },
+    "ElectricLoadCenter:Inverter:PVWatts": {
+        "name": True,
+        "fields": ["dc_to_ac_size_ratio", "inverter_efficiency"],
+        "numeric": ["dc_to_ac_size_ratio", "inverter_efficiency"],
+        "references": ["InverterList"],
+    },
+    "ElectricLoadCenter:Inverter:Simple": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "zone_name",
+            "radiative_fraction",
+            "inverter_efficiency",
+        ],
+        "numeric": ["radiative_fraction", "inverter_efficiency"],
+        "references": ["InverterList"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+        },
+    },
+    "ElectricLoadCenter:Storage:Converter": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "power_conversion_efficiency_method",
+            "simple_fixed_efficiency",
+            "design_maximum_continuous_input_power",
+            "efficiency_function_of_power_curve_name",
+            "ancillary_power_consumed_in_standby",
+            "zone_name",
+            "radiative_fraction",
+        ],
+        "numeric": [
+            "simple_fixed_efficiency",
+            "design_maximum_continuous_input_power",
+            "ancillary_power_consumed_in_standby",
+            "radiative_fraction",
+        ],
+        "choices": {
+            "power_conversion_efficiency_method": ["FunctionOfPower", "SimpleFixed"]
+        },
+        "references": ["ConverterList"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "efficiency_function_of_power_curve_name": ["UnivariateFunctions"],
+            "zone_name": ["ZoneNames"],
+        },
+    },
+    "ElectricLoadCenter:Storage:Simple": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "zone_name",
+            "radiative_fraction_for_zone_heat_gains",
+            "nominal_energetic_efficiency_for_charging",
+            "nominal_discharging_energetic_efficiency",
+            "maximum_storage_capacity",
+            "maximum_power_for_discharging",
+            "maximum_power_for_charging",
+            "initial_state_of_charge",
+        ],
+        "numeric": [
+            "radiative_fraction_for_zone_heat_gains",
+            "nominal_energetic_efficiency_for_charging",
+            "nominal_discharging_energetic_efficiency",
+            "maximum_storage_capacity",
+            "maximum_power_for_discharging",
+            "maximum_power_for_charging",
+            "initial_state_of_charge",
+        ],
+        "references": ["ElecStorageList"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+        },
+    },
+    "ElectricLoadCenter:Transformer": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "transformer_usage",
+            "zone_name",
+            "radiative_fraction",
+            "rated_capacity",
+            "phase",
+            "conductor_material",
+            "full_load_temperature_rise",
+            "fraction_of_eddy_current_losses",
+            "performance_input_method",
+            "rated_no_load_loss",
+            "rated_load_loss",
+            "nameplate_efficiency",
+            "per_unit_load_for_nameplate_efficiency",
+            "reference_temperature_for_nameplate_efficiency",
+            "per_unit_load_for_maximum_efficiency",
+            "consider_transformer_loss_for_utility_cost",
+        ],
+        "extension": "meters",
+        "extensibles": ["meter_name"],
+        "numeric": [
+            "radiative_fraction",
+            "rated_capacity",
+            "phase",
+            "full_load_temperature_rise",
+            "fraction_of_eddy_current_losses",
+            "rated_no_load_loss",
+            "rated_load_loss",
+            "nameplate_efficiency",
+            "per_unit_load_for_nameplate_efficiency",
+            "reference_temperature_for_nameplate_efficiency",
+            "per_unit_load_for_maximum_efficiency",
+        ],
+        "choices": {
+            "transformer_usage": [
+                "LoadCenterPowerConditioning",
+                "PowerInFromGrid",
+                "PowerOutToGrid",
+            ],
+            "phase": [1, 3],
+            "conductor_material": ["Aluminum", "Copper"],
+            "performance_input_method": ["NominalEfficiency", "RatedLosses"],
+            "consider_transformer_loss_for_utility_cost": ["No", "Yes"],
+        },
+        "references": ["TransformerNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+        },
+    },
+    "EnergyManagementSystem:Actuator": {
+        "name": True,
+        "fields": [
+            "actuated_component_unique_name",
+            "actuated_component_type",
+            "actuated_component_control_type",
+        ],
+    },
+    "EnergyManagementSystem:GlobalVariable": {
+        "name": False,
+        "fields": [],
+        "extension": "variables",
+        "extensibles": ["erl_variable_name"],
+    },
+    "EnergyManagementSystem:InternalVariable": {
+        "name": True,
+        "fields": ["internal_data_index_key_name", "internal_data_type"],
+    },
+    "EnergyManagementSystem:OutputVariable": {
+        "name": True,
+        "fields": [
+            "ems_variable_name",
+            "type_of_data_in_variable",
+            "update_frequency",
+            "ems_program_or_subroutine_name",
+            "units",
+        ],
+        "choices": {
+            "type_of_data_in_variable": ["Averaged", "Summed"],
+            "update_frequency": ["SystemTimestep", "ZoneTimestep"],
+        },
+    },
+    "EnergyManagementSystem:Program": {
+        "name": True,
+        "fields": [],
+        "extension": "lines",
+        "extensibles": ["program_line"],
+        "references": ["ErlProgramNames"],
+    },
+    "EnergyManagementSystem:ProgramCallingManager": {
+        "name": True,
+        "fields": ["energyplus_model_calling_point"],
+        "extension": "programs",
+        "extensibles": ["program_name"],
+        "choices": {
+            "energyplus_model_calling_point": [
+                "AfterComponentInputReadIn",
+                "AfterNewEnvironmentWarmUpIsComplete",
+                "AfterPredictorAfterHVACManagers",
+                "AfterPredictorBeforeHVACManagers",
+                "BeginNewEnvironment",
+                "BeginTimestepBeforePredictor",
+                "BeginZoneTimestepAfterInitHeatBalance",
+                "BeginZoneTimestepBeforeInitHeatBalance",
+                "BeginZoneTimestepBeforeSetCurrentWeather",
+                "EndOfSystemSizing",
+                "EndOfSystemTimestepAfterHVACReporting",
+                "EndOfSystemTimestepBeforeHVACReporting",
+                "EndOfZoneSizing",
+                "EndOfZoneTimestepAfterZoneReporting",
+                "EndOfZoneTimestepBeforeZoneReporting",
+                "InsideHVACSystemIterationLoop",
+                "UnitarySystemSizing",
+                "UserDefinedComponentModel",
+            ]
+        },
+        "references": ["ProgramNames"],
+        "object_lists": {"program_name": ["ErlProgramNames"]},
+    },
+    "EnergyManagementSystem:Sensor": {
+        "name": True,
+        "fields": [
+            "output_variable_or_output_meter_index_key_name",
+            "output_variable_or_output_meter_name",
+        ],
+    },
+    "EnvironmentalImpactFactors": {
+        "name": False,
+        "fields": [
+            "district_heating_water_efficiency",
+            "district_cooling_cop",
+            "district_heating_steam_conversion_efficiency",
+            "total_carbon_equivalent_emission_factor_from_n2o",
+            "total_carbon_equivalent_emission_factor_from_ch4",
+            "total_carbon_equivalent_emission_factor_from_co2",
+        ],
+        "numeric": [
+            "district_heating_water_efficiency",
+            "district_cooling_cop",
+            "district_heating_steam_conversion_efficiency",
+            "total_carbon_equivalent_emission_factor_from_n2o",
+            "total_carbon_equivalent_emission_factor_from_ch4",
+            "total_carbon_equivalent_emission_factor_from_co2",
+        ],
+    },
+    "EvaporativeFluidCooler:TwoSpeed": {
+        "name": True,
+        "fields": [
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "high_fan_speed_air_flow_rate",
+            "high_fan_speed_fan_power",
+            "low_fan_speed_air_flow_rate",
+            "low_fan_speed_air_flow_rate_sizing_factor",
+            "low_fan_speed_fan_power",
+            "low_fan_speed_fan_power_sizing_factor",
+            "design_spray_water_flow_rate",
+            "performance_input_method",
+            "outdoor_air_inlet_node_name",
+            "heat_rejection_capacity_and_nominal_capacity_sizing_ratio",
+            "high_speed_standard_design_capacity",
+            "low_speed_standard_design_capacity",
+            "low_speed_standard_capacity_sizing_factor",
+            "high_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_sizing_factor",
+            "design_water_flow_rate",
+            "high_speed_user_specified_design_capacity",
+            "low_speed_user_specified_design_capacity",
+            "low_speed_user_specified_design_capacity_sizing_factor",
+            "design_entering_water_temperature",
+            "design_entering_air_temperature",
+            "design_entering_air_wet_bulb_temperature",
+            "high_speed_sizing_factor",
+            "evaporation_loss_mode",
+            "evaporation_loss_factor",
+            "drift_loss_percent",
+            "blowdown_calculation_mode",
+            "blowdown_concentration_ratio",
+            "blowdown_makeup_water_usage_schedule_name",
+            "supply_water_storage_tank_name",
+        ],
+        "numeric": [
+            "high_fan_speed_air_flow_rate",
+            "high_fan_speed_fan_power",
+            "low_fan_speed_air_flow_rate",
+            "low_fan_speed_air_flow_rate_sizing_factor",
+            "low_fan_speed_fan_power",
+            "low_fan_speed_fan_power_sizing_factor",
+            "design_spray_water_flow_rate",
+            "heat_rejection_capacity_and_nominal_capacity_sizing_ratio",
+            "high_speed_standard_design_capacity",
+            "low_speed_standard_design_capacity",
+            "low_speed_standard_capacity_sizing_factor",
+            "high_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_sizing_factor",
+            "design_water_flow_rate",
+            "high_speed_user_specified_design_capacity",
+            "low_speed_user_specified_design_capacity",
+            "low_speed_user_specified_design_capacity_sizing_factor",
+            "design_entering_water_temperature",
+            "design_entering_air_temperature",
+            "design_entering_air_wet_bulb_temperature",
+            "high_speed_sizing_factor",
+            "evaporation_loss_factor",
+            "drift_loss_percent",
+            "blowdown_concentration_ratio",
+        ],
+        "choices": {
+            "high_fan_speed_air_flow_rate": ["Autosize"],
+            "high_fan_speed_fan_power": ["Autosize"],
+            "low_fan_speed_air_flow_rate": ["Autocalculate"],
+            "low_fan_speed_fan_power": ["Autocalculate"],
+            "performance_input_method": [
+                "StandardDesignCapacity",
+                "UFactorTimesAreaAndDesignWaterFlowRate",
+                "UserSpecifiedDesignCapacity",
+            ],
+            "low_speed_standard_design_capacity": ["Autocalculate"],
+            "high_fan_speed_u_factor_times_area_value": ["Autosize"],
+            "low_fan_speed_u_factor_times_area_value": ["Autocalculate"],
+            "design_water_flow_rate": ["Autosize"],
+            "low_speed_user_specified_design_capacity": ["Autocalculate"],
+            "evaporation_loss_mode": ["LossFactor", "SaturatedExit"],
+            "blowdown_calculation_mode": ["ConcentrationRatio", "ScheduledRate"],
+        },
+        "references": [
+            "validBranchEquipmentNames",
+            "validCondenserEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "blowdown_makeup_water_usage_schedule_name": ["ScheduleNames"]
+        },
+    },
+    "Exterior:FuelEquipment": {
+        "name": True,
+        "fields": [
+            "fuel_use_type",
+            "schedule_name",
+            "design_level",
+            "end_use_subcategory",
+        ],
+        "numeric": ["design_level"],
+        "choices": {
+            "fuel_use_type": [
+                "Coal",
+                "Diesel",
+                "DistrictCooling",
+                "DistrictHeatingSteam",
+                "DistrictHeatingWater",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+                "Water",
+            ]
+        },
+        "object_lists": {"schedule_name": ["ScheduleNames"]},
+    },
+    "Exterior:Lights": {
+        "name": True,
+        "fields": [
+            "schedule_name",
+            "design_level",
+            "control_option",
+            "end_use_subcategory",
+        ],
+        "numeric": ["design_level"],
+        "choices": {"control_option": ["AstronomicalClock", "ScheduleNameOnly"]},
+        "references": ["ExteriorLightsNames"],
+        "object_lists": {"schedule_name": ["ScheduleNames"]},
+    },
+    "Fan:ConstantVolume": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "fan_total_efficiency",
+            "pressure_rise",
+            "maximum_flow_rate",
+            "motor_efficiency",
+            "motor_in_airstream_fraction",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "fan_total_efficiency",
+            "pressure_rise",
+            "maximum_flow_rate",
+            "motor_efficiency",
+            "motor_in_airstream_fraction",
+        ],
+        "choices": {"maximum_flow_rate": ["Autosize"]},
+        "references": [
+            "Fans",
+            "FansCV",
+            "FansCVandOnOff",
+            "FansCVandOnOffandVAV",
+            "FansCVandVAV",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "Fan:OnOff": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "fan_total_efficiency",
+            "pressure_rise",
+            "maximum_flow_rate",
+            "motor_efficiency",
+            "motor_in_airstream_fraction",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "fan_power_ratio_function_of_speed_ratio_curve_name",
+            "fan_efficiency_ratio_function_of_speed_ratio_curve_name",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "fan_total_efficiency",
+            "pressure_rise",
+            "maximum_flow_rate",
+            "motor_efficiency",
+            "motor_in_airstream_fraction",
+        ],
+        "choices": {"maximum_flow_rate": ["Autosize"]},
+        "references": [
+            "Fans",
+            "FansCVandOnOff",
+            "FansCVandOnOffandVAV",
+            "FansOnOff",
+            "FansOnOffandVAV",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "fan_power_ratio_function_of_speed_ratio_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "fan_efficiency_ratio_function_of_speed_ratio_curve_name": [
+                "UnivariateFunctions"
+            ],
+        },
+    },
+    "Fan:SystemModel": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "design_maximum_air_flow_rate",
+            "speed_control_method",
+            "electric_power_minimum_flow_rate_fraction",
+            "design_pressure_rise",
+            "motor_efficiency",
+            "motor_in_air_stream_fraction",
+            "design_electric_power_consumption",
+            "design_power_sizing_method",
+            "electric_power_per_unit_flow_rate",
+            "electric_power_per_unit_flow_rate_per_unit_pressure",
+            "fan_total_efficiency",
+            "electric_power_function_of_flow_fraction_curve_name",
+            "night_ventilation_mode_pressure_rise",
+            "night_ventilation_mode_flow_fraction",
+            "motor_loss_zone_name",
+            "motor_loss_radiative_fraction",
+            "end_use_subcategory",
+            "number_of_speeds",
+        ],
+        "extension": "speed_fractions",
+        "extensibles": ["speed_flow_fraction", "speed_electric_power_fraction"],
+        "numeric": [
+            "design_maximum_air_flow_rate",
+            "electric_power_minimum_flow_rate_fraction",
+            "design_pressure_rise",
+            "motor_efficiency",
+            "motor_in_air_stream_fraction",
+            "design_electric_power_consumption",
+            "electric_power_per_unit_flow_rate",
+            "electric_power_per_unit_flow_rate_per_unit_pressure",
+            "fan_total_efficiency",
+            "night_ventilation_mode_pressure_rise",
+            "night_ventilation_mode_flow_fraction",
+            "motor_loss_radiative_fraction",
+            "number_of_speeds",
+            "speed_flow_fraction",
+            "speed_electric_power_fraction",
+        ],
+        "choices": {
+            "design_maximum_air_flow_rate": ["Autosize"],
+            "speed_control_method": ["Continuous", "Discrete"],
+            "design_electric_power_consumption": ["Autosize"],
+            "design_power_sizing_method": [
+                "PowerPerFlow",
+                "PowerPerFlowPerPressure",
+                "TotalEfficiencyAndPressure",
+            ],
+        },
+        "references": [
+            "Fans",
+            "FansSystemModel",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "electric_power_function_of_flow_fraction_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "motor_loss_zone_name": ["ZoneNames"],
+        },
+    },
+    "Fan:VariableVolume": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "fan_total_efficiency",
+            "pressure_rise",
+            "maximum_flow_rate",
+            "fan_power_minimum_flow_rate_input_method",
+            "fan_power_minimum_flow_fraction",
+            "fan_power_minimum_air_flow_rate",
+            "motor_efficiency",
+            "motor_in_airstream_fraction",
+            "fan_power_coefficient_1",
+            "fan_power_coefficient_2",
+            "fan_power_coefficient_3",
+            "fan_power_coefficient_4",
+            "fan_power_coefficient_5",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "fan_total_efficiency",
+            "pressure_rise",
+            "maximum_flow_rate",
+            "fan_power_minimum_flow_fraction",
+            "fan_power_minimum_air_flow_rate",
+            "motor_efficiency",
+            "motor_in_airstream_fraction",
+            "fan_power_coefficient_1",
+            "fan_power_coefficient_2",
+            "fan_power_coefficient_3",
+            "fan_power_coefficient_4",
+            "fan_power_coefficient_5",
+        ],
+        "choices": {
+            "maximum_flow_rate": ["Autosize"],
+            "fan_power_minimum_flow_rate_input_method": ["FixedFlowRate", "Fraction"],
+        },
+        "references": [
+            "Fans",
+            "FansCVandOnOffandVAV",
+            "FansCVandVAV",
+            "FansOnOffandVAV",
+            "FansVAV",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "Fan:ZoneExhaust": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "fan_total_efficiency",
+            "pressure_rise",
+            "maximum_flow_rate",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "end_use_subcategory",
+            "flow_fraction_schedule_name",
+            "system_availability_manager_coupling_mode",
+            "minimum_zone_temperature_limit_schedule_name",
+            "balanced_exhaust_fraction_schedule_name",
+        ],
+        "numeric": ["fan_total_efficiency", "pressure_rise", "maximum_flow_rate"],
+        "choices": {
+            "system_availability_manager_coupling_mode": ["Coupled", "Decoupled"]
+        },
+        "references": ["FansZoneExhaust", "ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "flow_fraction_schedule_name": ["ScheduleNames"],
+            "minimum_zone_temperature_limit_schedule_name": ["ScheduleNames"],
+            "balanced_exhaust_fraction_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "FenestrationSurface:Detailed": {
+        "name": True,
+        "fields": [
+            "surface_type",
+            "construction_name",
+            "building_surface_name",
+            "outside_boundary_condition_object",
+            "view_factor_to_ground",
+            "frame_and_divider_name",
+            "multiplier",
+            "number_of_vertices",
+            "vertex_1_x_coordinate",
+            "vertex_1_y_coordinate",
+            "vertex_1_z_coordinate",
+            "vertex_2_x_coordinate",
+            "vertex_2_y_coordinate",
+            "vertex_2_z_coordinate",
+            "vertex_3_x_coordinate",
+            "vertex_3_y_coordinate",
+            "vertex_3_z_coordinate",
+            "vertex_4_x_coordinate",
+            "vertex_4_y_coordinate",
+            "vertex_4_z_coordinate",
+        ],
+        "numeric": [
+            "view_factor_to_ground",
+            "multiplier",
+            "number_of_vertices",
+            "vertex_1_x_coordinate",
+            "vertex_1_y_coordinate",
+            "vertex_1_z_coordinate",
+            "vertex_2_x_coordinate",
+            "vertex_2_y_coordinate",
+            "vertex_2_z_coordinate",
+            "vertex_3_x_coordinate",
+            "vertex_3_y_coordinate",
+            "vertex_3_z_coordinate",
+            "vertex_4_x_coordinate",
+            "vertex_4_y_coordinate",
+            "vertex_4_z_coordinate",
+        ],
+        "choices": {
+            "surface_type": [
+                "Door",
+                "GlassDoor",
+                "TubularDaylightDiffuser",
+                "TubularDaylightDome",
+                "Window",
+            ],
+            "view_factor_to_ground": ["Autocalculate"],
+            "number_of_vertices": ["Autocalculate"],
+        },
+        "references": [
+            "AllHeatTranAngFacNames",
+            "AllHeatTranSurfNames",
+            "AllShadingAndHTSurfNames",
+            "GlazedExtSubSurfNames",
+            "OutFaceEnvNames",
+            "RadiantSurfaceNames",
+            "SubSurfNames",
+            "SurfAndSubSurfNames",
+        ],
+        "object_lists": {
+            "construction_name": ["ComplexFenestrationStates", "ConstructionNames"],
+            "building_surface_name": ["SurfaceNames"],
+            "outside_boundary_condition_object": ["OutFaceEnvNames"],
+            "frame_and_divider_name": ["WindowFrameAndDividerNames"],
+        },
+    },
+    "FluidCooler:TwoSpeed": {
+        "name": True,
+        "fields": [
+            "water_inlet_node_name",
+            "water_outlet_node_name",
+            "performance_input_method",
+            "high_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_sizing_factor",
+            "high_speed_nominal_capacity",
+            "low_speed_nominal_capacity",
+            "low_speed_nominal_capacity_sizing_factor",
+            "design_entering_water_temperature",
+            "design_entering_air_temperature",
+            "design_entering_air_wet_bulb_temperature",
+            "design_water_flow_rate",
+            "high_fan_speed_air_flow_rate",
+            "high_fan_speed_fan_power",
+            "low_fan_speed_air_flow_rate",
+            "low_fan_speed_air_flow_rate_sizing_factor",
+            "low_fan_speed_fan_power",
+            "low_fan_speed_fan_power_sizing_factor",
+            "outdoor_air_inlet_node_name",
+        ],
+        "numeric": [
+            "high_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_value",
+            "low_fan_speed_u_factor_times_area_sizing_factor",
+            "high_speed_nominal_capacity",
+            "low_speed_nominal_capacity",
+            "low_speed_nominal_capacity_sizing_factor",
+            "design_entering_water_temperature",
+            "design_entering_air_temperature",
+            "design_entering_air_wet_bulb_temperature",
+            "design_water_flow_rate",
+            "high_fan_speed_air_flow_rate",
+            "high_fan_speed_fan_power",
+            "low_fan_speed_air_flow_rate",
+            "low_fan_speed_air_flow_rate_sizing_factor",
+            "low_fan_speed_fan_power",
+            "low_fan_speed_fan_power_sizing_factor",
+        ],
+        "choices": {
+            "performance_input_method": [
+                "NominalCapacity",
+                "UFactorTimesAreaAndDesignWaterFlowRate",
+            ],
+            "high_fan_speed_u_factor_times_area_value": ["Autosize"],
+            "low_fan_speed_u_factor_times_area_value": ["Autocalculate"],
+            "low_speed_nominal_capacity": ["Autocalculate"],
+            "design_water_flow_rate": ["Autosize"],
+            "high_fan_speed_air_flow_rate": ["Autosize"],
+            "high_fan_speed_fan_power": ["Autosize"],
+            "low_fan_speed_air_flow_rate": ["Autocalculate"],
+            "low_fan_speed_fan_power": ["Autocalculate"],
+        },
+        "references": [
+            "validBranchEquipmentNames",
+            "validCondenserEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+    },
+    "FluidProperties:GlycolConcentration": {
+        "name": True,
+        "fields": ["glycol_type", "user_defined_glycol_name", "glycol_concentration"],
+        "numeric": ["glycol_concentration"],
+        "choices": {
+            "glycol_type": [
+                "EthyleneGlycol",
+                "PropyleneGlycol",
+                "UserDefinedGlycolType",
+            ]
+        },
+        "references": ["FluidAndGlycolNames"],
+        "object_lists": {"user_defined_glycol_name": ["FluidAndGlycolNames"]},
+    },
+    "FluidProperties:Name": {
+        "name": False,
+        "fields": ["fluid_name", "fluid_type"],
+        "choices": {"fluid_type": ["Glycol", "Refrigerant"]},
+    },
+    "FluidProperties:Saturated": {
+        "name": False,
+        "fields": [
+            "fluid_name",
+            "fluid_property_type",
+            "fluid_phase",
+            "temperature_values_name",
+            "property_value_1",
+            "property_value_2",
+            "property_value_3",
+            "property_value_4",
+            "property_value_5",
+            "property_value_6",
+            "property_value_7",
+            "property_value_8",
+            "property_value_9",
+            "property_value_10",
+            "property_value_11",
+            "property_value_12",
+            "property_value_13",
+            "property_value_14",
+            "property_value_15",
+            "property_value_16",
+            "property_value_17",
+            "property_value_18",
+            "property_value_19",
+            "property_value_20",
+            "property_value_21",
+            "property_value_22",
+            "property_value_23",
+            "property_value_24",
+            "property_value_25",
+            "property_value_26",
+            "property_value_27",
+            "property_value_28",
+            "property_value_29",
+            "property_value_30",
+            "property_value_31",
+            "property_value_32",
+            "property_value_33",
+            "property_value_34",
+            "property_value_35",
+            "property_value_36",
+            "property_value_37",
+            "property_value_38",
+            "property_value_39",
+            "property_value_40",
+            "property_value_41",
+            "property_value_42",
+            "property_value_43",
+            "property_value_44",
+            "property_value_45",
+            "property_value_46",
+            "property_value_47",
+            "property_value_48",
+            "property_value_49",
+            "property_value_50",
+            "property_value_51",
+            "property_value_52",
+            "property_value_53",
+            "property_value_54",
+            "property_value_55",
+            "property_value_56",
+            "property_value_57",
+            "property_value_58",
+            "property_value_59",
+            "property_value_60",
+            "property_value_61",
+            "property_value_62",
+            "property_value_63",
+            "property_value_64",
+            "property_value_65",
+            "property_value_66",
+            "property_value_67",
+            "property_value_68",
+            "property_value_69",
+            "property_value_70",
+            "property_value_71",
+            "property_value_72",
+            "property_value_73",
+            "property_value_74",
+            "property_value_75",
+            "property_value_76",
+            "property_value_77",
+            "property_value_78",
+            "property_value_79",
+            "property_value_80",
+            "property_value_81",
+            "property_value_82",
+            "property_value_83",
+            "property_value_84",
+            "property_value_85",
+            "property_value_86",
+            "property_value_87",
+            "property_value_88",
+            "property_value_89",
+            "property_value_90",
+            "property_value_91",
+            "property_value_92",
+            "property_value_93",
+            "property_value_94",
+            "property_value_95",
+            "property_value_96",
+            "property_value_97",
+            "property_value_98",
+            "property_value_99",
+            "property_value_100",
+            "property_value_101",
+            "property_value_102",
+            "property_value_103",
+            "property_value_104",
+            "property_value_105",
+            "property_value_106",
+            "property_value_107",
+            "property_value_108",
+            "property_value_109",
+            "property_value_110",
+            "property_value_111",
+            "property_value_112",
+            "property_value_113",
+            "property_value_114",
+            "property_value_115",
+            "property_value_116",
+            "property_value_117",
+            "property_value_118",
+            "property_value_119",
+            "property_value_120",
+            "property_value_121",
+            "property_value_122",
+            "property_value_123",
+            "property_value_124",
+            "property_value_125",
+            "property_value_126",
+            "property_value_127",
+            "property_value_128",
+            "property_value_129",
+            "property_value_130",
+            "property_value_131",
+            "property_value_132",
+            "property_value_133",
+            "property_value_134",
+            "property_value_135",
+            "property_value_136",
+            "property_value_137",
+            "property_value_138",
+            "property_value_139",
+            "property_value_140",
+            "property_value_141",
+            "property_value_142",
+            "property_value_143",
+            "property_value_144",
+            "property_value_145",
+            "property_value_146",
+            "property_value_147",
+            "property_value_148",
+            "property_value_149",
+            "property_value_150",
+            "property_value_151",
+            "property_value_152",
+            "property_value_153",
+            "property_value_154",
+            "property_value_155",
+            "property_value_156",
+            "property_value_157",
+            "property_value_158",
+            "property_value_159",
+            "property_value_160",
+            "property_value_161",
+            "property_value_162",
+            "property_value_163",
+            "property_value_164",
+            "property_value_165",
+            "property_value_166",
+            "property_value_167",
+            "property_value_168",
+            "property_value_169",
+            "property_value_170",
+            "property_value_171",
+            "property_value_172",
+            "property_value_173",
+            "property_value_174",
+            "property_value_175",
+            "property_value_176",
+            "property_value_177",
+            "property_value_178",
+            "property_value_179",
+            "property_value_180",
+            "property_value_181",
+            "property_value_182",
+            "property_value_183",
+            "property_value_184",
+            "property_value_185",
+            "property_value_186",
+            "property_value_187",
+            "property_value_188",
+            "property_value_189",
+            "property_value_190",
+            "property_value_191",
+            "property_value_192",
+            "property_value_193",
+            "property_value_194",
+            "property_value_195",
+            "property_value_196",
+            "property_value_197",
+            "property_value_198",
+            "property_value_199",
+            "property_value_200",
+            "property_value_201",
+            "property_value_202",
+            "property_value_203",
+            "property_value_204",
+            "property_value_205",
+            "property_value_206",
+            "property_value_207",
+            "property_value_208",
+            "property_value_209",
+            "property_value_210",
+            "property_value_211",
+            "property_value_212",
+            "property_value_213",
+            "property_value_214",
+            "property_value_215",
+            "property_value_216",
+            "property_value_217",
+            "property_value_218",
+            "property_value_219",
+            "property_value_220",
+            "property_value_221",
+            "property_value_222",
+            "property_value_223",
+            "property_value_224",
+            "property_value_225",
+            "property_value_226",
+            "property_value_227",
+            "property_value_228",
+            "property_value_229",
+            "property_value_230",
+            "property_value_231",
+            "property_value_232",
+            "property_value_233",
+            "property_value_234",
+            "property_value_235",
+            "property_value_236",
+            "property_value_237",
+            "property_value_238",
+            "property_value_239",
+            "property_value_240",
+            "property_value_241",
+            "property_value_242",
+            "property_value_243",
+            "property_value_244",
+            "property_value_245",
+            "property_value_246",
+            "property_value_247",
+            "property_value_248",
+            "property_value_249",
+            "property_value_250",
+        ],
+        "numeric": [
+            "property_value_1",
+            "property_value_2",
+            "property_value_3",
+            "property_value_4",
+            "property_value_5",
+            "property_value_6",
+            "property_value_7",
+            "property_value_8",
+            "property_value_9",
+            "property_value_10",
+            "property_value_11",
+            "property_value_12",
+            "property_value_13",
+            "property_value_14",
+            "property_value_15",
+            "property_value_16",
+            "property_value_17",
+            "property_value_18",
+            "property_value_19",
+            "property_value_20",
+            "property_value_21",
+            "property_value_22",
+            "property_value_23",
+            "property_value_24",
+            "property_value_25",
+            "property_value_26",
+            "property_value_27",
+            "property_value_28",
+            "property_value_29",
+            "property_value_30",
+            "property_value_31",
+            "property_value_32",
+            "property_value_33",
+            "property_value_34",
+            "property_value_35",
+            "property_value_36",
+            "property_value_37",
+            "property_value_38",
+            "property_value_39",
+            "property_value_40",
+            "property_value_41",
+            "property_value_42",
+            "property_value_43",
+            "property_value_44",
+            "property_value_45",
+            "property_value_46",
+            "property_value_47",
+            "property_value_48",
+            "property_value_49",
+            "property_value_50",
+            "property_value_51",
+            "property_value_52",
+            "property_value_53",
+            "property_value_54",
+            "property_value_55",
+            "property_value_56",
+            "property_value_57",
+            "property_value_58",
+            "property_value_59",
+            "property_value_60",
+            "property_value_61",
+            "property_value_62",
+            "property_value_63",
+            "property_value_64",
+            "property_value_65",
+            "property_value_66",
+            "property_value_67",
+            "property_value_68",
+            "property_value_69",
+            "property_value_70",
+            "property_value_71",
+            "property_value_72",
+            "property_value_73",
+            "property_value_74",
+            "property_value_75",
+            "property_value_76",
+            "property_value_77",
+            "property_value_78",
+            "property_value_79",
+            "property_value_80",
+            "property_value_81",
+            "property_value_82",
+            "property_value_83",
+            "property_value_84",
+            "property_value_85",
+            "property_value_86",
+            "property_value_87",
+            "property_value_88",
+            "property_value_89",
+            "property_value_90",
+            "property_value_91",
+            "property_value_92",
+            "property_value_93",
+            "property_value_94",
+            "property_value_95",
+            "property_value_96",
+            "property_value_97",
+            "property_value_98",
+            "property_value_99",
+            "property_value_100",
+            "property_value_101",
+            "property_value_102",
+            "property_value_103",
+            "property_value_104",
+            "property_value_105",
+            "property_value_106",
+            "property_value_107",
+            "property_value_108",
+            "property_value_109",
+            "property_value_110",
+            "property_value_111",
+            "property_value_112",
+            "property_value_113",
+            "property_value_114",
+            "property_value_115",
+            "property_value_116",
+            "property_value_117",
+            "property_value_118",
+            "property_value_119",
+            "property_value_120",
+            "property_value_121",
+            "property_value_122",
+            "property_value_123",
+            "property_value_124",
+            "property_value_125",
+            "property_value_126",
+            "property_value_127",
+            "property_value_128",
+            "property_value_129",
+            "property_value_130",
+            "property_value_131",
+            "property_value_132",
+            "property_value_133",
+            "property_value_134",
+            "property_value_135",
+            "property_value_136",
+            "property_value_137",
+            "property_value_138",
+            "property_value_139",
+            "property_value_140",
+            "property_value_141",
+            "property_value_142",
+            "property_value_143",
+            "property_value_144",
+            "property_value_145",
+            "property_value_146",
+            "property_value_147",
+            "property_value_148",
+            "property_value_149",
+            "property_value_150",
+            "property_value_151",
+            "property_value_152",
+            "property_value_153",
+            "property_value_154",
+            "property_value_155",
+            "property_value_156",
+            "property_value_157",
+            "property_value_158",
+            "property_value_159",
+            "property_value_160",
+            "property_value_161",
+            "property_value_162",
+            "property_value_163",
+            "property_value_164",
+            "property_value_165",
+            "property_value_166",
+            "property_value_167",
+            "property_value_168",
+            "property_value_169",
+            "property_value_170",
+            "property_value_171",
+            "property_value_172",
+            "property_value_173",
+            "property_value_174",
+            "property_value_175",
+            "property_value_176",
+            "property_value_177",
+            "property_value_178",
+            "property_value_179",
+            "property_value_180",
+            "property_value_181",
+            "property_value_182",
+            "property_value_183",
+            "property_value_184",
+            "property_value_185",
+            "property_value_186",
+            "property_value_187",
+            "property_value_188",
+            "property_value_189",
+            "property_value_190",
+            "property_value_191",
+            "property_value_192",
+            "property_value_193",
+            "property_value_194",
+            "property_value_195",
+            "property_value_196",
+            "property_value_197",
+            "property_value_198",
+            "property_value_199",
+            "property_value_200",
+            "property_value_201",
+            "property_value_202",
+            "property_value_203",
+            "property_value_204",
+            "property_value_205",
+            "property_value_206",
+            "property_value_207",
+            "property_value_208",
+            "property_value_209",
+            "property_value_210",
+            "property_value_211",
+            "property_value_212",
+            "property_value_213",
+            "property_value_214",
+            "property_value_215",
+            "property_value_216",
+            "property_value_217",
+            "property_value_218",
+            "property_value_219",
+            "property_value_220",
+            "property_value_221",
+            "property_value_222",
+            "property_value_223",
+            "property_value_224",
+            "property_value_225",
+            "property_value_226",
+            "property_value_227",
+            "property_value_228",
+            "property_value_229",
+            "property_value_230",
+            "property_value_231",
+            "property_value_232",
+            "property_value_233",
+            "property_value_234",
+            "property_value_235",
+            "property_value_236",
+            "property_value_237",
+            "property_value_238",
+            "property_value_239",
+            "property_value_240",
+            "property_value_241",
+            "property_value_242",
+            "property_value_243",
+            "property_value_244",
+            "property_value_245",
+            "property_value_246",
+            "property_value_247",
+            "property_value_248",
+            "property_value_249",
+            "property_value_250",
+        ],
+        "choices": {
+            "fluid_property_type": ["Density", "Enthalpy", "Pressure", "SpecificHeat"],
+            "fluid_phase": ["Fluid", "FluidGas"],
+        },
+        "object_lists": {"temperature_values_name": ["FluidPropertyTemperatures"]},
+    },
+    "FluidProperties:Superheated": {
+        "name": False,
+        "fields": [
+            "fluid_name",
+            "fluid_property_type",
+            "temperature_values_name",
+            "pressure",
+            "property_value_1",
+            "property_value_2",
+            "property_value_3",
+            "property_value_4",
+            "property_value_5",
+            "property_value_6",
+            "property_value_7",
+            "property_value_8",
+            "property_value_9",
+            "property_value_10",
+            "property_value_11",
+            "property_value_12",
+            "property_value_13",
+            "property_value_14",
+            "property_value_15",
+            "property_value_16",
+            "property_value_17",
+            "property_value_18",
+            "property_value_19",
+            "property_value_20",
+            "property_value_21",
+            "property_value_22",
+            "property_value_23",
+            "property_value_24",
+            "property_value_25",
+            "property_value_26",
+            "property_value_27",
+            "property_value_28",
+            "property_value_29",
+            "property_value_30",
+            "property_value_31",
+            "property_value_32",
+            "property_value_33",
+            "property_value_34",
+            "property_value_35",
+            "property_value_36",
+            "property_value_37",
+            "property_value_38",
+            "property_value_39",
+            "property_value_40",
+            "property_value_41",
+            "property_value_42",
+            "property_value_43",
+            "property_value_44",
+            "property_value_45",
+            "property_value_46",
+            "property_value_47",
+            "property_value_48",
+            "property_value_49",
+            "property_value_50",
+            "property_value_51",
+            "property_value_52",
+            "property_value_53",
+            "property_value_54",
+            "property_value_55",
+            "property_value_56",
+            "property_value_57",
+            "property_value_58",
+            "property_value_59",
+            "property_value_60",
+            "property_value_61",
+            "property_value_62",
+            "property_value_63",
+            "property_value_64",
+            "property_value_65",
+            "property_value_66",
+            "property_value_67",
+            "property_value_68",
+            "property_value_69",
+            "property_value_70",
+            "property_value_71",
+            "property_value_72",
+            "property_value_73",
+            "property_value_74",
+            "property_value_75",
+            "property_value_76",
+            "property_value_77",
+            "property_value_78",
+            "property_value_79",
+            "property_value_80",
+            "property_value_81",
+            "property_value_82",
+            "property_value_83",
+            "property_value_84",
+            "property_value_85",
+            "property_value_86",
+            "property_value_87",
+            "property_value_88",
+            "property_value_89",
+            "property_value_90",
+            "property_value_91",
+            "property_value_92",
+            "property_value_93",
+            "property_value_94",
+            "property_value_95",
+            "property_value_96",
+            "property_value_97",
+            "property_value_98",
+            "property_value_99",
+            "property_value_100",
+            "property_value_101",
+            "property_value_102",
+            "property_value_103",
+            "property_value_104",
+            "property_value_105",
+            "property_value_106",
+            "property_value_107",
+            "property_value_108",
+            "property_value_109",
+            "property_value_110",
+            "property_value_111",
+            "property_value_112",
+            "property_value_113",
+            "property_value_114",
+            "property_value_115",
+            "property_value_116",
+            "property_value_117",
+            "property_value_118",
+            "property_value_119",
+            "property_value_120",
+            "property_value_121",
+            "property_value_122",
+            "property_value_123",
+            "property_value_124",
+            "property_value_125",
+            "property_value_126",
+            "property_value_127",
+            "property_value_128",
+            "property_value_129",
+            "property_value_130",
+            "property_value_131",
+            "property_value_132",
+            "property_value_133",
+            "property_value_134",
+            "property_value_135",
+            "property_value_136",
+            "property_value_137",
+            "property_value_138",
+            "property_value_139",
+            "property_value_140",
+            "property_value_141",
+            "property_value_142",
+            "property_value_143",
+            "property_value_144",
+            "property_value_145",
+            "property_value_146",
+            "property_value_147",
+            "property_value_148",
+            "property_value_149",
+            "property_value_150",
+            "property_value_151",
+            "property_value_152",
+            "property_value_153",
+            "property_value_154",
+            "property_value_155",
+            "property_value_156",
+            "property_value_157",
+            "property_value_158",
+            "property_value_159",
+            "property_value_160",
+            "property_value_161",
+            "property_value_162",
+            "property_value_163",
+            "property_value_164",
+            "property_value_165",
+            "property_value_166",
+            "property_value_167",
+            "property_value_168",
+            "property_value_169",
+            "property_value_170",
+            "property_value_171",
+            "property_value_172",
+            "property_value_173",
+            "property_value_174",
+            "property_value_175",
+            "property_value_176",
+            "property_value_177",
+            "property_value_178",
+            "property_value_179",
+            "property_value_180",
+            "property_value_181",
+            "property_value_182",
+            "property_value_183",
+            "property_value_184",
+            "property_value_185",
+            "property_value_186",
+            "property_value_187",
+            "property_value_188",
+            "property_value_189",
+            "property_value_190",
+            "property_value_191",
+            "property_value_192",
+            "property_value_193",
+            "property_value_194",
+            "property_value_195",
+            "property_value_196",
+            "property_value_197",
+            "property_value_198",
+            "property_value_199",
+            "property_value_200",
+            "property_value_201",
+            "property_value_202",
+            "property_value_203",
+            "property_value_204",
+            "property_value_205",
+            "property_value_206",
+            "property_value_207",
+            "property_value_208",
+            "property_value_209",
+            "property_value_210",
+            "property_value_211",
+            "property_value_212",
+            "property_value_213",
+            "property_value_214",
+            "property_value_215",
+            "property_value_216",
+            "property_value_217",
+            "property_value_218",
+            "property_value_219",
+            "property_value_220",
+            "property_value_221",
+            "property_value_222",
+            "property_value_223",
+            "property_value_224",
+            "property_value_225",
+            "property_value_226",
+            "property_value_227",
+            "property_value_228",
+            "property_value_229",
+            "property_value_230",
+            "property_value_231",
+            "property_value_232",
+            "property_value_233",
+            "property_value_234",
+            "property_value_235",
+            "property_value_236",
+            "property_value_237",
+            "property_value_238",
+            "property_value_239",
+            "property_value_240",
+            "property_value_241",
+            "property_value_242",
+            "property_value_243",
+            "property_value_244",
+            "property_value_245",
+            "property_value_246",
+            "property_value_247",
+            "property_value_248",
+            "property_value_249",
+            "property_value_250",
+        ],
+        "numeric": [
+            "pressure",
+            "property_value_1",
+            "property_value_2",
+            "property_value_3",
+            "property_value_4",
+            "property_value_5",
+            "property_value_6",
+            "property_value_7",
+            "property_value_8",
+            "property_value_9",
+            "property_value_10",
+            "property_value_11",
+            "property_value_12",
+            "property_value_13",
+            "property_value_14",
+            "property_value_15",
+            "property_value_16",
+            "property_value_17",
+            "property_value_18",
+            "property_value_19",
+            "property_value_20",
+            "property_value_21",
+            "property_value_22",
+            "property_value_23",
+            "property_value_24",
+            "property_value_25",
+            "property_value_26",
+            "property_value_27",
+            "property_value_28",
+            "property_value_29",
+            "property_value_30",
+            "property_value_31",
+            "property_value_32",
+            "property_value_33",
+            "property_value_34",
+            "property_value_35",
+            "property_value_36",
+            "property_value_37",
+            "property_value_38",
+            "property_value_39",
+            "property_value_40",
+            "property_value_41",
+            "property_value_42",
+            "property_value_43",
+            "property_value_44",
+            "property_value_45",
+            "property_value_46",
+            "property_value_47",
+            "property_value_48",
+            "property_value_49",
+            "property_value_50",
+            "property_value_51",
+            "property_value_52",
+            "property_value_53",
+            "property_value_54",
+            "property_value_55",
+            "property_value_56",
+            "property_value_57",
+            "property_value_58",
+            "property_value_59",
+            "property_value_60",
+            "property_value_61",
+            "property_value_62",
+            "property_value_63",
+            "property_value_64",
+            "property_value_65",
+            "property_value_66",
+            "property_value_67",
+            "property_value_68",
+            "property_value_69",
+            "property_value_70",
+            "property_value_71",
+            "property_value_72",
+            "property_value_73",
+            "property_value_74",
+            "property_value_75",
+            "property_value_76",
+            "property_value_77",
+            "property_value_78",
+            "property_value_79",
+            "property_value_80",
+            "property_value_81",
+            "property_value_82",
+            "property_value_83",
+            "property_value_84",
+            "property_value_85",
+            "property_value_86",
+            "property_value_87",
+            "property_value_88",
+            "property_value_89",
+            "property_value_90",
+            "property_value_91",
+            "property_value_92",
+            "property_value_93",
+            "property_value_94",
+            "property_value_95",
+            "property_value_96",
+            "property_value_97",
+            "property_value_98",
+            "property_value_99",
+            "property_value_100",
+            "property_value_101",
+            "property_value_102",
+            "property_value_103",
+            "property_value_104",
+            "property_value_105",
+            "property_value_106",
+            "property_value_107",
+            "property_value_108",
+            "property_value_109",
+            "property_value_110",
+            "property_value_111",
+            "property_value_112",
+            "property_value_113",
+            "property_value_114",
+            "property_value_115",
+            "property_value_116",
+            "property_value_117",
+            "property_value_118",
+            "property_value_119",
+            "property_value_120",
+            "property_value_121",
+            "property_value_122",
+            "property_value_123",
+            "property_value_124",
+            "property_value_125",
+            "property_value_126",
+            "property_value_127",
+            "property_value_128",
+            "property_value_129",
+            "property_value_130",
+            "property_value_131",
+            "property_value_132",
+            "property_value_133",
+            "property_value_134",
+            "property_value_135",
+            "property_value_136",
+            "property_value_137",
+            "property_value_138",
+            "property_value_139",
+            "property_value_140",
+            "property_value_141",
+            "property_value_142",
+            "property_value_143",
+            "property_value_144",
+            "property_value_145",
+            "property_value_146",
+            "property_value_147",
+            "property_value_148",
+            "property_value_149",
+            "property_value_150",
+            "property_value_151",
+            "property_value_152",
+            "property_value_153",
+            "property_value_154",
+            "property_value_155",
+            "property_value_156",
+            "property_value_157",
+            "property_value_158",
+            "property_value_159",
+            "property_value_160",
+            "property_value_161",
+            "property_value_162",
+            "property_value_163",
+            "property_value_164",
+            "property_value_165",
+            "property_value_166",
+            "property_value_167",
+            "property_value_168",
+            "property_value_169",
+            "property_value_170",
+            "property_value_171",
+            "property_value_172",
+            "property_value_173",
+            "property_value_174",
+            "property_value_175",
+            "property_value_176",
+            "property_value_177",
+            "property_value_178",
+            "property_value_179",
+            "property_value_180",
+            "property_value_181",
+            "property_value_182",
+            "property_value_183",
+            "property_value_184",
+            "property_value_185",
+            "property_value_186",
+            "property_value_187",
+            "property_value_188",
+            "property_value_189",
+            "property_value_190",
+            "property_value_191",
+            "property_value_192",
+            "property_value_193",
+            "property_value_194",
+            "property_value_195",
+            "property_value_196",
+            "property_value_197",
+            "property_value_198",
+            "property_value_199",
+            "property_value_200",
+            "property_value_201",
+            "property_value_202",
+            "property_value_203",
+            "property_value_204",
+            "property_value_205",
+            "property_value_206",
+            "property_value_207",
+            "property_value_208",
+            "property_value_209",
+            "property_value_210",
+            "property_value_211",
+            "property_value_212",
+            "property_value_213",
+            "property_value_214",
+            "property_value_215",
+            "property_value_216",
+            "property_value_217",
+            "property_value_218",
+            "property_value_219",
+            "property_value_220",
+            "property_value_221",
+            "property_value_222",
+            "property_value_223",
+            "property_value_224",
+            "property_value_225",
+            "property_value_226",
+            "property_value_227",
+            "property_value_228",
+            "property_value_229",
+            "property_value_230",
+            "property_value_231",
+            "property_value_232",
+            "property_value_233",
+            "property_value_234",
+            "property_value_235",
+            "property_value_236",
+            "property_value_237",
+            "property_value_238",
+            "property_value_239",
+            "property_value_240",
+            "property_value_241",
+            "property_value_242",
+            "property_value_243",
+            "property_value_244",
+            "property_value_245",
+            "property_value_246",
+            "property_value_247",
+            "property_value_248",
+            "property_value_249",
+            "property_value_250",
+        ],
+        "choices": {"fluid_property_type": ["Density", "Enthalpy"]},
+        "object_lists": {"temperature_values_name": ["FluidPropertyTemperatures"]},
+    },
+    "FluidProperties:Temperatures": {
+        "name": True,
+        "fields": [
+            "temperature_1",
+            "temperature_2",
+            "temperature_3",
+            "temperature_4",
+            "temperature_5",
+            "temperature_6",
+            "temperature_7",
+            "temperature_8",
+            "temperature_9",
+            "temperature_10",
+            "temperature_11",
+            "temperature_12",
+            "temperature_13",
+            "temperature_14",
+            "temperature_15",
+            "temperature_16",
+            "temperature_17",
+            "temperature_18",
+            "temperature_19",
+            "temperature_20",
+            "temperature_21",
+            "temperature_22",
+            "temperature_23",
+            "temperature_24",
+            "temperature_25",
+            "temperature_26",
+            "temperature_27",
+            "temperature_28",
+            "temperature_29",
+            "temperature_30",
+            "temperature_31",
+            "temperature_32",
+            "temperature_33",
+            "temperature_34",
+            "temperature_35",
+            "temperature_36",
+            "temperature_37",
+            "temperature_38",
+            "temperature_39",
+            "temperature_40",
+            "temperature_41",
+            "temperature_42",
+            "temperature_43",
+            "temperature_44",
+            "temperature_45",
+            "temperature_46",
+            "temperature_47",
+            "temperature_48",
+            "temperature_49",
+            "temperature_50",
+            "temperature_51",
+            "temperature_52",
+            "temperature_53",
+            "temperature_54",
+            "temperature_55",
+            "temperature_56",
+            "temperature_57",
+            "temperature_58",
+            "temperature_59",
+            "temperature_60",
+            "temperature_61",
+            "temperature_62",
+            "temperature_63",
+            "temperature_64",
+            "temperature_65",
+            "temperature_66",
+            "temperature_67",
+            "temperature_68",
+            "temperature_69",
+            "temperature_70",
+            "temperature_71",
+            "temperature_72",
+            "temperature_73",
+            "temperature_74",
+            "temperature_75",
+            "temperature_76",
+            "temperature_77",
+            "temperature_78",
+            "temperature_79",
+            "temperature_80",
+            "temperature_81",
+            "temperature_82",
+            "temperature_83",
+            "temperature_84",
+            "temperature_85",
+            "temperature_86",
+            "temperature_87",
+            "temperature_88",
+            "temperature_89",
+            "temperature_90",
+            "temperature_91",
+            "temperature_92",
+            "temperature_93",
+            "temperature_94",
+            "temperature_95",
+            "temperature_96",
+            "temperature_97",
+            "temperature_98",
+            "temperature_99",
+            "temperature_100",
+            "temperature_101",
+            "temperature_102",
+            "temperature_103",
+            "temperature_104",
+            "temperature_105",
+            "temperature_106",
+            "temperature_107",
+            "temperature_108",
+            "temperature_109",
+            "temperature_110",
+            "temperature_111",
+            "temperature_112",
+            "temperature_113",
+            "temperature_114",
+            "temperature_115",
+            "temperature_116",
+            "temperature_117",
+            "temperature_118",
+            "temperature_119",
+            "temperature_120",
+            "temperature_121",
+            "temperature_122",
+            "temperature_123",
+            "temperature_124",
+            "temperature_125",
+            "temperature_126",
+            "temperature_127",
+            "temperature_128",
+            "temperature_129",
+            "temperature_130",
+            "temperature_131",
+            "temperature_132",
+            "temperature_133",
+            "temperature_134",
+            "temperature_135",
+            "temperature_136",
+            "temperature_137",
+            "temperature_138",
+            "temperature_139",
+            "temperature_140",
+            "temperature_141",
+            "temperature_142",
+            "temperature_143",
+            "temperature_144",
+            "temperature_145",
+            "temperature_146",
+            "temperature_147",
+            "temperature_148",
+            "temperature_149",
+            "temperature_150",
+            "temperature_151",
+            "temperature_152",
+            "temperature_153",
+            "temperature_154",
+            "temperature_155",
+            "temperature_156",
+            "temperature_157",
+            "temperature_158",
+            "temperature_159",
+            "temperature_160",
+            "temperature_161",
+            "temperature_162",
+            "temperature_163",
+            "temperature_164",
+            "temperature_165",
+            "temperature_166",
+            "temperature_167",
+            "temperature_168",
+            "temperature_169",
+            "temperature_170",
+            "temperature_171",
+            "temperature_172",
+            "temperature_173",
+            "temperature_174",
+            "temperature_175",
+            "temperature_176",
+            "temperature_177",
+            "temperature_178",
+            "temperature_179",
+            "temperature_180",
+            "temperature_181",
+            "temperature_182",
+            "temperature_183",
+            "temperature_184",
+            "temperature_185",
+            "temperature_186",
+            "temperature_187",
+            "temperature_188",
+            "temperature_189",
+            "temperature_190",
+            "temperature_191",
+            "temperature_192",
+            "temperature_193",
+            "temperature_194",
+            "temperature_195",
+            "temperature_196",
+            "temperature_197",
+            "temperature_198",
+            "temperature_199",
+            "temperature_200",
+            "temperature_201",
+            "temperature_202",
+            "temperature_203",
+            "temperature_204",
+            "temperature_205",
+            "temperature_206",
+            "temperature_207",
+            "temperature_208",
+            "temperature_209",
+            "temperature_210",
+            "temperature_211",
+            "temperature_212",
+            "temperature_213",
+            "temperature_214",
+            "temperature_215",
+            "temperature_216",
+            "temperature_217",
+            "temperature_218",
+            "temperature_219",
+            "temperature_220",
+            "temperature_221",
+            "temperature_222",
+            "temperature_223",
+            "temperature_224",
+            "temperature_225",
+            "temperature_226",
+            "temperature_227",
+            "temperature_228",
+            "temperature_229",
+            "temperature_230",
+            "temperature_231",
+            "temperature_232",
+            "temperature_233",
+            "temperature_234",
+            "temperature_235",
+            "temperature_236",
+            "temperature_237",
+            "temperature_238",
+            "temperature_239",
+            "temperature_240",
+            "temperature_241",
+            "temperature_242",
+            "temperature_243",
+            "temperature_244",
+            "temperature_245",
+            "temperature_246",
+            "temperature_247",
+            "temperature_248",
+            "temperature_249",
+            "temperature_250",
+        ],
+        "numeric": [
+            "temperature_1",
+            "temperature_2",
+            "temperature_3",
+            "temperature_4",
+            "temperature_5",
+            "temperature_6",
+            "temperature_7",
+            "temperature_8",
+            "temperature_9",
+            "temperature_10",
+            "temperature_11",
+            "temperature_12",
+            "temperature_13",
+            "temperature_14",
+            "temperature_15",
+            "temperature_16",
+            "temperature_17",
+            "temperature_18",
+            "temperature_19",
+            "temperature_20",
+            "temperature_21",
+            "temperature_22",
+            "temperature_23",
+            "temperature_24",
+            "temperature_25",
+            "temperature_26",
+            "temperature_27",
+            "temperature_28",
+            "temperature_29",
+            "temperature_30",
+            "temperature_31",
+            "temperature_32",
+            "temperature_33",
+            "temperature_34",
+            "temperature_35",
+            "temperature_36",
+            "temperature_37",
+            "temperature_38",
+            "temperature_39",
+            "temperature_40",
+            "temperature_41",
+            "temperature_42",
+            "temperature_43",
+            "temperature_44",
+            "temperature_45",
+            "temperature_46",
+            "temperature_47",
+            "temperature_48",
+            "temperature_49",
+            "temperature_50",
+            "temperature_51",
+            "temperature_52",
+            "temperature_53",
+            "temperature_54",
+            "temperature_55",
+            "temperature_56",
+            "temperature_57",
+            "temperature_58",
+            "temperature_59",
+            "temperature_60",
+            "temperature_61",
+            "temperature_62",
+            "temperature_63",
+            "temperature_64",
+            "temperature_65",
+            "temperature_66",
+            "temperature_67",
+            "temperature_68",
+            "temperature_69",
+            "temperature_70",
+            "temperature_71",
+            "temperature_72",
+            "temperature_73",
+            "temperature_74",
+            "temperature_75",
+            "temperature_76",
+            "temperature_77",
+            "temperature_78",
+            "temperature_79",
+            "temperature_80",
+            "temperature_81",
+            "temperature_82",
+            "temperature_83",
+            "temperature_84",
+            "temperature_85",
+            "temperature_86",
+            "temperature_87",
+            "temperature_88",
+            "temperature_89",
+            "temperature_90",
+            "temperature_91",
+            "temperature_92",
+            "temperature_93",
+            "temperature_94",
+            "temperature_95",
+            "temperature_96",
+            "temperature_97",
+            "temperature_98",
+            "temperature_99",
+            "temperature_100",
+            "temperature_101",
+            "temperature_102",
+            "temperature_103",
+            "temperature_104",
+            "temperature_105",
+            "temperature_106",
+            "temperature_107",
+            "temperature_108",
+            "temperature_109",
+            "temperature_110",
+            "temperature_111",
+            "temperature_112",
+            "temperature_113",
+            "temperature_114",
+            "temperature_115",
+            "temperature_116",
+            "temperature_117",
+            "temperature_118",
+            "temperature_119",
+            "temperature_120",
+            "temperature_121",
+            "temperature_122",
+            "temperature_123",
+            "temperature_124",
+            "temperature_125",
+            "temperature_126",
+            "temperature_127",
+            "temperature_128",
+            "temperature_129",
+            "temperature_130",
+            "temperature_131",
+            "temperature_132",
+            "temperature_133",
+            "temperature_134",
+            "temperature_135",
+            "temperature_136",
+            "temperature_137",
+            "temperature_138",
+            "temperature_139",
+            "temperature_140",
+            "temperature_141",
+            "temperature_142",
+            "temperature_143",
+            "temperature_144",
+            "temperature_145",
+            "temperature_146",
+            "temperature_147",
+            "temperature_148",
+            "temperature_149",
+            "temperature_150",
+            "temperature_151",
+            "temperature_152",
+            "temperature_153",
+            "temperature_154",
+            "temperature_155",
+            "temperature_156",
+            "temperature_157",
+            "temperature_158",
+            "temperature_159",
+            "temperature_160",
+            "temperature_161",
+            "temperature_162",
+            "temperature_163",
+            "temperature_164",
+            "temperature_165",
+            "temperature_166",
+            "temperature_167",
+            "temperature_168",
+            "temperature_169",
+            "temperature_170",
+            "temperature_171",
+            "temperature_172",
+            "temperature_173",
+            "temperature_174",
+            "temperature_175",
+            "temperature_176",
+            "temperature_177",
+            "temperature_178",
+            "temperature_179",
+            "temperature_180",
+            "temperature_181",
+            "temperature_182",
+            "temperature_183",
+            "temperature_184",
+            "temperature_185",
+            "temperature_186",
+            "temperature_187",
+            "temperature_188",
+            "temperature_189",
+            "temperature_190",
+            "temperature_191",
+            "temperature_192",
+            "temperature_193",
+            "temperature_194",
+            "temperature_195",
+            "temperature_196",
+            "temperature_197",
+            "temperature_198",
+            "temperature_199",
+            "temperature_200",
+            "temperature_201",
+            "temperature_202",
+            "temperature_203",
+            "temperature_204",
+            "temperature_205",
+            "temperature_206",
+            "temperature_207",
+            "temperature_208",
+            "temperature_209",
+            "temperature_210",
+            "temperature_211",
+            "temperature_212",
+            "temperature_213",
+            "temperature_214",
+            "temperature_215",
+            "temperature_216",
+            "temperature_217",
+            "temperature_218",
+            "temperature_219",
+            "temperature_220",
+            "temperature_221",
+            "temperature_222",
+            "temperature_223",
+            "temperature_224",
+            "temperature_225",
+            "temperature_226",
+            "temperature_227",
+            "temperature_228",
+            "temperature_229",
+            "temperature_230",
+            "temperature_231",
+            "temperature_232",
+            "temperature_233",
+            "temperature_234",
+            "temperature_235",
+            "temperature_236",
+            "temperature_237",
+            "temperature_238",
+            "temperature_239",
+            "temperature_240",
+            "temperature_241",
+            "temperature_242",
+            "temperature_243",
+            "temperature_244",
+            "temperature_245",
+            "temperature_246",
+            "temperature_247",
+            "temperature_248",
+            "temperature_249",
+            "temperature_250",
+        ],
+        "references": ["FluidPropertyTemperatures"],
+    },
+    "FuelFactors": {
+        "name": False,
+        "fields": [
+            "existing_fuel_resource_name",
+            "source_energy_factor",
+            "source_energy_schedule_name",
+            "co2_emission_factor",
+            "co2_emission_factor_schedule_name",
+            "co_emission_factor",
+            "co_emission_factor_schedule_name",
+            "ch4_emission_factor",
+            "ch4_emission_factor_schedule_name",
+            "nox_emission_factor",
+            "nox_emission_factor_schedule_name",
+            "n2o_emission_factor",
+            "n2o_emission_factor_schedule_name",
+            "so2_emission_factor",
+            "so2_emission_factor_schedule_name",
+            "pm_emission_factor",
+            "pm_emission_factor_schedule_name",
+            "pm10_emission_factor",
+            "pm10_emission_factor_schedule_name",
+            "pm2_5_emission_factor",
+            "pm2_5_emission_factor_schedule_name",
+            "nh3_emission_factor",
+            "nh3_emission_factor_schedule_name",
+            "nmvoc_emission_factor",
+            "nmvoc_emission_factor_schedule_name",
+            "hg_emission_factor",
+            "hg_emission_factor_schedule_name",
+            "pb_emission_factor",
+            "pb_emission_factor_schedule_name",
+            "water_emission_factor",
+            "water_emission_factor_schedule_name",
+            "nuclear_high_level_emission_factor",
+            "nuclear_high_level_emission_factor_schedule_name",
+            "nuclear_low_level_emission_factor",
+            "nuclear_low_level_emission_factor_schedule_name",
+        ],
+        "numeric": [
+            "source_energy_factor",
+            "co2_emission_factor",
+            "co_emission_factor",
+            "ch4_emission_factor",
+            "nox_emission_factor",
+            "n2o_emission_factor",
+            "so2_emission_factor",
+            "pm_emission_factor",
+            "pm10_emission_factor",
+            "pm2_5_emission_factor",
+            "nh3_emission_factor",
+            "nmvoc_emission_factor",
+            "hg_emission_factor",
+            "pb_emission_factor",
+            "water_emission_factor",
+            "nuclear_high_level_emission_factor",
+            "nuclear_low_level_emission_factor",
+        ],
+        "choices": {
+            "existing_fuel_resource_name": [
+                "Coal",
+                "Diesel",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ]
+        },
+        "object_lists": {
+            "source_energy_schedule_name": ["ScheduleNames"],
+            "co2_emission_factor_schedule_name": ["ScheduleNames"],
+            "co_emission_factor_schedule_name": ["ScheduleNames"],
+            "ch4_emission_factor_schedule_name": ["ScheduleNames"],
+            "nox_emission_factor_schedule_name": ["ScheduleNames"],
+            "n2o_emission_factor_schedule_name": ["ScheduleNames"],
+            "so2_emission_factor_schedule_name": ["ScheduleNames"],
+            "pm_emission_factor_schedule_name": ["ScheduleNames"],
+            "pm10_emission_factor_schedule_name": ["ScheduleNames"],
+            "pm2_5_emission_factor_schedule_name": ["ScheduleNames"],
+            "nh3_emission_factor_schedule_name": ["ScheduleNames"],
+            "nmvoc_emission_factor_schedule_name": ["ScheduleNames"],
+            "hg_emission_factor_schedule_name": ["ScheduleNames"],
+            "pb_emission_factor_schedule_name": ["ScheduleNames"],
+            "water_emission_factor_schedule_name": ["ScheduleNames"],
+            "nuclear_high_level_emission_factor_schedule_name": ["ScheduleNames"],
+            "nuclear_low_level_emission_factor_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "GasEquipment": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_or_space_or_spacelist_name",
+            "schedule_name",
+            "design_level_calculation_method",
+            "design_level",
+            "power_per_floor_area",
+            "power_per_person",
+            "fraction_latent",
+            "fraction_radiant",
+            "fraction_lost",
+            "carbon_dioxide_generation_rate",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "design_level",
+            "power_per_floor_area",
+            "power_per_person",
+            "fraction_latent",
+            "fraction_radiant",
+            "fraction_lost",
+            "carbon_dioxide_generation_rate",
+        ],
+        "choices": {
+            "design_level_calculation_method": [
+                "EquipmentLevel",
+                "Power/Area",
+                "Power/Person",
+                "Watts/Area",
+                "Watts/Person",
+            ]
+        },
+        "object_lists": {
+            "zone_or_zonelist_or_space_or_spacelist_name": ["ZoneAndZoneListNames"],
+            "schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Generator:PVWatts": {
+        "name": True,
+        "fields": [
+            "pvwatts_version",
+            "dc_system_capacity",
+            "module_type",
+            "array_type",
+            "system_losses",
+            "array_geometry_type",
+            "tilt_angle",
+            "azimuth_angle",
+            "surface_name",
+            "ground_coverage_ratio",
+        ],
+        "numeric": [
+            "dc_system_capacity",
+            "system_losses",
+            "tilt_angle",
+            "azimuth_angle",
+            "ground_coverage_ratio",
+        ],
+        "choices": {
+            "pvwatts_version": ["5"],
+            "module_type": ["Premium", "Standard", "ThinFilm"],
+            "array_type": [
+                "FixedOpenRack",
+                "FixedRoofMounted",
+                "OneAxis",
+                "OneAxisBacktracking",
+                "TwoAxis",
+            ],
+            "array_geometry_type": ["Surface", "TiltAzimuth"],
+        },
+        "references": ["GeneratorNames"],
+        "object_lists": {"surface_name": ["AllShadingAndHTSurfNames"]},
+    },
+    "GlobalGeometryRules": {
+        "name": False,
+        "fields": [
+            "starting_vertex_position",
+            "vertex_entry_direction",
+            "coordinate_system",
+            "daylighting_reference_point_coordinate_system",
+            "rectangular_surface_coordinate_system",
+        ],
+        "choices": {
+            "starting_vertex_position": [
+                "LowerLeftCorner",
+                "LowerRightCorner",
+                "UpperLeftCorner",
+                "UpperRightCorner",
+            ],
+            "vertex_entry_direction": ["Clockwise", "Counterclockwise"],
+            "coordinate_system": ["Relative", "World"],
+            "daylighting_reference_point_coordinate_system": ["Relative", "World"],
+            "rectangular_surface_coordinate_system": ["Relative", "World"],
+        },
+    },
+    "HeaderedPumps:VariableSpeed": {
+        "name": True,
+        "fields": [
+            "inlet_node_name",
+            "outlet_node_name",
+            "total_design_flow_rate",
+            "number_of_pumps_in_bank",
+            "flow_sequencing_control_scheme",
+            "design_pump_head",
+            "design_power_consumption",
+            "motor_efficiency",
+            "fraction_of_motor_inefficiencies_to_fluid_stream",
+            "coefficient_1_of_the_part_load_performance_curve",
+            "coefficient_2_of_the_part_load_performance_curve",
+            "coefficient_3_of_the_part_load_performance_curve",
+            "coefficient_4_of_the_part_load_performance_curve",
+            "minimum_flow_rate_fraction",
+            "pump_control_type",
+            "pump_flow_rate_schedule_name",
+            "zone_name",
+            "skin_loss_radiative_fraction",
+            "design_power_sizing_method",
+            "design_electric_power_per_unit_flow_rate",
+            "design_shaft_power_per_unit_flow_rate_per_unit_head",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "total_design_flow_rate",
+            "number_of_pumps_in_bank",
+            "design_pump_head",
+            "design_power_consumption",
+            "motor_efficiency",
+            "fraction_of_motor_inefficiencies_to_fluid_stream",
+            "coefficient_1_of_the_part_load_performance_curve",
+            "coefficient_2_of_the_part_load_performance_curve",
+            "coefficient_3_of_the_part_load_performance_curve",
+            "coefficient_4_of_the_part_load_performance_curve",
+            "minimum_flow_rate_fraction",
+            "skin_loss_radiative_fraction",
+            "design_electric_power_per_unit_flow_rate",
+            "design_shaft_power_per_unit_flow_rate_per_unit_head",
+        ],
+        "choices": {
+            "total_design_flow_rate": ["Autosize"],
+            "flow_sequencing_control_scheme": ["Sequential"],
+            "design_power_consumption": ["Autosize"],
+            "pump_control_type": ["Continuous", "Intermittent"],
+            "design_power_sizing_method": ["PowerPerFlow", "PowerPerFlowPerPressure"],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "pump_flow_rate_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+        },
+    },
+    "HeatBalanceAlgorithm": {
+        "name": False,
+        "fields": [
+            "algorithm",
+            "surface_temperature_upper_limit",
+            "minimum_surface_convection_heat_transfer_coefficient_value",
+            "maximum_surface_convection_heat_transfer_coefficient_value",
+        ],
+        "numeric": [
+            "surface_temperature_upper_limit",
+            "minimum_surface_convection_heat_transfer_coefficient_value",
+            "maximum_surface_convection_heat_transfer_coefficient_value",
+        ],
+        "choices": {
+            "algorithm": [
+                "CombinedHeatAndMoistureFiniteElement",
+                "ConductionFiniteDifference",
+                "ConductionTransferFunction",
+                "MoisturePenetrationDepthConductionTransferFunction",
+            ]
+        },
+    },
+    "HeatExchanger:AirToAir:SensibleAndLatent": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "nominal_supply_air_flow_rate",
+            "sensible_effectiveness_at_100_heating_air_flow",
+            "latent_effectiveness_at_100_heating_air_flow",
+            "sensible_effectiveness_at_100_cooling_air_flow",
+            "latent_effectiveness_at_100_cooling_air_flow",
+            "supply_air_inlet_node_name",
+            "supply_air_outlet_node_name",
+            "exhaust_air_inlet_node_name",
+            "exhaust_air_outlet_node_name",
+            "nominal_electric_power",
+            "supply_air_outlet_temperature_control",
+            "heat_exchanger_type",
+            "frost_control_type",
+            "threshold_temperature",
+            "initial_defrost_time_fraction",
+            "rate_of_defrost_time_fraction_increase",
+            "economizer_lockout",
+            "sensible_effectiveness_of_heating_air_flow_curve_name",
+            "latent_effectiveness_of_heating_air_flow_curve_name",
+            "sensible_effectiveness_of_cooling_air_flow_curve_name",
+            "latent_effectiveness_of_cooling_air_flow_curve_name",
+        ],
+        "numeric": [
+            "nominal_supply_air_flow_rate",
+            "sensible_effectiveness_at_100_heating_air_flow",
+            "latent_effectiveness_at_100_heating_air_flow",
+            "sensible_effectiveness_at_100_cooling_air_flow",
+            "latent_effectiveness_at_100_cooling_air_flow",
+            "nominal_electric_power",
+            "threshold_temperature",
+            "initial_defrost_time_fraction",
+            "rate_of_defrost_time_fraction_increase",
+        ],
+        "choices": {
+            "nominal_supply_air_flow_rate": ["Autosize"],
+            "supply_air_outlet_temperature_control": ["No", "Yes"],
+            "heat_exchanger_type": ["Plate", "Rotary"],
+            "frost_control_type": [
+                "ExhaustAirRecirculation",
+                "ExhaustOnly",
+                "MinimumExhaustTemperature",
+                "None",
+            ],
+            "economizer_lockout": ["No", "Yes"],
+        },
+        "references": [
+            "AFNHeatExchangerNames",
+            "HXAirToAirNames",
+            "HXAirToAirSensibleAndLatentNames",
+            "validBranchEquipmentNames",
+            "validOASysEquipmentNames",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "sensible_effectiveness_of_heating_air_flow_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "latent_effectiveness_of_heating_air_flow_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "sensible_effectiveness_of_cooling_air_flow_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "latent_effectiveness_of_cooling_air_flow_curve_name": [
+                "UnivariateFunctions"
+            ],
+        },
+    },
+    "HeatExchanger:FluidToFluid": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "loop_demand_side_inlet_node_name",
+            "loop_demand_side_outlet_node_name",
+            "loop_demand_side_design_flow_rate",
+            "loop_supply_side_inlet_node_name",
+            "loop_supply_side_outlet_node_name",
+            "loop_supply_side_design_flow_rate",
+            "heat_exchange_model_type",
+            "heat_exchanger_u_factor_times_area_value",
+            "control_type",
+            "heat_exchanger_setpoint_node_name",
+            "minimum_temperature_difference_to_activate_heat_exchanger",
+            "heat_transfer_metering_end_use_type",
+            "component_override_loop_supply_side_inlet_node_name",
+            "component_override_loop_demand_side_inlet_node_name",
+            "component_override_cooling_control_temperature_mode",
+            "sizing_factor",
+            "operation_minimum_temperature_limit",
+            "operation_maximum_temperature_limit",
+        ],
+        "numeric": [
+            "loop_demand_side_design_flow_rate",
+            "loop_supply_side_design_flow_rate",
+            "heat_exchanger_u_factor_times_area_value",
+            "minimum_temperature_difference_to_activate_heat_exchanger",
+            "sizing_factor",
+            "operation_minimum_temperature_limit",
+            "operation_maximum_temperature_limit",
+        ],
+        "choices": {
+            "loop_demand_side_design_flow_rate": ["Autosize"],
+            "loop_supply_side_design_flow_rate": ["Autosize"],
+            "heat_exchange_model_type": [
+                "CounterFlow",
+                "CrossFlowBothMixed",
+                "CrossFlowBothUnMixed",
+                "CrossFlowSupplyMixedDemandUnMixed",
+                "CrossFlowSupplyUnMixedDemandMixed",
+                "Ideal",
+                "ParallelFlow",
+            ],
+            "heat_exchanger_u_factor_times_area_value": ["Autosize"],
+            "control_type": [
+                "CoolingDifferentialOnOff",
+                "CoolingSetpointModulated",
+                "CoolingSetpointOnOff",
+                "CoolingSetpointOnOffWithComponentOverride",
+                "DualDeadbandSetpointModulated",
+                "DualDeadbandSetpointOnOff",
+                "HeatingSetpointModulated",
+                "HeatingSetpointOnOff",
+                "OperationSchemeModulated",
+                "OperationSchemeOnOff",
+                "UncontrolledOn",
+            ],
+            "heat_transfer_metering_end_use_type": [
+                "FreeCooling",
+                "HeatRecovery",
+                "HeatRecoveryForCooling",
+                "HeatRecoveryForHeating",
+                "HeatRejection",
+                "LoopToLoop",
+            ],
+            "component_override_cooling_control_temperature_mode": [
+                "DryBulbTemperature",
+                "Loop",
+                "WetBulbTemperature",
+            ],
+        },
+        "references": [
+            "validBranchEquipmentNames",
+            "validCondenserEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "Humidifier:Steam:Electric": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "rated_capacity",
+            "rated_power",
+            "rated_fan_power",
+            "standby_power",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "water_storage_tank_name",
+        ],
+        "numeric": [
+            "rated_capacity",
+            "rated_power",
+            "rated_fan_power",
+            "standby_power",
+        ],
+        "choices": {"rated_capacity": ["Autosize"], "rated_power": ["Autosize"]},
+        "references": ["validBranchEquipmentNames", "validOASysEquipmentNames"],
+        "object_lists": {"availability_schedule_name": ["ScheduleNames"]},
+    },
+    "InternalMass": {
+        "name": True,
+        "fields": [
+            "construction_name",
+            "zone_or_zonelist_name",
+            "space_or_spacelist_name",
+            "surface_area",
+        ],
+        "numeric": ["surface_area"],
+        "references": [
+            "AllHeatTranAngFacNames",
+            "AllHeatTranSurfNames",
+            "RadiantSurfaceNames",
+        ],
+        "object_lists": {
+            "construction_name": ["ConstructionNames"],
+            "zone_or_zonelist_name": ["ZoneAndZoneListNames"],
+        },
+    },
+    "Lights": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_or_space_or_spacelist_name",
+            "schedule_name",
+            "design_level_calculation_method",
+            "lighting_level",
+            "watts_per_floor_area",
+            "watts_per_person",
+            "return_air_fraction",
+            "fraction_radiant",
+            "fraction_visible",
+            "fraction_replaceable",
+            "end_use_subcategory",
+            "return_air_fraction_calculated_from_plenum_temperature",
+            "return_air_fraction_function_of_plenum_temperature_coefficient_1",
+            "return_air_fraction_function_of_plenum_temperature_coefficient_2",
+            "return_air_heat_gain_node_name",
+            "exhaust_air_heat_gain_node_name",
+        ],
+        "numeric": [
+            "lighting_level",
+            "watts_per_floor_area",
+            "watts_per_person",
+            "return_air_fraction",
+            "fraction_radiant",
+            "fraction_visible",
+            "fraction_replaceable",
+            "return_air_fraction_function_of_plenum_temperature_coefficient_1",
+            "return_air_fraction_function_of_plenum_temperature_coefficient_2",
+        ],
+        "choices": {
+            "design_level_calculation_method": [
+                "LightingLevel",
+                "Watts/Area",
+                "Watts/Person",
+            ],
+            "return_air_fraction_calculated_from_plenum_temperature": ["No", "Yes"],
+        },
+        "references": ["LightsNames"],
+        "object_lists": {
+            "zone_or_zonelist_or_space_or_spacelist_name": ["ZoneAndZoneListNames"],
+            "schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Material": {
+        "name": True,
+        "fields": [
+            "roughness",
+            "thickness",
+            "conductivity",
+            "density",
+            "specific_heat",
+            "thermal_absorptance",
+            "solar_absorptance",
+            "visible_absorptance",
+        ],
+        "numeric": [
+            "thickness",
+            "conductivity",
+            "density",
+            "specific_heat",
+            "thermal_absorptance",
+            "solar_absorptance",
+            "visible_absorptance",
+        ],
+        "choices": {
+            "roughness": [
+                "MediumRough",
+                "MediumSmooth",
+                "Rough",
+                "Smooth",
+                "VeryRough",
+                "VerySmooth",
+            ]
+        },
+        "references": ["MaterialName"],
+    },
+    "Material:AirGap": {
+        "name": True,
+        "fields": ["thermal_resistance"],
+        "numeric": ["thermal_resistance"],
+        "references": ["MaterialName"],
+    },
+    "Material:NoMass": {
+        "name": True,
+        "fields": [
+            "roughness",
+            "thermal_resistance",
+            "thermal_absorptance",
+            "solar_absorptance",
+            "visible_absorptance",
+        ],
+        "numeric": [
+            "thermal_resistance",
+            "thermal_absorptance",
+            "solar_absorptance",
+            "visible_absorptance",
+        ],
+        "choices": {
+            "roughness": [
+                "MediumRough",
+                "MediumSmooth",
+                "Rough",
+                "Smooth",
+                "VeryRough",
+                "VerySmooth",
+            ]
+        },
+        "references": ["MaterialName"],
+    },
+    "Matrix:TwoDimension": {
+        "name": True,
+        "fields": ["number_of_rows", "number_of_columns"],
+        "extension": "values",
+        "extensibles": ["value"],
+        "numeric": ["number_of_rows", "number_of_columns", "value"],
+        "references": ["DataMatrices"],
+    },
+    "Meter:Custom": {
+        "name": True,
+        "fields": ["resource_type"],
+        "extension": "variable_details",
+        "extensibles": ["key_name", "output_variable_or_meter_name"],
+        "choices": {
+            "resource_type": [
+                "Coal",
+                "Diesel",
+                "DistrictCooling",
+                "DistrictHeatingSteam",
+                "DistrictHeatingWater",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "Generic",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+                "Water",
+            ]
+        },
+    },
+    "Meter:CustomDecrement": {
+        "name": True,
+        "fields": ["resource_type", "source_meter_name"],
+        "extension": "variable_details",
+        "extensibles": ["key_name", "output_variable_or_meter_name"],
+        "choices": {
+            "resource_type": [
+                "Coal",
+                "Diesel",
+                "DistrictCooling",
+                "DistrictHeatingSteam",
+                "DistrictHeatingWater",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "Generic",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+                "Water",
+            ]
+        },
+    },
+    "NodeList": {
+        "name": True,
+        "fields": [],
+        "extension": "nodes",
+        "extensibles": ["node_name"],
+    },
+    "OtherEquipment": {
+        "name": True,
+        "fields": [
+            "fuel_type",
+            "zone_or_zonelist_or_space_or_spacelist_name",
+            "schedule_name",
+            "design_level_calculation_method",
+            "design_level",
+            "power_per_floor_area",
+            "power_per_person",
+            "fraction_latent",
+            "fraction_radiant",
+            "fraction_lost",
+            "carbon_dioxide_generation_rate",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "design_level",
+            "power_per_floor_area",
+            "power_per_person",
+            "fraction_latent",
+            "fraction_radiant",
+            "fraction_lost",
+            "carbon_dioxide_generation_rate",
+        ],
+        "choices": {
+            "fuel_type": [
+                "Coal",
+                "Diesel",
+                "DistrictCooling",
+                "DistrictHeatingSteam",
+                "DistrictHeatingWater",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "None",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ],
+            "design_level_calculation_method": [
+                "EquipmentLevel",
+                "Power/Area",
+                "Power/Person",
+                "Watts/Area",
+                "Watts/Person",
+            ],
+        },
+        "object_lists": {
+            "zone_or_zonelist_or_space_or_spacelist_name": ["ZoneAndZoneListNames"],
+            "schedule_name": ["ScheduleNames"],
+        },
+    },
+    "OutdoorAir:Mixer": {
+        "name": True,
+        "fields": [
+            "mixed_air_node_name",
+            "outdoor_air_stream_node_name",
+            "relief_air_stream_node_name",
+            "return_air_stream_node_name",
+        ],
+        "references": ["OutdoorAirMixers", "validOASysEquipmentNames"],
+    },
+    "OutdoorAir:Node": {
+        "name": True,
+        "fields": [
+            "height_above_ground",
+            "drybulb_temperature_schedule_name",
+            "wetbulb_temperature_schedule_name",
+            "wind_speed_schedule_name",
+            "wind_direction_schedule_name",
+            "wind_pressure_coefficient_curve_name",
+            "symmetric_wind_pressure_coefficient_curve",
+            "wind_angle_type",
+        ],
+        "numeric": ["height_above_ground"],
+        "choices": {
+            "symmetric_wind_pressure_coefficient_curve": ["No", "Yes"],
+            "wind_angle_type": ["Absolute", "Relative"],
+        },
+        "references": ["OutdoorAirNodeNames"],
+        "object_lists": {
+            "drybulb_temperature_schedule_name": ["ScheduleNames"],
+            "wetbulb_temperature_schedule_name": ["ScheduleNames"],
+            "wind_speed_schedule_name": ["ScheduleNames"],
+            "wind_direction_schedule_name": ["ScheduleNames"],
+            "wind_pressure_coefficient_curve_name": ["UnivariateFunctions"],
+        },
+    },
+    "OutdoorAir:NodeList": {
+        "name": False,
+        "fields": [],
+        "extension": "nodes",
+        "extensibles": ["node_or_nodelist_name"],
+    },
+    "Output:Constructions": {
+        "name": False,
+        "fields": ["details_type_1", "details_type_2"],
+        "choices": {
+            "details_type_1": ["Constructions", "Materials"],
+            "details_type_2": ["Constructions", "Materials"],
+        },
+    },
+    "Output:Diagnostics": {
+        "name": False,
+        "fields": [],
+        "extension": "diagnostics",
+        "extensibles": ["key"],
+        "choices": {
+            "key": [
+                "DisplayAdvancedReportVariables",
+                "DisplayAllWarnings",
+                "DisplayExtraWarnings",
+                "DisplayUnusedObjects",
+                "DisplayUnusedSchedules",
+                "DisplayWeatherMissingDataWarnings",
+                "DisplayZoneAirHeatBalanceOffBalance",
+                "DoNotMirrorAttachedShading",
+                "DoNotMirrorDetachedShading",
+                "ReportDetailedWarmupConvergence",
+                "ReportDuringHVACSizingSimulation",
+                "ReportDuringWarmup",
+            ]
+        },
+    },
+    "Output:EnergyManagementSystem": {
+        "name": False,
+        "fields": [
+            "actuator_availability_dictionary_reporting",
+            "internal_variable_availability_dictionary_reporting",
+            "ems_runtime_language_debug_output_level",
+        ],
+        "choices": {
+            "actuator_availability_dictionary_reporting": [
+                "None",
+                "NotByUniqueKeyNames",
+                "Verbose",
+            ],
+            "internal_variable_availability_dictionary_reporting": [
+                "None",
+                "NotByUniqueKeyNames",
+                "Verbose",
+            ],
+            "ems_runtime_language_debug_output_level": [
+                "ErrorsOnly",
+                "None",
+                "Verbose",
+            ],
+        },
+    },
+    "Output:EnvironmentalImpactFactors": {
+        "name": False,
+        "fields": ["reporting_frequency"],
+        "choices": {
+            "reporting_frequency": [
+                "Annual",
+                "Daily",
+                "Environment",
+                "Hourly",
+                "Monthly",
+                "RunPeriod",
+                "Timestep",
+            ]
+        },
+    },
+    "Output:JSON": {
+        "name": False,
+        "fields": ["option_type", "output_json", "output_cbor", "output_messagepack"],
+        "choices": {
+            "option_type": ["TimeSeries", "TimeSeriesAndTabular"],
+            "output_json": ["No", "Yes"],
+            "output_cbor": ["No", "Yes"],
+            "output_messagepack": ["No", "Yes"],
+        },
+    },
+    "Output:Meter": {
+        "name": False,
+        "fields": ["key_name", "reporting_frequency"],
+        "choices": {
+            "reporting_frequency": [
+                "Annual",
+                "Daily",
+                "Detailed",
+                "Environment",
+                "Hourly",
+                "Monthly",
+                "RunPeriod",
+                "Timestep",
+            ]
+        },
+    },
+    "Output:Meter:MeterFileOnly": {
+        "name": False,
+        "fields": ["key_name", "reporting_frequency"],
+        "choices": {
+            "reporting_frequency": [
+                "Annual",
+                "Daily",
+                "Detailed",
+                "Environment",
+                "Hourly",
+                "Monthly",
+                "RunPeriod",
+                "Timestep",
+            ]
+        },
+    },
+    "Output:SQLite": {
+        "name": False,
+        "fields": ["option_type", "unit_conversion_for_tabular_data"],
+        "choices": {
+            "option_type": ["Simple", "SimpleAndTabular"],
+            "unit_conversion_for_tabular_data": [
+                "InchPound",
+                "InchPoundExceptElectricity",
+                "JtoGJ",
+                "JtoKWH",
+                "JtoMJ",
+                "None",
+                "UseOutputControlTableStyle",
+            ],
+        },
+    },
+    "Output:Surfaces:Drawing": {
+        "name": False,
+        "fields": ["report_type", "report_specifications_1", "report_specifications_2"],
+        "choices": {
+            "report_type": ["DXF", "DXF:WireFrame", "VRML"],
+            "report_specifications_1": [
+                "RegularPolyline",
+                "ThickPolyline",
+                "Triangulate3DFace",
+            ],
+        },
+    },
+    "Output:Surfaces:List": {
+        "name": False,
+        "fields": ["report_type", "report_specifications"],
+        "choices": {
+            "report_type": [
+                "CostInfo",
+                "DecayCurvesFromComponentLoadsSummary",
+                "Details",
+                "DetailsWithVertices",
+                "Lines",
+                "Vertices",
+                "ViewFactorInfo",
+            ],
+            "report_specifications": ["IDF"],
+        },
+    },
+    "Output:Table:Monthly": {
+        "name": True,
+        "fields": ["digits_after_decimal"],
+        "extension": "variable_details",
+        "extensibles": [
+            "variable_or_meter_name",
+            "aggregation_type_for_variable_or_meter",
+        ],
+        "numeric": ["digits_after_decimal"],
+        "choices": {
+            "aggregation_type_for_variable_or_meter": [
+                "HoursNegative",
+                "HoursNonNegative",
+                "HoursNonPositive",
+                "HoursNonZero",
+                "HoursPositive",
+                "HoursZero",
+                "Maximum",
+                "MaximumDuringHoursShown",
+                "Minimum",
+                "MinimumDuringHoursShown",
+                "SumOrAverage",
+                "SumOrAverageDuringHoursShown",
+                "ValueWhenMaximumOrMinimum",
+            ]
+        },
+    },
+    "Output:Table:SummaryReports": {
+        "name": False,
+        "fields": [],
+        "extension": "reports",
+        "extensibles": ["report_name"],
+        "choices": {
+            "report_name": [
+                "AdaptiveComfortSummary",
+                "AirLoopComponentLoadSummary",
+                "AirLoopSystemComponentEnergyUseMonthly",
+                "AirLoopSystemComponentLoadsMonthly",
+                "AirLoopSystemEnergyAndWaterUseMonthly",
+                "AllMonthly",
+                "AllSummary",
+                "AllSummaryAndMonthly",
+                "AllSummaryAndSizingPeriod",
+                "AllSummaryMonthlyAndSizingPeriod",
+                "AnnualBuildingUtilityPerformanceSummary",
+                "AverageOutdoorConditionsMonthly",
+                "BoilerReportMonthly",
+                "CO2ResilienceSummary",
+                "ChillerReportMonthly",
+                "ClimaticDataSummary",
+                "CoilReportMonthly",
+                "CoilSizingDetails",
+                "ComfortReportSimple55Monthly",
+                "ComponentCostEconomicsSummary",
+                "ComponentSizingSummary",
+                "CondLoopDemandReportMonthly",
+                "DXReportMonthly",
+                "DaylightingReportMonthly",
+                "DemandEndUseComponentsSummary",
+                "EconomicResultSummary",
+                "ElectricComponentsOfPeakDemandMonthly",
+                "EndUseEnergyConsumptionCoalMonthly",
+                "EndUseEnergyConsumptionDieselMonthly",
+                "EndUseEnergyConsumptionElectricityMonthly",
+                "EndUseEnergyConsumptionFuelOilMonthly",
+                "EndUseEnergyConsumptionGasolineMonthly",
+                "EndUseEnergyConsumptionNaturalGasMonthly",
+                "EndUseEnergyConsumptionOtherFuelsMonthly",
+                "EndUseEnergyConsumptionPropaneMonthly",
+                "EnergyConsumptionCoalGasolineMonthly",
+                "EnergyConsumptionDieselFuelOilMonthly",
+                "EnergyConsumptionDistrictHeatingCoolingMonthly",
+                "EnergyConsumptionElectricityGeneratedPropaneMonthly",
+                "EnergyConsumptionElectricityNaturalGasMonthly",
+                "EnergyConsumptionOtherFuelsMonthly",
+                "EnergyMeters",
+                "EnvelopeSummary",
+                "EquipmentSummary",
+                "FacilityComponentLoadSummary",
+                "FanReportMonthly",
+                "GeneratorReportMonthly",
+                "HVACSizingSummary",
+                "HeatEmissionsReportMonthly",
+                "HeatEmissionsSummary",
+                "InitializationSummary",
+                "InputVerificationandResultsSummary",
+                "LEEDSummary",
+                "LifeCycleCostReport",
+                "LightingSummary",
+                "MechanicalVentilationLoadsMonthly",
+                "ObjectCountSummary",
+                "OccupantComfortDataSummaryMonthly",
+                "OutdoorAirDetails",
+                "OutdoorAirSummary",
+                "OutdoorConditionsMaximumDewPointMonthly",
+                "OutdoorConditionsMaximumDryBulbMonthly",
+                "OutdoorConditionsMaximumWetBulbMonthly",
+                "OutdoorConditionsMinimumDryBulbMonthly",
+                "OutdoorGroundConditionsMonthly",
+                "PeakEnergyEndUseCoalMonthly",
+                "PeakEnergyEndUseDieselMonthly",
+                "PeakEnergyEndUseElectricityPart1Monthly",
+                "PeakEnergyEndUseElectricityPart2Monthly",
+                "PeakEnergyEndUseFuelOilMonthly",
+                "PeakEnergyEndUseGasolineMonthly",
+                "PeakEnergyEndUseNaturalGasMonthly",
+                "PeakEnergyEndUseOtherFuelsMonthly",
+                "PeakEnergyEndUsePropaneMonthly",
+                "PeakSpaceGainsMonthly",
+                "PlantLoopDemandReportMonthly",
+                "PumpReportMonthly",
+                "SensibleHeatGainSummary",
+                "SetpointsNotMetWithTemperaturesMonthly",
+                "ShadingSummary",
+                "SourceEnergyEndUseComponentsSummary",
+                "SpaceGainComponentsAtCoolingPeakMonthly",
+                "SpaceGainsMonthly",
+                "Standard62.1Summary",
+                "SurfaceShadowingSummary",
+                "SystemSummary",
+                "TariffReport",
+                "ThermalResilienceSummary",
+                "TowerReportMonthly",
+                "UnglazedTranspiredSolarCollectorSummaryMonthly",
+                "VisualResilienceSummary",
+                "WaterHeaterReportMonthly",
+                "WindowACReportMonthly",
+                "WindowEnergyReportMonthly",
+                "WindowEnergyZoneSummaryMonthly",
+                "WindowReportMonthly",
+                "WindowZoneSummaryMonthly",
+                "ZoneComponentLoadSummary",
+                "ZoneCoolingSummaryMonthly",
+                "ZoneElectricSummaryMonthly",
+                "ZoneHeatingSummaryMonthly",
+                "ZoneTemperatureOscillationReportMonthly",
+            ]
+        },
+    },
+    "Output:Table:TimeBins": {
+        "name": False,
+        "fields": [
+            "key_value",
+            "variable_name",
+            "interval_start",
+            "interval_size",
+            "interval_count",
+            "schedule_name",
+            "variable_type",
+        ],
+        "numeric": ["interval_start", "interval_size", "interval_count"],
+        "choices": {
+            "variable_type": ["Energy", "Power", "Temperature", "VolumetricFlow"]
+        },
+        "object_lists": {"schedule_name": ["ScheduleNames"]},
+    },
+    "Output:Variable": {
+        "name": False,
+        "fields": [
+            "key_value",
+            "variable_name",
+            "reporting_frequency",
+            "schedule_name",
+        ],
+        "choices": {
+            "reporting_frequency": [
+                "Annual",
+                "Daily",
+                "Detailed",
+                "Environment",
+                "Hourly",
+                "Monthly",
+                "RunPeriod",
+                "Timestep",
+            ]
+        },
+        "object_lists": {"schedule_name": ["ScheduleNames"]},
+    },
+    "Output:VariableDictionary": {
+        "name": False,
+        "fields": ["key_field", "sort_option"],
+        "choices": {
+            "key_field": ["IDF", "regular"],
+            "sort_option": ["Name", "Unsorted"],
+        },
+    },
+    "OutputControl:Files": {
+        "name": False,
+        "fields": [
+            "output_csv",
+            "output_mtr",
+            "output_eso",
+            "output_eio",
+            "output_tabular",
+            "output_sqlite",
+            "output_json",
+            "output_audit",
+            "output_space_sizing",
+            "output_zone_sizing",
+            "output_system_sizing",
+            "output_dxf",
+            "output_bnd",
+            "output_rdd",
+            "output_mdd",
+            "output_mtd",
+            "output_end",
+            "output_shd",
+            "output_dfs",
+            "output_glhe",
+            "output_delightin",
+            "output_delighteldmp",
+            "output_delightdfdmp",
+            "output_edd",
+            "output_dbg",
+            "output_perflog",
+            "output_sln",
+            "output_sci",
+            "output_wrl",
+            "output_screen",
+            "output_extshd",
+            "output_tarcog",
+        ],
+        "choices": {
+            "output_csv": ["No", "Yes"],
+            "output_mtr": ["No", "Yes"],
+            "output_eso": ["No", "Yes"],
+            "output_eio": ["No", "Yes"],
+            "output_tabular": ["No", "Yes"],
+            "output_sqlite": ["No", "Yes"],
+            "output_json": ["No", "Yes"],
+            "output_audit": ["No", "Yes"],
+            "output_space_sizing": ["No", "Yes"],
+            "output_zone_sizing": ["No", "Yes"],
+            "output_system_sizing": ["No", "Yes"],
+            "output_dxf": ["No", "Yes"],
+            "output_bnd": ["No", "Yes"],
+            "output_rdd": ["No", "Yes"],
+            "output_mdd": ["No", "Yes"],
+            "output_mtd": ["No", "Yes"],
+            "output_end": ["No", "Yes"],
+            "output_shd": ["No", "Yes"],
+            "output_dfs": ["No", "Yes"],
+            "output_glhe": ["No", "Yes"],
+            "output_delightin": ["No", "Yes"],
+            "output_delighteldmp": ["No", "Yes"],
+            "output_delightdfdmp": ["No", "Yes"],
+            "output_edd": ["No", "Yes"],
+            "output_dbg": ["No", "Yes"],
+            "output_perflog": ["No", "Yes"],
+            "output_sln": ["No", "Yes"],
+            "output_sci": ["No", "Yes"],
+            "output_wrl": ["No", "Yes"],
+            "output_screen": ["No", "Yes"],
+            "output_extshd": ["No", "Yes"],
+            "output_tarcog": ["No", "Yes"],
+        },
+    },
+    "OutputControl:ReportingTolerances": {
+        "name": False,
+        "fields": [
+            "tolerance_for_time_heating_setpoint_not_met",
+            "tolerance_for_time_cooling_setpoint_not_met",
+        ],
+        "numeric": [
+            "tolerance_for_time_heating_setpoint_not_met",
+            "tolerance_for_time_cooling_setpoint_not_met",
+        ],
+    },
+    "OutputControl:Table:Style": {
+        "name": False,
+        "fields": ["column_separator", "unit_conversion"],
+        "choices": {
+            "column_separator": [
+                "All",
+                "Comma",
+                "CommaAndHTML",
+                "CommaAndXML",
+                "Fixed",
+                "HTML",
+                "Tab",
+                "TabAndHTML",
+                "XML",
+                "XMLandHTML",
+            ],
+            "unit_conversion": [
+                "InchPound",
+                "InchPoundExceptElectricity",
+                "JtoGJ",
+                "JtoKWH",
+                "JtoMJ",
+                "None",
+            ],
+        },
+    },
+    "OutputControl:Timestamp": {
+        "name": False,
+        "fields": ["iso_8601_format", "timestamp_at_beginning_of_interval"],
+        "choices": {
+            "iso_8601_format": ["No", "Yes"],
+            "timestamp_at_beginning_of_interval": ["No", "Yes"],
+        },
+    },
+    "People": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_or_space_or_spacelist_name",
+            "number_of_people_schedule_name",
+            "number_of_people_calculation_method",
+            "number_of_people",
+            "people_per_floor_area",
+            "floor_area_per_person",
+            "fraction_radiant",
+            "sensible_heat_fraction",
+            "activity_level_schedule_name",
+            "carbon_dioxide_generation_rate",
+            "enable_ashrae_55_comfort_warnings",
+            "mean_radiant_temperature_calculation_type",
+            "surface_name_angle_factor_list_name",
+            "work_efficiency_schedule_name",
+            "clothing_insulation_calculation_method",
+            "clothing_insulation_calculation_method_schedule_name",
+            "clothing_insulation_schedule_name",
+            "air_velocity_schedule_name",
+            "thermal_comfort_model_1_type",
+            "thermal_comfort_model_2_type",
+            "thermal_comfort_model_3_type",
+            "thermal_comfort_model_4_type",
+            "thermal_comfort_model_5_type",
+            "thermal_comfort_model_6_type",
+            "thermal_comfort_model_7_type",
+            "ankle_level_air_velocity_schedule_name",
+            "cold_stress_temperature_threshold",
+            "heat_stress_temperature_threshold",
+        ],
+        "numeric": [
+            "number_of_people",
+            "people_per_floor_area",
+            "floor_area_per_person",
+            "fraction_radiant",
+            "sensible_heat_fraction",
+            "carbon_dioxide_generation_rate",
+            "cold_stress_temperature_threshold",
+            "heat_stress_temperature_threshold",
+        ],
+        "choices": {
+            "number_of_people_calculation_method": [
+                "Area/Person",
+                "People",
+                "People/Area",
+            ],
+            "sensible_heat_fraction": ["Autocalculate"],
+            "enable_ashrae_55_comfort_warnings": ["No", "Yes"],
+            "mean_radiant_temperature_calculation_type": [
+                "AngleFactor",
+                "EnclosureAveraged",
+                "SurfaceWeighted",
+            ],
+            "clothing_insulation_calculation_method": [
+                "CalculationMethodSchedule",
+                "ClothingInsulationSchedule",
+                "DynamicClothingModelASHRAE55",
+            ],
+            "thermal_comfort_model_1_type": [
+                "AdaptiveASH55",
+                "AdaptiveCEN15251",
+                "AnkleDraftASH55",
+                "CoolingEffectASH55",
+                "Fanger",
+                "KSU",
+                "Pierce",
+            ],
+            "thermal_comfort_model_2_type": [
+                "AdaptiveASH55",
+                "AdaptiveCEN15251",
+                "AnkleDraftASH55",
+                "CoolingEffectASH55",
+                "Fanger",
+                "KSU",
+                "Pierce",
+            ],
+            "thermal_comfort_model_3_type": [
+                "AdaptiveASH55",
+                "AdaptiveCEN15251",
+                "AnkleDraftASH55",
+                "CoolingEffectASH55",
+                "Fanger",
+                "KSU",
+                "Pierce",
+            ],
+            "thermal_comfort_model_4_type": [
+                "AdaptiveASH55",
+                "AdaptiveCEN15251",
+                "AnkleDraftASH55",
+                "CoolingEffectASH55",
+                "Fanger",
+                "KSU",
+                "Pierce",
+            ],
+            "thermal_comfort_model_5_type": [
+                "AdaptiveASH55",
+                "AdaptiveCEN15251",
+                "AnkleDraftASH55",
+                "CoolingEffectASH55",
+                "Fanger",
+                "KSU",
+                "Pierce",
+            ],
+            "thermal_comfort_model_6_type": [
+                "AdaptiveASH55",
+                "AdaptiveCEN15251",
+                "AnkleDraftASH55",
+                "CoolingEffectASH55",
+                "Fanger",
+                "KSU",
+                "Pierce",
+            ],
+            "thermal_comfort_model_7_type": [
+                "AdaptiveASH55",
+                "AdaptiveCEN15251",
+                "AnkleDraftASH55",
+                "CoolingEffectASH55",
+                "Fanger",
+                "KSU",
+                "Pierce",
+            ],
+        },
+        "references": ["PeopleNames"],
+        "object_lists": {
+            "zone_or_zonelist_or_space_or_spacelist_name": ["ZoneAndZoneListNames"],
+            "number_of_people_schedule_name": ["ScheduleNames"],
+            "activity_level_schedule_name": ["ScheduleNames"],
+            "surface_name_angle_factor_list_name": ["AllHeatTranAngFacNames"],
+            "work_efficiency_schedule_name": ["ScheduleNames"],
+            "clothing_insulation_calculation_method_schedule_name": ["ScheduleNames"],
+            "clothing_insulation_schedule_name": ["ScheduleNames"],
+            "air_velocity_schedule_name": ["ScheduleNames"],
+            "ankle_level_air_velocity_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Pipe:Adiabatic": {
+        "name": True,
+        "fields": ["inlet_node_name", "outlet_node_name"],
+        "references": ["validBranchEquipmentNames"],
+    },
+    "PlantEquipmentList": {
+        "name": True,
+        "fields": [],
+        "extension": "equipment",
+        "extensibles": ["equipment_object_type", "equipment_name"],
+        "references": ["PlantAndCondenserEquipmentLists"],
+        "object_lists": {"equipment_name": ["validPlantEquipmentNames"]},
+        "object_types": {"equipment_name": "equipment_object_type"},
+    },
+    "PlantEquipmentOperation:ComponentSetpoint": {
+        "name": True,
+        "fields": [
+            "equipment_1_object_type",
+            "equipment_1_name",
+            "demand_calculation_1_node_name",
+            "setpoint_1_node_name",
+            "component_1_flow_rate",
+            "operation_1_type",
+            "equipment_2_object_type",
+            "equipment_2_name",
+            "demand_calculation_2_node_name",
+            "setpoint_2_node_name",
+            "component_2_flow_rate",
+            "operation_2_type",
+            "equipment_3_object_type",
+            "equipment_3_name",
+            "demand_calculation_3_node_name",
+            "setpoint_3_node_name",
+            "component_3_flow_rate",
+            "operation_3_type",
+            "equipment_4_object_type",
+            "equipment_4_name",
+            "demand_calculation_4_node_name",
+            "setpoint_4_node_name",
+            "component_4_flow_rate",
+            "operation_4_type",
+            "equipment_5_object_type",
+            "equipment_5_name",
+            "demand_calculation_5_node_name",
+            "setpoint_5_node_name",
+            "component_5_flow_rate",
+            "operation_5_type",
+            "equipment_6_object_type",
+            "equipment_6_name",
+            "demand_calculation_6_node_name",
+            "setpoint_6_node_name",
+            "component_6_flow_rate",
+            "operation_6_type",
+            "equipment_7_object_type",
+            "equipment_7_name",
+            "demand_calculation_7_node_name",
+            "setpoint_7_node_name",
+            "component_7_flow_rate",
+            "operation_7_type",
+            "equipment_8_object_type",
+            "equipment_8_name",
+            "demand_calculation_8_node_name",
+            "setpoint_8_node_name",
+            "component_8_flow_rate",
+            "operation_8_type",
+            "equipment_9_object_type",
+            "equipment_9_name",
+            "demand_calculation_9_node_name",
+            "setpoint_9_node_name",
+            "component_9_flow_rate",
+            "operation_9_type",
+            "equipment_10_object_type",
+            "equipment_10_name",
+            "demand_calculation_10_node_name",
+            "setpoint_10_node_name",
+            "component_10_flow_rate",
+            "operation_10_type",
+        ],
+        "numeric": [
+            "component_1_flow_rate",
+            "component_2_flow_rate",
+            "component_3_flow_rate",
+            "component_4_flow_rate",
+            "component_5_flow_rate",
+            "component_6_flow_rate",
+            "component_7_flow_rate",
+            "component_8_flow_rate",
+            "component_9_flow_rate",
+            "component_10_flow_rate",
+        ],
+        "choices": {
+            "component_1_flow_rate": ["Autosize"],
+            "operation_1_type": ["Cooling", "Dual", "Heating"],
+            "component_2_flow_rate": ["Autosize"],
+            "operation_2_type": ["Cooling", "Dual", "Heating"],
+            "component_3_flow_rate": ["Autosize"],
+            "operation_3_type": ["Cooling", "Dual", "Heating"],
+            "component_4_flow_rate": ["Autosize"],
+            "operation_4_type": ["Cooling", "Dual", "Heating"],
+            "component_5_flow_rate": ["Autosize"],
+            "operation_5_type": ["Cooling", "Dual", "Heating"],
+            "component_6_flow_rate": ["Autosize"],
+            "operation_6_type": ["Cooling", "Dual", "Heating"],
+            "component_7_flow_rate": ["Autosize"],
+            "operation_7_type": ["Cooling", "Dual", "Heating"],
+            "component_8_flow_rate": ["Autosize"],
+            "operation_8_type": ["Cooling", "Dual", "Heating"],
+            "component_9_flow_rate": ["Autosize"],
+            "operation_9_type": ["Cooling", "Dual", "Heating"],
+            "component_10_flow_rate": ["Autosize"],
+            "operation_10_type": ["Cooling", "Dual", "Heating"],
+        },
+        "references": ["ControlSchemeList"],
+    },
+    "PlantEquipmentOperation:CoolingLoad": {
+        "name": True,
+        "fields": [
+            "load_range_1_lower_limit",
+            "load_range_1_upper_limit",
+            "range_1_equipment_list_name",
+            "load_range_2_lower_limit",
+            "load_range_2_upper_limit",
+            "range_2_equipment_list_name",
+            "load_range_3_lower_limit",
+            "load_range_3_upper_limit",
+            "range_3_equipment_list_name",
+            "load_range_4_lower_limit",
+            "load_range_4_upper_limit",
+            "range_4_equipment_list_name",
+            "load_range_5_lower_limit",
+            "load_range_5_upper_limit",
+            "range_5_equipment_list_name",
+            "load_range_6_lower_limit",
+            "load_range_6_upper_limit",
+            "range_6_equipment_list_name",
+            "load_range_7_lower_limit",
+            "load_range_7_upper_limit",
+            "range_7_equipment_list_name",
+            "load_range_8_lower_limit",
+            "load_range_8_upper_limit",
+            "range_8_equipment_list_name",
+            "load_range_9_lower_limit",
+            "load_range_9_upper_limit",
+            "range_9_equipment_list_name",
+            "load_range_10_lower_limit",
+            "load_range_10_upper_limit",
+            "range_10_equipment_list_name",
+        ],
+        "numeric": [
+            "load_range_1_lower_limit",
+            "load_range_1_upper_limit",
+            "load_range_2_lower_limit",
+            "load_range_2_upper_limit",
+            "load_range_3_lower_limit",
+            "load_range_3_upper_limit",
+            "load_range_4_lower_limit",
+            "load_range_4_upper_limit",
+            "load_range_5_lower_limit",
+            "load_range_5_upper_limit",
+            "load_range_6_lower_limit",
+            "load_range_6_upper_limit",
+            "load_range_7_lower_limit",
+            "load_range_7_upper_limit",
+            "load_range_8_lower_limit",
+            "load_range_8_upper_limit",
+            "load_range_9_lower_limit",
+            "load_range_9_upper_limit",
+            "load_range_10_lower_limit",
+            "load_range_10_upper_limit",
+        ],
+        "references": ["ControlSchemeList"],
+        "object_lists": {
+            "range_1_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_2_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_3_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_4_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_5_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_6_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_7_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_8_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_9_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_10_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+        },
+    },
+    "PlantEquipmentOperation:HeatingLoad": {
+        "name": True,
+        "fields": [
+            "load_range_1_lower_limit",
+            "load_range_1_upper_limit",
+            "range_1_equipment_list_name",
+            "load_range_2_lower_limit",
+            "load_range_2_upper_limit",
+            "range_2_equipment_list_name",
+            "load_range_3_lower_limit",
+            "load_range_3_upper_limit",
+            "range_3_equipment_list_name",
+            "load_range_4_lower_limit",
+            "load_range_4_upper_limit",
+            "range_4_equipment_list_name",
+            "load_range_5_lower_limit",
+            "load_range_5_upper_limit",
+            "range_5_equipment_list_name",
+            "load_range_6_lower_limit",
+            "load_range_6_upper_limit",
+            "range_6_equipment_list_name",
+            "load_range_7_lower_limit",
+            "load_range_7_upper_limit",
+            "range_7_equipment_list_name",
+            "load_range_8_lower_limit",
+            "load_range_8_upper_limit",
+            "range_8_equipment_list_name",
+            "load_range_9_lower_limit",
+            "load_range_9_upper_limit",
+            "range_9_equipment_list_name",
+            "load_range_10_lower_limit",
+            "load_range_10_upper_limit",
+            "range_10_equipment_list_name",
+        ],
+        "numeric": [
+            "load_range_1_lower_limit",
+            "load_range_1_upper_limit",
+            "load_range_2_lower_limit",
+            "load_range_2_upper_limit",
+            "load_range_3_lower_limit",
+            "load_range_3_upper_limit",
+            "load_range_4_lower_limit",
+            "load_range_4_upper_limit",
+            "load_range_5_lower_limit",
+            "load_range_5_upper_limit",
+            "load_range_6_lower_limit",
+            "load_range_6_upper_limit",
+            "load_range_7_lower_limit",
+            "load_range_7_upper_limit",
+            "load_range_8_lower_limit",
+            "load_range_8_upper_limit",
+            "load_range_9_lower_limit",
+            "load_range_9_upper_limit",
+            "load_range_10_lower_limit",
+            "load_range_10_upper_limit",
+        ],
+        "references": ["ControlSchemeList"],
+        "object_lists": {
+            "range_1_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_2_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_3_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_4_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_5_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_6_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_7_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_8_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_9_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+            "range_10_equipment_list_name": ["PlantAndCondenserEquipmentLists"],
+        },
+    },
+    "PlantEquipmentOperationSchemes": {
+        "name": True,
+        "fields": [
+            "control_scheme_1_object_type",
+            "control_scheme_1_name",
+            "control_scheme_1_schedule_name",
+            "control_scheme_2_object_type",
+            "control_scheme_2_name",
+            "control_scheme_2_schedule_name",
+            "control_scheme_3_object_type",
+            "control_scheme_3_name",
+            "control_scheme_3_schedule_name",
+            "control_scheme_4_object_type",
+            "control_scheme_4_name",
+            "control_scheme_4_schedule_name",
+            "control_scheme_5_object_type",
+            "control_scheme_5_name",
+            "control_scheme_5_schedule_name",
+            "control_scheme_6_object_type",
+            "control_scheme_6_name",
+            "control_scheme_6_schedule_name",
+            "control_scheme_7_object_type",
+            "control_scheme_7_name",
+            "control_scheme_7_schedule_name",
+            "control_scheme_8_object_type",
+            "control_scheme_8_name",
+            "control_scheme_8_schedule_name",
+        ],
+        "choices": {
+            "control_scheme_1_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_2_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_3_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_4_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_5_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_6_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_7_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+            "control_scheme_8_object_type": [
+                "PlantEquipmentOperation:ChillerHeaterChangeover",
+                "PlantEquipmentOperation:ComponentSetpoint",
+                "PlantEquipmentOperation:CoolingLoad",
+                "PlantEquipmentOperation:HeatingLoad",
+                "PlantEquipmentOperation:OutdoorDewpoint",
+                "PlantEquipmentOperation:OutdoorDewpointDifference",
+                "PlantEquipmentOperation:OutdoorDryBulb",
+                "PlantEquipmentOperation:OutdoorDryBulbDifference",
+                "PlantEquipmentOperation:OutdoorRelativeHumidity",
+                "PlantEquipmentOperation:OutdoorWetBulb",
+                "PlantEquipmentOperation:OutdoorWetBulbDifference",
+                "PlantEquipmentOperation:ThermalEnergyStorage",
+                "PlantEquipmentOperation:Uncontrolled",
+                "PlantEquipmentOperation:UserDefined",
+            ],
+        },
+        "references": ["PlantOperationSchemes"],
+        "object_lists": {
+            "control_scheme_1_name": ["ControlSchemeList"],
+            "control_scheme_1_schedule_name": ["ScheduleNames"],
+            "control_scheme_2_name": ["ControlSchemeList"],
+            "control_scheme_2_schedule_name": ["ScheduleNames"],
+            "control_scheme_3_name": ["ControlSchemeList"],
+            "control_scheme_3_schedule_name": ["ScheduleNames"],
+            "control_scheme_4_name": ["ControlSchemeList"],
+            "control_scheme_4_schedule_name": ["ScheduleNames"],
+            "control_scheme_5_name": ["ControlSchemeList"],
+            "control_scheme_5_schedule_name": ["ScheduleNames"],
+            "control_scheme_6_name": ["ControlSchemeList"],
+            "control_scheme_6_schedule_name": ["ScheduleNames"],
+            "control_scheme_7_name": ["ControlSchemeList"],
+            "control_scheme_7_schedule_name": ["ScheduleNames"],
+            "control_scheme_8_name": ["ControlSchemeList"],
+            "control_scheme_8_schedule_name": ["ScheduleNames"],
+        },
+        "object_types": {
+            "control_scheme_1_name": "control_scheme_1_object_type",
+            "control_scheme_2_name": "control_scheme_2_object_type",
+            "control_scheme_3_name": "control_scheme_3_object_type",
+            "control_scheme_4_name": "control_scheme_4_object_type",
+            "control_scheme_5_name": "control_scheme_5_object_type",
+            "control_scheme_6_name": "control_scheme_6_object_type",
+            "control_scheme_7_name": "control_scheme_7_object_type",
+            "control_scheme_8_name": "control_scheme_8_object_type",
+        },
+    },
+    "PlantLoop": {
+        "name": True,
+        "fields": [
+            "fluid_type",
+            "user_defined_fluid_type",
+            "plant_equipment_operation_scheme_name",
+            "loop_temperature_setpoint_node_name",
+            "maximum_loop_temperature",
+            "minimum_loop_temperature",
+            "maximum_loop_flow_rate",
+            "minimum_loop_flow_rate",
+            "plant_loop_volume",
+            "plant_side_inlet_node_name",
+            "plant_side_outlet_node_name",
+            "plant_side_branch_list_name",
+            "plant_side_connector_list_name",
+            "demand_side_inlet_node_name",
+            "demand_side_outlet_node_name",
+            "demand_side_branch_list_name",
+            "demand_side_connector_list_name",
+            "load_distribution_scheme",
+            "availability_manager_list_name",
+            "plant_loop_demand_calculation_scheme",
+            "common_pipe_simulation",
+            "pressure_simulation_type",
+            "loop_circulation_time",
+        ],
+        "numeric": [
+            "maximum_loop_temperature",
+            "minimum_loop_temperature",
+            "maximum_loop_flow_rate",
+            "minimum_loop_flow_rate",
+            "plant_loop_volume",
+            "loop_circulation_time",
+        ],
+        "choices": {
+            "fluid_type": ["Steam", "UserDefinedFluidType", "Water"],
+            "maximum_loop_flow_rate": ["Autosize"],
+            "plant_loop_volume": ["Autocalculate"],
+            "load_distribution_scheme": [
+                "Optimal",
+                "SequentialLoad",
+                "SequentialUniformPLR",
+                "UniformLoad",
+                "UniformPLR",
+            ],
+            "plant_loop_demand_calculation_scheme": [
+                "DualSetpointDeadband",
+                "SingleSetpoint",
+            ],
+            "common_pipe_simulation": ["CommonPipe", "None", "TwoWayCommonPipe"],
+            "pressure_simulation_type": [
+                "LoopFlowCorrection",
+                "None",
+                "PumpPowerCorrection",
+            ],
+        },
+        "references": ["PlantLoops"],
+        "object_lists": {
+            "user_defined_fluid_type": ["FluidAndGlycolNames"],
+            "plant_equipment_operation_scheme_name": ["PlantOperationSchemes"],
+            "plant_side_branch_list_name": ["BranchLists"],
+            "plant_side_connector_list_name": ["ConnectorLists"],
+            "demand_side_branch_list_name": ["BranchLists"],
+            "demand_side_connector_list_name": ["ConnectorLists"],
+            "availability_manager_list_name": ["SystemAvailabilityManagerLists"],
+        },
+    },
+    "Pump:ConstantSpeed": {
+        "name": True,
+        "fields": [
+            "inlet_node_name",
+            "outlet_node_name",
+            "design_flow_rate",
+            "design_pump_head",
+            "design_power_consumption",
+            "motor_efficiency",
+            "fraction_of_motor_inefficiencies_to_fluid_stream",
+            "pump_control_type",
+            "pump_flow_rate_schedule_name",
+            "pump_curve_name",
+            "impeller_diameter",
+            "rotational_speed",
+            "zone_name",
+            "skin_loss_radiative_fraction",
+            "design_power_sizing_method",
+            "design_electric_power_per_unit_flow_rate",
+            "design_shaft_power_per_unit_flow_rate_per_unit_head",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "design_flow_rate",
+            "design_pump_head",
+            "design_power_consumption",
+            "motor_efficiency",
+            "fraction_of_motor_inefficiencies_to_fluid_stream",
+            "impeller_diameter",
+            "rotational_speed",
+            "skin_loss_radiative_fraction",
+            "design_electric_power_per_unit_flow_rate",
+            "design_shaft_power_per_unit_flow_rate_per_unit_head",
+        ],
+        "choices": {
+            "design_flow_rate": ["Autosize"],
+            "design_power_consumption": ["Autosize"],
+            "pump_control_type": ["Continuous", "Intermittent"],
+            "design_power_sizing_method": ["PowerPerFlow", "PowerPerFlowPerPressure"],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "pump_flow_rate_schedule_name": ["ScheduleNames"],
+            "pump_curve_name": ["UnivariateFunctions"],
+            "zone_name": ["ZoneNames"],
+        },
+    },
+    "Pump:VariableSpeed": {
+        "name": True,
+        "fields": [
+            "inlet_node_name",
+            "outlet_node_name",
+            "design_maximum_flow_rate",
+            "design_pump_head",
+            "design_power_consumption",
+            "motor_efficiency",
+            "fraction_of_motor_inefficiencies_to_fluid_stream",
+            "coefficient_1_of_the_part_load_performance_curve",
+            "coefficient_2_of_the_part_load_performance_curve",
+            "coefficient_3_of_the_part_load_performance_curve",
+            "coefficient_4_of_the_part_load_performance_curve",
+            "design_minimum_flow_rate",
+            "pump_control_type",
+            "pump_flow_rate_schedule_name",
+            "pump_curve_name",
+            "impeller_diameter",
+            "vfd_control_type",
+            "pump_rpm_schedule_name",
+            "minimum_pressure_schedule",
+            "maximum_pressure_schedule",
+            "minimum_rpm_schedule",
+            "maximum_rpm_schedule",
+            "zone_name",
+            "skin_loss_radiative_fraction",
+            "design_power_sizing_method",
+            "design_electric_power_per_unit_flow_rate",
+            "design_shaft_power_per_unit_flow_rate_per_unit_head",
+            "design_minimum_flow_rate_fraction",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "design_maximum_flow_rate",
+            "design_pump_head",
+            "design_power_consumption",
+            "motor_efficiency",
+            "fraction_of_motor_inefficiencies_to_fluid_stream",
+            "coefficient_1_of_the_part_load_performance_curve",
+            "coefficient_2_of_the_part_load_performance_curve",
+            "coefficient_3_of_the_part_load_performance_curve",
+            "coefficient_4_of_the_part_load_performance_curve",
+            "design_minimum_flow_rate",
+            "impeller_diameter",
+            "skin_loss_radiative_fraction",
+            "design_electric_power_per_unit_flow_rate",
+            "design_shaft_power_per_unit_flow_rate_per_unit_head",
+            "design_minimum_flow_rate_fraction",
+        ],
+        "choices": {
+            "design_maximum_flow_rate": ["Autosize"],
+            "design_power_consumption": ["Autosize"],
+            "design_minimum_flow_rate": ["Autosize"],
+            "pump_control_type": ["Continuous", "Intermittent"],
+            "vfd_control_type": ["ManualControl", "PressureSetpointControl"],
+            "design_power_sizing_method": ["PowerPerFlow", "PowerPerFlowPerPressure"],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "pump_flow_rate_schedule_name": ["ScheduleNames"],
+            "pump_curve_name": ["UnivariateFunctions"],
+            "pump_rpm_schedule_name": ["ScheduleNames"],
+            "minimum_pressure_schedule": ["ScheduleNames"],
+            "maximum_pressure_schedule": ["ScheduleNames"],
+            "minimum_rpm_schedule": ["ScheduleNames"],
+            "maximum_rpm_schedule": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+        },
+    },
+    "Refrigeration:AirChiller": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "capacity_rating_type",
+            "rated_unit_load_factor",
+            "rated_capacity",
+            "rated_relative_humidity",
+            "rated_cooling_source_temperature",
+            "rated_temperature_difference_dt1",
+            "maximum_temperature_difference_between_inlet_air_and_evaporating_temperature",
+            "coil_material_correction_factor",
+            "refrigerant_correction_factor",
+            "capacity_correction_curve_type",
+            "capacity_correction_curve_name",
+            "shr60_correction_factor",
+            "rated_total_heating_power",
+            "heating_power_schedule_name",
+            "fan_speed_control_type",
+            "rated_fan_power",
+            "rated_air_flow",
+            "minimum_fan_air_flow_ratio",
+            "defrost_type",
+            "defrost_control_type",
+            "defrost_schedule_name",
+            "defrost_drip_down_schedule_name",
+            "defrost_power",
+            "temperature_termination_defrost_fraction_to_ice",
+            "vertical_location",
+            "average_refrigerant_charge_inventory",
+        ],
+        "numeric": [
+            "rated_unit_load_factor",
+            "rated_capacity",
+            "rated_relative_humidity",
+            "rated_cooling_source_temperature",
+            "rated_temperature_difference_dt1",
+            "maximum_temperature_difference_between_inlet_air_and_evaporating_temperature",
+            "coil_material_correction_factor",
+            "refrigerant_correction_factor",
+            "shr60_correction_factor",
+            "rated_total_heating_power",
+            "rated_fan_power",
+            "rated_air_flow",
+            "minimum_fan_air_flow_ratio",
+            "defrost_power",
+            "temperature_termination_defrost_fraction_to_ice",
+            "average_refrigerant_charge_inventory",
+        ],
+        "choices": {
+            "capacity_rating_type": [
+                "CapacityTotalSpecificConditions",
+                "EuropeanSC1NominalWet",
+                "EuropeanSC1Standard",
+                "EuropeanSC2NominalWet",
+                "EuropeanSC2Standard",
+                "EuropeanSC3NominalWet",
+                "EuropeanSC3Standard",
+                "EuropeanSC4NominalWet",
+                "EuropeanSC4Standard",
+                "EuropeanSC5NominalWet",
+                "EuropeanSC5Standard",
+                "FixedLinear",
+                "UnitLoadFactorSensibleOnly",
+            ],
+            "capacity_correction_curve_type": [
+                "European",
+                "LinearSHR60",
+                "QuadraticSHR",
+                "TabularRHxDT1xTRoom",
+            ],
+            "fan_speed_control_type": [
+                "Fixed",
+                "FixedLinear",
+                "TwoSpeed",
+                "VariableSpeed",
+            ],
+            "defrost_type": ["Electric", "HotFluid", "None", "OffCycle"],
+            "defrost_control_type": ["TemperatureTermination", "TimeSchedule"],
+            "vertical_location": ["Ceiling", "Floor", "Middle"],
+        },
+        "references": [
+            "RefrigerationAirChillerNames",
+            "RefrigerationCaseAndWalkInAndListNames",
+            "RefrigerationCaseAndWalkInNames",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "capacity_correction_curve_name": [
+                "TrivariateFunctions",
+                "UnivariateFunctions",
+            ],
+            "heating_power_schedule_name": ["ScheduleNames"],
+            "defrost_schedule_name": ["ScheduleNames"],
+            "defrost_drip_down_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Refrigeration:Case": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "zone_name",
+            "rated_ambient_temperature",
+            "rated_ambient_relative_humidity",
+            "rated_total_cooling_capacity_per_unit_length",
+            "rated_latent_heat_ratio",
+            "rated_runtime_fraction",
+            "case_length",
+            "case_operating_temperature",
+            "latent_case_credit_curve_type",
+            "latent_case_credit_curve_name",
+            "standard_case_fan_power_per_unit_length",
+            "operating_case_fan_power_per_unit_length",
+            "standard_case_lighting_power_per_unit_length",
+            "installed_case_lighting_power_per_unit_length",
+            "case_lighting_schedule_name",
+            "fraction_of_lighting_energy_to_case",
+            "case_anti_sweat_heater_power_per_unit_length",
+            "minimum_anti_sweat_heater_power_per_unit_length",
+            "anti_sweat_heater_control_type",
+            "humidity_at_zero_anti_sweat_heater_energy",
+            "case_height",
+            "fraction_of_anti_sweat_heater_energy_to_case",
+            "case_defrost_power_per_unit_length",
+            "case_defrost_type",
+            "case_defrost_schedule_name",
+            "case_defrost_drip_down_schedule_name",
+            "defrost_energy_correction_curve_type",
+            "defrost_energy_correction_curve_name",
+            "under_case_hvac_return_air_fraction",
+            "refrigerated_case_restocking_schedule_name",
+            "case_credit_fraction_schedule_name",
+            "design_evaporator_temperature_or_brine_inlet_temperature",
+            "average_refrigerant_charge_inventory",
+            "under_case_hvac_return_air_node_name",
+        ],
+        "numeric": [
+            "rated_ambient_temperature",
+            "rated_ambient_relative_humidity",
+            "rated_total_cooling_capacity_per_unit_length",
+            "rated_latent_heat_ratio",
+            "rated_runtime_fraction",
+            "case_length",
+            "case_operating_temperature",
+            "standard_case_fan_power_per_unit_length",
+            "operating_case_fan_power_per_unit_length",
+            "standard_case_lighting_power_per_unit_length",
+            "installed_case_lighting_power_per_unit_length",
+            "fraction_of_lighting_energy_to_case",
+            "case_anti_sweat_heater_power_per_unit_length",
+            "minimum_anti_sweat_heater_power_per_unit_length",
+            "humidity_at_zero_anti_sweat_heater_energy",
+            "case_height",
+            "fraction_of_anti_sweat_heater_energy_to_case",
+            "case_defrost_power_per_unit_length",
+            "under_case_hvac_return_air_fraction",
+            "design_evaporator_temperature_or_brine_inlet_temperature",
+            "average_refrigerant_charge_inventory",
+        ],
+        "choices": {
+            "latent_case_credit_curve_type": [
+                "CaseTemperatureMethod",
+                "DewpointMethod",
+                "RelativeHumidityMethod",
+            ],
+            "anti_sweat_heater_control_type": [
+                "Constant",
+                "DewpointMethod",
+                "HeatBalanceMethod",
+                "Linear",
+                "None",
+            ],
+            "case_defrost_type": [
+                "Electric",
+                "ElectricWithTemperatureTermination",
+                "HotFluid",
+                "HotFluidWithTemperatureTermination",
+                "HotGas",
+                "HotGasWithTemperatureTermination",
+                "None",
+                "OffCycle",
+            ],
+            "defrost_energy_correction_curve_type": [
+                "CaseTemperatureMethod",
+                "DewpointMethod",
+                "None",
+                "RelativeHumidityMethod",
+            ],
+        },
+        "references": [
+            "RefrigerationCaseAndWalkInAndListNames",
+            "RefrigerationCaseAndWalkInNames",
+        ],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+            "latent_case_credit_curve_name": ["UnivariateFunctions"],
+            "case_lighting_schedule_name": ["ScheduleNames"],
+            "case_defrost_schedule_name": ["ScheduleNames"],
+            "case_defrost_drip_down_schedule_name": ["ScheduleNames"],
+            "defrost_energy_correction_curve_name": ["UnivariateFunctions"],
+            "refrigerated_case_restocking_schedule_name": ["ScheduleNames"],
+            "case_credit_fraction_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "Refrigeration:CaseAndWalkInList": {
+        "name": True,
+        "fields": [],
+        "extension": "cases_and_walkins",
+        "extensibles": ["case_or_walkin_name"],
+        "references": ["RefrigerationCaseAndWalkInAndListNames"],
+        "object_lists": {"case_or_walkin_name": ["RefrigerationCaseAndWalkInNames"]},
+    },
+    "Refrigeration:Compressor": {
+        "name": True,
+        "fields": [
+            "refrigeration_compressor_power_curve_name",
+            "refrigeration_compressor_capacity_curve_name",
+            "rated_superheat",
+            "rated_return_gas_temperature",
+            "rated_liquid_temperature",
+            "rated_subcooling",
+            "end_use_subcategory",
+            "mode_of_operation",
+            "transcritical_compressor_power_curve_name",
+            "transcritical_compressor_capacity_curve_name",
+        ],
+        "numeric": [
+            "rated_superheat",
+            "rated_return_gas_temperature",
+            "rated_liquid_temperature",
+            "rated_subcooling",
+        ],
+        "choices": {"mode_of_operation": ["Subcritical", "Transcritical"]},
+        "references": [
+            "RefrigerationCompressorAndListNames",
+            "RefrigerationCompressorNames",
+        ],
+        "object_lists": {
+            "refrigeration_compressor_power_curve_name": ["BivariateFunctions"],
+            "refrigeration_compressor_capacity_curve_name": ["BivariateFunctions"],
+            "transcritical_compressor_power_curve_name": ["BivariateFunctions"],
+            "transcritical_compressor_capacity_curve_name": ["BivariateFunctions"],
+        },
+    },
+    "Refrigeration:CompressorList": {
+        "name": True,
+        "fields": [],
+        "extension": "compressors",
+        "extensibles": ["refrigeration_compressor_name"],
+        "references": ["RefrigerationCompressorAndListNames"],
+        "object_lists": {
+            "refrigeration_compressor_name": ["RefrigerationCompressorNames"]
+        },
+    },
+    "Refrigeration:CompressorRack": {
+        "name": True,
+        "fields": [
+            "heat_rejection_location",
+            "design_compressor_rack_cop",
+            "compressor_rack_cop_function_of_temperature_curve_name",
+            "design_condenser_fan_power",
+            "condenser_fan_power_function_of_temperature_curve_name",
+            "condenser_type",
+            "water_cooled_condenser_inlet_node_name",
+            "water_cooled_condenser_outlet_node_name",
+            "water_cooled_loop_flow_type",
+            "water_cooled_condenser_outlet_temperature_schedule_name",
+            "water_cooled_condenser_design_flow_rate",
+            "water_cooled_condenser_maximum_flow_rate",
+            "water_cooled_condenser_maximum_water_outlet_temperature",
+            "water_cooled_condenser_minimum_water_inlet_temperature",
+            "evaporative_condenser_availability_schedule_name",
+            "evaporative_condenser_effectiveness",
+            "evaporative_condenser_air_flow_rate",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "design_evaporative_condenser_water_pump_power",
+            "evaporative_water_supply_tank_name",
+            "condenser_air_inlet_node_name",
+            "end_use_subcategory",
+            "refrigeration_case_name_or_walkin_name_or_caseandwalkinlist_name",
+            "heat_rejection_zone_name",
+        ],
+        "numeric": [
+            "design_compressor_rack_cop",
+            "design_condenser_fan_power",
+            "water_cooled_condenser_design_flow_rate",
+            "water_cooled_condenser_maximum_flow_rate",
+            "water_cooled_condenser_maximum_water_outlet_temperature",
+            "water_cooled_condenser_minimum_water_inlet_temperature",
+            "evaporative_condenser_effectiveness",
+            "evaporative_condenser_air_flow_rate",
+            "basin_heater_capacity",
+            "basin_heater_setpoint_temperature",
+            "design_evaporative_condenser_water_pump_power",
+        ],
+        "choices": {
+            "heat_rejection_location": ["Outdoors", "Zone"],
+            "condenser_type": ["AirCooled", "EvaporativelyCooled", "WaterCooled"],
+            "water_cooled_loop_flow_type": ["ConstantFlow", "VariableFlow"],
+            "evaporative_condenser_air_flow_rate": ["Autocalculate"],
+            "design_evaporative_condenser_water_pump_power": ["Autocalculate"],
+        },
+        "references": ["DesuperHeatingCoilSources", "validBranchEquipmentNames"],
+        "object_lists": {
+            "compressor_rack_cop_function_of_temperature_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "condenser_fan_power_function_of_temperature_curve_name": [
+                "UnivariateFunctions"
+            ],
+            "water_cooled_condenser_outlet_temperature_schedule_name": [
+                "ScheduleNames"
+            ],
+            "evaporative_condenser_availability_schedule_name": ["ScheduleNames"],
+            "refrigeration_case_name_or_walkin_name_or_caseandwalkinlist_name": [
+                "RefrigerationCaseAndWalkInAndListNames"
+            ],
+            "heat_rejection_zone_name": ["ZoneNames"],
+        },
+    },
+    "Refrigeration:Condenser:AirCooled": {
+        "name": True,
+        "fields": [
+            "rated_effective_total_heat_rejection_rate_curve_name",
+            "rated_subcooling_temperature_difference",
+            "condenser_fan_speed_control_type",
+            "rated_fan_power",
+            "minimum_fan_air_flow_ratio",
+            "air_inlet_node_name_or_zone_name",
+            "end_use_subcategory",
+            "condenser_refrigerant_operating_charge_inventory",
+            "condensate_receiver_refrigerant_inventory",
+            "condensate_piping_refrigerant_inventory",
+        ],
+        "numeric": [
+            "rated_subcooling_temperature_difference",
+            "rated_fan_power",
+            "minimum_fan_air_flow_ratio",
+            "condenser_refrigerant_operating_charge_inventory",
+            "condensate_receiver_refrigerant_inventory",
+            "condensate_piping_refrigerant_inventory",
+        ],
+        "choices": {
+            "condenser_fan_speed_control_type": [
+                "Fixed",
+                "FixedLinear",
+                "TwoSpeed",
+                "VariableSpeed",
+            ]
+        },
+        "references": [
+            "DesuperHeatingCoilSources",
+            "RefrigerationAllTypesCondenserNames",
+        ],
+        "object_lists": {
+            "rated_effective_total_heat_rejection_rate_curve_name": [
+                "UnivariateFunctions"
+            ]
+        },
+    },
+    "Refrigeration:System": {
+        "name": True,
+        "fields": [
+            "refrigerated_case_or_walkin_or_caseandwalkinlist_name",
+            "refrigeration_transfer_load_or_transferload_list_name",
+            "refrigeration_condenser_name",
+            "compressor_or_compressorlist_name",
+            "minimum_condensing_temperature",
+            "refrigeration_system_working_fluid_type",
+            "suction_temperature_control_type",
+            "mechanical_subcooler_name",
+            "liquid_suction_heat_exchanger_subcooler_name",
+            "sum_ua_suction_piping",
+            "suction_piping_zone_name",
+            "end_use_subcategory",
+            "number_of_compressor_stages",
+            "intercooler_type",
+            "shell_and_coil_intercooler_effectiveness",
+            "high_stage_compressor_or_compressorlist_name",
+        ],
+        "numeric": [
+            "minimum_condensing_temperature",
+            "sum_ua_suction_piping",
+            "number_of_compressor_stages",
+            "shell_and_coil_intercooler_effectiveness",
+        ],
+        "choices": {
+            "suction_temperature_control_type": [
+                "ConstantSuctionTemperature",
+                "FloatSuctionTemperature",
+            ],
+            "number_of_compressor_stages": [1, 2],
+            "intercooler_type": [
+                "Flash Intercooler",
+                "None",
+                "Shell-and-Coil Intercooler",
+            ],
+        },
+        "references": ["RefrigerationSystemNames"],
+        "object_lists": {
+            "refrigerated_case_or_walkin_or_caseandwalkinlist_name": [
+                "RefrigerationCaseAndWalkInAndListNames"
+            ],
+            "refrigeration_condenser_name": ["RefrigerationAllTypesCondenserNames"],
+            "compressor_or_compressorlist_name": [
+                "RefrigerationCompressorAndListNames"
+            ],
+            "suction_piping_zone_name": ["ZoneNames"],
+            "high_stage_compressor_or_compressorlist_name": [
+                "RefrigerationCompressorAndListNames"
+            ],
+        },
+    },
+    "RunPeriod": {
+        "name": True,
+        "fields": [
+            "begin_month",
+            "begin_day_of_month",
+            "begin_year",
+            "end_month",
+            "end_day_of_month",
+            "end_year",
+            "day_of_week_for_start_day",
+            "use_weather_file_holidays_and_special_days",
+            "use_weather_file_daylight_saving_period",
+            "apply_weekend_holiday_rule",
+            "use_weather_file_rain_indicators",
+            "use_weather_file_snow_indicators",
+            "treat_weather_as_actual",
+            "first_hour_interpolation_starting_values",
+        ],
+        "numeric": [
+            "begin_month",
+            "begin_day_of_month",
+            "begin_year",
+            "end_month",
+            "end_day_of_month",
+            "end_year",
+        ],
+        "choices": {
+            "day_of_week_for_start_day": [
+                "Friday",
+                "Monday",
+                "Saturday",
+                "Sunday",
+                "Thursday",
+                "Tuesday",
+                "Wednesday",
+            ],
+            "use_weather_file_holidays_and_special_days": ["No", "Yes"],
+            "use_weather_file_daylight_saving_period": ["No", "Yes"],
+            "apply_weekend_holiday_rule": ["No", "Yes"],
+            "use_weather_file_rain_indicators": ["No", "Yes"],
+            "use_weather_file_snow_indicators": ["No", "Yes"],
+            "treat_weather_as_actual": ["No", "Yes"],
+            "first_hour_interpolation_starting_values": ["Hour1", "Hour24"],
+        },
+        "references": ["RunPeriodsAndDesignDays"],
+    },
+    "RunPeriodControl:DaylightSavingTime": {
+        "name": False,
+        "fields": ["start_date", "end_date"],
+    },
+    "RunPeriodControl:SpecialDays": {
+        "name": True,
+        "fields": ["start_date", "duration", "special_day_type"],
+        "numeric": ["duration"],
+        "choices": {
+            "special_day_type": [
+                "CustomDay1",
+                "CustomDay2",
+                "Holiday",
+                "SummerDesignDay",
+                "WinterDesignDay",
+            ]
+        },
+    },
+    "Schedule:Compact": {
+        "name": True,
+        "fields": ["schedule_type_limits_name"],
+        "extension": "data",
+        "extensibles": ["field"],
+        "numeric": ["field"],
+        "references": ["ScheduleNames"],
+        "object_lists": {"schedule_type_limits_name": ["ScheduleTypeLimitsNames"]},
+    },
+    "Schedule:Constant": {
+        "name": True,
+        "fields": ["schedule_type_limits_name", "hourly_value"],
+        "numeric": ["hourly_value"],
+        "references": ["ScheduleNames"],
+        "object_lists": {"schedule_type_limits_name": ["ScheduleTypeLimitsNames"]},
+    },
+    "Schedule:Day:Hourly": {
+        "name": True,
+        "fields": [
+            "schedule_type_limits_name",
+            "hour_1",
+            "hour_2",
+            "hour_3",
+            "hour_4",
+            "hour_5",
+            "hour_6",
+            "hour_7",
+            "hour_8",
+            "hour_9",
+            "hour_10",
+            "hour_11",
+            "hour_12",
+            "hour_13",
+            "hour_14",
+            "hour_15",
+            "hour_16",
+            "hour_17",
+            "hour_18",
+            "hour_19",
+            "hour_20",
+            "hour_21",
+            "hour_22",
+            "hour_23",
+            "hour_24",
+        ],
+        "numeric": [
+            "hour_1",
+            "hour_2",
+            "hour_3",
+            "hour_4",
+            "hour_5",
+            "hour_6",
+            "hour_7",
+            "hour_8",
+            "hour_9",
+            "hour_10",
+            "hour_11",
+            "hour_12",
+            "hour_13",
+            "hour_14",
+            "hour_15",
+            "hour_16",
+            "hour_17",
+            "hour_18",
+            "hour_19",
+            "hour_20",
+            "hour_21",
+            "hour_22",
+            "hour_23",
+            "hour_24",
+        ],
+        "references": ["DayScheduleNames"],
+        "object_lists": {"schedule_type_limits_name": ["ScheduleTypeLimitsNames"]},
+    },
+    "Schedule:Day:Interval": {
+        "name": True,
+        "fields": ["schedule_type_limits_name", "interpolate_to_timestep"],
+        "extension": "data",
+        "extensibles": ["time", "value_until_time"],
+        "numeric": ["value_until_time"],
+        "choices": {"interpolate_to_timestep": ["Average", "Linear", "No"]},
+        "references": ["DayScheduleNames"],
+        "object_lists": {"schedule_type_limits_name": ["ScheduleTypeLimitsNames"]},
+    },
+    "Schedule:Week:Daily": {
+        "name": True,
+        "fields": [
+            "sunday_schedule_day_name",
+            "monday_schedule_day_name",
+            "tuesday_schedule_day_name",
+            "wednesday_schedule_day_name",
+            "thursday_schedule_day_name",
+            "friday_schedule_day_name",
+            "saturday_schedule_day_name",
+            "holiday_schedule_day_name",
+            "summerdesignday_schedule_day_name",
+            "winterdesignday_schedule_day_name",
+            "customday1_schedule_day_name",
+            "customday2_schedule_day_name",
+        ],
+        "references": ["WeekScheduleNames"],
+        "object_lists": {
+            "sunday_schedule_day_name": ["DayScheduleNames"],
+            "monday_schedule_day_name": ["DayScheduleNames"],
+            "tuesday_schedule_day_name": ["DayScheduleNames"],
+            "wednesday_schedule_day_name": ["DayScheduleNames"],
+            "thursday_schedule_day_name": ["DayScheduleNames"],
+            "friday_schedule_day_name": ["DayScheduleNames"],
+            "saturday_schedule_day_name": ["DayScheduleNames"],
+            "holiday_schedule_day_name": ["DayScheduleNames"],
+            "summerdesignday_schedule_day_name": ["DayScheduleNames"],
+            "winterdesignday_schedule_day_name": ["DayScheduleNames"],
+            "customday1_schedule_day_name": ["DayScheduleNames"],
+            "customday2_schedule_day_name": ["DayScheduleNames"],
+        },
+    },
+    "Schedule:Year": {
+        "name": True,
+        "fields": ["schedule_type_limits_name"],
+        "extension": "schedule_weeks",
+        "extensibles": [
+            "schedule_week_name",
+            "start_month",
+            "start_day",
+            "end_month",
+            "end_day",
+        ],
+        "numeric": ["start_month", "start_day", "end_month", "end_day"],
+        "references": ["ScheduleNames"],
+        "object_lists": {
+            "schedule_type_limits_name": ["ScheduleTypeLimitsNames"],
+            "schedule_week_name": ["WeekScheduleNames"],
+        },
+    },
+    "ScheduleTypeLimits": {
+        "name": True,
+        "fields": [
+            "lower_limit_value",
+            "upper_limit_value",
+            "numeric_type",
+            "unit_type",
+        ],
+        "numeric": ["lower_limit_value", "upper_limit_value"],
+        "choices": {
+            "numeric_type": ["Continuous", "Discrete"],
+            "unit_type": [
+                "ActivityLevel",
+                "Angle",
+                "Availability",
+                "Capacity",
+                "Control",
+                "ConvectionCoefficient",
+                "DeltaTemperature",
+                "Dimensionless",
+                "Mode",
+                "Percent",
+                "Power",
+                "PrecipitationRate",
+                "Temperature",
+                "Velocity",
+            ],
+        },
+        "references": ["ScheduleTypeLimitsNames"],
+    },
+    "SetpointManager:FollowOutdoorAirTemperature": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "reference_temperature_type",
+            "offset_temperature_difference",
+            "maximum_setpoint_temperature",
+            "minimum_setpoint_temperature",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "numeric": [
+            "offset_temperature_difference",
+            "maximum_setpoint_temperature",
+            "minimum_setpoint_temperature",
+        ],
+        "choices": {
+            "control_variable": [
+                "MaximumTemperature",
+                "MinimumTemperature",
+                "Temperature",
+            ],
+            "reference_temperature_type": ["OutdoorAirDryBulb", "OutdoorAirWetBulb"],
+        },
+    },
+    "SetpointManager:MixedAir": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "reference_setpoint_node_name",
+            "fan_inlet_node_name",
+            "fan_outlet_node_name",
+            "setpoint_node_or_nodelist_name",
+            "cooling_coil_inlet_node_name",
+            "cooling_coil_outlet_node_name",
+            "minimum_temperature_at_cooling_coil_outlet_node",
+        ],
+        "numeric": ["minimum_temperature_at_cooling_coil_outlet_node"],
+        "choices": {"control_variable": ["Temperature"]},
+    },
+    "SetpointManager:MultiZone:Humidity:Maximum": {
+        "name": True,
+        "fields": [
+            "hvac_air_loop_name",
+            "minimum_setpoint_humidity_ratio",
+            "maximum_setpoint_humidity_ratio",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "numeric": [
+            "minimum_setpoint_humidity_ratio",
+            "maximum_setpoint_humidity_ratio",
+        ],
+        "object_lists": {"hvac_air_loop_name": ["AirPrimaryLoops"]},
+    },
+    "SetpointManager:MultiZone:Humidity:Minimum": {
+        "name": True,
+        "fields": [
+            "hvac_air_loop_name",
+            "minimum_setpoint_humidity_ratio",
+            "maximum_setpoint_humidity_ratio",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "numeric": [
+            "minimum_setpoint_humidity_ratio",
+            "maximum_setpoint_humidity_ratio",
+        ],
+        "object_lists": {"hvac_air_loop_name": ["AirPrimaryLoops"]},
+    },
+    "SetpointManager:OutdoorAirPretreat": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "minimum_setpoint_temperature",
+            "maximum_setpoint_temperature",
+            "minimum_setpoint_humidity_ratio",
+            "maximum_setpoint_humidity_ratio",
+            "reference_setpoint_node_name",
+            "mixed_air_stream_node_name",
+            "outdoor_air_stream_node_name",
+            "return_air_stream_node_name",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "numeric": [
+            "minimum_setpoint_temperature",
+            "maximum_setpoint_temperature",
+            "minimum_setpoint_humidity_ratio",
+            "maximum_setpoint_humidity_ratio",
+        ],
+        "choices": {
+            "control_variable": [
+                "HumidityRatio",
+                "MaximumHumidityRatio",
+                "MinimumHumidityRatio",
+                "Temperature",
+            ]
+        },
+    },
+    "SetpointManager:OutdoorAirReset": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "setpoint_at_outdoor_low_temperature",
+            "outdoor_low_temperature",
+            "setpoint_at_outdoor_high_temperature",
+            "outdoor_high_temperature",
+            "setpoint_node_or_nodelist_name",
+            "schedule_name",
+            "setpoint_at_outdoor_low_temperature_2",
+            "outdoor_low_temperature_2",
+            "setpoint_at_outdoor_high_temperature_2",
+            "outdoor_high_temperature_2",
+        ],
+        "numeric": [
+            "setpoint_at_outdoor_low_temperature",
+            "outdoor_low_temperature",
+            "setpoint_at_outdoor_high_temperature",
+            "outdoor_high_temperature",
+            "setpoint_at_outdoor_low_temperature_2",
+            "outdoor_low_temperature_2",
+            "setpoint_at_outdoor_high_temperature_2",
+            "outdoor_high_temperature_2",
+        ],
+        "choices": {
+            "control_variable": [
+                "MaximumTemperature",
+                "MinimumTemperature",
+                "Temperature",
+            ]
+        },
+        "object_lists": {"schedule_name": ["ScheduleNames"]},
+    },
+    "SetpointManager:ReturnTemperature:ChilledWater": {
+        "name": True,
+        "fields": [
+            "plant_loop_supply_outlet_node",
+            "plant_loop_supply_inlet_node",
+            "minimum_supply_temperature_setpoint",
+            "maximum_supply_temperature_setpoint",
+            "return_temperature_setpoint_input_type",
+            "return_temperature_setpoint_constant_value",
+            "return_temperature_setpoint_schedule_name",
+        ],
+        "numeric": [
+            "minimum_supply_temperature_setpoint",
+            "maximum_supply_temperature_setpoint",
+            "return_temperature_setpoint_constant_value",
+        ],
+        "choices": {
+            "return_temperature_setpoint_input_type": [
+                "Constant",
+                "ReturnTemperatureSetpoint",
+                "Scheduled",
+            ]
+        },
+        "object_lists": {
+            "return_temperature_setpoint_schedule_name": ["ScheduleNames"]
+        },
+    },
+    "SetpointManager:ReturnTemperature:HotWater": {
+        "name": True,
+        "fields": [
+            "plant_loop_supply_outlet_node",
+            "plant_loop_supply_inlet_node",
+            "minimum_supply_temperature_setpoint",
+            "maximum_supply_temperature_setpoint",
+            "return_temperature_setpoint_input_type",
+            "return_temperature_setpoint_constant_value",
+            "return_temperature_setpoint_schedule_name",
+        ],
+        "numeric": [
+            "minimum_supply_temperature_setpoint",
+            "maximum_supply_temperature_setpoint",
+            "return_temperature_setpoint_constant_value",
+        ],
+        "choices": {
+            "return_temperature_setpoint_input_type": [
+                "Constant",
+                "ReturnTemperatureSetpoint",
+                "Scheduled",
+            ]
+        },
+        "object_lists": {
+            "return_temperature_setpoint_schedule_name": ["ScheduleNames"]
+        },
+    },
+    "SetpointManager:Scheduled": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "schedule_name",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "choices": {
+            "control_variable": [
+                "HumidityRatio",
+                "MassFlowRate",
+                "MaximumHumidityRatio",
+                "MaximumMassFlowRate",
+                "MaximumTemperature",
+                "MinimumHumidityRatio",
+                "MinimumMassFlowRate",
+                "MinimumTemperature",
+                "Temperature",
+            ]
+        },
+        "object_lists": {"schedule_name": ["ScheduleNames"]},
+    },
+    "SetpointManager:Scheduled:DualSetpoint": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "high_setpoint_schedule_name",
+            "low_setpoint_schedule_name",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "choices": {"control_variable": ["Temperature"]},
+        "object_lists": {
+            "high_setpoint_schedule_name": ["ScheduleNames"],
+            "low_setpoint_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "SetpointManager:SingleZone:Cooling": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "minimum_supply_air_temperature",
+            "maximum_supply_air_temperature",
+            "control_zone_name",
+            "zone_node_name",
+            "zone_inlet_node_name",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "numeric": ["minimum_supply_air_temperature", "maximum_supply_air_temperature"],
+        "choices": {"control_variable": ["Temperature"]},
+        "object_lists": {"control_zone_name": ["ZoneNames"]},
+    },
+    "SetpointManager:SingleZone:Heating": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "minimum_supply_air_temperature",
+            "maximum_supply_air_temperature",
+            "control_zone_name",
+            "zone_node_name",
+            "zone_inlet_node_name",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "numeric": ["minimum_supply_air_temperature", "maximum_supply_air_temperature"],
+        "choices": {"control_variable": ["Temperature"]},
+        "object_lists": {"control_zone_name": ["ZoneNames"]},
+    },
+    "SetpointManager:SingleZone:Humidity:Maximum": {
+        "name": True,
+        "fields": ["setpoint_node_or_nodelist_name", "control_zone_air_node_name"],
+    },
+    "SetpointManager:SingleZone:Humidity:Minimum": {
+        "name": True,
+        "fields": ["setpoint_node_or_nodelist_name", "control_zone_air_node_name"],
+    },
+    "SetpointManager:SingleZone:Reheat": {
+        "name": True,
+        "fields": [
+            "control_variable",
+            "minimum_supply_air_temperature",
+            "maximum_supply_air_temperature",
+            "control_zone_name",
+            "zone_node_name",
+            "zone_inlet_node_name",
+            "setpoint_node_or_nodelist_name",
+        ],
+        "numeric": ["minimum_supply_air_temperature", "maximum_supply_air_temperature"],
+        "choices": {"control_variable": ["Temperature"]},
+        "object_lists": {"control_zone_name": ["ZoneNames"]},
+    },
+    "Shading:Building:Detailed": {
+        "name": True,
+        "fields": ["transmittance_schedule_name", "number_of_vertices"],
+        "extension": "vertices",
+        "extensibles": [
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "numeric": [
+            "number_of_vertices",
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "choices": {"number_of_vertices": ["Autocalculate"]},
+        "references": ["AllShadingAndHTSurfNames", "AllShadingSurfNames"],
+        "object_lists": {"transmittance_schedule_name": ["ScheduleNames"]},
+    },
+    "Shading:Site:Detailed": {
+        "name": True,
+        "fields": ["transmittance_schedule_name", "number_of_vertices"],
+        "extension": "vertices",
+        "extensibles": [
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "numeric": [
+            "number_of_vertices",
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "choices": {"number_of_vertices": ["Autocalculate"]},
+        "references": ["AllShadingAndHTSurfNames", "AllShadingSurfNames"],
+        "object_lists": {"transmittance_schedule_name": ["ScheduleNames"]},
+    },
+    "Shading:Zone:Detailed": {
+        "name": True,
+        "fields": [
+            "base_surface_name",
+            "transmittance_schedule_name",
+            "number_of_vertices",
+        ],
+        "extension": "vertices",
+        "extensibles": [
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "numeric": [
+            "number_of_vertices",
+            "vertex_x_coordinate",
+            "vertex_y_coordinate",
+            "vertex_z_coordinate",
+        ],
+        "choices": {"number_of_vertices": ["Autocalculate"]},
+        "references": [
+            "AllShadingAndHTSurfNames",
+            "AllShadingSurfNames",
+            "AttachedShadingSurfNames",
+        ],
+        "object_lists": {
+            "base_surface_name": ["SurfaceNames"],
+            "transmittance_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ShadingProperty:Reflectance": {
+        "name": False,
+        "fields": [
+            "shading_surface_name",
+            "diffuse_solar_reflectance_of_unglazed_part_of_shading_surface",
+            "diffuse_visible_reflectance_of_unglazed_part_of_shading_surface",
+            "fraction_of_shading_surface_that_is_glazed",
+            "glazing_construction_name",
+        ],
+        "numeric": [
+            "diffuse_solar_reflectance_of_unglazed_part_of_shading_surface",
+            "diffuse_visible_reflectance_of_unglazed_part_of_shading_surface",
+            "fraction_of_shading_surface_that_is_glazed",
+        ],
+        "object_lists": {"shading_surface_name": ["AllShadingSurfNames"]},
+    },
+    "ShadowCalculation": {
+        "name": False,
+        "fields": [
+            "shading_calculation_method",
+            "shading_calculation_update_frequency_method",
+            "shading_calculation_update_frequency",
+            "maximum_figures_in_shadow_overlap_calculations",
+            "polygon_clipping_algorithm",
+            "pixel_counting_resolution",
+            "sky_diffuse_modeling_algorithm",
+            "output_external_shading_calculation_results",
+            "disable_self_shading_within_shading_zone_groups",
+            "disable_self_shading_from_shading_zone_groups_to_other_zones",
+        ],
+        "extension": "shading_zone_groups",
+        "extensibles": ["shading_zone_group_zonelist_name"],
+        "numeric": [
+            "shading_calculation_update_frequency",
+            "maximum_figures_in_shadow_overlap_calculations",
+            "pixel_counting_resolution",
+        ],
+        "choices": {
+            "shading_calculation_method": [
+                "Imported",
+                "PixelCounting",
+                "PolygonClipping",
+                "Scheduled",
+            ],
+            "shading_calculation_update_frequency_method": ["Periodic", "Timestep"],
+            "polygon_clipping_algorithm": [
+                "ConvexWeilerAtherton",
+                "SlaterBarskyandSutherlandHodgman",
+                "SutherlandHodgman",
+            ],
+            "sky_diffuse_modeling_algorithm": [
+                "DetailedSkyDiffuseModeling",
+                "SimpleSkyDiffuseModeling",
+            ],
+            "output_external_shading_calculation_results": ["No", "Yes"],
+            "disable_self_shading_within_shading_zone_groups": ["No", "Yes"],
+            "disable_self_shading_from_shading_zone_groups_to_other_zones": [
+                "No",
+                "Yes",
+            ],
+        },
+        "object_lists": {"shading_zone_group_zonelist_name": ["ZoneListNames"]},
+    },
+    "SimulationControl": {
+        "name": False,
+        "fields": [
+            "do_zone_sizing_calculation",
+            "do_system_sizing_calculation",
+            "do_plant_sizing_calculation",
+            "run_simulation_for_sizing_periods",
+            "run_simulation_for_weather_file_run_periods",
+            "do_hvac_sizing_simulation_for_sizing_periods",
+            "maximum_number_of_hvac_sizing_simulation_passes",
+        ],
+        "numeric": ["maximum_number_of_hvac_sizing_simulation_passes"],
+        "choices": {
+            "do_zone_sizing_calculation": ["No", "Yes"],
+            "do_system_sizing_calculation": ["No", "Yes"],
+            "do_plant_sizing_calculation": ["No", "Yes"],
+            "run_simulation_for_sizing_periods": ["No", "Yes"],
+            "run_simulation_for_weather_file_run_periods": ["No", "Yes"],
+            "do_hvac_sizing_simulation_for_sizing_periods": ["No", "Yes"],
+        },
+    },
+    "Site:GroundTemperature:BuildingSurface": {
+        "name": False,
+        "fields": [
+            "january_ground_temperature",
+            "february_ground_temperature",
+            "march_ground_temperature",
+            "april_ground_temperature",
+            "may_ground_temperature",
+            "june_ground_temperature",
+            "july_ground_temperature",
+            "august_ground_temperature",
+            "september_ground_temperature",
+            "october_ground_temperature",
+            "november_ground_temperature",
+            "december_ground_temperature",
+        ],
+        "numeric": [
+            "january_ground_temperature",
+            "february_ground_temperature",
+            "march_ground_temperature",
+            "april_ground_temperature",
+            "may_ground_temperature",
+            "june_ground_temperature",
+            "july_ground_temperature",
+            "august_ground_temperature",
+            "september_ground_temperature",
+            "october_ground_temperature",
+            "november_ground_temperature",
+            "december_ground_temperature",
+        ],
+    },
+    "Site:GroundTemperature:FCfactorMethod": {
+        "name": False,
+        "fields": [
+            "january_ground_temperature",
+            "february_ground_temperature",
+            "march_ground_temperature",
+            "april_ground_temperature",
+            "may_ground_temperature",
+            "june_ground_temperature",
+            "july_ground_temperature",
+            "august_ground_temperature",
+            "september_ground_temperature",
+            "october_ground_temperature",
+            "november_ground_temperature",
+            "december_ground_temperature",
+        ],
+        "numeric": [
+            "january_ground_temperature",
+            "february_ground_temperature",
+            "march_ground_temperature",
+            "april_ground_temperature",
+            "may_ground_temperature",
+            "june_ground_temperature",
+            "july_ground_temperature",
+            "august_ground_temperature",
+            "september_ground_temperature",
+            "october_ground_temperature",
+            "november_ground_temperature",
+            "december_ground_temperature",
+        ],
+    },
+    "Site:Location": {
+        "name": True,
+        "fields": [
+            "latitude",
+            "longitude",
+            "time_zone",
+            "elevation",
+            "keep_site_location_information",
+        ],
+        "numeric": ["latitude", "longitude", "time_zone", "elevation"],
+        "choices": {"keep_site_location_information": ["No", "Yes"]},
+    },
+    "Site:WaterMainsTemperature": {
+        "name": False,
+        "fields": [
+            "calculation_method",
+            "temperature_schedule_name",
+            "annual_average_outdoor_air_temperature",
+            "maximum_difference_in_monthly_average_outdoor_air_temperatures",
+        ],
+        "numeric": [
+            "annual_average_outdoor_air_temperature",
+            "maximum_difference_in_monthly_average_outdoor_air_temperatures",
+        ],
+        "choices": {
+            "calculation_method": [
+                "Correlation",
+                "CorrelationFromWeatherFile",
+                "Schedule",
+            ]
+        },
+        "object_lists": {"temperature_schedule_name": ["ScheduleNames"]},
+    },
+    "Sizing:Parameters": {
+        "name": False,
+        "fields": [
+            "heating_sizing_factor",
+            "cooling_sizing_factor",
+            "timesteps_in_averaging_window",
+        ],
+        "numeric": [
+            "heating_sizing_factor",
+            "cooling_sizing_factor",
+            "timesteps_in_averaging_window",
+        ],
+    },
+    "Sizing:Plant": {
+        "name": False,
+        "fields": [
+            "plant_or_condenser_loop_name",
+            "loop_type",
+            "design_loop_exit_temperature",
+            "loop_design_temperature_difference",
+            "sizing_option",
+            "zone_timesteps_in_averaging_window",
+            "coincident_sizing_factor_mode",
+        ],
+        "numeric": [
+            "design_loop_exit_temperature",
+            "loop_design_temperature_difference",
+            "zone_timesteps_in_averaging_window",
+        ],
+        "choices": {
+            "loop_type": ["Condenser", "Cooling", "Heating", "Steam"],
+            "sizing_option": ["Coincident", "NonCoincident"],
+            "coincident_sizing_factor_mode": [
+                "GlobalCoolingSizingFactor",
+                "GlobalHeatingSizingFactor",
+                "LoopComponentSizingFactor",
+                "None",
+            ],
+        },
+        "object_lists": {"plant_or_condenser_loop_name": ["PlantLoops"]},
+    },
+    "Sizing:System": {
+        "name": False,
+        "fields": [
+            "airloop_name",
+            "type_of_load_to_size_on",
+            "design_outdoor_air_flow_rate",
+            "central_heating_maximum_system_air_flow_ratio",
+            "preheat_design_temperature",
+            "preheat_design_humidity_ratio",
+            "precool_design_temperature",
+            "precool_design_humidity_ratio",
+            "central_cooling_design_supply_air_temperature",
+            "central_heating_design_supply_air_temperature",
+            "type_of_zone_sum_to_use",
+            "100_outdoor_air_in_cooling",
+            "100_outdoor_air_in_heating",
+            "central_cooling_design_supply_air_humidity_ratio",
+            "central_heating_design_supply_air_humidity_ratio",
+            "cooling_supply_air_flow_rate_method",
+            "cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_floor_area",
+            "cooling_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_unit_cooling_capacity",
+            "heating_supply_air_flow_rate_method",
+            "heating_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_floor_area",
+            "heating_fraction_of_autosized_heating_supply_air_flow_rate",
+            "heating_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_unit_heating_capacity",
+            "system_outdoor_air_method",
+            "zone_maximum_outdoor_air_fraction",
+            "cooling_design_capacity_method",
+            "cooling_design_capacity",
+            "cooling_design_capacity_per_floor_area",
+            "fraction_of_autosized_cooling_design_capacity",
+            "heating_design_capacity_method",
+            "heating_design_capacity",
+            "heating_design_capacity_per_floor_area",
+            "fraction_of_autosized_heating_design_capacity",
+            "central_cooling_capacity_control_method",
+            "occupant_diversity",
+        ],
+        "numeric": [
+            "design_outdoor_air_flow_rate",
+            "central_heating_maximum_system_air_flow_ratio",
+            "preheat_design_temperature",
+            "preheat_design_humidity_ratio",
+            "precool_design_temperature",
+            "precool_design_humidity_ratio",
+            "central_cooling_design_supply_air_temperature",
+            "central_heating_design_supply_air_temperature",
+            "central_cooling_design_supply_air_humidity_ratio",
+            "central_heating_design_supply_air_humidity_ratio",
+            "cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_floor_area",
+            "cooling_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "cooling_supply_air_flow_rate_per_unit_cooling_capacity",
+            "heating_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_floor_area",
+            "heating_fraction_of_autosized_heating_supply_air_flow_rate",
+            "heating_fraction_of_autosized_cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate_per_unit_heating_capacity",
+            "zone_maximum_outdoor_air_fraction",
+            "cooling_design_capacity",
+            "cooling_design_capacity_per_floor_area",
+            "fraction_of_autosized_cooling_design_capacity",
+            "heating_design_capacity",
+            "heating_design_capacity_per_floor_area",
+            "fraction_of_autosized_heating_design_capacity",
+            "occupant_diversity",
+        ],
+        "choices": {
+            "type_of_load_to_size_on": [
+                "Latent",
+                "Sensible",
+                "Total",
+                "VentilationRequirement",
+            ],
+            "design_outdoor_air_flow_rate": ["Autosize"],
+            "central_heating_maximum_system_air_flow_ratio": ["Autosize"],
+            "type_of_zone_sum_to_use": ["Coincident", "NonCoincident"],
+            "100_outdoor_air_in_cooling": ["No", "Yes"],
+            "100_outdoor_air_in_heating": ["No", "Yes"],
+            "cooling_supply_air_flow_rate_method": [
+                "DesignDay",
+                "Flow/System",
+                "FlowPerCoolingCapacity",
+                "FlowPerFloorArea",
+                "FractionOfAutosizedCoolingAirflow",
+            ],
+            "heating_supply_air_flow_rate_method": [
+                "DesignDay",
+                "Flow/System",
+                "FlowPerFloorArea",
+                "FlowPerHeatingCapacity",
+                "FractionOfAutosizedCoolingAirflow",
+                "FractionOfAutosizedHeatingAirflow",
+            ],
+            "system_outdoor_air_method": [
+                "Standard62.1SimplifiedProcedure",
+                "Standard62.1VentilationRateProcedure",
+                "ZoneSum",
+            ],
+            "cooling_design_capacity_method": [
+                "CapacityPerFloorArea",
+                "CoolingDesignCapacity",
+                "FractionOfAutosizedCoolingCapacity",
+                "None",
+            ],
+            "cooling_design_capacity": ["Autosize"],
+            "heating_design_capacity_method": [
+                "CapacityPerFloorArea",
+                "FractionOfAutosizedHeatingCapacity",
+                "HeatingDesignCapacity",
+                "None",
+            ],
+            "heating_design_capacity": ["Autosize"],
+            "central_cooling_capacity_control_method": ["Bypass", "OnOff", "VAV", "VT"],
+            "occupant_diversity": ["Autosize"],
+        },
+        "object_lists": {"airloop_name": ["AirPrimaryLoops"]},
+    },
+    "Sizing:Zone": {
+        "name": False,
+        "fields": [
+            "zone_or_zonelist_name",
+            "zone_cooling_design_supply_air_temperature_input_method",
+            "zone_cooling_design_supply_air_temperature",
+            "zone_cooling_design_supply_air_temperature_difference",
+            "zone_heating_design_supply_air_temperature_input_method",
+            "zone_heating_design_supply_air_temperature",
+            "zone_heating_design_supply_air_temperature_difference",
+            "zone_cooling_design_supply_air_humidity_ratio",
+            "zone_heating_design_supply_air_humidity_ratio",
+            "design_specification_outdoor_air_object_name",
+            "zone_heating_sizing_factor",
+            "zone_cooling_sizing_factor",
+            "cooling_design_air_flow_method",
+            "cooling_design_air_flow_rate",
+            "cooling_minimum_air_flow_per_zone_floor_area",
+            "cooling_minimum_air_flow",
+            "cooling_minimum_air_flow_fraction",
+            "heating_design_air_flow_method",
+            "heating_design_air_flow_rate",
+            "heating_maximum_air_flow_per_zone_floor_area",
+            "heating_maximum_air_flow",
+            "heating_maximum_air_flow_fraction",
+            "design_specification_zone_air_distribution_object_name",
+            "account_for_dedicated_outdoor_air_system",
+            "dedicated_outdoor_air_system_control_strategy",
+            "dedicated_outdoor_air_low_setpoint_temperature_for_design",
+            "dedicated_outdoor_air_high_setpoint_temperature_for_design",
+            "zone_load_sizing_method",
+            "zone_latent_cooling_design_supply_air_humidity_ratio_input_method",
+            "zone_dehumidification_design_supply_air_humidity_ratio",
+            "zone_cooling_design_supply_air_humidity_ratio_difference",
+            "zone_latent_heating_design_supply_air_humidity_ratio_input_method",
+            "zone_humidification_design_supply_air_humidity_ratio",
+            "zone_humidification_design_supply_air_humidity_ratio_difference",
+            "zone_humidistat_dehumidification_set_point_schedule_name",
+            "zone_humidistat_humidification_set_point_schedule_name",
+            "type_of_space_sum_to_use",
+        ],
+        "numeric": [
+            "zone_cooling_design_supply_air_temperature",
+            "zone_cooling_design_supply_air_temperature_difference",
+            "zone_heating_design_supply_air_temperature",
+            "zone_heating_design_supply_air_temperature_difference",
+            "zone_cooling_design_supply_air_humidity_ratio",
+            "zone_heating_design_supply_air_humidity_ratio",
+            "zone_heating_sizing_factor",
+            "zone_cooling_sizing_factor",
+            "cooling_design_air_flow_rate",
+            "cooling_minimum_air_flow_per_zone_floor_area",
+            "cooling_minimum_air_flow",
+            "cooling_minimum_air_flow_fraction",
+            "heating_design_air_flow_rate",
+            "heating_maximum_air_flow_per_zone_floor_area",
+            "heating_maximum_air_flow",
+            "heating_maximum_air_flow_fraction",
+            "dedicated_outdoor_air_low_setpoint_temperature_for_design",
+            "dedicated_outdoor_air_high_setpoint_temperature_for_design",
+            "zone_dehumidification_design_supply_air_humidity_ratio",
+            "zone_cooling_design_supply_air_humidity_ratio_difference",
+            "zone_humidification_design_supply_air_humidity_ratio",
+            "zone_humidification_design_supply_air_humidity_ratio_difference",
+        ],
+        "choices": {
+            "zone_cooling_design_supply_air_temperature_input_method": [
+                "SupplyAirTemperature",
+                "TemperatureDifference",
+            ],
+            "zone_heating_design_supply_air_temperature_input_method": [
+                "SupplyAirTemperature",
+                "TemperatureDifference",
+            ],
+            "cooling_design_air_flow_method": [
+                "DesignDay",
+                "DesignDayWithLimit",
+                "Flow/Zone",
+            ],
+            "heating_design_air_flow_method": [
+                "DesignDay",
+                "DesignDayWithLimit",
+                "Flow/Zone",
+            ],
+            "account_for_dedicated_outdoor_air_system": ["No", "Yes"],
+            "dedicated_outdoor_air_system_control_strategy": [
+                "ColdSupplyAir",
+                "NeutralDehumidifiedSupplyAir",
+                "NeutralSupplyAir",
+            ],
+            "dedicated_outdoor_air_low_setpoint_temperature_for_design": ["Autosize"],
+            "dedicated_outdoor_air_high_setpoint_temperature_for_design": ["Autosize"],
+            "zone_load_sizing_method": [
+                "Latent Load",
+                "Sensible And Latent Load",
+                "Sensible Load",
+                "Sensible Load Only No Latent Load",
+            ],
+            "zone_latent_cooling_design_supply_air_humidity_ratio_input_method": [
+                "HumidityRatioDifference",
+                "SupplyAirHumidityRatio",
+            ],
+            "zone_latent_heating_design_supply_air_humidity_ratio_input_method": [
+                "HumidityRatioDifference",
+                "SupplyAirHumidityRatio",
+            ],
+            "type_of_space_sum_to_use": ["Coincident", "NonCoincident"],
+        },
+        "object_lists": {
+            "zone_or_zonelist_name": ["ZoneAndZoneListNames"],
+            "design_specification_outdoor_air_object_name": [
+                "DesignSpecificationOutdoorAirNames"
+            ],
+            "design_specification_zone_air_distribution_object_name": [
+                "DesignSpecificationZoneAirDistributionNames"
+            ],
+        },
+    },
+    "SizingPeriod:DesignDay": {
+        "name": True,
+        "fields": [
+            "month",
+            "day_of_month",
+            "day_type",
+            "maximum_dry_bulb_temperature",
+            "daily_dry_bulb_temperature_range",
+            "dry_bulb_temperature_range_modifier_type",
+            "dry_bulb_temperature_range_modifier_day_schedule_name",
+            "humidity_condition_type",
+            "wetbulb_or_dewpoint_at_maximum_dry_bulb",
+            "humidity_condition_day_schedule_name",
+            "humidity_ratio_at_maximum_dry_bulb",
+            "enthalpy_at_maximum_dry_bulb",
+            "daily_wet_bulb_temperature_range",
+            "barometric_pressure",
+            "wind_speed",
+            "wind_direction",
+            "rain_indicator",
+            "snow_indicator",
+            "daylight_saving_time_indicator",
+            "solar_model_indicator",
+            "beam_solar_day_schedule_name",
+            "diffuse_solar_day_schedule_name",
+            "ashrae_clear_sky_optical_depth_for_beam_irradiance_taub_",
+            "ashrae_clear_sky_optical_depth_for_diffuse_irradiance_taud_",
+            "sky_clearness",
+            "maximum_number_warmup_days",
+            "begin_environment_reset_mode",
+        ],
+        "numeric": [
+            "month",
+            "day_of_month",
+            "maximum_dry_bulb_temperature",
+            "daily_dry_bulb_temperature_range",
+            "wetbulb_or_dewpoint_at_maximum_dry_bulb",
+            "humidity_ratio_at_maximum_dry_bulb",
+            "enthalpy_at_maximum_dry_bulb",
+            "daily_wet_bulb_temperature_range",
+            "barometric_pressure",
+            "wind_speed",
+            "wind_direction",
+            "ashrae_clear_sky_optical_depth_for_beam_irradiance_taub_",
+            "ashrae_clear_sky_optical_depth_for_diffuse_irradiance_taud_",
+            "sky_clearness",
+            "maximum_number_warmup_days",
+        ],
+        "choices": {
+            "day_type": [
+                "CustomDay1",
+                "CustomDay2",
+                "Friday",
+                "Holiday",
+                "Monday",
+                "Saturday",
+                "SummerDesignDay",
+                "Sunday",
+                "Thursday",
+                "Tuesday",
+                "Wednesday",
+                "WinterDesignDay",
+            ],
+            "dry_bulb_temperature_range_modifier_type": [
+                "DefaultMultipliers",
+                "DifferenceSchedule",
+                "MultiplierSchedule",
+                "TemperatureProfileSchedule",
+            ],
+            "humidity_condition_type": [
+                "DewPoint",
+                "Enthalpy",
+                "HumidityRatio",
+                "RelativeHumiditySchedule",
+                "WetBulb",
+                "WetBulbProfileDefaultMultipliers",
+                "WetBulbProfileDifferenceSchedule",
+                "WetBulbProfileMultiplierSchedule",
+            ],
+            "rain_indicator": ["No", "Yes"],
+            "snow_indicator": ["No", "Yes"],
+            "daylight_saving_time_indicator": ["No", "Yes"],
+            "solar_model_indicator": [
+                "ASHRAEClearSky",
+                "ASHRAETau",
+                "ASHRAETau2017",
+                "Schedule",
+                "ZhangHuang",
+            ],
+            "begin_environment_reset_mode": [
+                "FullResetAtBeginEnvironment",
+                "SuppressAllBeginEnvironmentResets",
+            ],
+        },
+        "references": ["RunPeriodsAndDesignDays"],
+        "object_lists": {
+            "dry_bulb_temperature_range_modifier_day_schedule_name": [
+                "DayScheduleNames"
+            ],
+            "humidity_condition_day_schedule_name": ["DayScheduleNames"],
+            "beam_solar_day_schedule_name": ["DayScheduleNames"],
+            "diffuse_solar_day_schedule_name": ["DayScheduleNames"],
+        },
+    },
+    "SurfaceConvectionAlgorithm:Inside": {
+        "name": False,
+        "fields": ["algorithm"],
+        "choices": {
+            "algorithm": [
+                "ASTMC1340",
+                "AdaptiveConvectionAlgorithm",
+                "CeilingDiffuser",
+                "Simple",
+                "TARP",
+            ]
+        },
+    },
+    "SurfaceConvectionAlgorithm:Outside": {
+        "name": False,
+        "fields": ["algorithm"],
+        "choices": {
+            "algorithm": [
+                "AdaptiveConvectionAlgorithm",
+                "DOE-2",
+                "MoWiTT",
+                "SimpleCombined",
+                "TARP",
+            ]
+        },
+    },
+    "SurfaceProperty:SolarIncidentInside": {
+        "name": True,
+        "fields": [
+            "surface_name",
+            "construction_name",
+            "inside_surface_incident_sun_solar_radiation_schedule_name",
+        ],
+        "object_lists": {
+            "surface_name": ["SurfaceNames"],
+            "construction_name": ["ConstructionNames"],
+            "inside_surface_incident_sun_solar_radiation_schedule_name": [
+                "ScheduleNames"
+            ],
+        },
+    },
+    "Table:IndependentVariable": {
+        "name": True,
+        "fields": [
+            "interpolation_method",
+            "extrapolation_method",
+            "minimum_value",
+            "maximum_value",
+            "normalization_reference_value",
+            "unit_type",
+            "external_file_name",
+            "external_file_column_number",
+            "external_file_starting_row_number",
+        ],
+        "extension": "values",
+        "extensibles": ["value"],
+        "numeric": [
+            "minimum_value",
+            "maximum_value",
+            "normalization_reference_value",
+            "external_file_column_number",
+            "external_file_starting_row_number",
+            "value",
+        ],
+        "choices": {
+            "interpolation_method": ["Cubic", "Linear"],
+            "extrapolation_method": ["Constant", "Linear"],
+            "unit_type": [
+                "Angle",
+                "Dimensionless",
+                "Distance",
+                "MassFlow",
+                "Power",
+                "Temperature",
+                "VolumetricFlow",
+            ],
+        },
+        "references": ["IndependentVariableName"],
+    },
+    "Table:IndependentVariableList": {
+        "name": True,
+        "fields": [],
+        "extension": "independent_variables",
+        "extensibles": ["independent_variable_name"],
+        "references": ["IndependentVariableListName"],
+        "object_lists": {"independent_variable_name": ["IndependentVariableName"]},
+    },
+    "Table:Lookup": {
+        "name": True,
+        "fields": [
+            "independent_variable_list_name",
+            "normalization_method",
+            "normalization_divisor",
+            "minimum_output",
+            "maximum_output",
+            "output_unit_type",
+            "external_file_name",
+            "external_file_column_number",
+            "external_file_starting_row_number",
+        ],
+        "extension": "values",
+        "extensibles": ["output_value"],
+        "numeric": [
+            "normalization_divisor",
+            "minimum_output",
+            "maximum_output",
+            "external_file_column_number",
+            "external_file_starting_row_number",
+            "output_value",
+        ],
+        "choices": {
+            "normalization_method": ["AutomaticWithDivisor", "DivisorOnly", "None"],
+            "output_unit_type": [
+                "Capacity",
+                "Dimensionless",
+                "Power",
+                "Pressure",
+                "Temperature",
+            ],
+        },
+        "references": [
+            "BivariateFunctions",
+            "MultivariateFunctions",
+            "QuadvariateFunctions",
+            "QuintvariateFunctions",
+            "TrivariateFunctions",
+            "UnivariateFunctions",
+        ],
+        "object_lists": {
+            "independent_variable_list_name": ["IndependentVariableListName"]
+        },
+    },
+    "ThermostatSetpoint:DualSetpoint": {
+        "name": True,
+        "fields": [
+            "heating_setpoint_temperature_schedule_name",
+            "cooling_setpoint_temperature_schedule_name",
+        ],
+        "references": ["ControlTypeNames"],
+        "object_lists": {
+            "heating_setpoint_temperature_schedule_name": ["ScheduleNames"],
+            "cooling_setpoint_temperature_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ThermostatSetpoint:SingleCooling": {
+        "name": True,
+        "fields": ["setpoint_temperature_schedule_name"],
+        "references": ["ControlTypeNames"],
+        "object_lists": {"setpoint_temperature_schedule_name": ["ScheduleNames"]},
+    },
+    "ThermostatSetpoint:SingleHeating": {
+        "name": True,
+        "fields": ["setpoint_temperature_schedule_name"],
+        "references": ["ControlTypeNames"],
+        "object_lists": {"setpoint_temperature_schedule_name": ["ScheduleNames"]},
+    },
+    "Timestep": {
+        "name": False,
+        "fields": ["number_of_timesteps_per_hour"],
+        "numeric": ["number_of_timesteps_per_hour"],
+    },
+    "UnitarySystemPerformance:Multispeed": {
+        "name": True,
+        "fields": [
+            "number_of_speeds_for_heating",
+            "number_of_speeds_for_cooling",
+            "single_mode_operation",
+            "no_load_supply_air_flow_rate_ratio",
+        ],
+        "extension": "flow_ratios",
+        "extensibles": [
+            "heating_speed_supply_air_flow_ratio",
+            "cooling_speed_supply_air_flow_ratio",
+        ],
+        "numeric": [
+            "number_of_speeds_for_heating",
+            "number_of_speeds_for_cooling",
+            "no_load_supply_air_flow_rate_ratio",
+            "heating_speed_supply_air_flow_ratio",
+            "cooling_speed_supply_air_flow_ratio",
+        ],
+        "choices": {
+            "single_mode_operation": ["No", "Yes"],
+            "heating_speed_supply_air_flow_ratio": ["Autosize"],
+            "cooling_speed_supply_air_flow_ratio": ["Autosize"],
+        },
+        "references": ["UnitarySystemPerformanceNames"],
+    },
+    "UtilityCost:Charge:Block": {
+        "name": False,
+        "fields": [
+            "utility_cost_charge_block_name",
+            "tariff_name",
+            "source_variable",
+            "season",
+            "category_variable_name",
+            "remaining_into_variable",
+            "block_size_multiplier_value_or_variable_name",
+            "block_size_1_value_or_variable_name",
+            "block_1_cost_per_unit_value_or_variable_name",
+            "block_size_2_value_or_variable_name",
+            "block_2_cost_per_unit_value_or_variable_name",
+            "block_size_3_value_or_variable_name",
+            "block_3_cost_per_unit_value_or_variable_name",
+            "block_size_4_value_or_variable_name",
+            "block_4_cost_per_unit_value_or_variable_name",
+            "block_size_5_value_or_variable_name",
+            "block_5_cost_per_unit_value_or_variable_name",
+            "block_size_6_value_or_variable_name",
+            "block_6_cost_per_unit_value_or_variable_name",
+            "block_size_7_value_or_variable_name",
+            "block_7_cost_per_unit_value_or_variable_name",
+            "block_size_8_value_or_variable_name",
+            "block_8_cost_per_unit_value_or_variable_name",
+            "block_size_9_value_or_variable_name",
+            "block_9_cost_per_unit_value_or_variable_name",
+            "block_size_10_value_or_variable_name",
+            "block_10_cost_per_unit_value_or_variable_name",
+            "block_size_11_value_or_variable_name",
+            "block_11_cost_per_unit_value_or_variable_name",
+            "block_size_12_value_or_variable_name",
+            "block_12_cost_per_unit_value_or_variable_name",
+            "block_size_13_value_or_variable_name",
+            "block_13_cost_per_unit_value_or_variable_name",
+            "block_size_14_value_or_variable_name",
+            "block_14_cost_per_unit_value_or_variable_name",
+            "block_size_15_value_or_variable_name",
+            "block_15_cost_per_unit_value_or_variable_name",
+        ],
+        "numeric": [
+            "block_size_multiplier_value_or_variable_name",
+            "block_size_1_value_or_variable_name",
+            "block_1_cost_per_unit_value_or_variable_name",
+            "block_size_2_value_or_variable_name",
+            "block_2_cost_per_unit_value_or_variable_name",
+            "block_size_3_value_or_variable_name",
+            "block_3_cost_per_unit_value_or_variable_name",
+            "block_size_4_value_or_variable_name",
+            "block_4_cost_per_unit_value_or_variable_name",
+            "block_size_5_value_or_variable_name",
+            "block_5_cost_per_unit_value_or_variable_name",
+            "block_size_6_value_or_variable_name",
+            "block_6_cost_per_unit_value_or_variable_name",
+            "block_size_7_value_or_variable_name",
+            "block_7_cost_per_unit_value_or_variable_name",
+            "block_size_8_value_or_variable_name",
+            "block_8_cost_per_unit_value_or_variable_name",
+            "block_size_9_value_or_variable_name",
+            "block_9_cost_per_unit_value_or_variable_name",
+            "block_size_10_value_or_variable_name",
+            "block_10_cost_per_unit_value_or_variable_name",
+            "block_size_11_value_or_variable_name",
+            "block_11_cost_per_unit_value_or_variable_name",
+            "block_size_12_value_or_variable_name",
+            "block_12_cost_per_unit_value_or_variable_name",
+            "block_size_13_value_or_variable_name",
+            "block_13_cost_per_unit_value_or_variable_name",
+            "block_size_14_value_or_variable_name",
+            "block_14_cost_per_unit_value_or_variable_name",
+            "block_size_15_value_or_variable_name",
+            "block_15_cost_per_unit_value_or_variable_name",
+        ],
+        "choices": {
+            "season": ["Annual", "Fall", "Spring", "Summer", "Winter"],
+            "category_variable_name": [
+                "Adjustment",
+                "Basis",
+                "DemandCharges",
+                "EnergyCharges",
+                "NotIncluded",
+                "ServiceCharges",
+                "Subtotal",
+                "Surcharge",
+                "Taxes",
+                "Total",
+            ],
+        },
+        "object_lists": {"tariff_name": ["UtilityCostTariffs"]},
+    },
+    "UtilityCost:Charge:Simple": {
+        "name": False,
+        "fields": [
+            "utility_cost_charge_simple_name",
+            "tariff_name",
+            "source_variable",
+            "season",
+            "category_variable_name",
+            "cost_per_unit_value_or_variable_name",
+        ],
+        "numeric": ["cost_per_unit_value_or_variable_name"],
+        "choices": {
+            "season": ["Annual", "Fall", "Spring", "Summer", "Winter"],
+            "category_variable_name": [
+                "Adjustment",
+                "Basis",
+                "DemandCharges",
+                "EnergyCharges",
+                "NotIncluded",
+                "ServiceCharges",
+                "Subtotal",
+                "Surcharge",
+                "Taxes",
+                "Total",
+            ],
+        },
+        "object_lists": {"tariff_name": ["UtilityCostTariffs"]},
+    },
+    "UtilityCost:Qualify": {
+        "name": False,
+        "fields": [
+            "utility_cost_qualify_name",
+            "tariff_name",
+            "variable_name",
+            "qualify_type",
+            "threshold_value_or_variable_name",
+            "season",
+            "threshold_test",
+            "number_of_months",
+        ],
+        "numeric": ["threshold_value_or_variable_name", "number_of_months"],
+        "choices": {
+            "qualify_type": ["Maximum", "Minimum"],
+            "season": ["Annual", "Fall", "Spring", "Summer", "Winter"],
+            "threshold_test": ["Consecutive", "Count"],
+        },
+        "object_lists": {"tariff_name": ["UtilityCostTariffs"]},
+    },
+    "UtilityCost:Tariff": {
+        "name": True,
+        "fields": [
+            "output_meter_name",
+            "conversion_factor_choice",
+            "energy_conversion_factor",
+            "demand_conversion_factor",
+            "time_of_use_period_schedule_name",
+            "season_schedule_name",
+            "month_schedule_name",
+            "demand_window_length",
+            "monthly_charge_or_variable_name",
+            "minimum_monthly_charge_or_variable_name",
+            "real_time_pricing_charge_schedule_name",
+            "customer_baseline_load_schedule_name",
+            "group_name",
+            "buy_or_sell",
+        ],
+        "numeric": [
+            "energy_conversion_factor",
+            "demand_conversion_factor",
+            "monthly_charge_or_variable_name",
+            "minimum_monthly_charge_or_variable_name",
+        ],
+        "choices": {
+            "conversion_factor_choice": [
+                "CCF",
+                "MCF",
+                "MJ",
+                "MMBtu",
+                "Therm",
+                "UserDefined",
+                "gal",
+                "kBtu",
+                "kWh",
+                "kgal",
+                "m3",
+            ],
+            "demand_window_length": [
+                "Day",
+                "FullHour",
+                "HalfHour",
+                "QuarterHour",
+                "Week",
+            ],
+            "buy_or_sell": ["BuyFromUtility", "NetMetering", "SellToUtility"],
+        },
+        "references": ["UtilityCostTariffs"],
+        "object_lists": {
+            "time_of_use_period_schedule_name": ["ScheduleNames"],
+            "season_schedule_name": ["ScheduleNames"],
+            "month_schedule_name": ["ScheduleNames"],
+            "real_time_pricing_charge_schedule_name": ["ScheduleNames"],
+            "customer_baseline_load_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "UtilityCost:Variable": {
+        "name": True,
+        "fields": [
+            "tariff_name",
+            "variable_type",
+            "january_value",
+            "february_value",
+            "march_value",
+            "april_value",
+            "may_value",
+            "june_value",
+            "july_value",
+            "august_value",
+            "september_value",
+            "october_value",
+            "november_value",
+            "december_value",
+        ],
+        "numeric": [
+            "january_value",
+            "february_value",
+            "march_value",
+            "april_value",
+            "may_value",
+            "june_value",
+            "july_value",
+            "august_value",
+            "september_value",
+            "october_value",
+            "november_value",
+            "december_value",
+        ],
+        "choices": {"variable_type": ["Currency", "Demand", "Dimensionless", "Energy"]},
+        "object_lists": {"tariff_name": ["UtilityCostTariffs"]},
+    },
+    "Version": {"name": False, "fields": ["version_identifier"]},
+    "WaterHeater:Mixed": {
+        "name": True,
+        "fields": [
+            "tank_volume",
+            "setpoint_temperature_schedule_name",
+            "deadband_temperature_difference",
+            "maximum_temperature_limit",
+            "heater_control_type",
+            "heater_maximum_capacity",
+            "heater_minimum_capacity",
+            "heater_ignition_minimum_flow_rate",
+            "heater_ignition_delay",
+            "heater_fuel_type",
+            "heater_thermal_efficiency",
+            "part_load_factor_curve_name",
+            "off_cycle_parasitic_fuel_consumption_rate",
+            "off_cycle_parasitic_fuel_type",
+            "off_cycle_parasitic_heat_fraction_to_tank",
+            "on_cycle_parasitic_fuel_consumption_rate",
+            "on_cycle_parasitic_fuel_type",
+            "on_cycle_parasitic_heat_fraction_to_tank",
+            "ambient_temperature_indicator",
+            "ambient_temperature_schedule_name",
+            "ambient_temperature_zone_name",
+            "ambient_temperature_outdoor_air_node_name",
+            "off_cycle_loss_coefficient_to_ambient_temperature",
+            "off_cycle_loss_fraction_to_zone",
+            "on_cycle_loss_coefficient_to_ambient_temperature",
+            "on_cycle_loss_fraction_to_zone",
+            "peak_use_flow_rate",
+            "use_flow_rate_fraction_schedule_name",
+            "cold_water_supply_temperature_schedule_name",
+            "use_side_inlet_node_name",
+            "use_side_outlet_node_name",
+            "use_side_effectiveness",
+            "source_side_inlet_node_name",
+            "source_side_outlet_node_name",
+            "source_side_effectiveness",
+            "use_side_design_flow_rate",
+            "source_side_design_flow_rate",
+            "indirect_water_heating_recovery_time",
+            "source_side_flow_control_mode",
+            "indirect_alternate_setpoint_temperature_schedule_name",
+            "end_use_subcategory",
+        ],
+        "numeric": [
+            "tank_volume",
+            "deadband_temperature_difference",
+            "maximum_temperature_limit",
+            "heater_maximum_capacity",
+            "heater_minimum_capacity",
+            "heater_ignition_minimum_flow_rate",
+            "heater_ignition_delay",
+            "heater_thermal_efficiency",
+            "off_cycle_parasitic_fuel_consumption_rate",
+            "off_cycle_parasitic_heat_fraction_to_tank",
+            "on_cycle_parasitic_fuel_consumption_rate",
+            "on_cycle_parasitic_heat_fraction_to_tank",
+            "off_cycle_loss_coefficient_to_ambient_temperature",
+            "off_cycle_loss_fraction_to_zone",
+            "on_cycle_loss_coefficient_to_ambient_temperature",
+            "on_cycle_loss_fraction_to_zone",
+            "peak_use_flow_rate",
+            "use_side_effectiveness",
+            "source_side_effectiveness",
+            "use_side_design_flow_rate",
+            "source_side_design_flow_rate",
+            "indirect_water_heating_recovery_time",
+        ],
+        "choices": {
+            "tank_volume": ["Autosize"],
+            "heater_control_type": ["Cycle", "Modulate"],
+            "heater_maximum_capacity": ["Autosize"],
+            "heater_fuel_type": [
+                "Coal",
+                "Diesel",
+                "DistrictHeatingSteam",
+                "DistrictHeatingWater",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ],
+            "off_cycle_parasitic_fuel_type": [
+                "Coal",
+                "Diesel",
+                "DistrictHeatingSteam",
+                "DistrictHeatingWater",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ],
+            "on_cycle_parasitic_fuel_type": [
+                "Coal",
+                "Diesel",
+                "DistrictHeatingSteam",
+                "DistrictHeatingWater",
+                "Electricity",
+                "FuelOilNo1",
+                "FuelOilNo2",
+                "Gasoline",
+                "NaturalGas",
+                "OtherFuel1",
+                "OtherFuel2",
+                "Propane",
+            ],
+            "ambient_temperature_indicator": ["Outdoors", "Schedule", "Zone"],
+            "use_side_design_flow_rate": ["Autosize"],
+            "source_side_design_flow_rate": ["Autosize"],
+            "source_side_flow_control_mode": [
+                "IndirectHeatAlternateSetpoint",
+                "IndirectHeatPrimarySetpoint",
+                "StorageTank",
+            ],
+        },
+        "references": [
+            "WaterHeaterMixedNames",
+            "WaterHeaterNames",
+            "validBranchEquipmentNames",
+            "validCondenserEquipmentNames",
+            "validPlantEquipmentNames",
+        ],
+        "object_lists": {
+            "setpoint_temperature_schedule_name": ["ScheduleNames"],
+            "part_load_factor_curve_name": ["UnivariateFunctions"],
+            "ambient_temperature_schedule_name": ["ScheduleNames"],
+            "ambient_temperature_zone_name": ["ZoneNames"],
+            "use_flow_rate_fraction_schedule_name": ["ScheduleNames"],
+            "cold_water_supply_temperature_schedule_name": ["ScheduleNames"],
+            "indirect_alternate_setpoint_temperature_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "WaterUse:Connections": {
+        "name": True,
+        "fields": [
+            "inlet_node_name",
+            "outlet_node_name",
+            "supply_water_storage_tank_name",
+            "reclamation_water_storage_tank_name",
+            "hot_water_supply_temperature_schedule_name",
+            "cold_water_supply_temperature_schedule_name",
+            "drain_water_heat_exchanger_type",
+            "drain_water_heat_exchanger_destination",
+            "drain_water_heat_exchanger_u_factor_times_area",
+        ],
+        "extension": "connections",
+        "extensibles": ["water_use_equipment_name"],
+        "numeric": ["drain_water_heat_exchanger_u_factor_times_area"],
+        "choices": {
+            "drain_water_heat_exchanger_type": [
+                "CounterFlow",
+                "CrossFlow",
+                "Ideal",
+                "None",
+            ],
+            "drain_water_heat_exchanger_destination": [
+                "Equipment",
+                "Plant",
+                "PlantAndEquipment",
+            ],
+        },
+        "references": ["validBranchEquipmentNames"],
+        "object_lists": {
+            "hot_water_supply_temperature_schedule_name": ["ScheduleNames"],
+            "cold_water_supply_temperature_schedule_name": ["ScheduleNames"],
+            "water_use_equipment_name": ["WaterUseEquipmentNames"],
+        },
+    },
+    "WaterUse:Equipment": {
+        "name": True,
+        "fields": [
+            "end_use_subcategory",
+            "peak_flow_rate",
+            "flow_rate_fraction_schedule_name",
+            "target_temperature_schedule_name",
+            "hot_water_supply_temperature_schedule_name",
+            "cold_water_supply_temperature_schedule_name",
+            "zone_name",
+            "sensible_fraction_schedule_name",
+            "latent_fraction_schedule_name",
+        ],
+        "numeric": ["peak_flow_rate"],
+        "references": ["WaterUseEquipmentNames"],
+        "object_lists": {
+            "flow_rate_fraction_schedule_name": ["ScheduleNames"],
+            "target_temperature_schedule_name": ["ScheduleNames"],
+            "hot_water_supply_temperature_schedule_name": ["ScheduleNames"],
+            "cold_water_supply_temperature_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+            "sensible_fraction_schedule_name": ["ScheduleNames"],
+            "latent_fraction_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "WindowGap:DeflectionState": {
+        "name": True,
+        "fields": ["deflected_thickness", "initial_temperature", "initial_pressure"],
+        "numeric": ["deflected_thickness", "initial_temperature", "initial_pressure"],
+        "references": ["WindowGapDeflectionStates"],
+    },
+    "WindowGap:SupportPillar": {
+        "name": True,
+        "fields": ["spacing", "radius"],
+        "numeric": ["spacing", "radius"],
+        "references": ["WindowGapSupportPillars"],
+    },
+    "WindowMaterial:Blind": {
+        "name": True,
+        "fields": [
+            "slat_orientation",
+            "slat_width",
+            "slat_separation",
+            "slat_thickness",
+            "slat_angle",
+            "slat_conductivity",
+            "slat_beam_solar_transmittance",
+            "front_side_slat_beam_solar_reflectance",
+            "back_side_slat_beam_solar_reflectance",
+            "slat_diffuse_solar_transmittance",
+            "front_side_slat_diffuse_solar_reflectance",
+            "back_side_slat_diffuse_solar_reflectance",
+            "slat_beam_visible_transmittance",
+            "front_side_slat_beam_visible_reflectance",
+            "back_side_slat_beam_visible_reflectance",
+            "slat_diffuse_visible_transmittance",
+            "front_side_slat_diffuse_visible_reflectance",
+            "back_side_slat_diffuse_visible_reflectance",
+            "slat_infrared_hemispherical_transmittance",
+            "front_side_slat_infrared_hemispherical_emissivity",
+            "back_side_slat_infrared_hemispherical_emissivity",
+            "blind_to_glass_distance",
+            "blind_top_opening_multiplier",
+            "blind_bottom_opening_multiplier",
+            "blind_left_side_opening_multiplier",
+            "blind_right_side_opening_multiplier",
+            "minimum_slat_angle",
+            "maximum_slat_angle",
+        ],
+        "numeric": [
+            "slat_width",
+            "slat_separation",
+            "slat_thickness",
+            "slat_angle",
+            "slat_conductivity",
+            "slat_beam_solar_transmittance",
+            "front_side_slat_beam_solar_reflectance",
+            "back_side_slat_beam_solar_reflectance",
+            "slat_diffuse_solar_transmittance",
+            "front_side_slat_diffuse_solar_reflectance",
+            "back_side_slat_diffuse_solar_reflectance",
+            "slat_beam_visible_transmittance",
+            "front_side_slat_beam_visible_reflectance",
+            "back_side_slat_beam_visible_reflectance",
+            "slat_diffuse_visible_transmittance",
+            "front_side_slat_diffuse_visible_reflectance",
+            "back_side_slat_diffuse_visible_reflectance",
+            "slat_infrared_hemispherical_transmittance",
+            "front_side_slat_infrared_hemispherical_emissivity",
+            "back_side_slat_infrared_hemispherical_emissivity",
+            "blind_to_glass_distance",
+            "blind_top_opening_multiplier",
+            "blind_bottom_opening_multiplier",
+            "blind_left_side_opening_multiplier",
+            "blind_right_side_opening_multiplier",
+            "minimum_slat_angle",
+            "maximum_slat_angle",
+        ],
+        "choices": {"slat_orientation": ["Horizontal", "Vertical"]},
+        "references": ["MaterialName", "WindowShadesScreensAndBlinds"],
+    },
+    "WindowMaterial:ComplexShade": {
+        "name": True,
+        "fields": [
+            "layer_type",
+            "thickness",
+            "conductivity",
+            "ir_transmittance",
+            "front_emissivity",
+            "back_emissivity",
+            "top_opening_multiplier",
+            "bottom_opening_multiplier",
+            "left_side_opening_multiplier",
+            "right_side_opening_multiplier",
+            "front_opening_multiplier",
+            "slat_width",
+            "slat_spacing",
+            "slat_thickness",
+            "slat_angle",
+            "slat_conductivity",
+            "slat_curve",
+        ],
+        "numeric": [
+            "thickness",
+            "conductivity",
+            "ir_transmittance",
+            "front_emissivity",
+            "back_emissivity",
+            "top_opening_multiplier",
+            "bottom_opening_multiplier",
+            "left_side_opening_multiplier",
+            "right_side_opening_multiplier",
+            "front_opening_multiplier",
+            "slat_width",
+            "slat_spacing",
+            "slat_thickness",
+            "slat_angle",
+            "slat_conductivity",
+            "slat_curve",
+        ],
+        "choices": {
+            "layer_type": [
+                "BSDF",
+                "OtherShadingType",
+                "Perforated",
+                "VenetianHorizontal",
+                "VenetianVertical",
+                "Woven",
+            ]
+        },
+        "references": ["WindowComplexShades"],
+    },
+    "WindowMaterial:Gap": {
+        "name": True,
+        "fields": [
+            "thickness",
+            "gas_or_gas_mixture_",
+            "pressure",
+            "deflection_state",
+            "support_pillar",
+        ],
+        "numeric": ["thickness", "pressure"],
+        "references": ["CFSGap"],
+        "object_lists": {
+            "gas_or_gas_mixture_": ["WindowGasAndGasMixtures"],
+            "deflection_state": ["WindowGapDeflectionStates"],
+            "support_pillar": ["WindowGapSupportPillars"],
+        },
+    },
+    "WindowMaterial:Gas": {
+        "name": True,
+        "fields": [
+            "gas_type",
+            "thickness",
+            "conductivity_coefficient_a",
+            "conductivity_coefficient_b",
+            "conductivity_coefficient_c",
+            "viscosity_coefficient_a",
+            "viscosity_coefficient_b",
+            "viscosity_coefficient_c",
+            "specific_heat_coefficient_a",
+            "specific_heat_coefficient_b",
+            "specific_heat_coefficient_c",
+            "molecular_weight",
+            "specific_heat_ratio",
+        ],
+        "numeric": [
+            "thickness",
+            "conductivity_coefficient_a",
+            "conductivity_coefficient_b",
+            "conductivity_coefficient_c",
+            "viscosity_coefficient_a",
+            "viscosity_coefficient_b",
+            "viscosity_coefficient_c",
+            "specific_heat_coefficient_a",
+            "specific_heat_coefficient_b",
+            "specific_heat_coefficient_c",
+            "molecular_weight",
+            "specific_heat_ratio",
+        ],
+        "choices": {"gas_type": ["Air", "Argon", "Custom", "Krypton", "Xenon"]},
+        "references": ["MaterialName", "WindowGasAndGasMixtures"],
+    },
+    "WindowMaterial:GasMixture": {
+        "name": True,
+        "fields": [
+            "thickness",
+            "number_of_gases_in_mixture",
+            "gas_1_type",
+            "gas_1_fraction",
+            "gas_2_type",
+            "gas_2_fraction",
+            "gas_3_type",
+            "gas_3_fraction",
+            "gas_4_type",
+            "gas_4_fraction",
+        ],
+        "numeric": [
+            "thickness",
+            "number_of_gases_in_mixture",
+            "gas_1_fraction",
+            "gas_2_fraction",
+            "gas_3_fraction",
+            "gas_4_fraction",
+        ],
+        "choices": {
+            "gas_1_type": ["Air", "Argon", "Krypton", "Xenon"],
+            "gas_2_type": ["Air", "Argon", "Krypton", "Xenon"],
+            "gas_3_type": ["Air", "Argon", "Krypton", "Xenon"],
+            "gas_4_type": ["Air", "Argon", "Krypton", "Xenon"],
+        },
+        "references": ["MaterialName", "WindowGasAndGasMixtures"],
+    },
+    "WindowMaterial:Glazing": {
+        "name": True,
+        "fields": [
+            "optical_data_type",
+            "window_glass_spectral_data_set_name",
+            "thickness",
+            "solar_transmittance_at_normal_incidence",
+            "front_side_solar_reflectance_at_normal_incidence",
+            "back_side_solar_reflectance_at_normal_incidence",
+            "visible_transmittance_at_normal_incidence",
+            "front_side_visible_reflectance_at_normal_incidence",
+            "back_side_visible_reflectance_at_normal_incidence",
+            "infrared_transmittance_at_normal_incidence",
+            "front_side_infrared_hemispherical_emissivity",
+            "back_side_infrared_hemispherical_emissivity",
+            "conductivity",
+            "dirt_correction_factor_for_solar_and_visible_transmittance",
+            "solar_diffusing",
+            "young_s_modulus",
+            "poisson_s_ratio",
+            "window_glass_spectral_and_incident_angle_transmittance_data_set_table_name",
+            "window_glass_spectral_and_incident_angle_front_reflectance_data_set_table_name",
+            "window_glass_spectral_and_incident_angle_back_reflectance_data_set_table_name",
+        ],
+        "numeric": [
+            "thickness",
+            "solar_transmittance_at_normal_incidence",
+            "front_side_solar_reflectance_at_normal_incidence",
+            "back_side_solar_reflectance_at_normal_incidence",
+            "visible_transmittance_at_normal_incidence",
+            "front_side_visible_reflectance_at_normal_incidence",
+            "back_side_visible_reflectance_at_normal_incidence",
+            "infrared_transmittance_at_normal_incidence",
+            "front_side_infrared_hemispherical_emissivity",
+            "back_side_infrared_hemispherical_emissivity",
+            "conductivity",
+            "dirt_correction_factor_for_solar_and_visible_transmittance",
+            "young_s_modulus",
+            "poisson_s_ratio",
+        ],
+        "choices": {
+            "optical_data_type": [
+                "BSDF",
+                "Spectral",
+                "SpectralAndAngle",
+                "SpectralAverage",
+            ],
+            "solar_diffusing": ["No", "Yes"],
+        },
+        "references": ["CFSGlazingName", "GlazingMaterialName", "MaterialName"],
+        "object_lists": {
+            "window_glass_spectral_and_incident_angle_transmittance_data_set_table_name": [
+                "BivariateFunctions"
+            ],
+            "window_glass_spectral_and_incident_angle_front_reflectance_data_set_table_name": [
+                "BivariateFunctions"
+            ],
+            "window_glass_spectral_and_incident_angle_back_reflectance_data_set_table_name": [
+                "BivariateFunctions"
+            ],
+        },
+    },
+    "WindowMaterial:SimpleGlazingSystem": {
+        "name": True,
+        "fields": ["u_factor", "solar_heat_gain_coefficient", "visible_transmittance"],
+        "numeric": ["u_factor", "solar_heat_gain_coefficient", "visible_transmittance"],
+        "references": ["GlazingMaterialName", "MaterialName"],
+    },
+    "WindowProperty:FrameAndDivider": {
+        "name": True,
+        "fields": [
+            "frame_width",
+            "frame_outside_projection",
+            "frame_inside_projection",
+            "frame_conductance",
+            "ratio_of_frame_edge_glass_conductance_to_center_of_glass_conductance",
+            "frame_solar_absorptance",
+            "frame_visible_absorptance",
+            "frame_thermal_hemispherical_emissivity",
+            "divider_type",
+            "divider_width",
+            "number_of_horizontal_dividers",
+            "number_of_vertical_dividers",
+            "divider_outside_projection",
+            "divider_inside_projection",
+            "divider_conductance",
+            "ratio_of_divider_edge_glass_conductance_to_center_of_glass_conductance",
+            "divider_solar_absorptance",
+            "divider_visible_absorptance",
+            "divider_thermal_hemispherical_emissivity",
+            "outside_reveal_solar_absorptance",
+            "inside_sill_depth",
+            "inside_sill_solar_absorptance",
+            "inside_reveal_depth",
+            "inside_reveal_solar_absorptance",
+            "nfrc_product_type_for_assembly_calculations",
+        ],
+        "numeric": [
+            "frame_width",
+            "frame_outside_projection",
+            "frame_inside_projection",
+            "frame_conductance",
+            "ratio_of_frame_edge_glass_conductance_to_center_of_glass_conductance",
+            "frame_solar_absorptance",
+            "frame_visible_absorptance",
+            "frame_thermal_hemispherical_emissivity",
+            "divider_width",
+            "number_of_horizontal_dividers",
+            "number_of_vertical_dividers",
+            "divider_outside_projection",
+            "divider_inside_projection",
+            "divider_conductance",
+            "ratio_of_divider_edge_glass_conductance_to_center_of_glass_conductance",
+            "divider_solar_absorptance",
+            "divider_visible_absorptance",
+            "divider_thermal_hemispherical_emissivity",
+            "outside_reveal_solar_absorptance",
+            "inside_sill_depth",
+            "inside_sill_solar_absorptance",
+            "inside_reveal_depth",
+            "inside_reveal_solar_absorptance",
+        ],
+        "choices": {
+            "divider_type": ["DividedLite", "Suspended"],
+            "nfrc_product_type_for_assembly_calculations": [
+                "CasementDouble",
+                "CasementSingle",
+                "CurtainWall",
+                "DoorSidelite",
+                "DoorTransom",
+                "DualAction",
+                "Fixed",
+                "Garage",
+                "Greenhouse",
+                "HingedEscape",
+                "HorizontalSlider",
+                "Jal",
+                "Pivoted",
+                "ProjectingDual",
+                "ProjectingSingle",
+                "SideHingedDoor",
+                "Skylight",
+                "SlidingPatioDoor",
+                "SpandrelPanel",
+                "TropicalAwning",
+                "TubularDaylightingDevice",
+                "VerticalSlider",
+            ],
+        },
+        "references": ["WindowFrameAndDividerNames"],
+    },
+    "WindowShadingControl": {
+        "name": True,
+        "fields": [
+            "zone_name",
+            "shading_control_sequence_number",
+            "shading_type",
+            "construction_with_shading_name",
+            "shading_control_type",
+            "schedule_name",
+            "setpoint",
+            "shading_control_is_scheduled",
+            "glare_control_is_active",
+            "shading_device_material_name",
+            "type_of_slat_angle_control_for_blinds",
+            "slat_angle_schedule_name",
+            "setpoint_2",
+            "daylighting_control_object_name",
+            "multiple_surface_control_type",
+        ],
+        "extension": "fenestration_surfaces",
+        "extensibles": ["fenestration_surface_name"],
+        "numeric": ["shading_control_sequence_number", "setpoint", "setpoint_2"],
+        "choices": {
+            "shading_type": [
+                "BetweenGlassBlind",
+                "BetweenGlassShade",
+                "ExteriorBlind",
+                "ExteriorScreen",
+                "ExteriorShade",
+                "InteriorBlind",
+                "InteriorShade",
+                "SwitchableGlazing",
+            ],
+            "shading_control_type": [
+                "AlwaysOff",
+                "AlwaysOn",
+                "MeetDaylightIlluminanceSetpoint",
+                "OffNightAndOnDayIfCoolingAndHighSolarOnWindow",
+                "OnIfHighGlare",
+                "OnIfHighHorizontalSolar",
+                "OnIfHighOutdoorAirTempAndHighHorizontalSolar",
+                "OnIfHighOutdoorAirTempAndHighSolarOnWindow",
+                "OnIfHighOutdoorAirTemperature",
+                "OnIfHighSolarOnWindow",
+                "OnIfHighSolarOrHighLuminanceTillMidnight",
+                "OnIfHighSolarOrHighLuminanceTillNextMorning",
+                "OnIfHighSolarOrHighLuminanceTillSunset",
+                "OnIfHighZoneAirTempAndHighHorizontalSolar",
+                "OnIfHighZoneAirTempAndHighSolarOnWindow",
+                "OnIfHighZoneAirTemperature",
+                "OnIfHighZoneCooling",
+                "OnIfScheduleAllows",
+                "OnNightAndOnDayIfCoolingAndHighSolarOnWindow",
+                "OnNightIfHeatingAndOffDay",
+                "OnNightIfHeatingAndOnDayIfCooling",
+                "OnNightIfLowInsideTempAndOffDay",
+                "OnNightIfLowOutdoorTempAndOffDay",
+                "OnNightIfLowOutdoorTempAndOnDayIfCooling",
+            ],
+            "shading_control_is_scheduled": ["No", "Yes"],
+            "glare_control_is_active": ["No", "Yes"],
+            "type_of_slat_angle_control_for_blinds": [
+                "BlockBeamSolar",
+                "FixedSlatAngle",
+                "ScheduledSlatAngle",
+            ],
+            "multiple_surface_control_type": ["Group", "Sequential"],
+        },
+        "references": ["WindowShadeControlNames"],
+        "object_lists": {
+            "zone_name": ["ZoneNames"],
+            "construction_with_shading_name": ["ConstructionNames"],
+            "schedule_name": ["ScheduleNames"],
+            "shading_device_material_name": ["WindowShadesScreensAndBlinds"],
+            "slat_angle_schedule_name": ["ScheduleNames"],
+            "daylighting_control_object_name": ["DaylightingControlNames"],
+            "fenestration_surface_name": ["GlazedExtSubSurfNames"],
+        },
+    },
+    "WindowThermalModel:Params": {
+        "name": True,
+        "fields": [
+            "standard",
+            "thermal_model",
+            "sdscalar",
+            "deflection_model",
+            "vacuum_pressure_limit",
+            "initial_temperature",
+            "initial_pressure",
+        ],
+        "numeric": [
+            "sdscalar",
+            "vacuum_pressure_limit",
+            "initial_temperature",
+            "initial_pressure",
+        ],
+        "choices": {
+            "standard": ["EN673Declared", "EN673Design", "ISO15099"],
+            "thermal_model": [
+                "ConvectiveScalarModel_NoSDThickness",
+                "ConvectiveScalarModel_withSDThickness",
+                "ISO15099",
+                "ScaledCavityWidth",
+            ],
+            "deflection_model": [
+                "MeasuredDeflection",
+                "NoDeflection",
+                "TemperatureAndPressureInput",
+            ],
+        },
+        "references": ["WindowThermalModelParameters"],
+    },
+    "Zone": {
+        "name": True,
+        "fields": [
+            "direction_of_relative_north",
+            "x_origin",
+            "y_origin",
+            "z_origin",
+            "type",
+            "multiplier",
+            "ceiling_height",
+            "volume",
+            "floor_area",
+            "zone_inside_convection_algorithm",
+            "zone_outside_convection_algorithm",
+            "part_of_total_floor_area",
+        ],
+        "numeric": [
+            "direction_of_relative_north",
+            "x_origin",
+            "y_origin",
+            "z_origin",
+            "type",
+            "multiplier",
+            "ceiling_height",
+            "volume",
+            "floor_area",
+        ],
+        "choices": {
+            "ceiling_height": ["Autocalculate"],
+            "volume": ["Autocalculate"],
+            "floor_area": ["Autocalculate"],
+            "zone_inside_convection_algorithm": [
+                "ASTMC1340",
+                "AdaptiveConvectionAlgorithm",
+                "CeilingDiffuser",
+                "Simple",
+                "TARP",
+                "TrombeWall",
+            ],
+            "zone_outside_convection_algorithm": [
+                "AdaptiveConvectionAlgorithm",
+                "DOE-2",
+                "MoWiTT",
+                "SimpleCombined",
+                "TARP",
+            ],
+            "part_of_total_floor_area": ["No", "Yes"],
+        },
+        "references": [
+            "AirflowNetworkNodeAndZoneNames",
+            "OutFaceEnvNames",
+            "ZoneAndZoneListAndSpaceAndSpaceListNames",
+            "ZoneAndZoneListNames",
+            "ZoneNames",
+        ],
+    },
+    "ZoneAirContaminantBalance": {
+        "name": False,
+        "fields": [
+            "carbon_dioxide_concentration",
+            "outdoor_carbon_dioxide_schedule_name",
+            "generic_contaminant_concentration",
+            "outdoor_generic_contaminant_schedule_name",
+        ],
+        "choices": {
+            "carbon_dioxide_concentration": ["No", "Yes"],
+            "generic_contaminant_concentration": ["No", "Yes"],
+        },
+        "object_lists": {
+            "outdoor_carbon_dioxide_schedule_name": ["ScheduleNames"],
+            "outdoor_generic_contaminant_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ZoneAirHeatBalanceAlgorithm": {
+        "name": False,
+        "fields": [
+            "algorithm",
+            "do_space_heat_balance_for_sizing",
+            "do_space_heat_balance_for_simulation",
+        ],
+        "choices": {
+            "algorithm": [
+                "AnalyticalSolution",
+                "EulerMethod",
+                "ThirdOrderBackwardDifference",
+            ],
+            "do_space_heat_balance_for_sizing": ["No", "Yes"],
+            "do_space_heat_balance_for_simulation": ["No", "Yes"],
+        },
+    },
+    "ZoneCapacitanceMultiplier:ResearchSpecial": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_name",
+            "temperature_capacity_multiplier",
+            "humidity_capacity_multiplier",
+            "carbon_dioxide_capacity_multiplier",
+            "generic_contaminant_capacity_multiplier",
+        ],
+        "numeric": [
+            "temperature_capacity_multiplier",
+            "humidity_capacity_multiplier",
+            "carbon_dioxide_capacity_multiplier",
+            "generic_contaminant_capacity_multiplier",
+        ],
+        "object_lists": {"zone_or_zonelist_name": ["ZoneAndZoneListNames"]},
+    },
+    "ZoneControl:Humidistat": {
+        "name": True,
+        "fields": [
+            "zone_name",
+            "humidifying_relative_humidity_setpoint_schedule_name",
+            "dehumidifying_relative_humidity_setpoint_schedule_name",
+        ],
+        "references": ["ZoneControlHumidistatNames"],
+        "object_lists": {
+            "zone_name": ["ZoneNames"],
+            "humidifying_relative_humidity_setpoint_schedule_name": ["ScheduleNames"],
+            "dehumidifying_relative_humidity_setpoint_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ZoneControl:Thermostat": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_name",
+            "control_type_schedule_name",
+            "control_1_object_type",
+            "control_1_name",
+            "control_2_object_type",
+            "control_2_name",
+            "control_3_object_type",
+            "control_3_name",
+            "control_4_object_type",
+            "control_4_name",
+            "temperature_difference_between_cutout_and_setpoint",
+        ],
+        "numeric": ["temperature_difference_between_cutout_and_setpoint"],
+        "choices": {
+            "control_1_object_type": [
+                "ThermostatSetpoint:DualSetpoint",
+                "ThermostatSetpoint:SingleCooling",
+                "ThermostatSetpoint:SingleHeating",
+                "ThermostatSetpoint:SingleHeatingOrCooling",
+            ],
+            "control_2_object_type": [
+                "ThermostatSetpoint:DualSetpoint",
+                "ThermostatSetpoint:SingleCooling",
+                "ThermostatSetpoint:SingleHeating",
+                "ThermostatSetpoint:SingleHeatingOrCooling",
+            ],
+            "control_3_object_type": [
+                "ThermostatSetpoint:DualSetpoint",
+                "ThermostatSetpoint:SingleCooling",
+                "ThermostatSetpoint:SingleHeating",
+                "ThermostatSetpoint:SingleHeatingOrCooling",
+            ],
+            "control_4_object_type": [
+                "ThermostatSetpoint:DualSetpoint",
+                "ThermostatSetpoint:SingleCooling",
+                "ThermostatSetpoint:SingleHeating",
+                "ThermostatSetpoint:SingleHeatingOrCooling",
+            ],
+        },
+        "references": ["ZoneControlThermostaticNames"],
+        "object_lists": {
+            "zone_or_zonelist_name": ["ZoneAndZoneListNames"],
+            "control_type_schedule_name": ["ScheduleNames"],
+            "control_1_name": ["ControlTypeNames"],
+            "control_2_name": ["ControlTypeNames"],
+            "control_3_name": ["ControlTypeNames"],
+            "control_4_name": ["ControlTypeNames"],
+        },
+        "object_types": {
+            "control_1_name": "control_1_object_type",
+            "control_2_name": "control_2_object_type",
+            "control_3_name": "control_3_object_type",
+            "control_4_name": "control_4_object_type",
+        },
+    },
+    "ZoneGroup": {
+        "name": True,
+        "fields": ["zone_list_name", "zone_list_multiplier"],
+        "numeric": ["zone_list_multiplier"],
+        "object_lists": {"zone_list_name": ["ZoneListNames"]},
+    },
+    "ZoneHVAC:AirDistributionUnit": {
+        "name": True,
+        "fields": [
+            "air_distribution_unit_outlet_node_name",
+            "air_terminal_object_type",
+            "air_terminal_name",
+            "nominal_upstream_leakage_fraction",
+            "constant_downstream_leakage_fraction",
+            "design_specification_air_terminal_sizing_object_name",
+        ],
+        "numeric": [
+            "nominal_upstream_leakage_fraction",
+            "constant_downstream_leakage_fraction",
+        ],
+        "choices": {
+            "air_terminal_object_type": [
+                "AirTerminal:DualDuct:ConstantVolume",
+                "AirTerminal:DualDuct:VAV",
+                "AirTerminal:DualDuct:VAV:OutdoorAir",
+                "AirTerminal:SingleDuct:ConstantVolume:CooledBeam",
+                "AirTerminal:SingleDuct:ConstantVolume:FourPipeBeam",
+                "AirTerminal:SingleDuct:ConstantVolume:FourPipeInduction",
+                "AirTerminal:SingleDuct:ConstantVolume:NoReheat",
+                "AirTerminal:SingleDuct:ConstantVolume:Reheat",
+                "AirTerminal:SingleDuct:Mixer",
+                "AirTerminal:SingleDuct:ParallelPIU:Reheat",
+                "AirTerminal:SingleDuct:SeriesPIU:Reheat",
+                "AirTerminal:SingleDuct:UserDefined",
+                "AirTerminal:SingleDuct:VAV:HeatAndCool:NoReheat",
+                "AirTerminal:SingleDuct:VAV:HeatAndCool:Reheat",
+                "AirTerminal:SingleDuct:VAV:NoReheat",
+                "AirTerminal:SingleDuct:VAV:Reheat",
+                "AirTerminal:SingleDuct:VAV:Reheat:VariableSpeedFan",
+            ]
+        },
+        "references": ["ZoneEquipmentNames"],
+        "object_lists": {"air_terminal_name": ["AirTerminalUnitNames"]},
+        "object_types": {"air_terminal_name": "air_terminal_object_type"},
+    },
+    "ZoneHVAC:EnergyRecoveryVentilator": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "heat_exchanger_name",
+            "supply_air_flow_rate",
+            "exhaust_air_flow_rate",
+            "supply_air_fan_name",
+            "exhaust_air_fan_name",
+            "controller_name",
+            "ventilation_rate_per_unit_floor_area",
+            "ventilation_rate_per_occupant",
+            "availability_manager_list_name",
+        ],
+        "numeric": [
+            "supply_air_flow_rate",
+            "exhaust_air_flow_rate",
+            "ventilation_rate_per_unit_floor_area",
+            "ventilation_rate_per_occupant",
+        ],
+        "choices": {
+            "supply_air_flow_rate": ["Autosize"],
+            "exhaust_air_flow_rate": ["Autosize"],
+        },
+        "references": ["ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "heat_exchanger_name": ["HXAirToAirSensibleAndLatentNames"],
+            "supply_air_fan_name": ["FansOnOff", "FansSystemModel"],
+            "exhaust_air_fan_name": ["FansOnOff", "FansSystemModel"],
+            "controller_name": ["ControllerStandAloneEnergyRecoveryVentilator"],
+            "availability_manager_list_name": ["SystemAvailabilityManagerLists"],
+        },
+    },
+    "ZoneHVAC:EnergyRecoveryVentilator:Controller": {
+        "name": True,
+        "fields": [
+            "temperature_high_limit",
+            "temperature_low_limit",
+            "enthalpy_high_limit",
+            "dewpoint_temperature_limit",
+            "electronic_enthalpy_limit_curve_name",
+            "exhaust_air_temperature_limit",
+            "exhaust_air_enthalpy_limit",
+            "time_of_day_economizer_flow_control_schedule_name",
+            "high_humidity_control_flag",
+            "humidistat_control_zone_name",
+            "high_humidity_outdoor_air_flow_ratio",
+            "control_high_indoor_humidity_based_on_outdoor_humidity_ratio",
+        ],
+        "numeric": [
+            "temperature_high_limit",
+            "temperature_low_limit",
+            "enthalpy_high_limit",
+            "dewpoint_temperature_limit",
+            "high_humidity_outdoor_air_flow_ratio",
+        ],
+        "choices": {
+            "exhaust_air_temperature_limit": [
+                "ExhaustAirTemperatureLimit",
+                "NoExhaustAirTemperatureLimit",
+            ],
+            "exhaust_air_enthalpy_limit": [
+                "ExhaustAirEnthalpyLimit",
+                "NoExhaustAirEnthalpyLimit",
+            ],
+            "high_humidity_control_flag": ["No", "Yes"],
+            "control_high_indoor_humidity_based_on_outdoor_humidity_ratio": [
+                "No",
+                "Yes",
+            ],
+        },
+        "references": ["ControllerStandAloneEnergyRecoveryVentilator"],
+        "object_lists": {
+            "electronic_enthalpy_limit_curve_name": ["UnivariateFunctions"],
+            "time_of_day_economizer_flow_control_schedule_name": ["ScheduleNames"],
+            "humidistat_control_zone_name": ["ZoneNames"],
+        },
+    },
+    "ZoneHVAC:EquipmentConnections": {
+        "name": False,
+        "fields": [
+            "zone_name",
+            "zone_conditioning_equipment_list_name",
+            "zone_air_inlet_node_or_nodelist_name",
+            "zone_air_exhaust_node_or_nodelist_name",
+            "zone_air_node_name",
+            "zone_return_air_node_or_nodelist_name",
+            "zone_return_air_node_1_flow_rate_fraction_schedule_name",
+            "zone_return_air_node_1_flow_rate_basis_node_or_nodelist_name",
+        ],
+        "object_lists": {
+            "zone_name": ["ZoneNames"],
+            "zone_conditioning_equipment_list_name": ["ZoneEquipmentLists"],
+            "zone_return_air_node_1_flow_rate_fraction_schedule_name": [
+                "ScheduleNames"
+            ],
+        },
+    },
+    "ZoneHVAC:EquipmentList": {
+        "name": True,
+        "fields": ["load_distribution_scheme"],
+        "extension": "equipment",
+        "extensibles": [
+            "zone_equipment_object_type",
+            "zone_equipment_name",
+            "zone_equipment_cooling_sequence",
+            "zone_equipment_heating_or_no_load_sequence",
+            "zone_equipment_sequential_cooling_fraction_schedule_name",
+            "zone_equipment_sequential_heating_fraction_schedule_name",
+        ],
+        "numeric": [
+            "zone_equipment_cooling_sequence",
+            "zone_equipment_heating_or_no_load_sequence",
+        ],
+        "choices": {
+            "load_distribution_scheme": [
+                "SequentialLoad",
+                "SequentialUniformPLR",
+                "UniformLoad",
+                "UniformPLR",
+            ],
+            "zone_equipment_object_type": [
+                "AirLoopHVAC:UnitarySystem",
+                "Fan:ZoneExhaust",
+                "HeatExchanger:AirToAir:FlatPlate",
+                "WaterHeater:HeatPump:PumpedCondenser",
+                "WaterHeater:HeatPump:WrappedCondenser",
+                "ZoneHVAC:AirDistributionUnit",
+                "ZoneHVAC:Baseboard:Convective:Electric",
+                "ZoneHVAC:Baseboard:Convective:Water",
+                "ZoneHVAC:Baseboard:RadiantConvective:Electric",
+                "ZoneHVAC:Baseboard:RadiantConvective:Steam",
+                "ZoneHVAC:Baseboard:RadiantConvective:Water",
+                "ZoneHVAC:CoolingPanel:RadiantConvective:Water",
+                "ZoneHVAC:Dehumidifier:DX",
+                "ZoneHVAC:EnergyRecoveryVentilator",
+                "ZoneHVAC:EvaporativeCoolerUnit",
+                "ZoneHVAC:ForcedAir:UserDefined",
+                "ZoneHVAC:FourPipeFanCoil",
+                "ZoneHVAC:HighTemperatureRadiant",
+                "ZoneHVAC:HybridUnitaryHVAC",
+                "ZoneHVAC:IdealLoadsAirSystem",
+                "ZoneHVAC:LowTemperatureRadiant:ConstantFlow",
+                "ZoneHVAC:LowTemperatureRadiant:Electric",
+                "ZoneHVAC:LowTemperatureRadiant:VariableFlow",
+                "ZoneHVAC:OutdoorAirUnit",
+                "ZoneHVAC:PackagedTerminalAirConditioner",
+                "ZoneHVAC:PackagedTerminalHeatPump",
+                "ZoneHVAC:RefrigerationChillerSet",
+                "ZoneHVAC:TerminalUnit:VariableRefrigerantFlow",
+                "ZoneHVAC:UnitHeater",
+                "ZoneHVAC:UnitVentilator",
+                "ZoneHVAC:VentilatedSlab",
+                "ZoneHVAC:WaterToAirHeatPump",
+                "ZoneHVAC:WindowAirConditioner",
+            ],
+        },
+        "references": ["ZoneEquipmentLists"],
+        "object_lists": {
+            "zone_equipment_name": ["ZoneEquipmentNames"],
+            "zone_equipment_sequential_cooling_fraction_schedule_name": [
+                "ScheduleNames"
+            ],
+            "zone_equipment_sequential_heating_fraction_schedule_name": [
+                "ScheduleNames"
+            ],
+        },
+        "object_types": {"zone_equipment_name": "zone_equipment_object_type"},
+    },
+    "ZoneHVAC:FourPipeFanCoil": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "capacity_control_method",
+            "maximum_supply_air_flow_rate",
+            "low_speed_supply_air_flow_ratio",
+            "medium_speed_supply_air_flow_ratio",
+            "maximum_outdoor_air_flow_rate",
+            "outdoor_air_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "outdoor_air_mixer_object_type",
+            "outdoor_air_mixer_name",
+            "supply_air_fan_object_type",
+            "supply_air_fan_name",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "maximum_cold_water_flow_rate",
+            "minimum_cold_water_flow_rate",
+            "cooling_convergence_tolerance",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "maximum_hot_water_flow_rate",
+            "minimum_hot_water_flow_rate",
+            "heating_convergence_tolerance",
+            "availability_manager_list_name",
+            "design_specification_zonehvac_sizing_object_name",
+            "supply_air_fan_operating_mode_schedule_name",
+            "minimum_supply_air_temperature_in_cooling_mode",
+            "maximum_supply_air_temperature_in_heating_mode",
+        ],
+        "numeric": [
+            "maximum_supply_air_flow_rate",
+            "low_speed_supply_air_flow_ratio",
+            "medium_speed_supply_air_flow_ratio",
+            "maximum_outdoor_air_flow_rate",
+            "maximum_cold_water_flow_rate",
+            "minimum_cold_water_flow_rate",
+            "cooling_convergence_tolerance",
+            "maximum_hot_water_flow_rate",
+            "minimum_hot_water_flow_rate",
+            "heating_convergence_tolerance",
+            "minimum_supply_air_temperature_in_cooling_mode",
+            "maximum_supply_air_temperature_in_heating_mode",
+        ],
+        "choices": {
+            "capacity_control_method": [
+                "ASHRAE90VariableFan",
+                "ConstantFanVariableFlow",
+                "CyclingFan",
+                "MultiSpeedFan",
+                "VariableFanConstantFlow",
+                "VariableFanVariableFlow",
+            ],
+            "maximum_supply_air_flow_rate": ["Autosize"],
+            "maximum_outdoor_air_flow_rate": ["Autosize"],
+            "outdoor_air_mixer_object_type": ["OutdoorAir:Mixer"],
+            "supply_air_fan_object_type": [
+                "Fan:ConstantVolume",
+                "Fan:OnOff",
+                "Fan:SystemModel",
+                "Fan:VariableVolume",
+            ],
+            "cooling_coil_object_type": [
+                "Coil:Cooling:Water",
+                "Coil:Cooling:Water:DetailedGeometry",
+                "CoilSystem:Cooling:Water:HeatExchangerAssisted",
+            ],
+            "maximum_cold_water_flow_rate": ["Autosize"],
+            "heating_coil_object_type": ["Coil:Heating:Electric", "Coil:Heating:Water"],
+            "maximum_hot_water_flow_rate": ["Autosize"],
+            "minimum_supply_air_temperature_in_cooling_mode": ["Autosize"],
+            "maximum_supply_air_temperature_in_heating_mode": ["Autosize"],
+        },
+        "references": ["DOAToZonalUnit", "ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "outdoor_air_schedule_name": ["ScheduleNames"],
+            "outdoor_air_mixer_name": ["OutdoorAirMixers"],
+            "supply_air_fan_name": ["FansCVandOnOffandVAV", "FansSystemModel"],
+            "cooling_coil_name": ["CoolingCoilsWater"],
+            "heating_coil_name": ["HeatingCoilsElectric", "HeatingCoilsWater"],
+            "availability_manager_list_name": ["SystemAvailabilityManagerLists"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+        },
+        "object_types": {
+            "outdoor_air_mixer_name": "outdoor_air_mixer_object_type",
+            "supply_air_fan_name": "supply_air_fan_object_type",
+            "cooling_coil_name": "cooling_coil_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+        },
+    },
+    "ZoneHVAC:HighTemperatureRadiant": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "zone_name",
+            "heating_design_capacity_method",
+            "heating_design_capacity",
+            "heating_design_capacity_per_floor_area",
+            "fraction_of_autosized_heating_design_capacity",
+            "fuel_type",
+            "combustion_efficiency",
+            "fraction_of_input_converted_to_radiant_energy",
+            "fraction_of_input_converted_to_latent_energy",
+            "fraction_of_input_that_is_lost",
+            "temperature_control_type",
+            "heating_throttling_range",
+            "heating_setpoint_temperature_schedule_name",
+            "fraction_of_radiant_energy_incident_on_people",
+        ],
+        "extension": "surface_fractions",
+        "extensibles": ["surface_name", "fraction_of_radiant_energy_to_surface"],
+        "numeric": [
+            "heating_design_capacity",
+            "heating_design_capacity_per_floor_area",
+            "fraction_of_autosized_heating_design_capacity",
+            "combustion_efficiency",
+            "fraction_of_input_converted_to_radiant_energy",
+            "fraction_of_input_converted_to_latent_energy",
+            "fraction_of_input_that_is_lost",
+            "heating_throttling_range",
+            "fraction_of_radiant_energy_incident_on_people",
+            "fraction_of_radiant_energy_to_surface",
+        ],
+        "choices": {
+            "heating_design_capacity_method": [
+                "CapacityPerFloorArea",
+                "FractionOfAutosizedHeatingCapacity",
+                "HeatingDesignCapacity",
+            ],
+            "heating_design_capacity": ["Autosize"],
+            "fuel_type": ["Electricity", "NaturalGas"],
+            "temperature_control_type": [
+                "MeanAirTemperature",
+                "MeanAirTemperatureSetpoint",
+                "MeanRadiantTemperature",
+                "MeanRadiantTemperatureSetpoint",
+                "OperativeTemperature",
+                "OperativeTemperatureSetpoint",
+            ],
+        },
+        "references": ["ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+            "heating_setpoint_temperature_schedule_name": ["ScheduleNames"],
+            "surface_name": ["AllHeatTranSurfNames"],
+        },
+    },
+    "ZoneHVAC:IdealLoadsAirSystem": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "zone_supply_air_node_name",
+            "zone_exhaust_air_node_name",
+            "system_inlet_air_node_name",
+            "maximum_heating_supply_air_temperature",
+            "minimum_cooling_supply_air_temperature",
+            "maximum_heating_supply_air_humidity_ratio",
+            "minimum_cooling_supply_air_humidity_ratio",
+            "heating_limit",
+            "maximum_heating_air_flow_rate",
+            "maximum_sensible_heating_capacity",
+            "cooling_limit",
+            "maximum_cooling_air_flow_rate",
+            "maximum_total_cooling_capacity",
+            "heating_availability_schedule_name",
+            "cooling_availability_schedule_name",
+            "dehumidification_control_type",
+            "cooling_sensible_heat_ratio",
+            "humidification_control_type",
+            "design_specification_outdoor_air_object_name",
+            "outdoor_air_inlet_node_name",
+            "demand_controlled_ventilation_type",
+            "outdoor_air_economizer_type",
+            "heat_recovery_type",
+            "sensible_heat_recovery_effectiveness",
+            "latent_heat_recovery_effectiveness",
+            "design_specification_zonehvac_sizing_object_name",
+        ],
+        "numeric": [
+            "maximum_heating_supply_air_temperature",
+            "minimum_cooling_supply_air_temperature",
+            "maximum_heating_supply_air_humidity_ratio",
+            "minimum_cooling_supply_air_humidity_ratio",
+            "maximum_heating_air_flow_rate",
+            "maximum_sensible_heating_capacity",
+            "maximum_cooling_air_flow_rate",
+            "maximum_total_cooling_capacity",
+            "cooling_sensible_heat_ratio",
+            "sensible_heat_recovery_effectiveness",
+            "latent_heat_recovery_effectiveness",
+        ],
+        "choices": {
+            "heating_limit": [
+                "LimitCapacity",
+                "LimitFlowRate",
+                "LimitFlowRateAndCapacity",
+                "NoLimit",
+            ],
+            "maximum_heating_air_flow_rate": ["Autosize"],
+            "maximum_sensible_heating_capacity": ["Autosize"],
+            "cooling_limit": [
+                "LimitCapacity",
+                "LimitFlowRate",
+                "LimitFlowRateAndCapacity",
+                "NoLimit",
+            ],
+            "maximum_cooling_air_flow_rate": ["Autosize"],
+            "maximum_total_cooling_capacity": ["Autosize"],
+            "dehumidification_control_type": [
+                "ConstantSensibleHeatRatio",
+                "ConstantSupplyHumidityRatio",
+                "Humidistat",
+                "None",
+            ],
+            "humidification_control_type": [
+                "ConstantSupplyHumidityRatio",
+                "Humidistat",
+                "None",
+            ],
+            "demand_controlled_ventilation_type": [
+                "CO2Setpoint",
+                "None",
+                "OccupancySchedule",
+            ],
+            "outdoor_air_economizer_type": [
+                "DifferentialDryBulb",
+                "DifferentialEnthalpy",
+                "NoEconomizer",
+            ],
+            "heat_recovery_type": ["Enthalpy", "None", "Sensible"],
+        },
+        "references": ["ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "heating_availability_schedule_name": ["ScheduleNames"],
+            "cooling_availability_schedule_name": ["ScheduleNames"],
+            "design_specification_outdoor_air_object_name": [
+                "DesignSpecificationOutdoorAirNames"
+            ],
+        },
+    },
+    "ZoneHVAC:PackagedTerminalAirConditioner": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "outdoor_air_mixer_object_type",
+            "outdoor_air_mixer_name",
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate_control_set_to_low_speed",
+            "cooling_outdoor_air_flow_rate",
+            "heating_outdoor_air_flow_rate",
+            "no_load_outdoor_air_flow_rate",
+            "supply_air_fan_object_type",
+            "supply_air_fan_name",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "cooling_coil_object_type",
+            "cooling_coil_name",
+            "fan_placement",
+            "supply_air_fan_operating_mode_schedule_name",
+            "availability_manager_list_name",
+            "design_specification_zonehvac_sizing_object_name",
+            "capacity_control_method",
+            "minimum_supply_air_temperature_in_cooling_mode",
+            "maximum_supply_air_temperature_in_heating_mode",
+        ],
+        "numeric": [
+            "cooling_supply_air_flow_rate",
+            "heating_supply_air_flow_rate",
+            "no_load_supply_air_flow_rate",
+            "cooling_outdoor_air_flow_rate",
+            "heating_outdoor_air_flow_rate",
+            "no_load_outdoor_air_flow_rate",
+            "minimum_supply_air_temperature_in_cooling_mode",
+            "maximum_supply_air_temperature_in_heating_mode",
+        ],
+        "choices": {
+            "outdoor_air_mixer_object_type": ["OutdoorAir:Mixer"],
+            "cooling_supply_air_flow_rate": ["Autosize"],
+            "heating_supply_air_flow_rate": ["Autosize"],
+            "no_load_supply_air_flow_rate": ["Autosize"],
+            "no_load_supply_air_flow_rate_control_set_to_low_speed": ["No", "Yes"],
+            "cooling_outdoor_air_flow_rate": ["Autosize"],
+            "heating_outdoor_air_flow_rate": ["Autosize"],
+            "no_load_outdoor_air_flow_rate": ["Autosize"],
+            "supply_air_fan_object_type": [
+                "Fan:ConstantVolume",
+                "Fan:OnOff",
+                "Fan:SystemModel",
+            ],
+            "heating_coil_object_type": [
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+            "cooling_coil_object_type": [
+                "Coil:Cooling:DX",
+                "Coil:Cooling:DX:SingleSpeed",
+                "Coil:Cooling:DX:VariableSpeed",
+                "CoilSystem:Cooling:DX:HeatExchangerAssisted",
+            ],
+            "fan_placement": ["BlowThrough", "DrawThrough"],
+            "capacity_control_method": ["None", "SingleZoneVAV"],
+            "minimum_supply_air_temperature_in_cooling_mode": ["Autosize"],
+            "maximum_supply_air_temperature_in_heating_mode": ["Autosize"],
+        },
+        "references": ["DOAToZonalUnit", "ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "outdoor_air_mixer_name": ["OutdoorAirMixers"],
+            "supply_air_fan_name": ["FansCVandOnOff", "FansSystemModel"],
+            "heating_coil_name": ["HeatingCoilName"],
+            "cooling_coil_name": ["CoolingCoilsDXSingleSpeed"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+            "availability_manager_list_name": ["SystemAvailabilityManagerLists"],
+        },
+        "object_types": {
+            "outdoor_air_mixer_name": "outdoor_air_mixer_object_type",
+            "supply_air_fan_name": "supply_air_fan_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+            "cooling_coil_name": "cooling_coil_object_type",
+        },
+    },
+    "ZoneHVAC:RefrigerationChillerSet": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "zone_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+        ],
+        "extension": "chillers",
+        "extensibles": ["air_chiller_name"],
+        "references": ["ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "zone_name": ["ZoneNames"],
+            "air_chiller_name": ["RefrigerationAirChillerNames"],
+        },
+    },
+    "ZoneHVAC:UnitHeater": {
+        "name": True,
+        "fields": [
+            "availability_schedule_name",
+            "air_inlet_node_name",
+            "air_outlet_node_name",
+            "supply_air_fan_object_type",
+            "supply_air_fan_name",
+            "maximum_supply_air_flow_rate",
+            "heating_coil_object_type",
+            "heating_coil_name",
+            "supply_air_fan_operating_mode_schedule_name",
+            "supply_air_fan_operation_during_no_heating",
+            "maximum_hot_water_or_steam_flow_rate",
+            "minimum_hot_water_or_steam_flow_rate",
+            "heating_convergence_tolerance",
+            "availability_manager_list_name",
+            "design_specification_zonehvac_sizing_object_name",
+        ],
+        "numeric": [
+            "maximum_supply_air_flow_rate",
+            "maximum_hot_water_or_steam_flow_rate",
+            "minimum_hot_water_or_steam_flow_rate",
+            "heating_convergence_tolerance",
+        ],
+        "choices": {
+            "supply_air_fan_object_type": [
+                "Fan:ConstantVolume",
+                "Fan:OnOff",
+                "Fan:SystemModel",
+                "Fan:VariableVolume",
+            ],
+            "maximum_supply_air_flow_rate": ["Autosize"],
+            "heating_coil_object_type": [
+                "Coil:Heating:Electric",
+                "Coil:Heating:Fuel",
+                "Coil:Heating:Steam",
+                "Coil:Heating:Water",
+            ],
+            "supply_air_fan_operation_during_no_heating": ["No", "Yes"],
+            "maximum_hot_water_or_steam_flow_rate": ["Autosize"],
+        },
+        "references": ["ZoneEquipmentNames"],
+        "object_lists": {
+            "availability_schedule_name": ["ScheduleNames"],
+            "supply_air_fan_name": ["FansCVandOnOffandVAV", "FansSystemModel"],
+            "heating_coil_name": ["HeatingCoilName"],
+            "supply_air_fan_operating_mode_schedule_name": ["ScheduleNames"],
+            "availability_manager_list_name": ["SystemAvailabilityManagerLists"],
+        },
+        "object_types": {
+            "supply_air_fan_name": "supply_air_fan_object_type",
+            "heating_coil_name": "heating_coil_object_type",
+        },
+    },
+    "ZoneInfiltration:DesignFlowRate": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_or_space_or_spacelist_name",
+            "schedule_name",
+            "design_flow_rate_calculation_method",
+            "design_flow_rate",
+            "flow_rate_per_floor_area",
+            "flow_rate_per_exterior_surface_area",
+            "air_changes_per_hour",
+            "constant_term_coefficient",
+            "temperature_term_coefficient",
+            "velocity_term_coefficient",
+            "velocity_squared_term_coefficient",
+            "density_basis",
+        ],
+        "numeric": [
+            "design_flow_rate",
+            "flow_rate_per_floor_area",
+            "flow_rate_per_exterior_surface_area",
+            "air_changes_per_hour",
+            "constant_term_coefficient",
+            "temperature_term_coefficient",
+            "velocity_term_coefficient",
+            "velocity_squared_term_coefficient",
+        ],
+        "choices": {
+            "design_flow_rate_calculation_method": [
+                "AirChanges/Hour",
+                "Flow/Area",
+                "Flow/ExteriorArea",
+                "Flow/ExteriorWallArea",
+                "Flow/Zone",
+            ],
+            "density_basis": ["Indoor", "Outdoor", "Standard"],
+        },
+        "object_lists": {
+            "zone_or_zonelist_or_space_or_spacelist_name": ["ZoneAndZoneListNames"],
+            "schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ZoneList": {
+        "name": True,
+        "fields": [],
+        "extension": "zones",
+        "extensibles": ["zone_name"],
+        "references": [
+            "ZoneAndZoneListAndSpaceAndSpaceListNames",
+            "ZoneAndZoneListNames",
+            "ZoneListNames",
+        ],
+        "object_lists": {"zone_name": ["ZoneNames"]},
+    },
+    "ZoneMixing": {
+        "name": True,
+        "fields": [
+            "zone_or_space_name",
+            "schedule_name",
+            "design_flow_rate_calculation_method",
+            "design_flow_rate",
+            "flow_rate_per_floor_area",
+            "flow_rate_per_person",
+            "air_changes_per_hour",
+            "source_zone_or_space_name",
+            "delta_temperature",
+            "delta_temperature_schedule_name",
+            "minimum_receiving_temperature_schedule_name",
+            "maximum_receiving_temperature_schedule_name",
+            "minimum_source_temperature_schedule_name",
+            "maximum_source_temperature_schedule_name",
+            "minimum_outdoor_temperature_schedule_name",
+            "maximum_outdoor_temperature_schedule_name",
+        ],
+        "numeric": [
+            "design_flow_rate",
+            "flow_rate_per_floor_area",
+            "flow_rate_per_person",
+            "air_changes_per_hour",
+            "delta_temperature",
+        ],
+        "choices": {
+            "design_flow_rate_calculation_method": [
+                "AirChanges/Hour",
+                "Flow/Area",
+                "Flow/Person",
+                "Flow/Zone",
+            ]
+        },
+        "object_lists": {
+            "zone_or_space_name": ["ZoneNames"],
+            "schedule_name": ["ScheduleNames"],
+            "source_zone_or_space_name": ["ZoneNames"],
+            "delta_temperature_schedule_name": ["ScheduleNames"],
+            "minimum_receiving_temperature_schedule_name": ["ScheduleNames"],
+            "maximum_receiving_temperature_schedule_name": ["ScheduleNames"],
+            "minimum_source_temperature_schedule_name": ["ScheduleNames"],
+            "maximum_source_temperature_schedule_name": ["ScheduleNames"],
+            "minimum_outdoor_temperature_schedule_name": ["ScheduleNames"],
+            "maximum_outdoor_temperature_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ZoneRefrigerationDoorMixing": {
+        "name": True,
+        "fields": [
+            "zone_or_space_name_1",
+            "zone_or_space_name_2",
+            "schedule_name",
+            "door_height",
+            "door_area",
+            "door_protection_type",
+        ],
+        "numeric": ["door_height", "door_area"],
+        "choices": {"door_protection_type": ["AirCurtain", "None", "StripCurtain"]},
+        "object_lists": {
+            "zone_or_space_name_1": ["ZoneNames"],
+            "zone_or_space_name_2": ["ZoneNames"],
+            "schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ZoneVentilation:DesignFlowRate": {
+        "name": True,
+        "fields": [
+            "zone_or_zonelist_or_space_or_spacelist_name",
+            "schedule_name",
+            "design_flow_rate_calculation_method",
+            "design_flow_rate",
+            "flow_rate_per_floor_area",
+            "flow_rate_per_person",
+            "air_changes_per_hour",
+            "ventilation_type",
+            "fan_pressure_rise",
+            "fan_total_efficiency",
+            "constant_term_coefficient",
+            "temperature_term_coefficient",
+            "velocity_term_coefficient",
+            "velocity_squared_term_coefficient",
+            "minimum_indoor_temperature",
+            "minimum_indoor_temperature_schedule_name",
+            "maximum_indoor_temperature",
+            "maximum_indoor_temperature_schedule_name",
+            "delta_temperature",
+            "delta_temperature_schedule_name",
+            "minimum_outdoor_temperature",
+            "minimum_outdoor_temperature_schedule_name",
+            "maximum_outdoor_temperature",
+            "maximum_outdoor_temperature_schedule_name",
+            "maximum_wind_speed",
+            "density_basis",
+        ],
+        "numeric": [
+            "design_flow_rate",
+            "flow_rate_per_floor_area",
+            "flow_rate_per_person",
+            "air_changes_per_hour",
+            "fan_pressure_rise",
+            "fan_total_efficiency",
+            "constant_term_coefficient",
+            "temperature_term_coefficient",
+            "velocity_term_coefficient",
+            "velocity_squared_term_coefficient",
+            "minimum_indoor_temperature",
+            "maximum_indoor_temperature",
+            "delta_temperature",
+            "minimum_outdoor_temperature",
+            "maximum_outdoor_temperature",
+            "maximum_wind_speed",
+        ],
+        "choices": {
+            "design_flow_rate_calculation_method": [
+                "AirChanges/Hour",
+                "Flow/Area",
+                "Flow/Person",
+                "Flow/Zone",
+            ],
+            "ventilation_type": ["Balanced", "Exhaust", "Intake", "Natural"],
+            "density_basis": ["Indoor", "Outdoor", "Standard"],
+        },
+        "references": ["VentilationNames"],
+        "object_lists": {
+            "zone_or_zonelist_or_space_or_spacelist_name": ["ZoneAndZoneListNames"],
+            "schedule_name": ["ScheduleNames"],
+            "minimum_indoor_temperature_schedule_name": ["ScheduleNames"],
+            "maximum_indoor_temperature_schedule_name": ["ScheduleNames"],
+            "delta_temperature_schedule_name": ["ScheduleNames"],
+            "minimum_outdoor_temperature_schedule_name": ["ScheduleNames"],
+            "maximum_outdoor_temperature_schedule_name": ["ScheduleNames"],
+        },
+    },
+    "ZoneVentilation:WindandStackOpenArea": {
+        "name": True,
+        "fields": [
+            "zone_or_space_name",
+            "opening_area",
+            "opening_area_fraction_schedule_name",
+            "opening_effectiveness",
+            "effective_angle",
+            "height_difference",
+            "discharge_coefficient_for_opening",
+            "minimum_indoor_temperature",
+            "minimum_indoor_temperature_schedule_name",
+            "maximum_indoor_temperature",
+            "maximum_indoor_temperature_schedule_name",
+            "delta_temperature",
+            "delta_temperature_schedule_name",
+            "minimum_outdoor_temperature",
+            "minimum_outdoor_temperature_schedule_name",
+            "maximum_outdoor_temperature",
+            "maximum_outdoor_temperature_schedule_name",
+            "maximum_wind_speed",
+        ],
+        "numeric": [
+            "opening_area",
+            "opening_effectiveness",
+            "effective_angle",
+            "height_difference",
+            "discharge_coefficient_for_opening",
+            "minimum_indoor_temperature",
+            "maximum_indoor_temperature",
+            "delta_temperature",
+            "minimum_outdoor_temperature",
+            "maximum_outdoor_temperature",
+            "maximum_wind_speed",
+        ],
+        "choices": {
+            "opening_effectiveness": ["Autocalculate"],
+            "discharge_coefficient_for_opening": ["Autocalculate"],
+        },
+        "references": ["VentilationNames"],
+        "object_lists": {
+            "zone_or_space_name": ["ZoneNames"],
+            "opening_area_fraction_schedule_name": ["ScheduleNames"],
+            "minimum_indoor_temperature_schedule_name": ["ScheduleNames"],
+            "maximum_indoor_temperature_schedule_name": ["ScheduleNames"],
+            "delta_temperature_schedule_name": ["ScheduleNames"],
+            "minimum_outdoor_temperature_schedule_name": ["ScheduleNames"],
+            "maximum_outdoor_temperature_schedule_name": ["ScheduleNames"],
+        },
+    },
+}
+
+# Every epJSON object type of the schema, including those outside keys.txt
+SCHEMA_OBJECT_TYPES: FrozenSet[str] = frozenset(
+    [
+        "AirConditioner:VariableRefrigerantFlow",
+        "AirConditioner:VariableRefrigerantFlow:FluidTemperatureControl",
+        "AirConditioner:VariableRefrigerantFlow:FluidTemperatureControl:HR",
+        "AirLoopHVAC",
+        "AirLoopHVAC:ControllerList",
+        "AirLoopHVAC:DedicatedOutdoorAirSystem",
+        "AirLoopHVAC:ExhaustSystem",
+        "AirLoopHVAC:Mixer",
+        "AirLoopHVAC:OutdoorAirSystem",
+        "AirLoopHVAC:OutdoorAirSystem:EquipmentList",
+        "AirLoopHVAC:ReturnPath",
+        "AirLoopHVAC:ReturnPlenum",
+        "AirLoopHVAC:Splitter",
+        "AirLoopHVAC:SupplyPath",
+        "AirLoopHVAC:SupplyPlenum",
+        "AirLoopHVAC:Unitary:Furnace:HeatCool",
+        "AirLoopHVAC:Unitary:Furnace:HeatOnly",
+        "AirLoopHVAC:UnitaryHeatCool",
+        "AirLoopHVAC:UnitaryHeatCool:VAVChangeoverBypass",
+        "AirLoopHVAC:UnitaryHeatOnly",
+        "AirLoopHVAC:UnitaryHeatPump:AirToAir",
+        "AirLoopHVAC:UnitaryHeatPump:AirToAir:MultiSpeed",
+        "AirLoopHVAC:UnitaryHeatPump:WaterToAir",
+        "AirLoopHVAC:UnitarySystem",
+        "AirLoopHVAC:ZoneMixer",
+        "AirLoopHVAC:ZoneSplitter",
+        "AirTerminal:DualDuct:ConstantVolume",
+        "AirTerminal:DualDuct:VAV",
+        "AirTerminal:DualDuct:VAV:OutdoorAir",
+        "AirTerminal:SingleDuct:ConstantVolume:CooledBeam",
+        "AirTerminal:SingleDuct:ConstantVolume:FourPipeBeam",
+        "AirTerminal:SingleDuct:ConstantVolume:FourPipeInduction",
+        "AirTerminal:SingleDuct:ConstantVolume:NoReheat",
+        "AirTerminal:SingleDuct:ConstantVolume:Reheat",
+        "AirTerminal:SingleDuct:Mixer",
+        "AirTerminal:SingleDuct:ParallelPIU:Reheat",
+        "AirTerminal:SingleDuct:SeriesPIU:Reheat",
+        "AirTerminal:SingleDuct:UserDefined",
+        "AirTerminal:SingleDuct:VAV:HeatAndCool:NoReheat",
+        "AirTerminal:SingleDuct:VAV:HeatAndCool:Reheat",
+        "AirTerminal:SingleDuct:VAV:NoReheat",
+        "AirTerminal:SingleDuct:VAV:Reheat",
+        "AirTerminal:SingleDuct:VAV:Reheat:VariableSpeedFan",
+        "AirflowNetwork:Distribution:Component:Coil",
+        "AirflowNetwork:Distribution:Component:ConstantPressureDrop",
+        "AirflowNetwork:Distribution:Component:Duct",
+        "AirflowNetwork:Distribution:Component:Fan",
+        "AirflowNetwork:Distribution:Component:HeatExchanger",
+        "AirflowNetwork:Distribution:Component:Leak",
+        "AirflowNetwork:Distribution:Component:LeakageRatio",
+        "AirflowNetwork:Distribution:Component:OutdoorAirFlow",
+        "AirflowNetwork:Distribution:Component:ReliefAirFlow",
+        "AirflowNetwork:Distribution:Component:TerminalUnit",
+        "AirflowNetwork:Distribution:DuctSizing",
+        "AirflowNetwork:Distribution:DuctViewFactors",
+        "AirflowNetwork:Distribution:Linkage",
+        "AirflowNetwork:Distribution:Node",
+        "AirflowNetwork:IntraZone:Linkage",
+        "AirflowNetwork:IntraZone:Node",
+        "AirflowNetwork:MultiZone:Component:DetailedOpening",
+        "AirflowNetwork:MultiZone:Component:HorizontalOpening",
+        "AirflowNetwork:MultiZone:Component:SimpleOpening",
+        "AirflowNetwork:MultiZone:Component:ZoneExhaustFan",
+        "AirflowNetwork:MultiZone:ExternalNode",
+        "AirflowNetwork:MultiZone:ReferenceCrackConditions",
+        "AirflowNetwork:MultiZone:SpecifiedFlowRate",
+        "AirflowNetwork:MultiZone:Surface",
+        "AirflowNetwork:MultiZone:Surface:Crack",
+        "AirflowNetwork:MultiZone:Surface:EffectiveLeakageArea",
+        "AirflowNetwork:MultiZone:WindPressureCoefficientArray",
+        "AirflowNetwork:MultiZone:WindPressureCoefficientValues",
+        "AirflowNetwork:MultiZone:Zone",
+        "AirflowNetwork:OccupantVentilationControl",
+        "AirflowNetwork:SimulationControl",
+        "AirflowNetwork:ZoneControl:PressureController",
+        "AvailabilityManager:DifferentialThermostat",
+        "AvailabilityManager:HighTemperatureTurnOff",
+        "AvailabilityManager:HighTemperatureTurnOn",
+        "AvailabilityManager:HybridVentilation",
+        "AvailabilityManager:LowTemperatureTurnOff",
+        "AvailabilityManager:LowTemperatureTurnOn",
+        "AvailabilityManager:NightCycle",
+        "AvailabilityManager:NightVentilation",
+        "AvailabilityManager:OptimumStart",
+        "AvailabilityManager:Scheduled",
+        "AvailabilityManager:ScheduledOff",
+        "AvailabilityManager:ScheduledOn",
+        "AvailabilityManagerAssignmentList",
+        "Boiler:HotWater",
+        "Boiler:Steam",
+        "Branch",
+        "BranchList",
+        "Building",
+        "BuildingSurface:Detailed",
+        "Ceiling:Adiabatic",
+        "Ceiling:Interzone",
+        "CentralHeatPumpSystem",
+        "Chiller:Absorption",
+        "Chiller:Absorption:Indirect",
+        "Chiller:CombustionTurbine",
+        "Chiller:ConstantCOP",
+        "Chiller:Electric",
+        "Chiller:Electric:ASHRAE205",
+        "Chiller:Electric:EIR",
+        "Chiller:Electric:ReformulatedEIR",
+        "Chiller:EngineDriven",
+        "ChillerHeater:Absorption:DirectFired",
+        "ChillerHeater:Absorption:DoubleEffect",
+        "ChillerHeaterPerformance:Electric:EIR",
+        "Coil:Cooling:DX",
+        "Coil:Cooling:DX:CurveFit:OperatingMode",
+        "Coil:Cooling:DX:CurveFit:Performance",
+        "Coil:Cooling:DX:CurveFit:Speed",
+        "Coil:Cooling:DX:MultiSpeed",
+        "Coil:Cooling:DX:SingleSpeed",
+        "Coil:Cooling:DX:SingleSpeed:ThermalStorage",
+        "Coil:Cooling:DX:TwoSpeed",
+        "Coil:Cooling:DX:TwoStageWithHumidityControlMode",
+        "Coil:Cooling:DX:VariableRefrigerantFlow",
+        "Coil:Cooling:DX:VariableRefrigerantFlow:FluidTemperatureControl",
+        "Coil:Cooling:DX:VariableSpeed",
+        "Coil:Cooling:Water",
+        "Coil:Cooling:Water:DetailedGeometry",
+        "Coil:Cooling:WaterToAirHeatPump:EquationFit",
+        "Coil:Cooling:WaterToAirHeatPump:ParameterEstimation",
+        "Coil:Cooling:WaterToAirHeatPump:VariableSpeedEquationFit",
+        "Coil:Heating:DX:MultiSpeed",
+        "Coil:Heating:DX:SingleSpeed",
+        "Coil:Heating:DX:VariableRefrigerantFlow",
+        "Coil:Heating:DX:VariableRefrigerantFlow:FluidTemperatureControl",
+        "Coil:Heating:DX:VariableSpeed",
+        "Coil:Heating:Desuperheater",
+        "Coil:Heating:Electric",
+        "Coil:Heating:Electric:MultiStage",
+        "Coil:Heating:Fuel",
+        "Coil:Heating:Gas:MultiStage",
+        "Coil:Heating:Steam",
+        "Coil:Heating:Water",
+        "Coil:Heating:WaterToAirHeatPump:EquationFit",
+        "Coil:Heating:WaterToAirHeatPump:ParameterEstimation",
+        "Coil:Heating:WaterToAirHeatPump:VariableSpeedEquationFit",
+        "Coil:UserDefined",
+        "Coil:WaterHeating:AirToWaterHeatPump:Pumped",
+        "Coil:WaterHeating:AirToWaterHeatPump:VariableSpeed",
+        "Coil:WaterHeating:AirToWaterHeatPump:Wrapped",
+        "Coil:WaterHeating:Desuperheater",
+        "CoilPerformance:DX:Cooling",
+        "CoilSystem:Cooling:DX",
+        "CoilSystem:Cooling:DX:HeatExchangerAssisted",
+        "CoilSystem:Cooling:Water",
+        "CoilSystem:Cooling:Water:HeatExchangerAssisted",
+        "CoilSystem:Heating:DX",
+        "CoilSystem:IntegratedHeatPump:AirSource",
+        "ComfortViewFactorAngles",
+        "ComplexFenestrationProperty:SolarAbsorbedLayers",
+        "Compliance:Building",
+        "ComponentCost:Adjustments",
+        "ComponentCost:LineItem",
+        "ComponentCost:Reference",
+        "CondenserEquipmentList",
+        "CondenserEquipmentOperationSchemes",
+        "CondenserLoop",
+        "Connector:Mixer",
+        "Connector:Splitter",
+        "ConnectorList",
+        "Construction",
+        "Construction:AirBoundary",
+        "Construction:CfactorUndergroundWall",
+        "Construction:ComplexFenestrationState",
+        "Construction:FfactorGroundFloor",
+        "Construction:WindowDataFile",
+        "Construction:WindowEquivalentLayer",
+        "ConstructionProperty:InternalHeatSource",
+        "Controller:MechanicalVentilation",
+        "Controller:OutdoorAir",
+        "Controller:WaterCoil",
+        "ConvergenceLimits",
+        "CoolingTower:SingleSpeed",
+        "CoolingTower:TwoSpeed",
+        "CoolingTower:VariableSpeed",
+        "CoolingTower:VariableSpeed:Merkel",
+        "CoolingTowerPerformance:CoolTools",
+        "CoolingTowerPerformance:YorkCalc",
+        "CurrencyType",
+        "Curve:Bicubic",
+        "Curve:Biquadratic",
+        "Curve:ChillerPartLoadWithLift",
+        "Curve:Cubic",
+        "Curve:CubicLinear",
+        "Curve:DoubleExponentialDecay",
+        "Curve:Exponent",
+        "Curve:ExponentialDecay",
+        "Curve:ExponentialSkewNormal",
+        "Curve:FanPressureRise",
+        "Curve:Functional:PressureDrop",
+        "Curve:Linear",
+        "Curve:QuadLinear",
+        "Curve:Quadratic",
+        "Curve:QuadraticLinear",
+        "Curve:Quartic",
+        "Curve:QuintLinear",
+        "Curve:RectangularHyperbola1",
+        "Curve:RectangularHyperbola2",
+        "Curve:Sigmoid",
+        "Curve:Triquadratic",
+        "Daylighting:Controls",
+        "Daylighting:DELight:ComplexFenestration",
+        "Daylighting:ReferencePoint",
+        "DaylightingDevice:LightWell",
+        "DaylightingDevice:Shelf",
+        "DaylightingDevice:Tubular",
+        "Dehumidifier:Desiccant:NoFans",
+        "Dehumidifier:Desiccant:System",
+        "DemandManager:ElectricEquipment",
+        "DemandManager:ExteriorLights",
+        "DemandManager:Lights",
+        "DemandManager:Thermostats",
+        "DemandManager:Ventilation",
+        "DemandManagerAssignmentList",
+        "DesignSpecification:AirTerminal:Sizing",
+        "DesignSpecification:OutdoorAir",
+        "DesignSpecification:OutdoorAir:SpaceList",
+        "DesignSpecification:ZoneAirDistribution",
+        "DesignSpecification:ZoneHVAC:Sizing",
+        "DistrictCooling",
+        "DistrictHeating:Steam",
+        "DistrictHeating:Water",
+        "Door",
+        "Door:Interzone",
+        "Duct",
+        "ElectricEquipment",
+        "ElectricEquipment:ITE:AirCooled",
+        "ElectricLoadCenter:Distribution",
+        "ElectricLoadCenter:Generators",
+        "ElectricLoadCenter:Inverter:FunctionOfPower",
+        "ElectricLoadCenter:Inverter:LookUpTable",
+        "ElectricLoadCenter:Inverter:PVWatts",
+        "ElectricLoadCenter:Inverter:Simple",
+        "ElectricLoadCenter:Storage:Battery",
+        "ElectricLoadCenter:Storage:Converter",
+        "ElectricLoadCenter:Storage:LiIonNMCBattery",
+        "ElectricLoadCenter:Storage:Simple",
+        "ElectricLoadCenter:Transformer",
+        "EnergyManagementSystem:Actuator",
+        "EnergyManagementSystem:ConstructionIndexVariable",
+        "EnergyManagementSystem:CurveOrTableIndexVariable",
+        "EnergyManagementSystem:GlobalVariable",
+        "EnergyManagementSystem:InternalVariable",
+        "EnergyManagementSystem:MeteredOutputVariable",
+        "EnergyManagementSystem:OutputVariable",
+        "EnergyManagementSystem:Program",
+        "EnergyManagementSystem:ProgramCallingManager",
+        "EnergyManagementSystem:Sensor",
+        "EnergyManagementSystem:Subroutine",
+        "EnergyManagementSystem:TrendVariable",
+        "EnvironmentalImpactFactors",
+        "EvaporativeCooler:Direct:CelDekPad",
+        "EvaporativeCooler:Direct:ResearchSpecial",
+        "EvaporativeCooler:Indirect:CelDekPad",
+        "EvaporativeCooler:Indirect:ResearchSpecial",
+        "EvaporativeCooler:Indirect:WetCoil",
+        "EvaporativeFluidCooler:SingleSpeed",
+        "EvaporativeFluidCooler:TwoSpeed",
+        "Exterior:FuelEquipment",
+        "Exterior:Lights",
+        "Exterior:WaterEquipment",
+        "ExternalInterface",
+        "ExternalInterface:Actuator",
+        "ExternalInterface:FunctionalMockupUnitExport:From:Variable",
+        "ExternalInterface:FunctionalMockupUnitExport:To:Actuator",
+        "ExternalInterface:FunctionalMockupUnitExport:To:Schedule",
+        "ExternalInterface:FunctionalMockupUnitExport:To:Variable",
+        "ExternalInterface:FunctionalMockupUnitImport",
+        "ExternalInterface:FunctionalMockupUnitImport:From:Variable",
+        "ExternalInterface:FunctionalMockupUnitImport:To:Actuator",
+        "ExternalInterface:FunctionalMockupUnitImport:To:Schedule",
+        "ExternalInterface:FunctionalMockupUnitImport:To:Variable",
+        "ExternalInterface:Schedule",
+        "ExternalInterface:Variable",
+        "Fan:ComponentModel",
+        "Fan:ConstantVolume",
+        "Fan:OnOff",
+        "Fan:SystemModel",
+        "Fan:VariableVolume",
+        "Fan:ZoneExhaust",
+        "FanPerformance:NightVentilation",
+        "FaultModel:EnthalpySensorOffset:OutdoorAir",
+        "FaultModel:EnthalpySensorOffset:ReturnAir",
+        "FaultModel:Fouling:AirFilter",
+        "FaultModel:Fouling:Boiler",
+        "FaultModel:Fouling:Chiller",
+        "FaultModel:Fouling:Coil",
+        "FaultModel:Fouling:CoolingTower",
+        "FaultModel:Fouling:EvaporativeCooler",
+        "FaultModel:HumidistatOffset",
+        "FaultModel:HumiditySensorOffset:OutdoorAir",
+        "FaultModel:TemperatureSensorOffset:ChillerSupplyWater",
+        "FaultModel:TemperatureSensorOffset:CoilSupplyAir",
+        "FaultModel:TemperatureSensorOffset:CondenserSupplyWater",
+        "FaultModel:TemperatureSensorOffset:OutdoorAir",
+        "FaultModel:TemperatureSensorOffset:ReturnAir",
+        "FaultModel:ThermostatOffset",
+        "FenestrationSurface:Detailed",
+        "Floor:Adiabatic",
+        "Floor:Detailed",
+        "Floor:GroundContact",
+        "Floor:Interzone",
+        "FluidCooler:SingleSpeed",
+        "FluidCooler:TwoSpeed",
+        "FluidProperties:Concentration",
+        "FluidProperties:GlycolConcentration",
+        "FluidProperties:Name",
+        "FluidProperties:Saturated",
+        "FluidProperties:Superheated",
+        "FluidProperties:Temperatures",
+        "Foundation:Kiva",
+        "Foundation:Kiva:Settings",
+        "FuelFactors",
+        "GasEquipment",
+        "Generator:CombustionTurbine",
+        "Generator:FuelCell",
+        "Generator:FuelCell:AirSupply",
+        "Generator:FuelCell:AuxiliaryHeater",
+        "Generator:FuelCell:ElectricalStorage",
+        "Generator:FuelCell:ExhaustGasToWaterHeatExchanger",
+        "Generator:FuelCell:Inverter",
+        "Generator:FuelCell:PowerModule",
+        "Generator:FuelCell:StackCooler",
+        "Generator:FuelCell:WaterSupply",
+        "Generator:FuelSupply",
+        "Generator:InternalCombustionEngine",
+        "Generator:MicroCHP",
+        "Generator:MicroCHP:NonNormalizedParameters",
+        "Generator:MicroTurbine",
+        "Generator:PVWatts",
+        "Generator:Photovoltaic",
+        "Generator:WindTurbine",
+        "GeometryTransform",
+        "GlazedDoor",
+        "GlazedDoor:Interzone",
+        "GlobalGeometryRules",
+        "GroundHeatExchanger:HorizontalTrench",
+        "GroundHeatExchanger:Pond",
+        "GroundHeatExchanger:ResponseFactors",
+        "GroundHeatExchanger:Slinky",
+        "GroundHeatExchanger:Surface",
+        "GroundHeatExchanger:System",
+        "GroundHeatExchanger:Vertical:Array",
+        "GroundHeatExchanger:Vertical:Properties",
+        "GroundHeatExchanger:Vertical:Single",
+        "GroundHeatTransfer:Basement:AutoGrid",
+        "GroundHeatTransfer:Basement:BldgData",
+        "GroundHeatTransfer:Basement:ComBldg",
+        "GroundHeatTransfer:Basement:EquivAutoGrid",
+        "GroundHeatTransfer:Basement:EquivSlab",
+        "GroundHeatTransfer:Basement:Insulation",
+        "GroundHeatTransfer:Basement:Interior",
+        "GroundHeatTransfer:Basement:ManualGrid",
+        "GroundHeatTransfer:Basement:MatlProps",
+        "GroundHeatTransfer:Basement:SimParameters",
+        "GroundHeatTransfer:Basement:SurfaceProps",
+        "GroundHeatTransfer:Basement:XFACE",
+        "GroundHeatTransfer:Basement:YFACE",
+        "GroundHeatTransfer:Basement:ZFACE",
+        "GroundHeatTransfer:Control",
+        "GroundHeatTransfer:Slab:AutoGrid",
+        "GroundHeatTransfer:Slab:BldgProps",
+        "GroundHeatTransfer:Slab:BoundConds",
+        "GroundHeatTransfer:Slab:EquivalentSlab",
+        "GroundHeatTransfer:Slab:Insulation",
+        "GroundHeatTransfer:Slab:ManualGrid",
+        "GroundHeatTransfer:Slab:Materials",
+        "GroundHeatTransfer:Slab:MatlProps",
+        "GroundHeatTransfer:Slab:XFACE",
+        "GroundHeatTransfer:Slab:YFACE",
+        "GroundHeatTransfer:Slab:ZFACE",
+        "HVACSystemRootFindingAlgorithm",
+        "HVACTemplate:Plant:Boiler",
+        "HVACTemplate:Plant:Boiler:ObjectReference",
+        "HVACTemplate:Plant:ChilledWaterLoop",
+        "HVACTemplate:Plant:Chiller",
+        "HVACTemplate:Plant:Chiller:ObjectReference",
+        "HVACTemplate:Plant:HotWaterLoop",
+        "HVACTemplate:Plant:MixedWaterLoop",
+        "HVACTemplate:Plant:Tower",
+        "HVACTemplate:Plant:Tower:ObjectReference",
+        "HVACTemplate:System:ConstantVolume",
+        "HVACTemplate:System:DedicatedOutdoorAir",
+        "HVACTemplate:System:DualDuct",
+        "HVACTemplate:System:PackagedVAV",
+        "HVACTemplate:System:Unitary",
+        "HVACTemplate:System:UnitaryHeatPump:AirToAir",
+        "HVACTemplate:System:UnitarySystem",
+        "HVACTemplate:System:VAV",
+        "HVACTemplate:System:VRF",
+        "HVACTemplate:Thermostat",
+        "HVACTemplate:Zone:BaseboardHeat",
+        "HVACTemplate:Zone:ConstantVolume",
+        "HVACTemplate:Zone:DualDuct",
+        "HVACTemplate:Zone:FanCoil",
+        "HVACTemplate:Zone:IdealLoadsAirSystem",
+        "HVACTemplate:Zone:PTAC",
+        "HVACTemplate:Zone:PTHP",
+        "HVACTemplate:Zone:Unitary",
+        "HVACTemplate:Zone:VAV",
+        "HVACTemplate:Zone:VAV:FanPowered",
+        "HVACTemplate:Zone:VAV:HeatAndCool",
+        "HVACTemplate:Zone:VRF",
+        "HVACTemplate:Zone:WaterToAirHeatPump",
+        "HeaderedPumps:ConstantSpeed",
+        "HeaderedPumps:VariableSpeed",
+        "HeatBalanceAlgorithm",
+        "HeatBalanceSettings:ConductionFiniteDifference",
+        "HeatExchanger:AirToAir:FlatPlate",
+        "HeatExchanger:AirToAir:SensibleAndLatent",
+        "HeatExchanger:Desiccant:BalancedFlow",
+        "HeatExchanger:Desiccant:BalancedFlow:PerformanceDataType1",
+        "HeatExchanger:FluidToFluid",
+        "HeatPump:AirToWater:FuelFired:Cooling",
+        "HeatPump:AirToWater:FuelFired:Heating",
+        "HeatPump:PlantLoop:EIR:Cooling",
+        "HeatPump:PlantLoop:EIR:Heating",
+        "HeatPump:WaterToWater:EquationFit:Cooling",
+        "HeatPump:WaterToWater:EquationFit:Heating",
+        "HeatPump:WaterToWater:ParameterEstimation:Cooling",
+        "HeatPump:WaterToWater:ParameterEstimation:Heating",
+        "HotWaterEquipment",
+        "Humidifier:Steam:Electric",
+        "Humidifier:Steam:Gas",
+        "HybridModel:Zone",
+        "IndoorLivingWall",
+        "InternalMass",
+        "LifeCycleCost:NonrecurringCost",
+        "LifeCycleCost:Parameters",
+        "LifeCycleCost:RecurringCosts",
+        "LifeCycleCost:UseAdjustment",
+        "LifeCycleCost:UsePriceEscalation",
+        "Lights",
+        "LoadProfile:Plant",
+        "Material",
+        "Material:AirGap",
+        "Material:InfraredTransparent",
+        "Material:NoMass",
+        "Material:RoofVegetation",
+        "MaterialProperty:GlazingSpectralData",
+        "MaterialProperty:HeatAndMoistureTransfer:Diffusion",
+        "MaterialProperty:HeatAndMoistureTransfer:Redistribution",
+        "MaterialProperty:HeatAndMoistureTransfer:Settings",
+        "MaterialProperty:HeatAndMoistureTransfer:SorptionIsotherm",
+        "MaterialProperty:HeatAndMoistureTransfer:Suction",
+        "MaterialProperty:HeatAndMoistureTransfer:ThermalConductivity",
+        "MaterialProperty:MoisturePenetrationDepth:Settings",
+        "MaterialProperty:PhaseChange",
+        "MaterialProperty:PhaseChangeHysteresis",
+        "MaterialProperty:VariableAbsorptance",
+        "MaterialProperty:VariableThermalConductivity",
+        "Matrix:TwoDimension",
+        "Meter:Custom",
+        "Meter:CustomDecrement",
+        "NodeList",
+        "OtherEquipment",
+        "OutdoorAir:Mixer",
+        "OutdoorAir:Node",
+        "OutdoorAir:NodeList",
+        "Output:Constructions",
+        "Output:DaylightFactors",
+        "Output:DebuggingData",
+        "Output:Diagnostics",
+        "Output:EnergyManagementSystem",
+        "Output:EnvironmentalImpactFactors",
+        "Output:IlluminanceMap",
+        "Output:JSON",
+        "Output:Meter",
+        "Output:Meter:Cumulative",
+        "Output:Meter:Cumulative:MeterFileOnly",
+        "Output:Meter:MeterFileOnly",
+        "Output:PreprocessorMessage",
+        "Output:SQLite",
+        "Output:Schedules",
+        "Output:Surfaces:Drawing",
+        "Output:Surfaces:List",
+        "Output:Table:Annual",
+        "Output:Table:Monthly",
+        "Output:Table:ReportPeriod",
+        "Output:Table:SummaryReports",
+        "Output:Table:TimeBins",
+        "Output:Variable",
+        "Output:VariableDictionary",
+        "OutputControl:Files",
+        "OutputControl:IlluminanceMap:Style",
+        "OutputControl:ReportingTolerances",
+        "OutputControl:ResilienceSummaries",
+        "OutputControl:Sizing:Style",
+        "OutputControl:SurfaceColorScheme",
+        "OutputControl:Table:Style",
+        "OutputControl:Timestamp",
+        "Parametric:FileNameSuffix",
+        "Parametric:Logic",
+        "Parametric:RunControl",
+        "Parametric:SetValueForRun",
+        "People",
+        "PerformancePrecisionTradeoffs",
+        "PhotovoltaicPerformance:EquivalentOne-Diode",
+        "PhotovoltaicPerformance:Sandia",
+        "PhotovoltaicPerformance:Simple",
+        "Pipe:Adiabatic",
+        "Pipe:Adiabatic:Steam",
+        "Pipe:Indoor",
+        "Pipe:Outdoor",
+        "Pipe:Underground",
+        "PipingSystem:Underground:Domain",
+        "PipingSystem:Underground:PipeCircuit",
+        "PipingSystem:Underground:PipeSegment",
+        "PlantComponent:TemperatureSource",
+        "PlantComponent:UserDefined",
+        "PlantEquipmentList",
+        "PlantEquipmentOperation:ChillerHeaterChangeover",
+        "PlantEquipmentOperation:ComponentSetpoint",
+        "PlantEquipmentOperation:CoolingLoad",
+        "PlantEquipmentOperation:HeatingLoad",
+        "PlantEquipmentOperation:OutdoorDewpoint",
+        "PlantEquipmentOperation:OutdoorDewpointDifference",
+        "PlantEquipmentOperation:OutdoorDryBulb",
+        "PlantEquipmentOperation:OutdoorDryBulbDifference",
+        "PlantEquipmentOperation:OutdoorRelativeHumidity",
+        "PlantEquipmentOperation:OutdoorWetBulb",
+        "PlantEquipmentOperation:OutdoorWetBulbDifference",
+        "PlantEquipmentOperation:ThermalEnergyStorage",
+        "PlantEquipmentOperation:Uncontrolled",
+        "PlantEquipmentOperation:UserDefined",
+        "PlantEquipmentOperationSchemes",
+        "PlantLoop",
+        "Pump:ConstantSpeed",
+        "Pump:VariableSpeed",
+        "Pump:VariableSpeed:Condensate",
+        "PythonPlugin:Instance",
+        "PythonPlugin:OutputVariable",
+        "PythonPlugin:SearchPaths",
+        "PythonPlugin:TrendVariable",
+        "PythonPlugin:Variables",
+        "Refrigeration:AirChiller",
+        "Refrigeration:Case",
+        "Refrigeration:CaseAndWalkInList",
+        "Refrigeration:Compressor",
+        "Refrigeration:CompressorList",
+        "Refrigeration:CompressorRack",
+        "Refrigeration:Condenser:AirCooled",
+        "Refrigeration:Condenser:Cascade",
+        "Refrigeration:Condenser:EvaporativeCooled",
+        "Refrigeration:Condenser:WaterCooled",
+        "Refrigeration:GasCooler:AirCooled",
+        "Refrigeration:SecondarySystem",
+        "Refrigeration:Subcooler",
+        "Refrigeration:System",
+        "Refrigeration:TranscriticalSystem",
+        "Refrigeration:TransferLoadList",
+        "Refrigeration:WalkIn",
+        "Roof",
+        "RoofCeiling:Detailed",
+        "RoofIrrigation",
+        "RoomAir:Node",
+        "RoomAir:Node:AirflowNetwork",
+        "RoomAir:Node:AirflowNetwork:AdjacentSurfaceList",
+        "RoomAir:Node:AirflowNetwork:HVACEquipment",
+        "RoomAir:Node:AirflowNetwork:InternalGains",
+        "RoomAir:TemperaturePattern:ConstantGradient",
+        "RoomAir:TemperaturePattern:NondimensionalHeight",
+        "RoomAir:TemperaturePattern:SurfaceMapping",
+        "RoomAir:TemperaturePattern:TwoGradient",
+        "RoomAir:TemperaturePattern:UserDefined",
+        "RoomAirModelType",
+        "RoomAirSettings:AirflowNetwork",
+        "RoomAirSettings:CrossVentilation",
+        "RoomAirSettings:OneNodeDisplacementVentilation",
+        "RoomAirSettings:ThreeNodeDisplacementVentilation",
+        "RoomAirSettings:UnderFloorAirDistributionExterior",
+        "RoomAirSettings:UnderFloorAirDistributionInterior",
+        "RunPeriod",
+        "RunPeriodControl:DaylightSavingTime",
+        "RunPeriodControl:SpecialDays",
+        "Schedule:Compact",
+        "Schedule:Constant",
+        "Schedule:Day:Hourly",
+        "Schedule:Day:Interval",
+        "Schedule:Day:List",
+        "Schedule:File",
+        "Schedule:File:Shading",
+        "Schedule:Week:Compact",
+        "Schedule:Week:Daily",
+        "Schedule:Year",
+        "ScheduleTypeLimits",
+        "SetpointManager:Coldest",
+        "SetpointManager:CondenserEnteringReset",
+        "SetpointManager:CondenserEnteringReset:Ideal",
+        "SetpointManager:FollowGroundTemperature",
+        "SetpointManager:FollowOutdoorAirTemperature",
+        "SetpointManager:FollowSystemNodeTemperature",
+        "SetpointManager:MixedAir",
+        "SetpointManager:MultiZone:Cooling:Average",
+        "SetpointManager:MultiZone:Heating:Average",
+        "SetpointManager:MultiZone:Humidity:Maximum",
+        "SetpointManager:MultiZone:Humidity:Minimum",
+        "SetpointManager:MultiZone:MaximumHumidity:Average",
+        "SetpointManager:MultiZone:MinimumHumidity:Average",
+        "SetpointManager:OutdoorAirPretreat",
+        "SetpointManager:OutdoorAirReset",
+        "SetpointManager:ReturnAirBypassFlow",
+        "SetpointManager:ReturnTemperature:ChilledWater",
+        "SetpointManager:ReturnTemperature:HotWater",
+        "SetpointManager:Scheduled",
+        "SetpointManager:Scheduled:DualSetpoint",
+        "SetpointManager:SingleZone:Cooling",
+        "SetpointManager:SingleZone:Heating",
+        "SetpointManager:SingleZone:Humidity:Maximum",
+        "SetpointManager:SingleZone:Humidity:Minimum",
+        "SetpointManager:SingleZone:OneStageCooling",
+        "SetpointManager:SingleZone:OneStageHeating",
+        "SetpointManager:SingleZone:Reheat",
+        "SetpointManager:SystemNodeReset:Humidity",
+        "SetpointManager:SystemNodeReset:Temperature",
+        "SetpointManager:Warmest",
+        "SetpointManager:WarmestTemperatureFlow",
+        "Shading:Building",
+        "Shading:Building:Detailed",
+        "Shading:Fin",
+        "Shading:Fin:Projection",
+        "Shading:Overhang",
+        "Shading:Overhang:Projection",
+        "Shading:Site",
+        "Shading:Site:Detailed",
+        "Shading:Zone:Detailed",
+        "ShadingProperty:Reflectance",
+        "ShadowCalculation",
+        "SimulationControl",
+        "Site:GroundDomain:Basement",
+        "Site:GroundDomain:Slab",
+        "Site:GroundReflectance",
+        "Site:GroundReflectance:SnowModifier",
+        "Site:GroundTemperature:BuildingSurface",
+        "Site:GroundTemperature:Deep",
+        "Site:GroundTemperature:FCfactorMethod",
+        "Site:GroundTemperature:Shallow",
+        "Site:GroundTemperature:Undisturbed:FiniteDifference",
+        "Site:GroundTemperature:Undisturbed:KusudaAchenbach",
+        "Site:GroundTemperature:Undisturbed:Xing",
+        "Site:HeightVariation",
+        "Site:Location",
+        "Site:Precipitation",
+        "Site:SolarAndVisibleSpectrum",
+        "Site:SpectrumData",
+        "Site:VariableLocation",
+        "Site:WaterMainsTemperature",
+        "Site:WeatherStation",
+        "Sizing:Parameters",
+        "Sizing:Plant",
+        "Sizing:System",
+        "Sizing:Zone",
+        "SizingPeriod:DesignDay",
+        "SizingPeriod:WeatherFileConditionType",
+        "SizingPeriod:WeatherFileDays",
+        "SolarCollector:FlatPlate:PhotovoltaicThermal",
+        "SolarCollector:FlatPlate:Water",
+        "SolarCollector:IntegralCollectorStorage",
+        "SolarCollector:UnglazedTranspired",
+        "SolarCollector:UnglazedTranspired:Multisystem",
+        "SolarCollectorPerformance:FlatPlate",
+        "SolarCollectorPerformance:IntegralCollectorStorage",
+        "SolarCollectorPerformance:PhotovoltaicThermal:BIPVT",
+        "SolarCollectorPerformance:PhotovoltaicThermal:Simple",
+        "Space",
+        "SpaceHVAC:EquipmentConnections",
+        "SpaceHVAC:ZoneEquipmentMixer",
+        "SpaceHVAC:ZoneEquipmentSplitter",
+        "SpaceHVAC:ZoneReturnMixer",
+        "SpaceList",
+        "SteamEquipment",
+        "SurfaceContaminantSourceAndSink:Generic:BoundaryLayerDiffusion",
+        "SurfaceContaminantSourceAndSink:Generic:DepositionVelocitySink",
+        "SurfaceContaminantSourceAndSink:Generic:PressureDriven",
+        "SurfaceControl:MovableInsulation",
+        "SurfaceConvectionAlgorithm:Inside",
+        "SurfaceConvectionAlgorithm:Inside:AdaptiveModelSelections",
+        "SurfaceConvectionAlgorithm:Inside:UserCurve",
+        "SurfaceConvectionAlgorithm:Outside",
+        "SurfaceConvectionAlgorithm:Outside:AdaptiveModelSelections",
+        "SurfaceConvectionAlgorithm:Outside:UserCurve",
+        "SurfaceProperties:VaporCoefficients",
+        "SurfaceProperty:ConvectionCoefficients",
+        "SurfaceProperty:ConvectionCoefficients:MultipleSurface",
+        "SurfaceProperty:ExposedFoundationPerimeter",
+        "SurfaceProperty:ExteriorNaturalVentedCavity",
+        "SurfaceProperty:GroundSurfaces",
+        "SurfaceProperty:HeatBalanceSourceTerm",
+        "SurfaceProperty:HeatTransferAlgorithm",
+        "SurfaceProperty:HeatTransferAlgorithm:Construction",
+        "SurfaceProperty:HeatTransferAlgorithm:MultipleSurface",
+        "SurfaceProperty:HeatTransferAlgorithm:SurfaceList",
+        "SurfaceProperty:IncidentSolarMultiplier",
+        "SurfaceProperty:LocalEnvironment",
+        "SurfaceProperty:OtherSideCoefficients",
+        "SurfaceProperty:OtherSideConditionsModel",
+        "SurfaceProperty:SolarIncidentInside",
+        "SurfaceProperty:SurroundingSurfaces",
+        "SurfaceProperty:Underwater",
+        "SwimmingPool:Indoor",
+        "Table:IndependentVariable",
+        "Table:IndependentVariableList",
+        "Table:Lookup",
+        "TemperingValve",
+        "ThermalStorage:ChilledWater:Mixed",
+        "ThermalStorage:ChilledWater:Stratified",
+        "ThermalStorage:Ice:Detailed",
+        "ThermalStorage:Ice:Simple",
+        "ThermostatSetpoint:DualSetpoint",
+        "ThermostatSetpoint:SingleCooling",
+        "ThermostatSetpoint:SingleHeating",
+        "ThermostatSetpoint:SingleHeatingOrCooling",
+        "ThermostatSetpoint:ThermalComfort:Fanger:DualSetpoint",
+        "ThermostatSetpoint:ThermalComfort:Fanger:SingleCooling",
+        "ThermostatSetpoint:ThermalComfort:Fanger:SingleHeating",
+        "ThermostatSetpoint:ThermalComfort:Fanger:SingleHeatingOrCooling",
+        "Timestep",
+        "UnitarySystemPerformance:Multispeed",
+        "UtilityCost:Charge:Block",
+        "UtilityCost:Charge:Simple",
+        "UtilityCost:Computation",
+        "UtilityCost:Qualify",
+        "UtilityCost:Ratchet",
+        "UtilityCost:Tariff",
+        "UtilityCost:Variable",
+        "Version",
+        "Wall:Adiabatic",
+        "Wall:Detailed",
+        "Wall:Exterior",
+        "Wall:Interzone",
+        "Wall:Underground",
+        "WaterHeater:HeatPump:PumpedCondenser",
+        "WaterHeater:HeatPump:WrappedCondenser",
+        "WaterHeater:Mixed",
+        "WaterHeater:Sizing",
+        "WaterHeater:Stratified",
+        "WaterUse:Connections",
+        "WaterUse:Equipment",
+        "WaterUse:RainCollector",
+        "WaterUse:Storage",
+        "WaterUse:Well",
+        "WeatherProperty:SkyTemperature",
+        "Window",
+        "Window:Interzone",
+        "WindowGap:DeflectionState",
+        "WindowGap:SupportPillar",
+        "WindowMaterial:Blind",
+        "WindowMaterial:Blind:EquivalentLayer",
+        "WindowMaterial:ComplexShade",
+        "WindowMaterial:Drape:EquivalentLayer",
+        "WindowMaterial:Gap",
+        "WindowMaterial:Gap:EquivalentLayer",
+        "WindowMaterial:Gas",
+        "WindowMaterial:GasMixture",
+        "WindowMaterial:Glazing",
+        "WindowMaterial:Glazing:EquivalentLayer",
+        "WindowMaterial:Glazing:RefractionExtinctionMethod",
+        "WindowMaterial:GlazingGroup:Thermochromic",
+        "WindowMaterial:Screen",
+        "WindowMaterial:Screen:EquivalentLayer",
+        "WindowMaterial:Shade",
+        "WindowMaterial:Shade:EquivalentLayer",
+        "WindowMaterial:SimpleGlazingSystem",
+        "WindowProperty:AirflowControl",
+        "WindowProperty:FrameAndDivider",
+        "WindowProperty:StormWindow",
+        "WindowShadingControl",
+        "WindowThermalModel:Params",
+        "WindowsCalculationEngine",
+        "Zone",
+        "ZoneAirBalance:OutdoorAir",
+        "ZoneAirContaminantBalance",
+        "ZoneAirHeatBalanceAlgorithm",
+        "ZoneAirMassFlowConservation",
+        "ZoneBaseboard:OutdoorTemperatureControlled",
+        "ZoneCapacitanceMultiplier:ResearchSpecial",
+        "ZoneContaminantSourceAndSink:CarbonDioxide",
+        "ZoneContaminantSourceAndSink:Generic:Constant",
+        "ZoneContaminantSourceAndSink:Generic:CutoffModel",
+        "ZoneContaminantSourceAndSink:Generic:DecaySource",
+        "ZoneContaminantSourceAndSink:Generic:DepositionRateSink",
+        "ZoneControl:ContaminantController",
+        "ZoneControl:Humidistat",
+        "ZoneControl:Thermostat",
+        "ZoneControl:Thermostat:OperativeTemperature",
+        "ZoneControl:Thermostat:StagedDualSetpoint",
+        "ZoneControl:Thermostat:TemperatureAndHumidity",
+        "ZoneControl:Thermostat:ThermalComfort",
+        "ZoneCoolTower:Shower",
+        "ZoneCrossMixing",
+        "ZoneEarthtube",
+        "ZoneEarthtube:Parameters",
+        "ZoneGroup",
+        "ZoneHVAC:AirDistributionUnit",
+        "ZoneHVAC:Baseboard:Convective:Electric",
+        "ZoneHVAC:Baseboard:Convective:Water",
+        "ZoneHVAC:Baseboard:RadiantConvective:Electric",
+        "ZoneHVAC:Baseboard:RadiantConvective:Steam",
+        "ZoneHVAC:Baseboard:RadiantConvective:Steam:Design",
+        "ZoneHVAC:Baseboard:RadiantConvective:Water",
+        "ZoneHVAC:Baseboard:RadiantConvective:Water:Design",
+        "ZoneHVAC:CoolingPanel:RadiantConvective:Water",
+        "ZoneHVAC:Dehumidifier:DX",
+        "ZoneHVAC:EnergyRecoveryVentilator",
+        "ZoneHVAC:EnergyRecoveryVentilator:Controller",
+        "ZoneHVAC:EquipmentConnections",
+        "ZoneHVAC:EquipmentList",
+        "ZoneHVAC:EvaporativeCoolerUnit",
+        "ZoneHVAC:ExhaustControl",
+        "ZoneHVAC:ForcedAir:UserDefined",
+        "ZoneHVAC:FourPipeFanCoil",
+        "ZoneHVAC:HighTemperatureRadiant",
+        "ZoneHVAC:HybridUnitaryHVAC",
+        "ZoneHVAC:IdealLoadsAirSystem",
+        "ZoneHVAC:LowTemperatureRadiant:ConstantFlow",
+        "ZoneHVAC:LowTemperatureRadiant:ConstantFlow:Design",
+        "ZoneHVAC:LowTemperatureRadiant:Electric",
+        "ZoneHVAC:LowTemperatureRadiant:SurfaceGroup",
+        "ZoneHVAC:LowTemperatureRadiant:VariableFlow",
+        "ZoneHVAC:LowTemperatureRadiant:VariableFlow:Design",
+        "ZoneHVAC:OutdoorAirUnit",
+        "ZoneHVAC:OutdoorAirUnit:EquipmentList",
+        "ZoneHVAC:PackagedTerminalAirConditioner",
+        "ZoneHVAC:PackagedTerminalHeatPump",
+        "ZoneHVAC:RefrigerationChillerSet",
+        "ZoneHVAC:TerminalUnit:VariableRefrigerantFlow",
+        "ZoneHVAC:UnitHeater",
+        "ZoneHVAC:UnitVentilator",
+        "ZoneHVAC:VentilatedSlab",
+        "ZoneHVAC:VentilatedSlab:SlabGroup",
+        "ZoneHVAC:WaterToAirHeatPump",
+        "ZoneHVAC:WindowAirConditioner",
+        "ZoneInfiltration:DesignFlowRate",
+        "ZoneInfiltration:EffectiveLeakageArea",
+        "ZoneInfiltration:FlowCoefficient",
+        "ZoneList",
+        "ZoneMixing",
+        "ZoneProperty:LocalEnvironment",
+        "ZoneProperty:UserViewFactors:BySurfaceName",
+        "ZoneRefrigerationDoorMixing",
+        "ZoneTerminalUnitList",
+        "ZoneThermalChimney",
+        "ZoneVentilation:DesignFlowRate",
+        "ZoneVentilation:WindandStackOpenArea",
+    ]
+)
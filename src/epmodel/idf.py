@@ -0,0 +1,394 @@
+"""
+Reading and writing IDF files without EnergyPlus.
+
+The IDF text is tokenized line by line and each object is mapped onto its
+epJSON form using the field order of the IDD (see epmodel.idd), the same
+way energyplus --convert-only does: empty fields are left out, numeric
+fields become numbers, choices are matched case-insensitively and the
+fields past the fixed ones are grouped into the extensible list, such as
+BuildingSurface:Detailed vertices or Schedule:Compact data.
+
+Objects of the object types outside EnergyPlusModel are read the same way,
+using the field order of epmodel.unknown_idd, and kept as raw epJSON data
+(see EnergyPlusModel._unknown_sections). Objects of types the schema does
+not know are skipped with a warning.
+
+write_idf goes the other way, streaming a model to IDF text.
+
+Paths ending in .gz, .bz2, .xz or .lzma are compressed, see
+epmodel.compression.
+"""
+
+import warnings
+from enum import Enum
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import RootModel
+
+from epmodel.builder import EnergyPlusModel
+from epmodel.compression import open_source, open_text
+from epmodel.idd import IDD
+from epmodel.loader import validate_lazy
+from epmodel.sections import OBJECT_TYPES, SECTIONS, object_type_filter
+from epmodel.unknown_idd import UNKNOWN_IDD
+
+_Converter = Callable[[str], Any]
+
+
+def _idd(object_type: str) -> Dict[str, Any]:
+    """IDD metadata of an object type, inside EnergyPlusModel or not."""
+    info = IDD.get(object_type)
+    return UNKNOWN_IDD[object_type] if info is None else info
+
+
+def _number(value: str) -> Optional[Union[int, float]]:
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _field_converter(numeric: bool, choices: List[str]) -> Optional[_Converter]:
+    """Convert an IDF field value to its epJSON value, None if kept as is."""
+    lookup = {choice.lower(): choice for choice in choices}
+    # EnergyPlus takes Autosize and Autocalculate for one another
+    for one, other in (("autosize", "autocalculate"), ("autocalculate", "autosize")):
+        if one in lookup and other not in lookup:
+            lookup[other] = lookup[one]
+    if numeric:
+
+        def convert(value):
+            number = _number(value)
+            if number is not None:
+                return number
+            return lookup.get(value.lower(), value)
+
+        return convert
+    if lookup:
+        return lambda value: lookup.get(value.lower(), value)
+    return None
+
+
+class _ObjectReader:
+    """Map the field values of IDF objects of a type onto epJSON."""
+
+    def __init__(self, object_type: str):
+        info = _idd(object_type)
+        self.object_type = object_type
+        self.has_name = info["name"]
+        numeric = set(info.get("numeric", ()))
+        choices = info.get("choices", {})
+
+        def fields(names):
+            return [
+                (name, _field_converter(name in numeric, choices.get(name, [])))
+                for name in names
+            ]
+
+        self.fields = fields(info["fields"])
+        self.extension = info.get("extension")
+        self.extensibles = fields(info.get("extensibles", ()))
+        self.count = 0
+
+    def read(self, values: List[str]) -> Tuple[str, Dict[str, Any]]:
+        """Get the name and epJSON data of an object from its field values."""
+        self.count += 1
+        if self.has_name:
+            name = values[0] if values else ""
+            values = values[1:]
+        else:
+            name = ""
+        if not name:
+            # Named the way energyplus --convert-only names them
+            name = f"{self.object_type} {self.count}"
+        data = {}
+        for (field, convert), value in zip(self.fields, values):
+            if value:
+                data[field] = value if convert is None else convert(value)
+        extra = values[len(self.fields) :]
+        if extra and self.extension:
+            size = len(self.extensibles)
+            groups = []
+            for start in range(0, len(extra), size):
+                group = {}
+                for (field, convert), value in zip(
+                    self.extensibles, extra[start : start + size]
+                ):
+                    if value:
+                        group[field] = value if convert is None else convert(value)
+                if group:
+                    groups.append(group)
+            if groups:
+                data[self.extension] = groups
+        return name, data
+
+
+def iter_idf(source: Union[str, Path, IO[str]]) -> Iterator[Tuple[str, List[str]]]:
+    """Iterate over the objects of an IDF file.
+
+    Comments are dropped and values are stripped of surrounding
+    whitespace, nothing else is interpreted.
+
+    Args:
+        source: path to an IDF file, or a text file object
+
+    Yields:
+        Tuples of the object type, as written, and the field values
+    """
+    f, close = open_source(source)
+    try:
+        pending: List[str] = []
+        for line in f:
+            line = line.partition("!")[0]
+            if ";" not in line:
+                if line and not line.isspace():
+                    pending.append(line)
+                continue
+            *texts, rest = line.split(";")
+            pending.append(texts[0])
+            texts[0] = "".join(pending)
+            pending = [rest] if rest and not rest.isspace() else []
+            for text in texts:
+                values = [value.strip() for value in text.split(",")]
+                yield values[0], values[1:]
+        if pending:
+            raise ValueError("IDF file ends within an object, missing ';'")
+    finally:
+        if close:
+            f.close()
+
+
+def idf_to_epjson(
+    source: Union[str, Path, IO[str]],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """Convert an IDF file to epJSON data.
+
+    Objects of types outside EnergyPlusModel are converted too, and kept
+    as raw data by EnergyPlusModel.model_validate. Objects of types that
+    are not in the schema are skipped with a warning.
+
+    Args:
+        source: path to an IDF file, or a text file object
+        include: epJSON object types (or field names) to keep, shell-style
+            wildcards such as "Output:*" are allowed. Keep all if None.
+            Required sections are always kept.
+        exclude: epJSON object types (or field names) to drop
+
+    Returns:
+        epJSON data as loaded by json.load
+
+    Raises:
+        ValueError: If the IDF file is cut short, or an object name is
+            used twice within an object type.
+    """
+    is_selected = object_type_filter(include, exclude)
+    object_types = {
+        object_type.lower(): object_type for object_type in (*IDD, *UNKNOWN_IDD)
+    }
+    readers: Dict[str, Optional[_ObjectReader]] = {}
+    data: Dict[str, Dict[str, Any]] = {}
+    skipped: Dict[str, int] = {}
+    for object_type, values in iter_idf(source):
+        key = object_type.lower()
+        try:
+            reader = readers[key]
+        except KeyError:
+            canonical = object_types.get(key)
+            section = OBJECT_TYPES.get(canonical)
+            if canonical is None or not (
+                (section is not None and section.required) or is_selected(canonical)
+            ):
+                reader = None
+            else:
+                reader = _ObjectReader(canonical)
+            readers[key] = reader
+        if reader is None:
+            if key not in object_types:
+                skipped[object_type] = skipped.get(object_type, 0) + 1
+            continue
+        name, obj = reader.read(values)
+        objects = data.setdefault(reader.object_type, {})
+        if name in objects:
+            raise ValueError(f"Duplicate name {name} in {reader.object_type}")
+        objects[name] = obj
+    if skipped:
+        counts = ", ".join(f"{key} ({count})" for key, count in skipped.items())
+        warnings.warn(f"Skipped objects of types not in the schema: {counts}")
+    return data
+
+
+def load_idf(
+    source: Union[str, Path, IO[str]],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    lazy: bool = False,
+) -> EnergyPlusModel:
+    """Load and validate an IDF file.
+
+    Args:
+        source: path to an IDF file, or a text file object
+        include: epJSON object types to validate, see idf_to_epjson
+        exclude: epJSON object types to skip
+        lazy: validate sections on first access, see
+            epmodel.loader.validate_lazy
+
+    Returns:
+        EnergyPlusModel object
+
+    Raises:
+        ValidationError: If the model is invalid.
+    """
+    data = idf_to_epjson(source, include, exclude)
+    if lazy:
+        return validate_lazy(data)
+    return EnergyPlusModel.model_validate(data)
+
+
+def _format(value: Any) -> str:
+    """Format an epJSON value as an IDF field."""
+    if type(value) is float:
+        return repr(value)
+    if type(value) is str:
+        return value
+    while True:
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, RootModel):
+            value = value.root
+        else:
+            break
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+class _ObjectWriter:
+    """Write objects of a type as IDF, in the field order of the IDD."""
+
+    def __init__(self, object_type: str):
+        info = _idd(object_type)
+        self.object_type = object_type
+        self.has_name = info["name"]
+        self.fields = info["fields"]
+        self.extension = info.get("extension")
+        self.extensibles = info.get("extensibles", [])
+        # Model class -> attribute of each IDD field, by epJSON name
+        self.attributes: Dict[type, List[str]] = {}
+
+    def _values(self, obj: Any, fields: List[str]) -> List[Any]:
+        if isinstance(obj, dict):
+            return [obj.get(field) for field in fields]
+        cls = type(obj)
+        attributes = self.attributes.get(cls)
+        if attributes is None:
+            aliases = {
+                info.alias or name: name for name, info in cls.model_fields.items()
+            }
+            attributes = self.attributes[cls] = [aliases[field] for field in fields]
+        return [getattr(obj, attribute) for attribute in attributes]
+
+    def _write_group(self, f: IO[str], group: List[Any], sep: str) -> None:
+        f.write("    ")
+        f.write(", ".join("" if value is None else _format(value) for value in group))
+        f.write(sep)
+
+    def write(self, f: IO[str], name: str, obj: Any) -> None:
+        values = self._values(obj, self.fields)
+        items = None
+        if self.extension is not None:
+            items = (
+                obj.get(self.extension)
+                if isinstance(obj, dict)
+                else getattr(obj, self.extension, None)
+            )
+        if not items:
+            while values and values[-1] is None:
+                values.pop()
+        fields = self.fields
+        if self.has_name:
+            values.insert(0, name)
+            fields = ["name", *fields]
+        f.write(self.object_type)
+        if not values and not items:
+            f.write(";\n\n")
+            return
+        f.write(",\n")
+        last = len(values) - 1
+        for index, (field, value) in enumerate(zip(fields, values)):
+            text = "" if value is None else _format(value)
+            sep = ";" if index == last and not items else ","
+            f.write(f"    {text}{sep}  !- {field}\n")
+        if items:
+            # One group behind, to end the last one with a semicolon
+            previous = None
+            for item in items:
+                if previous is not None:
+                    self._write_group(f, previous, ",\n")
+                previous = self._values(item, self.extensibles)
+            # Only trailing fields can be left out, groups keep their size
+            while previous and previous[-1] is None:
+                previous.pop()
+            self._write_group(f, previous, ";\n")
+        f.write("\n")
+
+
+def write_idf(model: EnergyPlusModel, f: IO[str]) -> None:
+    """Stream an EnergyPlusModel to a text file handle as IDF.
+
+    Objects are written one field at a time in the order of the IDD, with
+    one line per extensible group, so no string of a whole object or of
+    the model is built. Sections still pending from lazy loading are
+    written as loaded, without being validated. Sections of object types
+    outside EnergyPlusModel are written last, from their raw data.
+
+    Args:
+        model: EnergyPlusModel object
+        f: text file handle to write to
+    """
+    pending = model._pending_sections
+    for field_name, section in SECTIONS.items():
+        if field_name in pending:
+            objects = pending[field_name]
+        else:
+            objects = model.__dict__.get(field_name)
+        if not objects:
+            continue
+        writer = _ObjectWriter(section.object_type)
+        for name, obj in objects.items():
+            writer.write(f, name, obj)
+    for object_type, objects in model._unknown_sections.items():
+        if not isinstance(objects, dict):
+            continue
+        writer = _ObjectWriter(object_type)
+        for name, obj in objects.items():
+            writer.write(f, name, obj)
+
+
+def dump_idf(model: EnergyPlusModel, path: Union[str, Path]) -> None:
+    """Write an EnergyPlusModel to an IDF file.
+
+    Args:
+        model: EnergyPlusModel object
+        path: path to the IDF file, compressed if it ends in .gz, .bz2,
+            .xz or .lzma
+    """
+    with open_text(path, "w") as f:
+        write_idf(model, f)
@@ -0,0 +1,189 @@
+"""
+Journal of the changes made to an EnergyPlusModel.
+
+Every change is recorded as a small entry holding the old and new values
+it swapped, rather than a copy of the model:
+
+    ("set", owner, obj, attr, old, new)     field assigned on a nested model
+    ("object", field name, name, old, new)  object added, replaced or removed
+    ("section", field name, old, new)       section assigned to
+
+Undoing an entry swaps the old value back, redoing it swaps the new one
+in again. Objects are owned by an ObjectOwner once the model tracks its
+objects, see epmodel.base and EnergyPlusModel.track_objects, so that
+assignments to their fields mark them dirty, and are recorded too while
+the model has a journal.
+
+Changes are numbered, and the objects touched by each change are logged
+with its number, so changes_since a checkpoint is proportional to the
+changes made since.
+"""
+
+import bisect
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from epmodel.base import TrackedModel
+
+if TYPE_CHECKING:
+    from epmodel.builder import EnergyPlusModel
+
+
+class ObjectOwner:
+    """Owner of an object of the model and of the models nested in it."""
+
+    __slots__ = ("model", "field_name", "objname")
+
+    def __init__(self, model: "EnergyPlusModel", field_name: str, objname: str):
+        self.model = model
+        self.field_name = field_name
+        self.objname = objname
+
+    def field_set(self, obj: TrackedModel, name: str, old: Any, new: Any) -> None:
+        model = self.model
+        model.mark_dirty(self.field_name, self.objname)
+        journal = model.__pydantic_private__["_journal"]
+        if journal is None:
+            return
+        if journal.replaying:
+            journal.touched(self.field_name, self.objname)
+        else:
+            journal.record(("set", self, obj, name, old, new))
+
+
+class Journal:
+    """Undo and redo stacks of the changes to a model."""
+
+    def __init__(self, model: "EnergyPlusModel"):
+        self.model = model
+        self.replaying = False
+        self.sequence = 0
+        # (sequence number, entry), most recent last
+        self.undo_stack: List[Tuple[int, tuple]] = []
+        self.redo_stack: List[Tuple[int, tuple]] = []
+        # sequence numbers and objects touched, a name of None for a section
+        self.log_sequences: List[int] = []
+        self.log: List[Tuple[str, Optional[str]]] = []
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> None:
+        # Copies of a model do not inherit its journal
+        return None
+
+    def touched(self, field_name: str, objname: Optional[str]) -> None:
+        self.log_sequences.append(self.sequence)
+        self.log.append((field_name, objname))
+
+    def record(self, entry: tuple) -> None:
+        """Record a change made to the model, which clears the redo stack."""
+        self.sequence += 1
+        self.undo_stack.append((self.sequence, entry))
+        self.redo_stack.clear()
+        self._touch(entry)
+
+    def _touch(self, entry: tuple) -> None:
+        kind = entry[0]
+        if kind == "set":
+            owner = entry[1]
+            self.touched(owner.field_name, owner.objname)
+        elif kind == "object":
+            self.touched(entry[1], entry[2])
+        else:
+            self.touched(entry[1], None)
+
+    def object_replaced(
+        self, field_name: str, objname: str, old: Any, new: Any
+    ) -> None:
+        """Record an object added, replaced or removed."""
+        if not self.replaying:
+            self.record(("object", field_name, objname, old, new))
+
+    def section_replaced(
+        self,
+        field_name: str,
+        old: Optional[Dict[str, Any]],
+        new: Optional[Dict[str, Any]],
+    ) -> None:
+        """Record a section assigned to."""
+        if not self.replaying:
+            self.record(("section", field_name, old, new))
+
+    def _swap(self, entry: tuple, undo: bool) -> None:
+        """Put the old values of an entry back, or the new ones again."""
+        model = self.model
+        kind = entry[0]
+        self.replaying = True
+        try:
+            if kind == "set":
+                _, _, obj, attr, old, new = entry
+                setattr(obj, attr, old if undo else new)
+            elif kind == "object":
+                _, field_name, objname, old, new = entry
+                value = old if undo else new
+                section = getattr(model, field_name)
+                if value is None:
+                    del section[objname]
+                else:
+                    section[objname] = value
+                model.mark_dirty(field_name, objname)
+                model._replace_owner(field_name, objname, new if undo else old, value)
+                self.touched(field_name, objname)
+            else:
+                _, field_name, old, new = entry
+                setattr(model, field_name, old if undo else new)
+                self.touched(field_name, None)
+        finally:
+            self.replaying = False
+
+    def undo(self, steps: int = 1) -> int:
+        """Undo the last changes.
+
+        Returns:
+            Number of changes undone, fewer than steps if there are no more
+        """
+        done = 0
+        while done < steps and self.undo_stack:
+            self.sequence += 1
+            _, entry = self.undo_stack.pop()
+            self._swap(entry, undo=True)
+            self.redo_stack.append((self.sequence, entry))
+            done += 1
+        return done
+
+    def redo(self, steps: int = 1) -> int:
+        """Redo the last changes undone.
+
+        Returns:
+            Number of changes redone, fewer than steps if there are no more
+        """
+        done = 0
+        while done < steps and self.redo_stack:
+            self.sequence += 1
+            _, entry = self.redo_stack.pop()
+            self._swap(entry, undo=False)
+            self.undo_stack.append((self.sequence, entry))
+            done += 1
+        return done
+
+    def rollback(self, checkpoint: int) -> int:
+        """Undo the changes recorded or redone after a checkpoint.
+
+        Returns:
+            Number of changes undone
+        """
+        done = 0
+        while self.undo_stack and self.undo_stack[-1][0] > checkpoint:
+            done += self.undo()
+        return done
+
+    def changes_since(self, checkpoint: int) -> Dict[str, Optional[Set[str]]]:
+        """Objects touched after a checkpoint, see
+        EnergyPlusModel.changes_since."""
+        changes: Dict[str, Optional[Set[str]]] = {}
+        start = bisect.bisect_right(self.log_sequences, checkpoint)
+        for field_name, objname in self.log[start:]:
+            if objname is None:
+                changes[field_name] = None
+                continue
+            names = changes.setdefault(field_name, set())
+            if names is not None:
+                names.add(objname)
+        return changes
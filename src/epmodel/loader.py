@@ -0,0 +1,103 @@
+"""
+Alternative entry points to build an EnergyPlusModel from epJSON data.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from epmodel.builder import EnergyPlusModel
+from epmodel.sections import OBJECT_TYPES, object_type_filter
+
+
+def select_sections(
+    data: Dict[str, Any],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """Select the sections of epJSON data to be validated.
+
+    Required sections (Building, GlobalGeometryRules) are always kept.
+    Sections of object types outside EnergyPlusModel are kept if they
+    are included, or if include is None and they are not excluded.
+
+    Args:
+        data: epJSON data as loaded by json.load
+        include: epJSON object types (or field names) to keep, shell-style
+            wildcards such as "Output:*" are allowed. Keep all if None.
+        exclude: epJSON object types (or field names) to drop, applied
+            after include.
+
+    Returns:
+        epJSON data with only the selected sections
+
+    Raises:
+        KeyError: If a name without wildcards is not an object type of
+            the schema.
+    """
+    is_selected = object_type_filter(include, exclude)
+    selected = {}
+    for key, value in data.items():
+        section = OBJECT_TYPES.get(key)
+        if (section is not None and section.required) or is_selected(key):
+            selected[key] = value
+    return selected
+
+
+def validate_selected(
+    data: Dict[str, Any],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> EnergyPlusModel:
+    """Build an EnergyPlusModel with only the selected sections validated.
+
+    Sections that are not selected are skipped and left as None in the
+    returned model, see select_sections.
+
+    Args:
+        data: epJSON data as loaded by json.load
+        include: epJSON object types (or field names) to keep
+        exclude: epJSON object types (or field names) to skip
+
+    Returns:
+        EnergyPlusModel object
+
+    Raises:
+        ValidationError: If a selected section is invalid.
+    """
+    return EnergyPlusModel.model_validate(select_sections(data, include, exclude))
+
+
+def validate_lazy(data: Dict[str, Any]) -> EnergyPlusModel:
+    """Build an EnergyPlusModel that validates its sections on first access.
+
+    Only the required sections are validated up front. The other sections
+    are held as raw data and validated into their pydantic classes the
+    first time they are accessed, with the same errors
+    EnergyPlusModel.model_validate would raise for them. Dumping, copying
+    or comparing the model validates all sections still pending.
+
+    Args:
+        data: epJSON data as loaded by json.load
+
+    Returns:
+        EnergyPlusModel object
+
+    Raises:
+        ValidationError: If a required section is missing or invalid.
+    """
+    # Unknown object types are not validated, they are kept as is
+    eager = {
+        key: value
+        for key, value in data.items()
+        if key not in OBJECT_TYPES or OBJECT_TYPES[key].required
+    }
+    model = EnergyPlusModel.model_validate(eager)
+    pending = {
+        OBJECT_TYPES[key].field_name: value
+        for key, value in data.items()
+        if key not in eager
+    }
+    for name in pending:
+        del model.__dict__[name]
+    model._pending_sections.update(pending)
+    model.__pydantic_fields_set__.update(pending)
+    return model
@@ -0,0 +1,61 @@
+"""
+Case-insensitive index of the object names of an EnergyPlusModel.
+
+EnergyPlus compares object names case-insensitively, by their upper case
+form, and requires them to be unique within an object type only. The
+index maps each upper case name to the sections holding an object of
+that name, and each section's upper case names to their spelling in the
+model, so finding an object by name, or checking a new name for a
+collision, does not scan the sections.
+
+EnergyPlusModel builds the index on first use and keeps it up to date as
+objects are added and removed, see EnergyPlusModel.find.
+"""
+
+from typing import Dict, Iterable, Optional
+
+
+class NameIndex:
+    """Object names by section and by upper case name."""
+
+    def __init__(self):
+        # field name -> upper case name -> name
+        self.sections: Dict[str, Dict[str, str]] = {}
+        # upper case name -> field names, in insertion order
+        self.names: Dict[str, Dict[str, None]] = {}
+
+    def add(self, field_name: str, name: str) -> None:
+        key = name.upper()
+        self.sections.setdefault(field_name, {})[key] = name
+        self.names.setdefault(key, {})[field_name] = None
+
+    def discard(self, field_name: str, name: str) -> None:
+        key = name.upper()
+        section = self.sections.get(field_name)
+        # Another spelling of the name still holds the entry
+        if section is None or section.get(key) != name:
+            return
+        del section[key]
+        fields = self.names[key]
+        del fields[field_name]
+        if not fields:
+            del self.names[key]
+
+    def set_section(self, field_name: str, names: Iterable[str]) -> None:
+        """Replace the names of a section."""
+        for key in self.sections.pop(field_name, {}):
+            fields = self.names[key]
+            del fields[field_name]
+            if not fields:
+                del self.names[key]
+        for name in names:
+            self.add(field_name, name)
+
+    def get(self, field_name: str, name: str) -> Optional[str]:
+        """Spelling of a name in a section, None if it has no such name."""
+        section = self.sections.get(field_name)
+        return None if section is None else section.get(name.upper())
+
+    def fields(self, name: str) -> Iterable[str]:
+        """Field names of the sections with an object of a name."""
+        return self.names.get(name.upper(), {}).keys()
@@ -0,0 +1,202 @@
+"""
+JSON-Patch (RFC 6902) style patches between EnergyPlusModel objects.
+
+Paths are JSON pointers into the epJSON document: /<object type>/<name>
+for whole objects and /<object type>/<name>/<field>[/...] for fields.
+make_patch exports the add, remove and replace operations that turn one
+model into another, from diff_models. apply_patch applies them to a model
+in place, validating only the objects the patch touches.
+
+Example:
+    patch = make_patch(baseline, variant)
+    json.dump(patch, f)
+    ...
+    apply_patch(baseline, patch)
+"""
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from epmodel.builder import EnergyPlusModel
+from epmodel.diff import diff_models
+from epmodel.sections import OBJECT_TYPES, raise_errors, validate_object
+
+OPERATIONS = ("add", "remove", "replace")
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_pointer(*tokens: Any) -> str:
+    """Make a JSON pointer, e.g. make_pointer("Material", "1/2IN Gypsum")."""
+    return "".join("/" + _escape(str(token)) for token in tokens)
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON pointer into its unescaped tokens."""
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer {pointer!r}")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+def make_patch(old: EnergyPlusModel, new: EnergyPlusModel) -> List[Dict[str, Any]]:
+    """Export the patch that turns one model into another.
+
+    Modified objects are patched field by field, extensible lists such as
+    vertices are replaced as a whole.
+
+    Args:
+        old: baseline model
+        new: changed model
+
+    Returns:
+        List of JSON-Patch operations, as JSON data
+    """
+    diff = diff_models(old, new)
+    patch = []
+    for object_type, names in diff.removed.items():
+        for name in names:
+            patch.append({"op": "remove", "path": make_pointer(object_type, name)})
+    for object_type, objects in diff.modified.items():
+        for name, changes in objects.items():
+            for change in changes:
+                path = make_pointer(object_type, name, change.field)
+                if change.new is None:
+                    patch.append({"op": "remove", "path": path})
+                else:
+                    op = "add" if change.old is None else "replace"
+                    patch.append({"op": op, "path": path, "value": change.new})
+    for object_type, names in diff.added.items():
+        section = OBJECT_TYPES.get(object_type)
+        if section is None:
+            objects = new._unknown_sections[object_type]
+        else:
+            objects = getattr(new, section.field_name)
+        for name in names:
+            value = objects[name]
+            if isinstance(value, BaseModel):
+                value = value.model_dump(
+                    mode="json", by_alias=True, exclude_none=True, warnings=False
+                )
+            patch.append(
+                {"op": "add", "path": make_pointer(object_type, name), "value": value}
+            )
+    return patch
+
+
+def _apply(document: Any, tokens: List[str], op: str, value: Any) -> None:
+    """Apply an operation to a field of epJSON object data in place."""
+    *parents, last = tokens
+    for token in parents:
+        document = document[int(token) if isinstance(document, list) else token]
+    if isinstance(document, list):
+        index = len(document) if last == "-" else int(last)
+        if op == "add":
+            document.insert(index, value)
+        elif op == "remove":
+            del document[index]
+        else:
+            document[index] = value
+    elif op == "remove":
+        del document[last]
+    elif op == "replace" and last not in document:
+        raise KeyError(last)
+    else:
+        document[last] = value
+
+
+def _current(model: EnergyPlusModel, object_type: str, name: str) -> Any:
+    """epJSON data of an object of the model, None if there is none."""
+    section = OBJECT_TYPES.get(object_type)
+    if section is None:
+        objects = model._unknown_sections.get(object_type) or {}
+    else:
+        objects = getattr(model, section.field_name) or {}
+    obj = objects.get(name)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(
+            mode="json", by_alias=True, exclude_none=True, warnings=False
+        )
+    return copy.deepcopy(obj)
+
+
+def apply_patch(model: EnergyPlusModel, patch: List[Dict[str, Any]]) -> None:
+    """Apply a patch to a model in place.
+
+    Only the objects the patch touches are validated, and the model is
+    left unchanged if any of them is invalid. Changed objects are marked
+    dirty, see EnergyPlusModel.mark_dirty. Objects of unknown object
+    types are patched as raw data.
+
+    Args:
+        model: model to patch
+        patch: JSON-Patch operations, as made by make_patch
+
+    Raises:
+        ValueError: If an operation is not supported or its path does not
+            match the model.
+        ValidationError: If a patched object is invalid. Errors of all
+            touched objects are reported together.
+    """
+    # (object type, name) -> epJSON data, None if removed
+    touched: Dict[Tuple[str, str], Any] = {}
+    for operation in patch:
+        op = operation.get("op")
+        if op not in OPERATIONS:
+            raise ValueError(f"Unsupported patch operation {op!r}")
+        tokens = parse_pointer(operation["path"])
+        if len(tokens) < 2:
+            raise ValueError(f"Path must point into an object: {operation['path']}")
+        object_type, name, *fields = tokens
+        key = (object_type, name)
+        if key not in touched:
+            touched[key] = _current(model, object_type, name)
+        try:
+            if not fields:
+                if op != "add" and touched[key] is None:
+                    raise KeyError(name)
+                touched[key] = (
+                    None if op == "remove" else copy.deepcopy(operation["value"])
+                )
+            elif touched[key] is None:
+                raise KeyError(name)
+            else:
+                value = copy.deepcopy(operation.get("value"))
+                _apply(touched[key], fields, op, value)
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
+            raise ValueError(
+                f"Cannot {op} {operation['path']}, no such location"
+            ) from exc
+
+    # Validate every touched object before changing the model
+    validated = {}
+    line_errors = []
+    for (object_type, name), data in touched.items():
+        if data is None or object_type not in OBJECT_TYPES:
+            validated[object_type, name] = data
+            continue
+        try:
+            validated[object_type, name] = validate_object(object_type, name, data)
+        except ValidationError as exc:
+            line_errors.extend(exc.errors(include_url=False))
+    raise_errors(line_errors)
+
+    for (object_type, name), obj in validated.items():
+        section = OBJECT_TYPES.get(object_type)
+        if section is None:
+            objects = model._unknown_sections.setdefault(object_type, {})
+            if obj is None:
+                objects.pop(name, None)
+            else:
+                objects[name] = obj
+        elif obj is None:
+            model.remove(section.field_name, name)
+        else:
+            model.add(section.field_name, name, obj)
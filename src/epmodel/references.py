@@ -0,0 +1,630 @@
+"""
+Reference graph of the objects of an EnergyPlusModel.
+
+Fields such as BuildingSurface:Detailed construction_name or People
+number_of_people_schedule_name hold the name of another object. The
+schema tells which ones: each such field takes its values from object
+lists, e.g. ConstructionNames, and each object type is in the object
+lists its name is a reference in (see codegen/genidd.py). A reference is
+resolved to the first object of the types in its lists with that name,
+compared case-insensitively as EnergyPlus does. Fields paired with an
+object type field, e.g. Branch component_name with component_object_type,
+only resolve to the object type it names, as names are only unique within
+an object type.
+
+build_reference_graph resolves every reference of a model in one pass,
+using the name index of the model (see EnergyPlusModel.find), and keeps
+both the references of each object and the references to it.
+EnergyPlusModel.reference_graph caches the graph of a model.
+
+find_unreachable marks the objects reachable from the roots of a model,
+e.g. its zones and surfaces, for EnergyPlusModel.prune to sweep the rest.
+
+Example:
+    graph = build_reference_graph(model)
+    for ref in graph.referrers("Construction", "Exterior Wall"):
+        print(ref.source_type, ref.source_name, ref.field)
+"""
+
+from enum import Enum
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pydantic import RootModel
+
+from epmodel.idd import IDD
+from epmodel.sections import OBJECT_TYPES, SECTIONS
+
+if TYPE_CHECKING:
+    from epmodel.builder import EnergyPlusModel
+
+
+def _object_lists() -> Dict[str, Tuple[str, ...]]:
+    lists: Dict[str, List[str]] = {}
+    for object_type, info in IDD.items():
+        for name in info.get("references", []):
+            lists.setdefault(name, []).append(object_type)
+    return {name: tuple(types) for name, types in lists.items()}
+
+
+# Object list -> epJSON object types whose names are in it
+OBJECT_LISTS: Dict[str, Tuple[str, ...]] = _object_lists()
+
+
+@lru_cache(maxsize=None)
+def target_types(object_type: str, field: str) -> Tuple[str, ...]:
+    """epJSON object types a field can reference, none if it holds no
+    reference.
+
+    Args:
+        object_type: epJSON object type, e.g. BuildingSurface:Detailed
+        field: epJSON field name, e.g. construction_name, or the name of
+            a field of the extensible group, e.g. zone_name of ZoneList
+
+    Returns:
+        Object types, in the order references are resolved in
+    """
+    lists = IDD.get(object_type, {}).get("object_lists", {}).get(field, [])
+    types = {target: None for name in lists for target in OBJECT_LISTS.get(name, ())}
+    return tuple(types)
+
+
+# Upper case epJSON object type -> epJSON object type
+_TYPES_BY_UPPER: Dict[str, str] = {key.upper(): key for key in OBJECT_TYPES}
+
+
+@lru_cache(maxsize=None)
+def _declared(object_type: str) -> Tuple[str, ...]:
+    """Target types of a reference whose object type field is set."""
+    return (_TYPES_BY_UPPER.get(object_type.upper(), object_type),)
+
+
+def _referenceable() -> FrozenSet[str]:
+    return frozenset(
+        target
+        for object_type, info in IDD.items()
+        for field in info.get("object_lists", {})
+        for target in target_types(object_type, field)
+    )
+
+
+# Object types find_unreachable starts from: those no field can reference,
+# such as outputs, internal gains and simulation settings, and the
+# building geometry, HVAC loops and controls that act on their own
+ROOT_TYPES: FrozenSet[str] = (frozenset(IDD) - _referenceable()) | {
+    "AirLoopHVAC",
+    "BuildingSurface:Detailed",
+    "CondenserLoop",
+    "Daylighting:Controls",
+    "FenestrationSurface:Detailed",
+    "InternalMass",
+    "PlantLoop",
+    "Refrigeration:CompressorRack",
+    "Shading:Building:Detailed",
+    "Shading:Site:Detailed",
+    "Shading:Zone:Detailed",
+    "UtilityCost:Tariff",
+    "WaterHeater:Mixed",
+    "WaterUse:Equipment",
+    "Zone",
+}
+
+# Fields naming objects of any type, outside of object lists
+_NAME_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "EnergyManagementSystem:Actuator": ("actuated_component_unique_name",),
+    "EnergyManagementSystem:Sensor": (
+        "output_variable_or_output_meter_index_key_name",
+    ),
+}
+
+
+class Reference(NamedTuple):
+    """A field of an object holding the name of another object."""
+
+    source_type: str
+    source_name: str
+    # epJSON field name, of the extensible group if index is set
+    field: str
+    # Position in the extensible list, e.g. of ZoneList zones
+    index: Optional[int]
+    # epJSON object type of the object referenced, None if not found
+    target_type: Optional[str]
+    # Name of the object referenced, as spelled in the model if found
+    target_name: str
+    # epJSON object type set in the object type field paired with the field
+    declared_type: Optional[str] = None
+
+
+def _text(value: Any) -> Optional[str]:
+    if type(value) is str:
+        return value or None
+    while isinstance(value, (Enum, RootModel)):
+        value = value.value if isinstance(value, Enum) else value.root
+    return value if isinstance(value, str) and value else None
+
+
+class _FieldReader:
+    """Read the reference fields of objects of a type."""
+
+    def __init__(self, object_type: str):
+        info = IDD[object_type]
+        self.extension = info.get("extension")
+        extensibles = set(info.get("extensibles", []))
+        object_types = info.get("object_types", {})
+        # (field, target types, object type field or None)
+        self.fields = []
+        self.item_fields = []
+        for field in info.get("object_lists", {}):
+            entry = (field, target_types(object_type, field), object_types.get(field))
+            if field in extensibles:
+                self.item_fields.append(entry)
+            else:
+                self.fields.append(entry)
+        # Model class -> attribute of each field, by epJSON name
+        self.attributes: Dict[type, Dict[str, str]] = {}
+
+    def _get(self, obj: Any, field: str) -> Any:
+        if isinstance(obj, dict):
+            return obj.get(field)
+        cls = type(obj)
+        attributes = self.attributes.get(cls)
+        if attributes is None:
+            attributes = self.attributes[cls] = {
+                info.alias or name: name for name, info in cls.model_fields.items()
+            }
+        return getattr(obj, attributes[field], None)
+
+    def _set(self, obj: Any, field: str, value: Any) -> None:
+        if isinstance(obj, dict):
+            obj[field] = value
+        else:
+            self._get(obj, field)
+            setattr(obj, self.attributes[type(obj)][field], value)
+
+    def set(self, obj: Any, field: str, index: Optional[int], value: str) -> None:
+        """Set a reference field of an object, see Reference."""
+        if index is not None:
+            obj = self._get(obj, self.extension)[index]
+        self._set(obj, field, value)
+
+    def targets(
+        self, obj: Any, targets: Tuple[str, ...], type_field: Optional[str]
+    ) -> Tuple[Tuple[str, ...], Optional[str]]:
+        """Target types of a field of an object, restricted to the object
+        type set in its object type field, and that object type."""
+        if type_field is not None:
+            declared = _text(self._get(obj, type_field))
+            if declared is not None:
+                targets = _declared(declared)
+                return targets, targets[0]
+        return targets, None
+
+    def values(
+        self, obj: Any
+    ) -> Iterator[Tuple[str, Optional[int], str, Tuple[str, ...], Optional[str]]]:
+        """Field, index, value, target types and declared object type of
+        the references of an object."""
+        for field, targets, type_field in self.fields:
+            value = _text(self._get(obj, field))
+            if value is not None:
+                yield (field, None, value, *self.targets(obj, targets, type_field))
+        if self.item_fields:
+            for index, item in enumerate(self._get(obj, self.extension) or ()):
+                for field, targets, type_field in self.item_fields:
+                    value = _text(self._get(item, field))
+                    if value is not None:
+                        targets, declared = self.targets(item, targets, type_field)
+                        yield field, index, value, targets, declared
+
+
+@lru_cache(maxsize=None)
+def _reader(object_type: str) -> _FieldReader:
+    return _FieldReader(object_type)
+
+
+class ReferenceGraph:
+    """References between the objects of a model, both ways."""
+
+    def __init__(self):
+        # (object type, name) -> references of the object
+        self.forward: Dict[Tuple[str, str], List[Reference]] = {}
+        # (object type, upper case name) -> references to the object, as
+        # ordered sets so that single references are dropped in O(1)
+        self.reverse: Dict[Tuple[str, str], Dict[Reference, None]] = {}
+        # upper case name -> references to objects not in the model
+        self.unresolved: Dict[str, Dict[Reference, None]] = {}
+
+    def _targets(self, reference: Reference) -> Dict[Reference, None]:
+        if reference.target_type is None:
+            return self.unresolved.setdefault(reference.target_name.upper(), {})
+        target = (reference.target_type, reference.target_name.upper())
+        return self.reverse.setdefault(target, {})
+
+    def add(self, reference: Reference) -> None:
+        source = (reference.source_type, reference.source_name)
+        self.forward.setdefault(source, []).append(reference)
+        self._targets(reference)[reference] = None
+
+    def rename(self, object_type: str, old: str, new: str) -> List[Reference]:
+        """Follow the rename of an object.
+
+        References of the object move to its new name, references to it
+        point to the new name, and unresolved references to the new name
+        that can reference the object are resolved. References keep their
+        place in the references of their object.
+
+        Returns:
+            The references that pointed to the object, before the rename
+        """
+        referrers = list(self.reverse.pop((object_type, old.upper()), ()))
+        resolved = [
+            reference
+            for reference in self.unresolved.get(new.upper(), ())
+            if (
+                object_type == reference.declared_type
+                if reference.declared_type is not None
+                else object_type in target_types(reference.source_type, reference.field)
+            )
+        ]
+        for reference in resolved:
+            self.unresolved[new.upper()].pop(reference)
+        targets = {*referrers, *resolved}
+        own = self.forward.get((object_type, old), [])
+        replaced = {}
+        for reference in (*own, *referrers, *resolved):
+            renamed = reference
+            if reference in targets:
+                renamed = renamed._replace(target_type=object_type, target_name=new)
+            if (reference.source_type, reference.source_name) == (object_type, old):
+                renamed = renamed._replace(source_name=new)
+            replaced[reference] = renamed
+        for reference, renamed in replaced.items():
+            if reference not in targets:
+                self._targets(reference).pop(reference)
+            self._targets(renamed)[renamed] = None
+            references = self.forward[reference.source_type, reference.source_name]
+            references[references.index(reference)] = renamed
+        if own and new != old:
+            self.forward[object_type, new] = self.forward.pop((object_type, old))
+        return referrers
+
+    def dangling(self) -> List[Reference]:
+        """References to objects not in the model."""
+        return [
+            reference
+            for references in self.unresolved.values()
+            for reference in references
+        ]
+
+    def references(self, object_type: str, name: str) -> List[Reference]:
+        """References of an object to other objects.
+
+        Args:
+            object_type: epJSON object type
+            name: name of the object, as spelled in the model
+
+        Returns:
+            References, in field order
+        """
+        return self.forward.get((object_type, name), [])
+
+    def referrers(self, object_type: str, name: str) -> List[Reference]:
+        """References of other objects to an object.
+
+        Args:
+            object_type: epJSON object type
+            name: name of the object, compared case-insensitively
+
+        Returns:
+            References
+        """
+        return list(self.reverse.get((object_type, name.upper()), ()))
+
+
+def set_reference(model: "EnergyPlusModel", reference: Reference, value: str) -> None:
+    """Set the field of a reference in a model, and mark the object dirty.
+
+    Args:
+        model: EnergyPlusModel object
+        reference: reference to set
+        value: name of the object to reference
+    """
+    field_name = OBJECT_TYPES[reference.source_type].field_name
+    obj = model._section_names(field_name)[reference.source_name]
+    _reader(reference.source_type).set(obj, reference.field, reference.index, value)
+    model.mark_dirty(field_name, reference.source_name)
+
+
+def build_reference_graph(model: "EnergyPlusModel") -> ReferenceGraph:
+    """Resolve every reference of a model.
+
+    Takes time proportional to the number of objects and references, each
+    reference being resolved through the name index of the model, against
+    the object type set in its object type field if it has one. Sections
+    still held as raw data are read without being validated.
+
+    Args:
+        model: EnergyPlusModel object
+
+    Returns:
+        ReferenceGraph of the model
+    """
+    graph = ReferenceGraph()
+    index = model._names()
+    # epJSON object types -> (object type, field name) of the sections
+    resolved: Dict[Tuple[str, ...], List[Tuple[str, str]]] = {}
+    for field_name, section in SECTIONS.items():
+        if "object_lists" not in IDD.get(section.object_type, {}):
+            continue
+        objects = model._section_names(field_name)
+        if not objects:
+            continue
+        reader = _reader(section.object_type)
+        for name, obj in objects.items():
+            for field, position, value, targets, declared in reader.values(obj):
+                sections = resolved.get(targets)
+                if sections is None:
+                    sections = resolved[targets] = [
+                        (target, OBJECT_TYPES[target].field_name)
+                        for target in targets
+                        if target in OBJECT_TYPES
+                    ]
+                target_type = None
+                target_name = value
+                for target, target_field in sections:
+                    spelling = index.get(target_field, value)
+                    if spelling is not None:
+                        target_type, target_name = target, spelling
+                        break
+                graph.add(
+                    Reference(
+                        section.object_type,
+                        name,
+                        field,
+                        position,
+                        target_type,
+                        target_name,
+                        declared,
+                    )
+                )
+    return graph
+
+
+def _column(reader: _FieldReader, objects: List[Any], field: str) -> List[Any]:
+    """Values of a field of objects, read at C speed if all are models of
+    the same class."""
+    if objects and not isinstance(objects[0], dict):
+        reader._get(objects[0], field)
+        attribute = reader.attributes[type(objects[0])][field]
+        try:
+            return list(map(attrgetter(attribute), objects))
+        except AttributeError:
+            # Raw data among the models
+            pass
+    return [reader._get(obj, field) for obj in objects]
+
+
+def find_dangling(model: "EnergyPlusModel") -> List[Reference]:
+    """Find the references to objects not in a model.
+
+    Unlike build_reference_graph, references are only checked against the
+    set of names of their target types, a field at a time across all the
+    objects of a section, so the whole model is checked in one linear
+    sweep without building the graph. Sections still held as raw data are
+    read without being validated.
+
+    Args:
+        model: EnergyPlusModel object
+
+    Returns:
+        Unresolved references, by section and field
+    """
+    index = model._names()
+    # epJSON object types -> names as spelled, and upper case names
+    names: Dict[Tuple[str, ...], Tuple[Set[str], Set[str]]] = {}
+
+    def valid_names(targets: Tuple[str, ...]) -> Tuple[Set[str], Set[str]]:
+        valid = names.get(targets)
+        if valid is None:
+            spelled, upper = valid = names[targets] = (set(), set())
+            for target in targets:
+                if target in OBJECT_TYPES:
+                    section = index.sections.get(OBJECT_TYPES[target].field_name, {})
+                    upper.update(section)
+                    spelled.update(section.values())
+        return valid
+
+    dangling = []
+
+    def check(object_type, sources, positions, values, field, targets):
+        spelled, upper = valid_names(targets)
+        for source, position, value in zip(sources, positions, values):
+            if value is None or value in spelled:
+                continue
+            text = _text(value)
+            if text is None or text.upper() in upper:
+                continue
+            dangling.append(Reference(object_type, source, field, position, None, text))
+
+    def check_declared(
+        object_type, sources, positions, objects, field, targets, type_field
+    ):
+        # Target types vary with the object type field, a row at a time
+        reader = _reader(object_type)
+        for source, position, obj in zip(sources, positions, objects):
+            text = _text(reader._get(obj, field))
+            if text is None:
+                continue
+            row_targets, declared = reader.targets(obj, targets, type_field)
+            spelled, upper = valid_names(row_targets)
+            if text in spelled or text.upper() in upper:
+                continue
+            dangling.append(
+                Reference(object_type, source, field, position, None, text, declared)
+            )
+
+    for field_name, section in SECTIONS.items():
+        if "object_lists" not in IDD.get(section.object_type, {}):
+            continue
+        objects = model._section_names(field_name)
+        if not objects:
+            continue
+        reader = _reader(section.object_type)
+        object_type = section.object_type
+        object_names = list(objects)
+        values = list(objects.values())
+        for field, targets, type_field in reader.fields:
+            if type_field is not None:
+                check_declared(
+                    object_type,
+                    object_names,
+                    repeat(None),
+                    values,
+                    field,
+                    targets,
+                    type_field,
+                )
+                continue
+            column = _column(reader, values, field)
+            check(object_type, object_names, repeat(None), column, field, targets)
+        if reader.item_fields:
+            sources = []
+            positions = []
+            items = []
+            for name, groups in zip(
+                object_names, _column(reader, values, reader.extension)
+            ):
+                for position, item in enumerate(groups or ()):
+                    sources.append(name)
+                    positions.append(position)
+                    items.append(item)
+            for field, targets, type_field in reader.item_fields:
+                if type_field is not None:
+                    check_declared(
+                        object_type,
+                        sources,
+                        positions,
+                        items,
+                        field,
+                        targets,
+                        type_field,
+                    )
+                    continue
+                column = _column(reader, items, field)
+                check(object_type, sources, positions, column, field, targets)
+    return dangling
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def unknown_referrers(model: "EnergyPlusModel", name: str) -> List[str]:
+    """Find the sections of object types outside EnergyPlusModel that may
+    reference a name.
+
+    Their fields are not known, so any string equal to the name, compared
+    case-insensitively, is taken for a reference, as by find_unreachable.
+
+    Args:
+        model: EnergyPlusModel object
+        name: object name
+
+    Returns:
+        epJSON object types of the sections with such a string
+    """
+    key = name.upper()
+    return [
+        object_type
+        for object_type, objects in model._unknown_sections.items()
+        if any(value.upper() == key for value in _strings(objects))
+    ]
+
+
+def find_unreachable(
+    model: "EnergyPlusModel", roots: Iterable[str] = ROOT_TYPES
+) -> Dict[str, List[str]]:
+    """Find the objects not reachable from the roots of a model.
+
+    Marks every object of the root types, then every object they
+    reference, and so on through the reference graph, in time
+    proportional to the number of objects and references. Objects named
+    by EMS actuators and sensors, or by any string of the sections of
+    object types outside EnergyPlusModel, are marked too, as their
+    references are not known.
+
+    Args:
+        model: EnergyPlusModel object
+        roots: epJSON object types whose objects are all reachable
+
+    Returns:
+        epJSON object type -> names of the objects not reachable
+    """
+    roots = set(roots)
+    graph = model.reference_graph()
+    index = model._names()
+    marked = set()
+    stack = []
+
+    def mark(key: Tuple[str, str]) -> None:
+        if key not in marked:
+            marked.add(key)
+            stack.append(key)
+
+    def mark_name(name: str) -> None:
+        for field_name in index.fields(name):
+            mark((SECTIONS[field_name].object_type, index.get(field_name, name)))
+
+    for field_name, section in SECTIONS.items():
+        objects = model._section_names(field_name)
+        if objects and section.object_type in roots:
+            for name in objects:
+                mark((section.object_type, name))
+    for object_type, fields in _NAME_FIELDS.items():
+        objects = model._section_names(OBJECT_TYPES[object_type].field_name)
+        reader = _reader(object_type)
+        for obj in objects.values():
+            for field in fields:
+                value = _text(reader._get(obj, field))
+                if value is not None:
+                    mark_name(value)
+    for name in _strings(model._unknown_sections):
+        mark_name(name)
+
+    while stack:
+        for reference in graph.forward.get(stack.pop(), ()):
+            if reference.target_type is not None:
+                mark((reference.target_type, reference.target_name))
+
+    unreachable = {}
+    for field_name, section in SECTIONS.items():
+        object_type = section.object_type
+        names = [
+            name
+            for name in model._section_names(field_name)
+            if (object_type, name) not in marked
+        ]
+        if names:
+            unreachable[object_type] = names
+    return unreachable
@@ -0,0 +1,333 @@
+"""
+Section metadata and per-section validation for EnergyPlusModel.
+
+Every field of EnergyPlusModel holds one epJSON object type (a section),
+as a dictionary of objects keyed by object name. The helpers here let us
+look sections up by field name or epJSON object type, and validate a
+single section or object with the same error locations that
+EnergyPlusModel.model_validate would report.
+"""
+
+import time
+import tracemalloc
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from epmodel import epmodel as epm
+from epmodel.idd import SCHEMA_OBJECT_TYPES
+
+ERROR_TITLE = "EnergyPlusModel"
+
+# Called after each section or object validation with the epJSON object
+# type, number of objects, seconds spent and peak bytes allocated (None if
+# tracemalloc is not tracing), see epmodel.validation.ValidationProfiler.
+# Observers are process-wide, they see validations from every thread.
+Observer = Callable[[str, int, float, Optional[int]], None]
+_observers: List[Observer] = []
+
+
+class Section(NamedTuple):
+    """Metadata of a single EnergyPlusModel section."""
+
+    field_name: str
+    object_type: str
+    object_class: Type[BaseModel]
+    required: bool
+    # Position in EnergyPlusModel, the order model_validate reports errors in
+    index: int
+
+
+def _object_class(annotation: Any) -> Type[BaseModel]:
+    """Get the object class out of a Optional[Dict[str, cls]] annotation."""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    return get_args(annotation)[1]
+
+
+SECTIONS: Dict[str, Section] = {
+    name: Section(
+        field_name=name,
+        object_type=field.alias or name,
+        object_class=_object_class(field.annotation),
+        required=field.is_required(),
+        index=index,
+    )
+    for index, (name, field) in enumerate(epm.EnergyPlusModel.model_fields.items())
+}
+
+OBJECT_TYPES: Dict[str, Section] = {
+    section.object_type: section for section in SECTIONS.values()
+}
+
+
+def get_section(key: str) -> Section:
+    """Get section metadata by field name or epJSON object type.
+
+    Args:
+        key: field name (e.g. building_surface_detailed) or epJSON
+            object type (e.g. BuildingSurface:Detailed)
+
+    Returns:
+        Section metadata
+
+    Raises:
+        KeyError: If key is not a section of EnergyPlusModel.
+    """
+    section = OBJECT_TYPES.get(key) or SECTIONS.get(key)
+    if section is None:
+        raise KeyError(f"Unknown EnergyPlusModel section: {key}")
+    return section
+
+
+def is_section(key: str) -> bool:
+    """Whether key is a field name or epJSON object type of EnergyPlusModel."""
+    return key in OBJECT_TYPES or key in SECTIONS
+
+
+def unknown_sections(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Sections of epJSON data of object types outside EnergyPlusModel.
+
+    Only object types of the EnergyPlus schema are kept, other keys, e.g.
+    misspelled object types, are ignored as EnergyPlusModel ignores them.
+
+    Args:
+        data: epJSON data as loaded by json.load
+
+    Returns:
+        epJSON object type -> raw section data
+    """
+    return {
+        key: value
+        for key, value in data.items()
+        if key not in OBJECT_TYPES and key in SCHEMA_OBJECT_TYPES
+    }
+
+
+def _compile_patterns(patterns: Iterable[str]) -> List[str]:
+    """Normalize section names and epJSON object type patterns.
+
+    Field names are mapped to their epJSON object type. Names without
+    wildcards must be sections of EnergyPlusModel, or object types of the
+    schema outside it.
+    """
+    compiled = []
+    for pattern in patterns:
+        if any(char in pattern for char in "*?[") or pattern in SCHEMA_OBJECT_TYPES:
+            compiled.append(pattern)
+        else:
+            compiled.append(get_section(pattern).object_type)
+    return compiled
+
+
+def object_type_filter(
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Callable[[str], bool]:
+    """Get a predicate selecting epJSON object types.
+
+    Args:
+        include: epJSON object types (or field names) to select, shell-style
+            wildcards such as "Output:*" are allowed. Select all if None.
+        exclude: epJSON object types (or field names) to leave out,
+            applied after include.
+
+    Returns:
+        Function telling whether an epJSON object type is selected
+
+    Raises:
+        KeyError: If a name without wildcards is not an object type of
+            the schema.
+    """
+    included = None if include is None else _compile_patterns(include)
+    excluded = [] if exclude is None else _compile_patterns(exclude)
+
+    def is_selected(object_type: str) -> bool:
+        if included is not None and not any(
+            fnmatchcase(object_type, pattern) for pattern in included
+        ):
+            return False
+        return not any(fnmatchcase(object_type, pattern) for pattern in excluded)
+
+    return is_selected
+
+
+@lru_cache(maxsize=None)
+def section_adapter(field_name: str) -> TypeAdapter:
+    """TypeAdapter of a section, e.g. to dump it to JSON on its own."""
+    return TypeAdapter(epm.EnergyPlusModel.model_fields[field_name].annotation)
+
+
+def prefix_errors(
+    exc: ValidationError, prefix: Sequence[Union[str, int]]
+) -> List[Dict[str, Any]]:
+    """Get line errors of a ValidationError with loc prefixed."""
+    prefix = tuple(prefix)
+    return [
+        {**error, "loc": prefix + tuple(error["loc"])}
+        for error in exc.errors(include_url=False)
+    ]
+
+
+def raise_errors(line_errors: List[Dict[str, Any]]) -> None:
+    """Raise collected line errors as a single ValidationError, if any."""
+    if line_errors:
+        raise ValidationError.from_exception_data(ERROR_TITLE, line_errors)
+
+
+def add_observer(observer: Observer) -> None:
+    """Register a callback notified of each section or object validation."""
+    _observers.append(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """Unregister a callback registered with add_observer."""
+    _observers.remove(observer)
+
+
+def observing() -> bool:
+    """Whether any callback is registered with add_observer."""
+    return bool(_observers)
+
+
+def _observed(object_type: str, count: int, func: Callable[[], Any]) -> Any:
+    """Run a validation, notifying observers of its cost."""
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    try:
+        return func()
+    finally:
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] - baseline if tracing else None
+        for observer in list(_observers):
+            observer(object_type, count, seconds, peak)
+
+
+def validate_section(key: str, data: Any) -> Any:
+    """Validate the raw data of a single section.
+
+    Args:
+        key: field name or epJSON object type of the section
+        data: raw section data, a dictionary of objects keyed by name
+
+    Returns:
+        Dictionary of validated objects keyed by name
+
+    Raises:
+        ValidationError: If the section is invalid, with error locations
+            starting with the epJSON object type, as in
+            EnergyPlusModel.model_validate.
+    """
+    section = get_section(key)
+    if _observers:
+        count = len(data) if isinstance(data, dict) else 0
+        return _observed(
+            section.object_type, count, lambda: _validate_section(section, data)
+        )
+    return _validate_section(section, data)
+
+
+def _validate_section(section: Section, data: Any) -> Any:
+    try:
+        return section_adapter(section.field_name).validate_python(data)
+    except ValidationError as exc:
+        raise_errors(prefix_errors(exc, (section.object_type,)))
+
+
+def validate_object(key: str, name: str, data: Any) -> BaseModel:
+    """Validate the raw data of a single object.
+
+    Args:
+        key: field name or epJSON object type of the section
+        name: name of the object
+        data: raw object data
+
+    Returns:
+        Validated object
+
+    Raises:
+        ValidationError: If the object is invalid, with error locations
+            starting with the epJSON object type and object name.
+    """
+    section = get_section(key)
+    if _observers:
+        return _observed(
+            section.object_type, 1, lambda: _validate_object(section, name, data)
+        )
+    return _validate_object(section, name, data)
+
+
+def _validate_object(section: Section, name: str, data: Any) -> BaseModel:
+    try:
+        return section.object_class.model_validate(data)
+    except ValidationError as exc:
+        raise_errors(prefix_errors(exc, (section.object_type, name)))
+
+
+def revalidate_object(key: str, name: str, obj: Any) -> BaseModel:
+    """Validate an object that may have been changed since it was built.
+
+    Model instances are checked through their dumped data, since pydantic
+    does not validate field assignment, and returned as is. Anything else
+    is validated into the object class of the section.
+
+    Args:
+        key: field name or epJSON object type of the section
+        name: name of the object
+        obj: object instance or raw object data
+
+    Returns:
+        Validated object
+
+    Raises:
+        ValidationError: If the object is invalid, with error locations
+            starting with the epJSON object type and object name.
+    """
+    section = get_section(key)
+    if isinstance(obj, section.object_class):
+        validate_object(key, name, obj.model_dump(by_alias=True, exclude_unset=True))
+        return obj
+    return validate_object(key, name, obj)
+
+
+def validate_sections(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate several raw sections, collecting errors across all of them.
+
+    Args:
+        data: raw section data keyed by field name or epJSON object type
+
+    Returns:
+        Validated sections keyed by field name
+
+    Raises:
+        ValidationError: If any section is invalid. Errors of all sections
+            are reported together.
+    """
+    validated = {}
+    line_errors: List[Dict[str, Any]] = []
+    for key, value in data.items():
+        section = get_section(key)
+        try:
+            validated[section.field_name] = validate_section(key, value)
+        except ValidationError as exc:
+            line_errors.extend(exc.errors(include_url=False))
+    raise_errors(line_errors)
+    return validated
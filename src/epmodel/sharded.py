@@ -0,0 +1,241 @@
+"""
+Sharded directory layout of an EnergyPlusModel.
+
+The model is stored as one JSON file per epJSON object type, holding the
+objects of the section keyed by name, plus a manifest.json listing the
+file and content hash of every section:
+
+    model/
+        manifest.json
+        zone-0c5f3e1a9b2d4f67.json
+        building_surface_detailed-7a1e02c4d9b8f315.json
+        ...
+
+Section files are named after a hash of their bytes and never modified,
+so replacing the manifest is the only step that changes the model a
+reader sees. Files no longer listed are deleted after the manifest.
+
+load_sharded seeds the section hashes of the model from the manifest, so
+save_sharded can tell the sections changed since loading from their hash
+alone (see EnergyPlusModel.section_hash) and rewrites only those. The
+model tracks its objects (see EnergyPlusModel.track_objects), so editing
+an object drops the hash of its section.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pydantic
+
+from epmodel import epmodel as epm
+from epmodel import hashing, idd
+from epmodel.builder import EnergyPlusModel
+from epmodel.hashing import hash_data
+from epmodel.loader import validate_lazy
+from epmodel.sections import OBJECT_TYPES, SECTIONS, section_adapter
+
+MANIFEST = "manifest.json"
+FORMAT = "epmodel-sharded"
+FORMAT_VERSION = 2
+# Times load_sharded reads the manifest, racing saves that delete files
+_ATTEMPTS = 3
+
+# Section file names, see _file_name
+_SHARD = re.compile(r"[0-9a-z_]+-[0-9a-f]{16}\.json")
+
+
+@lru_cache(maxsize=None)
+def schema_version() -> str:
+    """Version of the data model and of the content hashes of the manifest.
+
+    Changes with the version of epmodel and of pydantic, and whenever the
+    data model, the IDD metadata or the content hashes change, including
+    in a source checkout.
+    """
+    try:
+        version = metadata.version("epmodel")
+    except metadata.PackageNotFoundError:
+        version = ""
+    digest = hashlib.sha256(version.encode())
+    digest.update(pydantic.VERSION.encode())
+    for module in (epm, idd, hashing):
+        digest.update(Path(inspect.getfile(module)).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _file_name(object_type: str, content: bytes) -> str:
+    """File name of a section, unique to its content."""
+    section = OBJECT_TYPES.get(object_type)
+    if section is not None:
+        stem = section.field_name
+    else:
+        stem = "_" + re.sub(r"[^0-9A-Za-z]+", "_", object_type).strip("_").lower()
+    return f"{stem}-{hashlib.sha256(content).hexdigest()[:16]}.json"
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _write_section(directory: Path, object_type: str, content: bytes) -> str:
+    """Write the file of a section, unless a file of that content exists."""
+    name = _file_name(object_type, content)
+    if not (directory / name).exists():
+        _write_atomic(directory / name, content)
+    return name
+
+
+def read_manifest(directory: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Read the manifest of a sharded model, None if there is none."""
+    try:
+        with open(Path(directory) / MANIFEST, "r") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    if manifest.get("format") != FORMAT:
+        raise ValueError(f"{directory} is not a sharded epmodel directory")
+    return manifest
+
+
+def save_sharded(
+    model: EnergyPlusModel, directory: Union[str, Path], indent: Optional[int] = None
+) -> List[str]:
+    """Save a model as one file per epJSON object type.
+
+    Sections whose content hash matches the manifest already in the
+    directory are not written again. For a model loaded with load_sharded
+    the hashes of untouched sections are known without hashing, so only
+    the sections changed since loading are hashed and rewritten. Changes
+    made in place to section dictionaries or lists must be marked with
+    EnergyPlusModel.mark_dirty, assignments to fields are seen.
+
+    New section files are written under new names, then the manifest is
+    replaced atomically, then the files it no longer lists are deleted.
+    A reader sees either the old or the new model, never a mix, and
+    load_sharded reads the manifest again if a save deletes the files of
+    the manifest it read.
+
+    Args:
+        model: EnergyPlusModel object
+        directory: directory to save to, created if needed
+        indent: indentation of the section files, None for compact output
+
+    Returns:
+        epJSON object types of the sections written
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    previous = read_manifest(directory) or {}
+    if previous.get("schema_version") != schema_version():
+        # Hashes of another data model version cannot be compared
+        previous = {}
+    old_sections = previous.get("sections", {})
+    sections = {}
+    written = []
+    pending = model._pending_sections
+    for field_name, section in SECTIONS.items():
+        objects = pending.get(field_name) or model.__dict__.get(field_name)
+        if not objects:
+            continue
+        digest = model.section_hash(field_name)
+        old = old_sections.get(section.object_type)
+        if old and old["hash"] == digest and (directory / old["file"]).exists():
+            sections[section.object_type] = old
+            continue
+        if field_name in pending:
+            content = json.dumps(pending[field_name], indent=indent).encode()
+        else:
+            content = section_adapter(field_name).dump_json(
+                objects, by_alias=True, exclude_none=True, indent=indent, warnings=False
+            )
+        name = _write_section(directory, section.object_type, content)
+        sections[section.object_type] = {"file": name, "hash": digest}
+        written.append(section.object_type)
+    for object_type, objects in model._unknown_sections.items():
+        digest = hash_data(objects)
+        old = old_sections.get(object_type)
+        if old and old["hash"] == digest and (directory / old["file"]).exists():
+            sections[object_type] = old
+            continue
+        content = json.dumps(objects, indent=indent).encode()
+        name = _write_section(directory, object_type, content)
+        sections[object_type] = {"file": name, "hash": digest}
+        written.append(object_type)
+    manifest = {
+        "format": FORMAT,
+        "format_version": FORMAT_VERSION,
+        "schema_version": schema_version(),
+        "sections": sections,
+    }
+    # The commit point, the new files are only read from here on
+    _write_atomic(directory / MANIFEST, json.dumps(manifest, indent=4).encode())
+    # Files of the previous manifest, or left by an interrupted save
+    current = {entry["file"] for entry in sections.values()}
+    stale = {entry["file"] for entry in old_sections.values()}
+    stale.update(name for name in os.listdir(directory) if _SHARD.fullmatch(name))
+    for name in stale - current:
+        try:
+            os.unlink(directory / name)
+        except OSError:
+            pass
+    return written
+
+
+def load_sharded(directory: Union[str, Path], lazy: bool = False) -> EnergyPlusModel:
+    """Load a model saved with save_sharded.
+
+    Args:
+        directory: directory of the sharded model
+        lazy: validate sections on first access, see
+            epmodel.loader.validate_lazy
+
+    Returns:
+        EnergyPlusModel object, with the section hashes of the manifest,
+        tracking its objects
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest.
+        ValidationError: If the model is invalid.
+    """
+    directory = Path(directory)
+    for attempt in range(_ATTEMPTS):
+        manifest = read_manifest(directory)
+        if manifest is None:
+            raise FileNotFoundError(f"No {MANIFEST} in {directory}")
+        try:
+            data = {}
+            for object_type, entry in manifest["sections"].items():
+                with open(directory / entry["file"], "r") as f:
+                    data[object_type] = json.load(f)
+            break
+        except FileNotFoundError:
+            # Deleted by a save that replaced the manifest meanwhile
+            if attempt == _ATTEMPTS - 1:
+                raise
+    model = validate_lazy(data) if lazy else EnergyPlusModel.model_validate(data)
+    # The seeded hashes are only valid while edits drop them
+    model.track_objects()
+    if manifest.get("schema_version") == schema_version():
+        for object_type, entry in manifest["sections"].items():
+            section = OBJECT_TYPES.get(object_type)
+            if section is not None:
+                model._section_hashes[section.field_name] = entry["hash"]
+    return model
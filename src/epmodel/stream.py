@@ -0,0 +1,194 @@
+"""
+Streaming access to epJSON files.
+
+iter_epjson parses an epJSON file incrementally and validates one object at
+a time, so memory use is bounded by the largest single object rather than
+the size of the file. read_epjson parses the same way into a dictionary,
+without ever holding the whole text, e.g. of a compressed file.
+
+Paths ending in .gz, .bz2, .xz or .lzma are decompressed as they are
+read, see epmodel.compression.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from epmodel.compression import open_source
+from epmodel.sections import OBJECT_TYPES, object_type_filter, validate_object
+
+_WHITESPACE = " \t\n\r"
+
+
+class _Reader:
+    """Incremental JSON tokenizer over a text file."""
+
+    def __init__(self, f: IO[str], chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self, size: int) -> bool:
+        """Read at least size more characters, False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has been consumed already
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non whitespace character, empty string at end of file."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self.fill(self.chunk_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error(f"Expecting one of {chars!r}")
+        self.pos += 1
+        return char
+
+    def decode(self) -> Any:
+        """Decode the next JSON value, reading more until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(len(self.buf) - self.pos):
+                    raise
+                continue
+            # A number at the end of the buffer may be cut short
+            if end == len(self.buf) and self.fill(self.chunk_size):
+                continue
+            self.pos = end
+            return value
+
+    def error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+
+def _iter_raw(reader: _Reader) -> Iterator[Tuple[str, Optional[str], Any]]:
+    """Iterate over the objects of an epJSON document as raw data.
+
+    Yields:
+        Tuples of epJSON object type, object name and object data. The
+        name is None for a section that is empty or not a JSON object,
+        with the whole section as data.
+    """
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        object_type = reader.decode()
+        reader.expect(":")
+        if reader.peek() == "{":
+            reader.pos += 1
+            if reader.peek() == "}":
+                reader.pos += 1
+                yield object_type, None, {}
+            else:
+                while True:
+                    name = reader.decode()
+                    reader.expect(":")
+                    yield object_type, name, reader.decode()
+                    if reader.expect(",}") == "}":
+                        break
+        else:
+            yield object_type, None, reader.decode()
+        if reader.expect(",}") == "}":
+            return
+
+
+def read_epjson(
+    source: Union[str, Path, IO[str]], chunk_size: int = 1 << 16
+) -> Dict[str, Any]:
+    """Parse an epJSON file incrementally into a dictionary.
+
+    Unlike json.load, the text of the file is never held in memory as a
+    whole, only a read buffer.
+
+    Args:
+        source: path to an epJSON file, or a text file object
+        chunk_size: number of characters read at once
+
+    Returns:
+        epJSON data as loaded by json.load
+
+    Raises:
+        JSONDecodeError: If the file is not valid JSON.
+    """
+    data: Dict[str, Any] = {}
+    f, close = open_source(source)
+    try:
+        for object_type, name, value in _iter_raw(_Reader(f, chunk_size)):
+            if name is None:
+                data[object_type] = value
+            else:
+                data.setdefault(object_type, {})[name] = value
+    finally:
+        if close:
+            f.close()
+    return data
+
+
+def iter_epjson(
+    source: Union[str, Path, IO[str]],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Tuple[str, str, BaseModel]]:
+    """Iterate over the objects of an epJSON file, validating one at a time.
+
+    Neither the whole document nor the whole EnergyPlusModel is ever built,
+    at most one object plus a read buffer is held in memory. Objects of
+    types that are not part of EnergyPlusModel, or not selected, are
+    skipped without validation.
+
+    Args:
+        source: path to an epJSON file, or a text file object
+        include: epJSON object types (or field names) to yield, shell-style
+            wildcards such as "Output:*" are allowed. Yield all if None.
+        exclude: epJSON object types (or field names) to skip
+        chunk_size: number of characters read at once
+
+    Yields:
+        Tuples of epJSON object type, object name and validated object
+
+    Raises:
+        JSONDecodeError: If the file is not valid JSON.
+        ValidationError: If an object is invalid, when reached.
+    """
+    is_selected = object_type_filter(include, exclude)
+    selected: Dict[str, bool] = {}
+    f, close = open_source(source)
+    try:
+        for object_type, name, data in _iter_raw(_Reader(f, chunk_size)):
+            if name is None:
+                continue
+            if object_type not in selected:
+                selected[object_type] = object_type in OBJECT_TYPES and is_selected(
+                    object_type
+                )
+            if selected[object_type]:
+                yield object_type, name, validate_object(object_type, name, data)
+    finally:
+        if close:
+            f.close()
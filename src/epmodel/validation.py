@@ -0,0 +1,206 @@
+"""
+Validation of whole epJSON models with a structured report.
+
+Instead of stopping at a single ValidationError, validate_report checks
+every section in one pass and reports what is wrong by epJSON object type
+and object name, along with the time spent on each section.
+
+ValidationProfiler records how many objects of each epJSON object type
+were validated, and the time and memory it took.
+"""
+
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field, ValidationError
+
+from epmodel.builder import EnergyPlusModel
+from epmodel.sections import (
+    OBJECT_TYPES,
+    SECTIONS,
+    add_observer,
+    remove_observer,
+    unknown_sections,
+    validate_section,
+)
+
+
+class ObjectError(BaseModel):
+    """A validation error of a single epJSON object."""
+
+    object_type: str
+    # Empty for errors of the whole section, e.g. a missing section
+    name: str
+    loc: Tuple[Union[str, int], ...]
+    msg: str
+    type: str
+
+
+class ValidationReport(BaseModel):
+    """Errors and timing of validating an epJSON model."""
+
+    # epJSON object type -> object name -> errors of the object
+    errors: Dict[str, Dict[str, List[ObjectError]]] = {}
+    # epJSON object type -> seconds spent validating the section
+    section_times: Dict[str, float] = {}
+    # Object types outside EnergyPlusModel, kept without validation
+    unknown_object_types: List[str] = []
+    total_time: float = 0.0
+    # The validated model, if there were no errors
+    model: Optional[EnergyPlusModel] = Field(default=None, exclude=True)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def error_count(self) -> int:
+        return sum(
+            len(errors)
+            for objects in self.errors.values()
+            for errors in objects.values()
+        )
+
+    def slowest_sections(self, n: int = 10) -> List[Tuple[str, float]]:
+        """Get the n sections that took the longest to validate."""
+        return sorted(self.section_times.items(), key=lambda item: -item[1])[:n]
+
+
+def _object_error(error: Dict[str, Any]) -> ObjectError:
+    loc = tuple(error["loc"])
+    name = str(loc[1]) if len(loc) > 1 else ""
+    return ObjectError(
+        object_type=loc[0],
+        name=name,
+        loc=loc[2:],
+        msg=error["msg"],
+        type=error["type"],
+    )
+
+
+def validate_report(data: Dict[str, Any]) -> ValidationReport:
+    """Validate epJSON data, collecting every error across all sections.
+
+    Args:
+        data: epJSON data as loaded by json.load
+
+    Returns:
+        ValidationReport with errors indexed by epJSON object type and
+        object name, per section timing, and the model if it is valid.
+    """
+    report = ValidationReport()
+    validated = {}
+    start = time.perf_counter()
+    for object_type, value in data.items():
+        if object_type not in OBJECT_TYPES:
+            report.unknown_object_types.append(object_type)
+            continue
+        section_start = time.perf_counter()
+        try:
+            validated[object_type] = validate_section(object_type, value)
+        except ValidationError as exc:
+            for error in exc.errors(include_url=False):
+                error = _object_error(error)
+                objects = report.errors.setdefault(error.object_type, {})
+                objects.setdefault(error.name, []).append(error)
+        report.section_times[object_type] = time.perf_counter() - section_start
+    for section in SECTIONS.values():
+        if section.required and section.object_type not in data:
+            report.errors.setdefault(section.object_type, {})[""] = [
+                ObjectError(
+                    object_type=section.object_type,
+                    name="",
+                    loc=(),
+                    msg="Field required",
+                    type="missing",
+                )
+            ]
+    if report.is_valid:
+        report.model = EnergyPlusModel.model_construct(**validated)
+        report.model._unknown_sections = unknown_sections(data)
+    report.total_time = time.perf_counter() - start
+    return report
+
+
+class ObjectTypeStats(BaseModel):
+    """Validation statistics of an epJSON object type."""
+
+    object_type: str
+    # Number of objects validated
+    count: int = 0
+    # Number of section or object validations
+    calls: int = 0
+    total_time: float = 0.0
+    # Largest peak of bytes allocated by a single validation, if tracked
+    peak_memory: Optional[int] = None
+
+
+class ValidationProfiler:
+    """Record validation statistics per epJSON object type.
+
+    Used as a context manager, it records every section and object
+    validated through epmodel while active: load_epjson and
+    EnergyPlusModel.model_validate, lazy and selective loading,
+    revalidate, validate_report, iter_epjson and the like. While active,
+    model_validate and model_validate_json validate one section at a time
+    rather than in a single pass, which takes a little longer.
+
+    Profilers are process-wide: they record validations from every
+    thread, and tracemalloc peaks are reset before each validation, so
+    peak memory is only meaningful while a single thread validates.
+
+    Args:
+        track_memory: record peak allocations with tracemalloc, which
+            slows down validation noticeably
+        callback: called after each validation with the epJSON object
+            type, number of objects, seconds and peak bytes allocated,
+            e.g. to forward measurements to a metrics system
+
+    Example:
+        with ValidationProfiler(track_memory=True) as profiler:
+            model = load_epjson(path)
+        for stats in profiler.slowest(5):
+            print(stats.object_type, stats.count, stats.total_time)
+    """
+
+    def __init__(
+        self,
+        track_memory: bool = False,
+        callback: Optional[Callable[[str, int, float, Optional[int]], None]] = None,
+    ):
+        self.track_memory = track_memory
+        self.callback = callback
+        self.stats: Dict[str, ObjectTypeStats] = {}
+        self._started_tracing = False
+
+    def record(
+        self, object_type: str, count: int, seconds: float, peak: Optional[int]
+    ) -> None:
+        stats = self.stats.get(object_type)
+        if stats is None:
+            stats = self.stats[object_type] = ObjectTypeStats(object_type=object_type)
+        stats.count += count
+        stats.calls += 1
+        stats.total_time += seconds
+        if peak is not None:
+            stats.peak_memory = max(stats.peak_memory or 0, peak)
+        if self.callback is not None:
+            self.callback(object_type, count, seconds, peak)
+
+    def slowest(self, n: int = 10) -> List[ObjectTypeStats]:
+        """Get the n object types that took the longest to validate."""
+        return sorted(self.stats.values(), key=lambda stats: -stats.total_time)[:n]
+
+    def __enter__(self) -> "ValidationProfiler":
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        add_observer(self.record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        remove_observer(self.record)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
@@ -1,6 +1,7 @@
 """
 Tests configuration
 """
+import copy
 import json
 from pathlib import Path
 
@@ -21,17 +22,32 @@ def test_file2(test_data_dir):
     return test_data_dir / "RefBldgMediumOfficeNew2004_Chicago_epJSON.epJSON"
 
 @pytest.fixture(scope="session")
-def epmodel1(test_file1):
+def json_data1(test_file1):
     with open(test_file1, 'r') as f:
-        json_data = json.load(f)
-    model = EnergyPlusModel.model_validate(json_data)
+        return json.load(f)
+
+@pytest.fixture(scope="session")
+def json_data2(test_file2):
+    with open(test_file2, 'r') as f:
+        return json.load(f)
+
+@pytest.fixture
+def data1(json_data1):
+    # For tests that change the data, or the raw sections of lazy models
+    return copy.deepcopy(json_data1)
+
+@pytest.fixture
+def data2(json_data2):
+    return copy.deepcopy(json_data2)
+
+@pytest.fixture(scope="session")
+def epmodel1(json_data1):
+    model = EnergyPlusModel.model_validate(json_data1)
     assert model.version is not None
     return model
 
 @pytest.fixture(scope="session")
-def epmodel2(test_file2):
-    with open(test_file2, 'r') as f:
-        json_data = json.load(f)
-    model = EnergyPlusModel.model_validate(json_data)
+def epmodel2(json_data2):
+    model = EnergyPlusModel.model_validate(json_data2)
     assert model.version is not None
     return model
@@ -3,11 +3,13 @@ Test epmodel systems builder
 """
 
 import pytest
+from pydantic import ValidationError
 
 from epmodel.builder import (
     ConstructionComplexFenestrationStateBuilder,
     ConstructionComplexFenestrationStateInput,
     ConstructionComplexFenestrationStateLayerInput,
+    EnergyPlusModel,
     LayerType,
 )
 from epmodel.epmodel import GasType, WindowMaterialGas
@@ -79,7 +81,36 @@ def input(layer1_input, layer2_input):
 
 
 def test_ccfs_builder(epmodel1, input):
-    builder = ConstructionComplexFenestrationStateBuilder("test", epmodel1, input)
+    # The session model is shared with other tests
+    model = epmodel1.model_copy(deep=True)
+    builder = ConstructionComplexFenestrationStateBuilder("test", model, input)
     builder.add_to_enenrgyplus_model()
-    assert epmodel1.construction_complex_fenestration_state is not None
-    assert epmodel1.construction_complex_fenestration_state["test"] is not None
+    assert model.construction_complex_fenestration_state is not None
+    assert model.construction_complex_fenestration_state["test"] is not None
+
+
+def test_revalidate(json_data2):
+    model = EnergyPlusModel.model_validate(json_data2)
+    assert model._dirty == {}
+    model.add("window_material_gas", "gas1", {"gas_type": "Air", "thickness": 0.01})
+    model.add("window_material_gas", "gas2", {"gas_type": "Air", "thickness": -1})
+    model.zone = dict(model.zone)
+    with pytest.raises(ValidationError) as e_info:
+        model.revalidate()
+    assert [e["loc"] for e in e_info.value.errors()] == [
+        ("WindowMaterial:Gas", "gas2", "thickness")
+    ]
+    assert model._dirty == {"window_material_gas": {"gas2"}}
+    assert isinstance(model.window_material_gas["gas1"], WindowMaterialGas)
+
+    model.window_material_gas["gas2"] = WindowMaterialGas(
+        gas_type=GasType.air, thickness=0.01
+    )
+    model.revalidate()
+    assert model._dirty == {}
+
+    zone = next(iter(model.zone))
+    model.zone[zone].multiplier = -1
+    model.mark_dirty("Zone", zone)
+    with pytest.raises(ValidationError):
+        model.revalidate()
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from epmodel.compression import (
+    COMPRESSIONS,
+    open_source,
+    open_text,
+    resolve_compression,
+)
+from epmodel.epjson import dump_epjson, load_epjson
+from epmodel.idf import dump_idf, load_idf
+from epmodel.stream import iter_epjson, read_epjson
+
+SUFFIXES = {"gzip": ".gz", "bz2": ".bz2", "lzma": ".xz"}
+
+
+def test_resolve_compression():
+    assert resolve_compression("model.epJSON.gz") == "gzip"
+    assert resolve_compression("model.epJSON.XZ") == "lzma"
+    assert resolve_compression("model.epJSON") is None
+    assert resolve_compression("model.epJSON.gz", None) is None
+    with pytest.raises(ValueError):
+        resolve_compression("model.epJSON", "zip")
+
+
+def test_open_source(tmp_path):
+    path = tmp_path / "model.idf.gz"
+    with open_text(path, "w") as f:
+        f.write("Version,9.2;")
+    f, close = open_source(path)
+    with f:
+        assert close
+        assert f.read() == "Version,9.2;"
+    buffer = io.StringIO("Version,9.2;")
+    assert open_source(buffer) == (buffer, False)
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_compressed_epjson(tmp_path, epmodel2, compression):
+    path = tmp_path / f"model.epJSON{SUFFIXES[compression]}"
+    dump_epjson(epmodel2, path)
+    plain = tmp_path / "model.epJSON"
+    dump_epjson(epmodel2, plain)
+    with open_text(path) as f:
+        assert f.read(1) == "{"
+    assert path.stat().st_size < plain.stat().st_size
+    assert load_epjson(path) == load_epjson(plain)
+    assert load_epjson(path, lazy=True) == load_epjson(plain)
+    assert read_epjson(path) == read_epjson(plain)
+    assert len(list(iter_epjson(path, include=["Zone"]))) == len(epmodel2.zone)
+    # Explicit codec, whatever the suffix
+    other = tmp_path / "model.bin"
+    dump_epjson(epmodel2, other, compression=compression)
+    assert load_epjson(other, compression=compression) == load_epjson(plain)
+
+
+def test_compressed_idf(tmp_path, epmodel2):
+    path = tmp_path / "model.idf.gz"
+    dump_idf(epmodel2, path)
+    assert load_idf(path).zone == epmodel2.zone
@@ -0,0 +1,41 @@
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel.diff import FieldChange, diff_models
+
+
+@pytest.mark.parametrize("hashed", [False, True])
+def test_diff_models(data1, hashed):
+    old = EnergyPlusModel.model_validate(data1)
+    new = EnergyPlusModel.model_validate(data1)
+    if hashed:
+        old.content_hash()
+        new.content_hash()
+    assert diff_models(old, new).is_empty
+
+    new.material["1/2IN Gypsum"].thickness = 0.02
+    zone = next(iter(new.zone))
+    del new.zone[zone]
+    new.mark_dirty("zone")
+    new.add("schedule_type_limits", "Extra", {"unit_type": "Dimensionless"})
+    new.revalidate()
+
+    diff = diff_models(old, new)
+    assert diff.added == {"ScheduleTypeLimits": ["Extra"]}
+    assert diff.removed == {"Zone": [zone]}
+    assert diff.modified == {
+        "Material": {
+            "1/2IN Gypsum": [FieldChange(field="thickness", old=0.0127, new=0.02)]
+        }
+    }
+    assert diff.object_types == ["Material", "ScheduleTypeLimits", "Zone"]
+    reverse = diff_models(new, old)
+    assert reverse.added == diff.removed
+    assert reverse.removed == diff.added
+
+
+def test_diff_unknown_object_types(data1):
+    old = EnergyPlusModel.model_validate(data1)
+    data1["Output:Schedules"] = {"A": {"value": 1}}
+    new = EnergyPlusModel.model_validate(data1)
+    assert diff_models(old, new).added == {"Output:Schedules": ["A"]}
@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel.epjson import (
+    BACKENDS,
+    dump_epjson,
+    dumps,
+    load_epjson,
+    orjson,
+    write_epjson,
+)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_load_dump_epjson(tmp_path, test_file2, epmodel2, backend):
+    if backend == "orjson" and orjson is None:
+        pytest.skip("orjson not installed")
+    assert load_epjson(test_file2, backend=backend) == epmodel2
+    path = tmp_path / "model.epJSON"
+    dump_epjson(epmodel2, path, backend=backend)
+    assert load_epjson(path) == EnergyPlusModel.model_validate(
+        epmodel2.model_dump(mode="json", by_alias=True, exclude_none=True)
+    )
+
+
+def test_load_epjson_options(test_file2, epmodel2):
+    model = load_epjson(test_file2, include=["Zone"])
+    assert model.zone == epmodel2.zone
+    assert model.material is None
+    model = load_epjson(test_file2, lazy=True)
+    assert "material" in model._pending_sections
+    assert model == epmodel2
+    with pytest.raises(ValueError):
+        load_epjson(test_file2, backend="pydantic", lazy=True)
+    with pytest.raises(ValueError):
+        load_epjson(test_file2, backend="yaml")
+
+
+@pytest.mark.parametrize("indent", [None, 4])
+def test_write_epjson(epmodel2, indent):
+    f = io.StringIO()
+    write_epjson(epmodel2, f, indent=indent)
+    assert json.loads(f.getvalue()) == json.loads(dumps(epmodel2, indent=indent))
+
+
+def test_write_epjson_exclude_defaults(epmodel2):
+    f = io.StringIO()
+    write_epjson(epmodel2, f, exclude_defaults=True)
+    assert len(f.getvalue()) < len(dumps(epmodel2))
+    assert EnergyPlusModel.model_validate(json.loads(f.getvalue())) == epmodel2
+
+
+def test_write_epjson_lazy(test_file2, json_data2):
+    data = json_data2
+    model = load_epjson(test_file2, lazy=True)
+    model.zone
+    f = io.StringIO()
+    write_epjson(model, f)
+    assert "material" in model._pending_sections
+    assert json.loads(f.getvalue())["Material"] == data["Material"]
+
+
+def test_unknown_sections_roundtrip(tmp_path, data2):
+    data = data2
+    data["ZoneHVAC:Baseboard:Convective:Electric"] = {
+        "bb": {"zone_name": "z", "x": [1, 2.5]}
+    }
+    path = tmp_path / "in.epJSON"
+    path.write_text(json.dumps(data))
+    for lazy in (False, True):
+        model = load_epjson(path, lazy=lazy)
+        out = tmp_path / "out.epJSON"
+        dump_epjson(model, out)
+        assert json.loads(out.read_text())[
+            "ZoneHVAC:Baseboard:Convective:Electric"
+        ] == (data["ZoneHVAC:Baseboard:Convective:Electric"])
+        f = io.StringIO()
+        write_epjson(model, f)
+        assert json.loads(f.getvalue()) == json.loads(out.read_text())
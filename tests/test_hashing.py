@@ -0,0 +1,62 @@
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel import epmodel as epm
+from epmodel.hashing import combine_hashes, hash_object
+from epmodel.loader import validate_lazy
+
+
+def test_content_hash(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    digest = model.content_hash()
+    # Independent of the order of sections and objects
+    reordered = {
+        key: dict(reversed(value.items())) for key, value in reversed(data1.items())
+    }
+    assert EnergyPlusModel.model_validate(reordered).content_hash() == digest
+    # Sections held as raw data hash as if validated
+    assert validate_lazy(data1).content_hash() == digest
+
+    # Fields assigned are seen without mark_dirty
+    model.material["1/2IN Gypsum"].thickness = 0.02
+    assert model.content_hash() != digest
+    model.material["1/2IN Gypsum"].thickness = 0.0127
+    assert model.content_hash() == digest
+    surface_name = next(iter(model.building_surface_detailed))
+    vertex = model.building_surface_detailed[surface_name].vertices[0]
+    x = vertex.vertex_x_coordinate
+    vertex.vertex_x_coordinate = x + 1.0
+    assert model.content_hash() != digest
+    vertex.vertex_x_coordinate = x
+    assert model.content_hash() == digest
+
+    model.add("material", "New", epm.Material(**data1["Material"]["1/2IN Gypsum"]))
+    assert model.content_hash() != digest
+    del model.material["New"]
+    model.mark_dirty("material")
+    assert model.content_hash() == digest
+
+
+def test_object_hash(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    raw = data1["Material"]["1/2IN Gypsum"]
+    assert model.object_hash("Material", "1/2IN Gypsum") == hash_object(
+        "Material", "1/2IN Gypsum", raw
+    )
+    with pytest.raises(KeyError):
+        model.object_hash("Material", "Missing")
+    assert model.section_hash("Zone") != model.section_hash("Material")
+    model.material = {}
+    assert model.section_hash("Material") == combine_hashes({})
+
+
+def test_equal_with_caches(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    other = EnergyPlusModel.model_validate(data1)
+    model.content_hash()
+    model.find("1/2IN Gypsum")
+    model.checkpoint()
+    model.add("material", "1/2IN Gypsum", model.material["1/2IN Gypsum"])
+    assert model == other
+    model._unknown_sections["Door"] = {"Door 1": {}}
+    assert model != other
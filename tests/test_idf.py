@@ -0,0 +1,123 @@
+import io
+
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel.idf import dump_idf, idf_to_epjson, iter_idf, load_idf, write_idf
+
+IDF = """
+! Comment
+Version,25.1;
+Timestep,4;  Building,Office,  ! Trailing comment
+  0,City,0.04,0.4,FullExterior,25,6;
+Schedule:Compact,
+    Always On,    !- Name
+    ,             !- Schedule Type Limits Name
+    Through: 12/31,
+    For: AllDays,
+    Until: 24:00,1;
+Matrix:TwoDimension,
+    Transmittance,
+    2,1,
+    0.5,
+    0.25;
+Coil:Heating:Fuel,
+    Heating Coil,
+    ,
+    naturalgas,
+    0.8,
+    autocalculate,
+    Inlet,
+    Outlet;
+GlobalGeometryRules,UpperLeftCorner,Counterclockwise,Relative;
+door,Front Door,Wood,Wall 1,1,0.5,0,1,2.1;
+UnknownObject,A,B;
+"""
+
+
+def test_iter_idf():
+    objects = list(iter_idf(io.StringIO(IDF)))
+    assert objects[0] == ("Version", ["25.1"])
+    assert objects[1] == ("Timestep", ["4"])
+    assert objects[2][0] == "Building"
+    assert objects[3][1][-4:] == ["Through: 12/31", "For: AllDays", "Until: 24:00", "1"]
+    with pytest.raises(ValueError):
+        list(iter_idf(io.StringIO("Version,25.1")))
+
+
+def test_idf_to_epjson():
+    with pytest.warns(UserWarning, match="UnknownObject"):
+        data = idf_to_epjson(io.StringIO(IDF))
+    assert "UnknownObject" not in data
+    # Object types outside EnergyPlusModel are read from the schema
+    assert data["Door"] == {
+        "Front Door": {
+            "construction_name": "Wood",
+            "building_surface_name": "Wall 1",
+            "multiplier": 1,
+            "starting_x_coordinate": 0.5,
+            "starting_z_coordinate": 0,
+            "length": 1,
+            "height": 2.1,
+        }
+    }
+    assert data["Version"] == {"Version 1": {"version_identifier": "25.1"}}
+    assert data["Timestep"] == {"Timestep 1": {"number_of_timesteps_per_hour": 4}}
+    assert data["Building"]["Office"]["terrain"] == "City"
+    assert data["Schedule:Compact"]["Always On"] == {
+        "data": [
+            {"field": "Through: 12/31"},
+            {"field": "For: AllDays"},
+            {"field": "Until: 24:00"},
+            {"field": 1},
+        ]
+    }
+    assert data["Matrix:TwoDimension"]["Transmittance"] == {
+        "number_of_rows": 2,
+        "number_of_columns": 1,
+        "values": [{"value": 0.5}, {"value": 0.25}],
+    }
+    # Choices are matched case-insensitively
+    coil = data["Coil:Heating:Fuel"]["Heating Coil"]
+    assert coil["fuel_type"] == "NaturalGas"
+    assert coil["nominal_capacity"] == "Autosize"
+    with pytest.warns(UserWarning):
+        data = idf_to_epjson(io.StringIO(IDF), include=["Schedule:*", "Door"])
+    assert set(data) == {"Building", "GlobalGeometryRules", "Schedule:Compact", "Door"}
+
+
+def test_load_idf(test_data_dir, json_data1):
+    model1 = EnergyPlusModel.model_validate(json_data1)
+    path = test_data_dir / "RefBldgPrimarySchoolNew2004_Chicago.idf"
+    assert load_idf(path) == model1
+    model = load_idf(path, lazy=True)
+    assert model.building_surface_detailed == model1.building_surface_detailed
+
+
+def test_write_idf():
+    model = load_idf(io.StringIO(IDF.replace("UnknownObject,A,B;", "")))
+    assert "Front Door" in model._unknown_sections["Door"]
+    f = io.StringIO()
+    write_idf(model, f)
+    text = f.getvalue()
+    assert "Timestep,\n    4;  !- number_of_timesteps_per_hour\n" in text
+    assert "    1,  !- number_of_columns\n    0.5,\n    0.25;\n" in text
+    assert "    ,  !- schedule_type_limits_name\n    Through: 12/31,\n" in text
+    assert "Door,\n    Front Door,  !- name\n" in text
+    f.seek(0)
+    loaded = load_idf(f)
+    assert loaded == model
+    assert loaded._unknown_sections == model._unknown_sections
+
+
+def test_dump_idf(tmp_path, epmodel1):
+    model1 = epmodel1
+    path = tmp_path / "model.idf"
+    dump_idf(model1, path)
+    # Defaults of some fields are not built into their models, so compare
+    # the epJSON rather than the models
+    assert load_idf(path).model_dump(
+        mode="json", by_alias=True, exclude_none=True, warnings=False
+    ) == model1.model_dump(
+        mode="json", by_alias=True, exclude_none=True, warnings=False
+    )
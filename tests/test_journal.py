@@ -0,0 +1,110 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel import epmodel as epm
+from epmodel.loader import validate_lazy
+
+
+def dump(model):
+    # Compared as data, undoing a removal appends the object to its section
+    return json.loads(
+        model.model_dump_json(by_alias=True, exclude_none=True, warnings=False)
+    )
+
+
+def test_field_assignment(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    digest = model.content_hash()
+    original = dump(model)
+    checkpoint = model.checkpoint()
+    assert model.changes_since(checkpoint) == {}
+
+    model.material["1/2IN Gypsum"].thickness = 0.02
+    surface_name = next(iter(model.building_surface_detailed))
+    vertex = model.building_surface_detailed[surface_name].vertices[0]
+    vertex.vertex_x_coordinate += 1.0
+    assert model.changes_since(checkpoint) == {
+        "material": {"1/2IN Gypsum"},
+        "building_surface_detailed": {surface_name},
+    }
+    # Marked dirty without mark_dirty
+    assert model.content_hash() != digest
+
+    assert model.undo(2) == 2
+    assert model.undo() == 0
+    assert dump(model) == original
+    assert model.content_hash() == digest
+    assert model.redo() == 1
+    assert model.material["1/2IN Gypsum"].thickness == 0.02
+
+
+def test_add_remove_section(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    original = dump(model)
+    material = epm.Material(**data1["Material"]["1/2IN Gypsum"])
+    checkpoint = model.checkpoint()
+
+    model.add("material", "New", material)
+    model.remove("material", "1/2IN Gypsum")
+    model.zone = None
+    with pytest.raises(KeyError):
+        model.remove("material", "Missing")
+    assert model.changes_since(checkpoint) == {
+        "material": {"New", "1/2IN Gypsum"},
+        "zone": None,
+    }
+
+    middle = model.checkpoint()
+    material.thickness = 0.03
+    assert model.changes_since(middle) == {"material": {"New"}}
+    # A new change drops what was undone
+    model.undo()
+    model.material["New"].roughness = "Rough"
+    assert model.redo() == 0
+
+    assert model.rollback(checkpoint) == 4
+    assert dump(model) == original
+    # Removed objects are no longer tracked
+    material.thickness = 0.04
+    assert model.changes_since(middle).keys() == {"material", "zone"}
+    assert model.undo() == 0
+
+
+def test_lazy_and_copies(data1):
+    model = validate_lazy(data1)
+    checkpoint = model.checkpoint()
+    model.material["1/2IN Gypsum"].thickness = 0.02
+    assert model.changes_since(checkpoint) == {"material": {"1/2IN Gypsum"}}
+
+    copied = copy.deepcopy(model)
+    copied.material["1/2IN Gypsum"].thickness = 0.03
+    with pytest.raises(RuntimeError):
+        copied.undo()
+    assert model.material["1/2IN Gypsum"].thickness == 0.02
+
+    model.stop_tracking()
+    model.material["1/2IN Gypsum"].thickness = 0.03
+    with pytest.raises(RuntimeError):
+        model.changes_since(checkpoint)
+
+
+def test_pickle(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    model.checkpoint()
+    model.material["1/2IN Gypsum"].thickness = 0.02
+    digest = model.content_hash()
+    # Unpickled models start a new journal and still track their objects
+    loaded = pickle.loads(pickle.dumps(model))
+    with pytest.raises(RuntimeError):
+        loaded.undo()
+    assert loaded.content_hash() == digest
+    checkpoint = loaded.checkpoint()
+    zone = next(iter(loaded.zone))
+    loaded.zone[zone].multiplier = 3
+    assert loaded.changes_since(checkpoint) == {"zone": {zone}}
+    assert loaded.content_hash() != digest
+    assert model.zone[zone].multiplier != 3
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from epmodel import EnergyPlusModel
+from epmodel.loader import validate_lazy, validate_selected
+
+
+def test_validate_lazy(json_data1, epmodel1):
+    model = validate_lazy(json_data1)
+    assert "building_surface_detailed" in model._pending_sections
+    assert model.building_surface_detailed == epmodel1.building_surface_detailed
+    assert "building_surface_detailed" not in model._pending_sections
+    assert model == epmodel1
+    assert model.model_fields_set == epmodel1.model_fields_set
+
+
+def test_validate_lazy_errors(json_data1):
+    data = dict(json_data1)
+    data["BuildingSurface:Detailed"] = {"wall": {"surface_type": "Nope"}}
+    with pytest.raises(ValidationError) as eager:
+        EnergyPlusModel.model_validate(data)
+    model = validate_lazy(data)
+    assert model.zone is not None
+    with pytest.raises(ValidationError) as lazy:
+        model.building_surface_detailed
+    assert lazy.value.errors() == eager.value.errors()
+    with pytest.raises(ValidationError):
+        model.model_dump()
+    model.building_surface_detailed = None
+    assert model.model_dump()["building_surface_detailed"] is None
+
+
+def test_validate_selected(json_data1, epmodel1):
+    model = validate_selected(
+        json_data1, include=["BuildingSurface:Detailed", "zone", "Output:*"]
+    )
+    assert model.building_surface_detailed == epmodel1.building_surface_detailed
+    assert model.zone == epmodel1.zone
+    assert model.output_variable == epmodel1.output_variable
+    assert model.building == epmodel1.building
+    assert model.material is None
+
+    model = validate_selected(json_data1, exclude=["Output:*", "Schedule:Compact"])
+    assert model.output_variable is None
+    assert model.schedule_compact is None
+    assert model.material == epmodel1.material
+
+    with pytest.raises(KeyError):
+        validate_selected(json_data1, include=["BuildingSurface:Detaild"])
+
+
+def test_unknown_sections(json_data1):
+    unknown = {"Door": {"obj": {"field": 1}}}
+    # Keys that are not object types of the schema are ignored
+    data = {**json_data1, **unknown, "Zoen": {"obj": {}}}
+    for model in (
+        EnergyPlusModel.model_validate(data),
+        EnergyPlusModel.model_validate_json(json.dumps(data)),
+        validate_lazy(data),
+        validate_selected(data, exclude=["Zone"]),
+    ):
+        assert model._unknown_sections == unknown
+        assert model.model_extra is None
+    assert validate_selected(data, include=["Zone"])._unknown_sections == {}
+    with pytest.raises(ValueError):
+        model.zonee = {}
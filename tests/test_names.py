@@ -0,0 +1,47 @@
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel import epmodel as epm
+from epmodel.loader import validate_lazy
+
+
+def test_find(data1):
+    model = validate_lazy(data1)
+    zone_name = next(iter(data1["Zone"]))
+    objects = model.find(zone_name.lower())
+    assert objects["Zone"] is model.zone[zone_name]
+    assert model.find("Missing") == {}
+    assert model.canonical_name("Material", "1/2in gypsum") == "1/2IN Gypsum"
+    assert model.get_object("material", "1/2IN GYPSUM").thickness == 0.0127
+    with pytest.raises(KeyError):
+        model.get_object("material", "Missing")
+
+
+def test_index_updates(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    assert model.canonical_name("material", "new") is None
+    material = epm.Material(**data1["Material"]["1/2IN Gypsum"])
+    model.add("material", "New", material)
+    assert model.get_object("Material", "NEW") is material
+    model.remove("material", "New")
+    assert model.canonical_name("material", "new") is None
+
+    # Section dictionaries edited directly are indexed once marked
+    model.material["Direct"] = material
+    model.mark_dirty("material", "Direct")
+    assert model.find("direct") == {"Material": material}
+    del model.material["1/2IN Gypsum"]
+    model.mark_dirty("material")
+    assert model.find("1/2IN Gypsum") == {}
+
+    model.material = {"Other": material}
+    assert model.canonical_name("material", "direct") is None
+    assert model.canonical_name("material", "OTHER") == "Other"
+
+    # Undo and redo keep the index up to date
+    model.checkpoint()
+    model.add("material", "Undone", material)
+    model.undo()
+    assert model.canonical_name("material", "undone") is None
+    model.redo()
+    assert model.canonical_name("material", "undone") == "Undone"
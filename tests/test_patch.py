@@ -0,0 +1,64 @@
+import pytest
+from pydantic import ValidationError
+
+from epmodel import EnergyPlusModel
+from epmodel.diff import diff_models
+from epmodel.patch import apply_patch, make_patch, make_pointer, parse_pointer
+
+
+def test_pointer():
+    pointer = make_pointer("Material", "1/2IN Gypsum", "thickness")
+    assert pointer == "/Material/1~12IN Gypsum/thickness"
+    assert parse_pointer(pointer) == ["Material", "1/2IN Gypsum", "thickness"]
+
+
+def test_make_apply_patch(data1):
+    old = EnergyPlusModel.model_validate(data1)
+    new = EnergyPlusModel.model_validate(data1)
+    new.material["1/2IN Gypsum"].thickness = 0.02
+    new.mark_dirty("material", "1/2IN Gypsum")
+    zone = next(iter(new.zone))
+    del new.zone[zone]
+    new.mark_dirty("zone")
+    new.add("schedule_type_limits", "Extra", {"unit_type": "Dimensionless"})
+    new.revalidate()
+
+    patch = make_patch(old, new)
+    assert len(patch) == 3
+    assert {"op": "remove", "path": make_pointer("Zone", zone)} in patch
+    apply_patch(old, patch)
+    assert diff_models(old, new).is_empty
+    assert old.content_hash() == new.content_hash()
+
+
+def test_apply_patch_field_paths(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    surface = next(iter(model.building_surface_detailed))
+    path = make_pointer("BuildingSurface:Detailed", surface, "vertices", 0)
+    apply_patch(
+        model,
+        [{"op": "replace", "path": path + "/vertex_x_coordinate", "value": 1.5}],
+    )
+    vertex = model.building_surface_detailed[surface].vertices[0]
+    assert vertex.vertex_x_coordinate == 1.5
+
+
+def test_apply_patch_invalid(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    digest = model.content_hash()
+    patch = [
+        {"op": "remove", "path": "/Zone/" + next(iter(model.zone))},
+        {
+            "op": "replace",
+            "path": "/Material/1~12IN Gypsum/thickness",
+            "value": "thick",
+        },
+    ]
+    with pytest.raises(ValidationError):
+        apply_patch(model, patch)
+    # Nothing applied
+    assert model.content_hash() == digest
+    with pytest.raises(ValueError):
+        apply_patch(model, [{"op": "remove", "path": "/Zone/Missing"}])
+    with pytest.raises(ValueError):
+        apply_patch(model, [{"op": "move", "path": "/Zone/A", "from": "/Zone/B"}])
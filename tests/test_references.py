@@ -0,0 +1,230 @@
+import json
+
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel.builder import build_matrix_two_dimension
+from epmodel.loader import validate_lazy
+from epmodel.references import build_reference_graph, find_dangling, target_types
+
+
+def test_target_types():
+    assert target_types("ZoneList", "zone_name") == ("Zone",)
+    assert "Schedule:Compact" in target_types(
+        "People", "number_of_people_schedule_name"
+    )
+    assert "Construction" in target_types(
+        "BuildingSurface:Detailed", "construction_name"
+    )
+    assert target_types("BuildingSurface:Detailed", "surface_type") == ()
+
+
+def test_build_reference_graph(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    graph = build_reference_graph(model)
+    assert graph.dangling() == []
+
+    surface_name, surface = next(iter(data1["BuildingSurface:Detailed"].items()))
+    references = {
+        ref.field: ref
+        for ref in graph.references("BuildingSurface:Detailed", surface_name)
+    }
+    construction = references["construction_name"]
+    assert construction.target_type == "Construction"
+    assert construction.target_name == surface["construction_name"]
+    assert references["zone_name"].target_type == "Zone"
+
+    referrers = graph.referrers("Construction", surface["construction_name"].upper())
+    assert construction in referrers
+    assert all(ref.target_type == "Construction" for ref in referrers)
+
+    # Fields of extensible groups, e.g. BranchList branches
+    branch_list = next(iter(data1["BranchList"]))
+    indices = [ref.index for ref in graph.references("BranchList", branch_list)]
+    assert indices == list(range(len(data1["BranchList"][branch_list]["branches"])))
+
+    # Raw sections resolve the same, without being validated
+    lazy = validate_lazy(data1)
+    assert build_reference_graph(lazy).forward == graph.forward
+    assert lazy._pending_sections
+
+
+def test_unresolved(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    surface_name = next(iter(data1["BuildingSurface:Detailed"]))
+    model.building_surface_detailed[surface_name].construction_name = "Missing"
+    graph = build_reference_graph(model)
+    [missing] = graph.dangling()
+    assert missing.source_name == surface_name
+    assert missing.field == "construction_name"
+    assert missing.index is None
+    assert missing.target_type is None
+
+
+def test_rename(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    surface_name, surface = next(iter(data1["BuildingSurface:Detailed"].items()))
+    old = surface["construction_name"]
+    count = sum(
+        1
+        for objects in (data1["BuildingSurface:Detailed"], data1["InternalMass"])
+        for obj in objects.values()
+        if obj["construction_name"] == old
+    )
+    checkpoint = model.checkpoint()
+    assert model.rename("Construction", old.lower(), "Renamed") >= count
+    assert model.canonical_name("construction", old) is None
+    assert list(model.construction)[-1] == "Renamed"
+    assert model.building_surface_detailed[surface_name].construction_name == "Renamed"
+    # The cached graph follows the rename
+    graph = model.reference_graph()
+    assert graph.forward == build_reference_graph(model).forward
+    assert graph.referrers("Construction", old) == []
+    model.revalidate()
+
+    # Renaming again only touches the references to the object
+    model.rename("Zone", surface["zone_name"], "Renamed")
+    assert model.changes_since(checkpoint)["zone"] == {surface["zone_name"], "Renamed"}
+    with pytest.raises(ValueError):
+        other = next(name for name in data1["Construction"] if name != old)
+        model.rename("Construction", "Renamed", other.upper())
+    with pytest.raises(KeyError):
+        model.rename("Construction", "Missing", "Other")
+
+    model.rollback(checkpoint)
+    assert model.building_surface_detailed[surface_name].construction_name == old
+    assert model.reference_graph().dangling() == []
+
+
+def test_rename_resolves(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    surface_name, surface = next(iter(data1["BuildingSurface:Detailed"].items()))
+    model.building_surface_detailed[surface_name].construction_name = "Later"
+    model.mark_dirty("building_surface_detailed", surface_name)
+    assert len(model.reference_graph().dangling()) == 1
+    model.rename("Construction", surface["construction_name"], "later")
+    assert model.reference_graph().dangling() == []
+
+
+def test_rename_unknown_sections(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    surface_name, surface = next(iter(data1["BuildingSurface:Detailed"].items()))
+    old = surface["construction_name"]
+    door = {"construction_name": old.lower(), "building_surface_name": surface_name}
+    model._unknown_sections["Door"] = {"Door 1": door}
+    with pytest.warns(UserWarning, match="Door"):
+        model.rename("Construction", old, "Renamed")
+    # Left as is, the fields of unknown object types are not known
+    assert door["construction_name"] == old.lower()
+    assert model.construction["Renamed"]
+
+
+def test_object_type_field(data1):
+    # Names are unique within an object type only, Branch components resolve
+    # to the object type of their component_object_type field
+    model = EnergyPlusModel.model_validate(data1)
+    model.reference_graph()
+    model.rename("Boiler:HotWater", "HeatSys1 Boiler", "HeatSys1 Demand Bypass Pipe")
+    fresh = build_reference_graph(model)
+    assert model.reference_graph().forward == fresh.forward
+    [pipe] = [
+        ref
+        for ref in fresh.references("Branch", "HeatSys1 Demand Bypass Branch")
+        if ref.field == "component_name"
+    ]
+    assert pipe.target_type == "Pipe:Adiabatic"
+    assert pipe.declared_type == "Pipe:Adiabatic"
+    referrers = fresh.referrers("Boiler:HotWater", "HeatSys1 Demand Bypass Pipe")
+    assert "Branch" in {ref.source_type for ref in referrers}
+    assert fresh.dangling() == find_dangling(model) == []
+
+    # A component of another type does not resolve to the object
+    branch = model.branch["HeatSys1 Demand Bypass Branch"]
+    branch.components[0].component_name = "Later"
+    model.mark_dirty("branch", "HeatSys1 Demand Bypass Branch")
+    [missing] = model.reference_graph().dangling()
+    assert missing.declared_type == "Pipe:Adiabatic"
+    model.rename("Boiler:HotWater", "HeatSys1 Demand Bypass Pipe", "later")
+    assert model.reference_graph().dangling() == [missing]
+    assert find_dangling(model) == [missing]
+
+
+def test_find_dangling(data1):
+    model = validate_lazy(data1)
+    assert find_dangling(model) == []
+    assert model._pending_sections
+
+    surface_name = next(iter(data1["BuildingSurface:Detailed"]))
+    model.building_surface_detailed[surface_name].zone_name = "Missing Zone"
+    branch_list, value = next(iter(data1["BranchList"].items()))
+    raw = json.loads(json.dumps(value))
+    raw["branches"][1]["branch_name"] = "Missing Branch"
+    model.add("branch_list", "Raw", raw)
+    dangling = find_dangling(model)
+    assert {(ref.source_name, ref.field, ref.index) for ref in dangling} == {
+        (surface_name, "zone_name", None),
+        ("Raw", "branch_name", 1),
+    }
+    assert set(dangling) == set(build_reference_graph(model).dangling())
+    # Names are compared case-insensitively
+    model.building_surface_detailed[surface_name].zone_name = next(
+        iter(data1["Zone"])
+    ).lower()
+    assert len(find_dangling(model)) == 1
+
+
+def test_prune(data1):
+    model = EnergyPlusModel.model_validate(data1)
+    model.add(
+        "matrix_two_dimension", "Old BSDF", build_matrix_two_dimension([[0.1, 0.2]])
+    )
+    model.add(
+        "schedule_constant",
+        "Unused",
+        {"schedule_type_limits_name": "Fraction", "hourly_value": 1.0},
+    )
+    model.add(
+        "schedule_constant",
+        "Used by unknown",
+        {"schedule_type_limits_name": "Fraction", "hourly_value": 1.0},
+    )
+    model._unknown_sections["ZoneHVAC:Baseboard:Convective:Electric"] = {
+        "Baseboard 1": {"availability_schedule_name": "USED BY UNKNOWN"}
+    }
+    expected = model.prune(dry_run=True)
+    assert expected["Matrix:TwoDimension"] == ["Old BSDF"]
+    assert expected["Schedule:Constant"] == ["Unused"]
+    assert "Zone" not in expected
+
+    checkpoint = model.checkpoint()
+    assert model.prune() == expected
+    assert model.prune() == {}
+    assert "Used by unknown" in model.schedule_constant
+    assert find_dangling(model) == []
+    model.revalidate()
+    assert model.changes_since(checkpoint)["matrix_two_dimension"] == {"Old BSDF"}
+
+    # Undone removals append the objects to their sections again
+    model.rollback(checkpoint)
+    restored = model.prune(dry_run=True)
+    assert {key: set(names) for key, names in restored.items()} == {
+        key: set(names) for key, names in expected.items()
+    }
+
+
+def test_prune_object_type_field(data1):
+    # A boiler sharing the name of a pipe of a branch is not referenced by it
+    model = EnergyPlusModel.model_validate(data1)
+    unused = model.prune(dry_run=True)
+    boiler = dict(data1["Boiler:HotWater"]["HeatSys1 Boiler"])
+    model.add("boiler_hot_water", "HeatSys1 Demand Bypass Pipe", boiler)
+    pruned = model.prune()
+    assert pruned.pop("Boiler:HotWater") == ["HeatSys1 Demand Bypass Pipe"]
+    assert pruned == unused
+    assert "HeatSys1 Demand Bypass Pipe" in model.pipe_adiabatic
+    assert find_dangling(model) == []
+
+    # Nor is a pipe sharing the name of a boiler
+    model.rename("Boiler:HotWater", "HeatSys1 Boiler", "HeatSys1 Demand Bypass Pipe")
+    assert model.prune(dry_run=True) == {}
+    assert "HeatSys1 Demand Bypass Pipe" in model.pipe_adiabatic
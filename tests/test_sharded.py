@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from epmodel import EnergyPlusModel
+from epmodel import sharded
+from epmodel.sharded import MANIFEST, load_sharded, read_manifest, save_sharded
+
+
+@pytest.fixture
+def model1(data1):
+    data = data1
+    data["Output:Schedules"] = {"A": {"value": 1}}
+    return EnergyPlusModel.model_validate(data)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_save_load_sharded(tmp_path, model1, lazy):
+    written = save_sharded(model1, tmp_path)
+    manifest = read_manifest(tmp_path)
+    assert set(written) == set(manifest["sections"])
+    assert manifest["sections"]["Zone"]["file"].startswith("zone-")
+    model = load_sharded(tmp_path, lazy=lazy)
+    assert model.zone == model1.zone
+    assert model._unknown_sections == {"Output:Schedules": {"A": {"value": 1}}}
+    assert model.content_hash() == model1.content_hash()
+    # Nothing changed since loading, nothing hashed or written
+    assert save_sharded(model, tmp_path) == []
+    assert not model._object_hashes
+
+
+def test_save_sharded_dirty(tmp_path, model1):
+    save_sharded(model1, tmp_path)
+    model = load_sharded(tmp_path)
+    name = next(iter(model.lights))
+    model.lights[name].watts_per_floor_area = 20.0
+    model.mark_dirty("lights", name)
+    assert save_sharded(model, tmp_path) == ["Lights"]
+    assert load_sharded(tmp_path).lights[name].watts_per_floor_area == 20.0
+
+    model.lights = None
+    assert save_sharded(model, tmp_path) == []
+    assert not list(tmp_path.glob("lights-*.json"))
+    assert "Lights" not in json.loads((tmp_path / MANIFEST).read_text())["sections"]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_save_sharded_edit(tmp_path, model1, lazy):
+    # Fields assigned on a loaded model are seen without mark_dirty
+    save_sharded(model1, tmp_path)
+    model = load_sharded(tmp_path, lazy=lazy)
+    name = next(iter(model1.lights))
+    model.lights[name].watts_per_floor_area = 99.0
+    assert save_sharded(model, tmp_path) == ["Lights"]
+    assert load_sharded(tmp_path).lights[name].watts_per_floor_area == 99.0
+
+    surface_name = next(iter(model1.building_surface_detailed))
+    vertex = model.building_surface_detailed[surface_name].vertices[0]
+    vertex.vertex_z_coordinate += 1.0
+    assert save_sharded(model, tmp_path) == ["BuildingSurface:Detailed"]
+    reloaded = load_sharded(tmp_path).building_surface_detailed[surface_name]
+    assert reloaded.vertices[0].vertex_z_coordinate == vertex.vertex_z_coordinate
+
+
+def test_save_sharded_commit(tmp_path, model1, monkeypatch):
+    save_sharded(model1, tmp_path)
+    old = read_manifest(tmp_path)
+    name = next(iter(model1.lights))
+    model1.lights[name].watts_per_floor_area = 20.0
+    model1.mark_dirty("lights", name)
+    save_sharded(model1, tmp_path)
+    # Files are never rewritten in place, the old one is deleted
+    new = read_manifest(tmp_path)
+    assert new["sections"]["Lights"]["file"] != old["sections"]["Lights"]["file"]
+    assert not (tmp_path / old["sections"]["Lights"]["file"]).exists()
+    assert new["sections"]["Zone"] == old["sections"]["Zone"]
+    files = {entry["file"] for entry in new["sections"].values()}
+    assert {path.name for path in tmp_path.iterdir()} == files | {MANIFEST}
+
+    # A reader of the old manifest reads the new one once its files are gone
+    manifests = iter([old, new])
+    monkeypatch.setattr(sharded, "read_manifest", lambda directory: next(manifests))
+    assert load_sharded(tmp_path).lights[name].watts_per_floor_area == 20.0
@@ -0,0 +1,42 @@
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from epmodel import EnergyPlusModel
+from epmodel.stream import iter_epjson
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+def test_iter_epjson(test_file2, chunk_size):
+    with open(test_file2, "r") as f:
+        model = EnergyPlusModel.model_validate(json.load(f))
+    objects = list(iter_epjson(test_file2, chunk_size=chunk_size))
+    assert len(objects) == sum(
+        len(getattr(model, name) or {}) for name in EnergyPlusModel.model_fields
+    )
+    fields = {v.alias: k for k, v in EnergyPlusModel.model_fields.items()}
+    for object_type, name, obj in objects:
+        assert getattr(model, fields[object_type])[name] == obj
+
+
+def test_iter_epjson_include(test_file2):
+    objects = list(iter_epjson(test_file2, include=["Zone", "Output:*"]))
+    object_types = {object_type for object_type, _, _ in objects}
+    assert "Zone" in object_types
+    assert "Output:Variable" in object_types
+    assert all(t == "Zone" or t.startswith("Output:") for t in object_types)
+
+
+def test_iter_epjson_errors():
+    source = io.StringIO(
+        '{"Zone": {"z1": {"multiplier": 1}, "z2": {"multiplier": "x"}}}'
+    )
+    objects = iter_epjson(source)
+    assert next(objects)[1] == "z1"
+    with pytest.raises(ValidationError) as e_info:
+        next(objects)
+    assert e_info.value.errors()[0]["loc"] == ("Zone", "z2", "multiplier")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_epjson(io.StringIO('{"Zone": {"z1": {"multiplier": 1}')))
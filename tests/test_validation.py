@@ -0,0 +1,77 @@
+import pytest
+from pydantic import ValidationError
+
+from epmodel import EnergyPlusModel
+from epmodel.epjson import load_epjson
+from epmodel.validation import ValidationProfiler, validate_report
+
+
+def test_validate_report(json_data2):
+    report = validate_report(json_data2)
+    assert report.is_valid
+    assert report.model == EnergyPlusModel.model_validate(json_data2)
+    assert set(report.section_times) == set(json_data2)
+    assert report.slowest_sections(1)[0][1] <= report.total_time
+
+
+def test_validate_report_errors(json_data2):
+    data = dict(json_data2)
+    data["Zone"] = {"z1": {"multiplier": "x"}, "z2": {"multiplier": 1}}
+    data["BuildingSurface:Detailed"] = {
+        "wall": {"surface_type": "Nope", "construction_name": "c", "zone_name": "z1"}
+    }
+    data["Not:AnObject"] = {}
+    del data["Building"]
+    report = validate_report(data)
+    assert not report.is_valid
+    assert report.model is None
+    assert report.error_count == 4
+    assert report.unknown_object_types == ["Not:AnObject"]
+    assert report.errors["Zone"]["z1"][0].loc == ("multiplier",)
+    assert [e.loc for e in report.errors["BuildingSurface:Detailed"]["wall"]] == [
+        ("surface_type",),
+        ("outside_boundary_condition",),
+    ]
+    assert report.errors["Building"][""][0].type == "missing"
+    assert "model" not in report.model_dump()
+
+
+def test_validation_profiler(json_data2):
+    calls = []
+    with ValidationProfiler(
+        track_memory=True, callback=lambda *args: calls.append(args)
+    ) as profiler:
+        report = validate_report(json_data2)
+    assert report.is_valid
+    assert set(profiler.stats) == set(json_data2)
+    assert len(calls) == len(json_data2)
+    stats = profiler.stats["BuildingSurface:Detailed"]
+    assert stats.count == len(json_data2["BuildingSurface:Detailed"])
+    assert stats.calls == 1
+    assert stats.total_time > 0
+    assert stats.peak_memory > 0
+    assert profiler.slowest(1)[0].total_time >= stats.total_time
+
+    validate_report(json_data2)
+    assert len(calls) == len(json_data2)
+
+
+def test_profiler_default_paths(json_data2, test_file2):
+    plain = EnergyPlusModel.model_validate(json_data2)
+    with ValidationProfiler() as profiler:
+        model = EnergyPlusModel.model_validate(json_data2)
+    assert model == plain
+    assert model.model_fields_set == plain.model_fields_set
+    assert set(profiler.stats) == set(json_data2)
+    with ValidationProfiler() as profiler:
+        assert load_epjson(test_file2) == plain
+    assert set(profiler.stats) == set(json_data2)
+
+    data = dict(json_data2)
+    data["Zone"] = {"z1": {"multiplier": "x"}}
+    del data["Building"]
+    with pytest.raises(ValidationError) as eager:
+        EnergyPlusModel.model_validate(data)
+    with ValidationProfiler(), pytest.raises(ValidationError) as observed:
+        EnergyPlusModel.model_validate(data)
+    assert observed.value.errors() == eager.value.errors()